@@ -1,13 +1,16 @@
 from .dtos import (
     AgentConfigOutputDTO,
+    ChatBatchItemDTO,
+    ChatBatchOutputDTO,
     ChatInputDTO,
     ChatOutputDTO,
     CreateAgentInputDTO,
     StreamingResponseDTO,
 )
 from .facade import CreateAgent
-from .interfaces import ChatRepository
+from .interfaces import ChatRepository, SessionStore
 from .use_cases import (
+    ChatManyWithAgentUseCase,
     ChatWithAgentUseCase,
     CreateAgentUseCase,
     GetAgentConfigUseCase,
@@ -21,6 +24,7 @@ __all__ = [
     # use cases
     'CreateAgentUseCase',
     'ChatWithAgentUseCase',
+    'ChatManyWithAgentUseCase',
     'GetAgentConfigUseCase',
     'GetAllAvailableToolsUseCase',
     'GetSystemAvailableToolsUseCase',
@@ -29,7 +33,10 @@ __all__ = [
     'AgentConfigOutputDTO',
     'ChatInputDTO',
     'ChatOutputDTO',
+    'ChatBatchItemDTO',
+    'ChatBatchOutputDTO',
     'StreamingResponseDTO',
     # interfaces
     'ChatRepository',
+    'SessionStore',
 ]
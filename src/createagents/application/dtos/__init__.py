@@ -4,6 +4,7 @@ from .agent_dtos import (
     ChatOutputDTO,
     CreateAgentInputDTO,
 )
+from .chat_batch_dtos import ChatBatchItemDTO, ChatBatchOutputDTO
 from .streaming_response_dto import StreamingResponseDTO
 
 __all__ = [
@@ -11,5 +12,7 @@ __all__ = [
     'AgentConfigOutputDTO',
     'ChatInputDTO',
     'ChatOutputDTO',
+    'ChatBatchItemDTO',
+    'ChatBatchOutputDTO',
     'StreamingResponseDTO',
 ]
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, Union
 
-from ...domain import BaseTool, InvalidBaseToolException
+from ...domain import BaseTool, InvalidBaseToolException, TokenCounter
 
 
 @dataclass
@@ -14,7 +14,9 @@ class CreateAgentInputDTO:
     instructions: Optional[str] = None
     config: Optional[Dict[str, Any]] = None
     tools: Optional[Sequence[Union[str, BaseTool]]] = None
-    history_max_size: int = 10
+    history_max_size: Optional[int] = 10
+    history_max_tokens: Optional[int] = None
+    token_counter: Optional[TokenCounter] = None
 
     def validate(self) -> None:
         """Validate and transform the DTO data.
@@ -87,7 +89,11 @@ class CreateAgentInputDTO:
 
             object.__setattr__(self, 'tools', validated_tools)
 
+        # history_max_size may only be None when a token budget replaces it.
         if (
+            self.history_max_size is not None
+            or self.history_max_tokens is None
+        ) and (
             not isinstance(self.history_max_size, int)
             or self.history_max_size <= 0
         ):
@@ -95,6 +101,22 @@ class CreateAgentInputDTO:
                 "The 'history_max_size' field must be a positive integer."
             )
 
+        if self.history_max_tokens is not None and (
+            isinstance(self.history_max_tokens, bool)
+            or not isinstance(self.history_max_tokens, int)
+            or self.history_max_tokens <= 0
+        ):
+            raise ValueError(
+                "The 'history_max_tokens' field must be a positive integer."
+            )
+
+        if self.token_counter is not None and not isinstance(
+            self.token_counter, TokenCounter
+        ):
+            raise ValueError(
+                "The 'token_counter' field must be a TokenCounter instance."
+            )
+
 
 @dataclass
 class AgentConfigOutputDTO:
@@ -107,7 +129,8 @@ class AgentConfigOutputDTO:
     config: Optional[Dict[str, Any]]
     tools: Optional[List[BaseTool]]
     history: List[Dict[str, str]]
-    history_max_size: int = 10
+    history_max_size: Optional[int] = 10
+    history_max_tokens: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the DTO to a dictionary.
@@ -128,6 +151,7 @@ class AgentConfigOutputDTO:
             'tools': tool_names,
             'history': self.history,
             'history_max_size': self.history_max_size,
+            'history_max_tokens': self.history_max_tokens,
         }
 
 
@@ -136,17 +160,34 @@ class ChatInputDTO:
     """DTO for chat message input."""
 
     message: str
+    timeout: Optional[float] = None
+    session_id: Optional[str] = None
 
     def validate(self) -> None:
         """Validate the DTO data.
 
         Raises:
-            ValueError: If the message is invalid.
+            ValueError: If the message, the timeout or the session id is
+                invalid.
         """
         if not isinstance(self.message, str) or not self.message.strip():
             raise ValueError(
                 "The 'message' field is required, must be a string, and cannot be empty."
             )
+        if self.timeout is not None and (
+            isinstance(self.timeout, bool)
+            or not isinstance(self.timeout, (int, float))
+            or self.timeout <= 0
+        ):
+            raise ValueError(
+                "The 'timeout' field must be a positive number of seconds."
+            )
+        if self.session_id is not None and (
+            not isinstance(self.session_id, str) or not self.session_id
+        ):
+            raise ValueError(
+                "The 'session_id' field must be a non-empty string."
+            )
 
 
 @dataclass
@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ChatBatchItemDTO:
+    """DTO for the outcome of one message of a batch."""
+
+    index: int
+    message: str
+    response: Optional[str] = None
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    tokens_used: Optional[int] = None
+
+    @property
+    def success(self) -> bool:
+        """Return whether the message got a response."""
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the DTO to a dictionary.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the DTO.
+        """
+        return {
+            'index': self.index,
+            'message': self.message,
+            'response': self.response,
+            'error': self.error,
+            'success': self.success,
+            'latency_ms': round(self.latency_ms, 2),
+            'tokens_used': self.tokens_used,
+        }
+
+
+@dataclass
+class ChatBatchOutputDTO:
+    """DTO for the results of a batch, in input order, with throughput."""
+
+    results: List[ChatBatchItemDTO] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    tokens_used: Optional[int] = None
+
+    @property
+    def total(self) -> int:
+        """Return the number of messages in the batch."""
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> int:
+        """Return the number of messages answered successfully."""
+        return sum(1 for item in self.results if item.success)
+
+    @property
+    def failed(self) -> int:
+        """Return the number of messages that failed."""
+        return self.total - self.succeeded
+
+    @property
+    def requests_per_second(self) -> float:
+        """Return the completed messages per second of wall time."""
+        if self.elapsed_ms <= 0:
+            return 0.0
+        return self.total / (self.elapsed_ms / 1000)
+
+    @property
+    def responses(self) -> List[Optional[str]]:
+        """Return the responses in input order (None for failures)."""
+        return [item.response for item in self.results]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the DTO to a dictionary.
+
+        Returns:
+            Dict[str, Any]: The dictionary representation of the DTO.
+        """
+        return {
+            'total': self.total,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'elapsed_ms': round(self.elapsed_ms, 2),
+            'requests_per_second': round(self.requests_per_second, 2),
+            'tokens_used': self.tokens_used,
+            'results': [item.to_dict() for item in self.results],
+        }
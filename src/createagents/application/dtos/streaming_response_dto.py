@@ -1,3 +1,4 @@
+import asyncio
 from typing import AsyncGenerator
 
 
@@ -6,6 +7,11 @@ class StreamingResponseDTO:
 
     Wraps an async generator to provide a clean interface for async iteration.
     Can be awaited to get the complete response string automatically.
+
+    To stop early, call `aclose()` or use the DTO as an async context
+    manager: the upstream request is closed, running tools are cancelled
+    and the agent's history is left unchanged. Cancelling the task that
+    reads the stream has the same effect.
     """
 
     def __init__(self, generator: AsyncGenerator[str, None]):
@@ -16,15 +22,21 @@ class StreamingResponseDTO:
         """
         self._generator = generator
         self._consumed = False
+        self._closed = False
         self._full_response = ''
 
+    @property
+    def closed(self) -> bool:
+        """Return whether the stream was stopped before it finished."""
+        return self._closed
+
     def __aiter__(self):
         """Allow async iteration over tokens."""
         return self
 
     async def __anext__(self):
         """Get next token asynchronously."""
-        if self._consumed:
+        if self._consumed or self._closed:
             raise StopAsyncIteration
 
         try:
@@ -34,6 +46,27 @@ class StreamingResponseDTO:
         except StopAsyncIteration:
             self._consumed = True
             raise
+        except asyncio.CancelledError:
+            self._closed = True
+            raise
+
+    async def aclose(self) -> None:
+        """Stops the stream, cancelling the work still in flight.
+
+        Does nothing if the stream already finished.
+        """
+        if self._consumed or self._closed:
+            return
+        self._closed = True
+        await self._generator.aclose()
+
+    async def __aenter__(self) -> 'StreamingResponseDTO':
+        """Return the stream, closed on exit if not fully read."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the stream if it was not fully read."""
+        await self.aclose()
 
     def __await__(self):
         """Allow awaiting to get complete response string.
@@ -72,4 +105,6 @@ class StreamingResponseDTO:
         """Return representation."""
         if self._consumed:
             return f'StreamingResponseDTO(consumed, length={len(self._full_response)})'
+        if self._closed:
+            return f'StreamingResponseDTO(closed, length={len(self._full_response)})'
         return 'StreamingResponseDTO(active)'
@@ -1,10 +1,34 @@
-from typing import Any, Dict, List, Optional, Sequence, Union
+import asyncio
+import dataclasses
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
-from ...domain import Agent, BaseTool
-from ...infra import ChatMetrics, LoggingConfig
+from ...domain import (
+    Agent,
+    BaseTool,
+    ChatException,
+    TokenCounter,
+    ToolPools,
+)
+from ...infra import ChatMetrics, LoggingConfig, SemanticCache
 from ...main import AgentComposer
-from ..dtos import ChatInputDTO, StreamingResponseDTO
+from ..dtos import (
+    ChatBatchItemDTO,
+    ChatBatchOutputDTO,
+    ChatInputDTO,
+    StreamingResponseDTO,
+)
+from ..interfaces import SessionStore
+from ..services import HistoryCompactor, SessionManager
 from ..use_cases import (
+    ChatManyWithAgentUseCase,
     ChatWithAgentUseCase,
     GetAgentConfigUseCase,
     GetSystemAvailableToolsUseCase,
@@ -25,7 +49,20 @@ class CreateAgent:
         instructions: Optional[str] = None,
         config: Optional[Dict[str, Any]] = None,
         tools: Optional[Sequence[Union[str, BaseTool]]] = None,
-        history_max_size: int = 10,
+        history_max_size: Optional[int] = 10,
+        history_max_tokens: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
+        preload: bool = False,
+        semantic_cache: Union[bool, SemanticCache] = False,
+        timeout: Optional[float] = None,
+        tool_pool: Optional[str] = None,
+        compaction_model: Optional[str] = None,
+        compaction_provider: Optional[str] = None,
+        compaction_threshold: int = HistoryCompactor.DEFAULT_THRESHOLD_TOKENS,
+        session_id: Optional[str] = None,
+        session_store: Optional[SessionStore] = None,
+        session_idle_ttl: Optional[float] = None,
+        max_sessions: Optional[int] = None,
     ) -> None:
         """
         Initializes the controller by creating an agent and its dependencies.
@@ -36,10 +73,102 @@ class CreateAgent:
             name: The name of the agent (optional).
             instructions: The agent's instructions or prompt (optional).
             config: Extra agent configurations, such as `max_tokens` and `temperature` (optional).
-            history_max_size: The maximum history size (default: 10).
+            history_max_size: The maximum history size (default: 10). May
+                be None when history_max_tokens is set.
+            history_max_tokens: Token budget of the history. When set,
+                the oldest turns are dropped once the history exceeds it
+                (default: None, no token limit).
+            token_counter: Counts the tokens of each message for the
+                budget, e.g. `TiktokenCounter()` (default: an estimate of
+                four characters per token).
+            preload: If True, warm up the model right away (see `warmup`).
+                Inside a running event loop the warm-up runs in the
+                background and the first `chat` waits for it; otherwise
+                the constructor blocks until it finishes and then releases
+                the agent's hold on its adapter, closing the connections
+                unless another agent shares them (a loaded Ollama model
+                stays loaded).
+                Failures are logged and do not prevent the agent from
+                being created.
+            semantic_cache: If True, messages similar to ones already
+                answered get the cached response instead of a new request,
+                using a local Ollama embedding model (requires the
+                `semantic-cache` extra). A SemanticCache instance may be
+                passed instead, e.g. with a custom embedder or to share
+                one cache between agents (default: False).
+            timeout: Default time budget of each chat call, in seconds,
+                covering model requests, retries and tool executions
+                (default: None, no limit). `chat` can override it.
+            tool_pool: Name of a `ToolPools` pool on which the agent's
+                synchronous tools run, unless a tool names its own `pool`
+                (default: None, the event loop's default thread pool).
+            compaction_model: If set, once the history exceeds
+                `compaction_threshold` tokens its older turns are
+                summarized by this (usually cheaper) model in the
+                background and replaced by one summary message
+                (default: None, no compaction).
+            compaction_provider: Provider of the compaction model
+                (default: the agent's provider).
+            compaction_threshold: History size, in tokens, that triggers
+                compaction (default: 4000). Keep it below
+                `history_max_tokens`, or turns are dropped before they can
+                be summarized.
+            session_id: Default session of `chat`, `chat_many`,
+                `clear_history` and `get_configs`. With `session_store`,
+                its latest turns (up to the history limits) are restored
+                now (default: None, the agent's own in-memory history).
+            session_store: Durable storage of the sessions, e.g.
+                `JSONLSessionStore('sessions/')` or
+                `SQLiteSessionStore('sessions.db')`. Each turn of a
+                session is appended to it. The caller owns it and closes
+                it (default: None).
+            session_idle_ttl: Seconds after which an unused session is
+                dropped from memory; with a store it is restored on its
+                next use (default: None, kept in memory).
+            max_sessions: Most sessions held in memory; beyond it the
+                least recently used is dropped, as if idle (default:
+                None, no limit).
+
+        Raises:
+            ValueError: If timeout is not a positive number, tool_pool is
+                not a non-empty string, compaction_threshold or
+                max_sessions is not a positive integer, session_id is not
+                a non-empty string or session_idle_ttl is not a positive
+                number.
         """
         self.__logger = LoggingConfig.get_logger(__name__)
 
+        if timeout is not None and (
+            isinstance(timeout, bool)
+            or not isinstance(timeout, (int, float))
+            or timeout <= 0
+        ):
+            raise ValueError(
+                "The 'timeout' field must be a positive number of seconds."
+            )
+        self.__timeout = timeout
+        if tool_pool is not None and (
+            not isinstance(tool_pool, str) or not tool_pool.strip()
+        ):
+            raise ValueError(
+                "The 'tool_pool' field must be a non-empty pool name."
+            )
+        if (
+            isinstance(compaction_threshold, bool)
+            or not isinstance(compaction_threshold, int)
+            or compaction_threshold <= 0
+        ):
+            raise ValueError(
+                "The 'compaction_threshold' field must be a positive integer."
+            )
+        if session_id is not None and (
+            not isinstance(session_id, str) or not session_id
+        ):
+            raise ValueError(
+                "The 'session_id' field must be a non-empty string."
+            )
+        self.__session_id = session_id
+
         self.__logger.info(
             'Initializing CreateAgent controller - Provider: %s, Model: %s, Name: %s',
             provider,
@@ -55,10 +184,48 @@ class CreateAgent:
             config=config,
             tools=tools,
             history_max_size=history_max_size,
+            history_max_tokens=history_max_tokens,
+            token_counter=token_counter,
+        )
+
+        self.__semantic_cache: Optional[SemanticCache] = None
+        if isinstance(semantic_cache, SemanticCache):
+            self.__semantic_cache = semantic_cache
+        elif semantic_cache:
+            self.__semantic_cache = AgentComposer.create_semantic_cache()
+
+        # One manager serves every session of this agent; the agent's
+        # configuration, tools and chat adapter are shared by all of them.
+        self.__sessions: SessionManager = AgentComposer.create_session_manager(
+            self.__agent.history,
+            store=session_store,
+            idle_ttl_s=session_idle_ttl,
+            max_sessions=max_sessions,
         )
+        if session_id is not None:
+            # Restores the session now rather than on the first chat.
+            self.__sessions.get(session_id)
+
+        compactor: Optional[HistoryCompactor] = None
+        if compaction_model is not None:
+            compactor = AgentComposer.create_history_compactor(
+                provider=compaction_provider or provider,
+                model=compaction_model,
+                threshold_tokens=compaction_threshold,
+            )
 
         self.__chat_use_case: ChatWithAgentUseCase = (
-            AgentComposer.create_chat_use_case(provider=provider, model=model)
+            AgentComposer.create_chat_use_case(
+                provider=provider,
+                model=model,
+                semantic_cache=self.__semantic_cache,
+                tool_pool=tool_pool,
+                compactor=compactor,
+                sessions=self.__sessions,
+            )
+        )
+        self.__chat_many_use_case: ChatManyWithAgentUseCase = (
+            AgentComposer.create_chat_many_use_case(self.__chat_use_case)
         )
         self.__get_config_use_case: GetAgentConfigUseCase = (
             AgentComposer.create_get_config_use_case()
@@ -66,14 +233,59 @@ class CreateAgent:
 
         self.__get_system_available_tools_use_case: GetSystemAvailableToolsUseCase = AgentComposer.create_get_system_available_tools_use_case()
 
+        self.__warmup_task: Optional[asyncio.Task] = None
+        if preload:
+            self.__preload()
+
         self.__logger.info(
             'CreateAgent controller initialized successfully - Agent: %s',
             self.__agent.name,
         )
 
+    def __preload(self) -> None:
+        """Starts the warm-up, in the background when a loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.__warmup_and_release())
+            return
+
+        self.__warmup_task = loop.create_task(self.__safe_warmup())
+
+    async def __warmup_and_release(self) -> None:
+        """Warms up on a temporary loop, then releases the adapter.
+
+        Connections are bound to the loop that opened them and would be
+        unusable once `asyncio.run` closes it. Only this agent's hold is
+        dropped, so connections other agents share stay open; server-side
+        effects, such as a loaded Ollama model, are kept.
+        """
+        try:
+            await self.__safe_warmup()
+        finally:
+            await self.__chat_use_case.aclose()
+
+    async def __safe_warmup(self) -> None:
+        try:
+            await self.warmup()
+        except ChatException as e:
+            self.__logger.warning('Model preload failed: %s', e)
+
+    async def __await_preload(self) -> None:
+        """Waits for a background preload started on the current loop."""
+        task = self.__warmup_task
+        if task is None:
+            return
+
+        self.__warmup_task = None
+        if not task.done() and task.get_loop() is asyncio.get_running_loop():
+            await task
+
     async def chat(
         self,
         message: str,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
     ) -> Union[str, StreamingResponseDTO]:
         """
         Sends a message to the agent and returns the response.
@@ -83,15 +295,26 @@ class CreateAgent:
 
         Args:
             message: The user's message.
+            timeout: Time budget of this call, in seconds (default: the
+                agent's `timeout`). When streaming, it also covers reading
+                the stream.
+            session_id: Conversation this message belongs to (default:
+                the agent's `session_id`, or else its own history). Each
+                session has its own history, created on first use.
 
         Returns:
             Union[str, StreamingResponseDTO]: The agent's response.
                 Returns str for normal responses, or StreamingResponseDTO for streaming
                 (which behaves like str when printed).
 
+        Raises:
+            ValueError: If session_id is not a non-empty string.
+            ChatTimeoutException: If the call does not finish in time.
+
         Example:
             >>> agent = CreateAgent(provider="openai", model="gpt-5-nano")
             >>> print(await agent.chat("Hello!"))  # Works seamlessly with or without streaming
+            >>> await agent.chat("Hi, I'm Ana", session_id="user-1")
         """
         from typing import AsyncGenerator  # pylint: disable=import-outside-toplevel
 
@@ -99,8 +322,12 @@ class CreateAgent:
             'Chat request received - Message length: %s chars', len(message)
         )
 
+        await self.__await_preload()
+
         input_dto = ChatInputDTO(
             message=message,
+            timeout=timeout if timeout is not None else self.__timeout,
+            session_id=self.__session_or_default(session_id),
         )
         result = await self.__chat_use_case.execute(self.__agent, input_dto)
 
@@ -121,15 +348,160 @@ class CreateAgent:
 
         return response
 
-    def get_configs(self) -> Dict[str, Any]:
+    async def chat_many(
+        self,
+        messages: Sequence[str],
+        concurrency: int = 8,
+        isolated_history: bool = True,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+    ) -> ChatBatchOutputDTO:
+        """
+        Sends many independent messages and returns all responses.
+
+        At most `concurrency` messages are in flight at once, sharing the
+        agent's chat adapter. A failing message is reported in its result
+        instead of aborting the batch.
+
+        Args:
+            messages: The user messages.
+            concurrency: Maximum number of messages in flight (default: 8).
+            isolated_history: If True (default), each message is answered
+                with a private copy of the current history, which is left
+                unchanged. If False, the messages share and update it (and
+                the session store, if any).
+            timeout: Time budget of each message, in seconds (default:
+                the agent's `timeout`). A message that runs out of time
+                is reported as failed.
+            session_id: Session whose history the messages see (default:
+                the agent's `session_id`, or else its own history).
+
+        Returns:
+            ChatBatchOutputDTO: The results in input order, with the
+                batch's elapsed time, throughput and token usage.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer.
+
+        Example:
+            >>> batch = await agent.chat_many(["Hi", "Hello"], concurrency=4)
+            >>> print(batch.responses, batch.requests_per_second)
+        """
+        await self.__await_preload()
+        output = await self.__chat_many_use_case.execute(
+            self.__agent,
+            messages,
+            concurrency,
+            isolated_history,
+            timeout if timeout is not None else self.__timeout,
+            self.__session_or_default(session_id),
+        )
+        self.__logger.info(
+            'Batch finished - %s/%s succeeded, %.2f req/s',
+            output.succeeded,
+            output.total,
+            output.requests_per_second,
+        )
+        return output
+
+    async def iter_chat_many(
+        self,
+        messages: Sequence[str],
+        concurrency: int = 8,
+        isolated_history: bool = True,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[ChatBatchItemDTO]:
+        """
+        Sends many independent messages, yielding each result as it completes.
+
+        Same behavior as `chat_many`, but results arrive in completion
+        order; use `item.index` to match them with the input.
+
+        Args:
+            messages: The user messages.
+            concurrency: Maximum number of messages in flight (default: 8).
+            isolated_history: See `chat_many`.
+            timeout: See `chat_many`.
+            session_id: See `chat_many`.
+
+        Yields:
+            ChatBatchItemDTO: One result per message.
+
+        Example:
+            >>> async for item in agent.iter_chat_many(prompts):
+            ...     print(item.index, item.response or item.error)
+        """
+        await self.__await_preload()
+        async for item in self.__chat_many_use_case.iterate(
+            self.__agent,
+            messages,
+            concurrency,
+            isolated_history,
+            timeout if timeout is not None else self.__timeout,
+            self.__session_or_default(session_id),
+        ):
+            yield item
+
+    async def warmup(self) -> None:
+        """
+        Prepares the model so the first chat does not pay its start-up cost.
+
+        For Ollama this loads the model into memory with a zero-token
+        request; for OpenAI it establishes the connection and TLS session
+        that the following requests reuse.
+
+        Raises:
+            ChatException: If the model could not be warmed up.
+
+        Example:
+            >>> agent = CreateAgent(provider="ollama", model="llama3")
+            >>> await agent.warmup()
+            >>> await agent.chat("Hello!")  # No model load latency
+        """
+        await self.__chat_use_case.warmup(self.__agent)
+        self.__logger.info(
+            'CreateAgent warmed up - Agent: %s', self.__agent.name
+        )
+
+    async def aclose(self) -> None:
+        """
+        Releases the agent's hold on its chat adapter.
+
+        Agents on the same provider and model share one adapter, so its
+        pooled connections are only closed once no agent holds it; a
+        later `chat` call transparently opens new ones.
+
+        Example:
+            >>> agent = CreateAgent(provider="ollama", model="llama3")
+            >>> await agent.chat("Hello!")
+            >>> await agent.aclose()
+        """
+        await self.__await_preload()
+        await self.__chat_use_case.aclose()
+        self.__logger.info(
+            'CreateAgent resources released - Agent: %s', self.__agent.name
+        )
+
+    def get_configs(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Returns the agent's configurations.
 
+        Args:
+            session_id: Session whose history is included (default: the
+                agent's `session_id`, or else its own history).
+
         Returns:
             A dictionary containing the agent's configurations.
         """
         self.__logger.debug('Retrieving agent configurations')
-        output_dto = self.__get_config_use_case.execute(self.__agent)
+        agent = self.__agent
+        session_id = self.__session_or_default(session_id)
+        if session_id is not None:
+            agent = dataclasses.replace(
+                agent, history=self.__sessions.get(session_id)
+            )
+        output_dto = self.__get_config_use_case.execute(agent)
 
         output_dict: Dict[str, Any] = output_dto.to_dict()
 
@@ -206,14 +578,28 @@ class CreateAgent:
         )
         return output_dto
 
-    def clear_history(self) -> None:
-        """Clears the agent's history."""
-        history_size = len(self.__agent.history)
-        self.__agent.clear_history()
+    def clear_history(self, session_id: Optional[str] = None) -> None:
+        """
+        Clears the agent's history, or a session and its stored turns.
+
+        Args:
+            session_id: Session to clear (default: the agent's
+                `session_id`, or else its own history).
+        """
+        session_id = self.__session_or_default(session_id)
+        if session_id is None:
+            history_size = len(self.__agent.history)
+            self.__agent.clear_history()
+        else:
+            history_size = len(self.__sessions.get(session_id))
+            self.__sessions.clear(session_id)
         self.__logger.info(
             'Agent history cleared - Removed %s message(s)', history_size
         )
 
+    def __session_or_default(self, session_id: Optional[str]) -> Optional[str]:
+        return session_id if session_id is not None else self.__session_id
+
     def get_metrics(self) -> List[ChatMetrics]:
         """
         Returns the performance metrics of the chat adapter.
@@ -225,6 +611,58 @@ class CreateAgent:
         self.__logger.debug('Retrieved %s metric(s)', len(metrics))
         return metrics
 
+    def get_semantic_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the counters of the agent's semantic cache.
+
+        Returns:
+            A dictionary with hits, misses, hit_rate, entries and
+            evictions, or None if the semantic cache is disabled.
+        """
+        if self.__semantic_cache is None:
+            return None
+        return self.__semantic_cache.get_stats()
+
+    def get_compaction_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the counters of the agent's history compaction.
+
+        Returns:
+            A dictionary with compactions, failed, stale and in_progress,
+            or None if compaction is disabled.
+        """
+        return self.__chat_use_case.get_compaction_stats()
+
+    def get_session_stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters and memory use of the agent's sessions.
+
+        Returns:
+            A dictionary with sessions (held in memory), max_sessions,
+            idle_ttl_s, restored, evicted_idle, evicted_lru and the
+            messages, tokens and bytes of all sessions, plus per_session:
+            for each session id, its messages, tokens, bytes (approximate
+            memory of the message contents) and idle_s.
+        """
+        stats: Dict[str, Any] = self.__sessions.get_stats()
+        stats['per_session'] = self.__sessions.get_session_stats()
+        return stats
+
+    @staticmethod
+    def get_tool_pool_stats() -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the queue and wait-time statistics of the tool pools.
+
+        Pools are shared by every agent in the process.
+
+        Returns:
+            A dictionary keyed by pool name; each value holds kind,
+            max_workers, in_flight, queue_depth, max_queue_depth,
+            submitted, completed, failed, cancelled, avg_wait_ms and
+            max_wait_ms.
+        """
+        return ToolPools.get_stats()
+
     def export_metrics_json(self, filepath: Optional[str] = None) -> str:
         """
         Exports metrics in JSON format.
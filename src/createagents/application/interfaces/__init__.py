@@ -1,3 +1,4 @@
 from .chat_repository import ChatRepository
+from .session_store import SessionStore
 
-__all__ = ['ChatRepository']
+__all__ = ['ChatRepository', 'SessionStore']
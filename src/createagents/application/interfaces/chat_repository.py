@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, AsyncGenerator, List, Optional, Union
+from typing import Any, Dict, AsyncGenerator, List, Optional, Sequence, Union
 
-from ...domain import BaseTool
+from ...domain import BaseTool, Deadline
 
 
 class ChatRepository(ABC):
@@ -14,8 +14,10 @@ class ChatRepository(ABC):
         instructions: Optional[str],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
-        history: List[Dict[str, str]],
+        history: Sequence[Dict[str, str]],
         user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
     ) -> Union[str, AsyncGenerator[str, None]]:
         """Send a message to the chat model and get a response.
 
@@ -24,11 +26,37 @@ class ChatRepository(ABC):
             instructions: System instructions for the agent.
             config: Configuration parameters for the model.
             tools: List of tools available to the agent.
-            history: Chat history.
+            history: Chat history. Its dictionaries may be shared with
+                the agent's history and must not be mutated.
             user_ask: The user's message.
+            deadline: Optional time budget of the whole call, tool
+                executions included.
+            tool_pool: Optional `ToolPools` pool for synchronous tools
+                that do not choose one themselves.
 
         Returns:
             Union[str, AsyncGenerator[str, None]]: The model's response.
                 - str: Complete response (if stream=False)
                 - AsyncGenerator: Token stream (if stream=True)
+
+        Raises:
+            ChatTimeoutException: If the deadline passes.
+        """
+
+    async def warmup(self, model: str) -> None:
+        """Prepare the model ahead of the first chat request.
+
+        Repositories override this to load the model or open their
+        connections early, so that cost is not paid by the first user
+        request. The default does nothing.
+
+        Args:
+            model: The name of the model to warm up.
+        """
+
+    async def aclose(self) -> None:
+        """Release network resources held by the repository.
+
+        Repositories that keep long-lived connections (e.g. pooled HTTP
+        clients) override this method. The default does nothing.
         """
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+from ...domain import Message
+
+
+class SessionStore(ABC):
+    """Durable storage of conversation sessions.
+
+    Messages are appended as each turn finishes, never rewritten, and read
+    back newest first, so restoring a long session only reads what fits
+    in its history. A compacted history is persisted as a summary record
+    appended after its turns; loading stops at it.
+    """
+
+    @abstractmethod
+    def append(self, session_id: str, messages: Sequence[Message]) -> None:
+        """Append messages to the end of a session.
+
+        Args:
+            session_id: The session's identifier.
+            messages: The new messages, oldest first. Their token counts
+                are stored so they are not recounted on load.
+        """
+
+    @abstractmethod
+    def load(
+        self,
+        session_id: str,
+        max_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[Message]:
+        """Return the most recent messages of a session.
+
+        Args:
+            session_id: The session's identifier.
+            max_messages: Load at most this many messages (optional).
+            max_tokens: Load at most this many tokens, counted like
+                `History.message_tokens` (optional). When a limit cuts
+                the session, it is cut at the start of a user turn.
+                The latest summary record stands in for every message
+                before the ones it keeps.
+
+        Returns:
+            List[Message]: The messages, oldest first; empty for an unknown
+            session.
+        """
+
+    def append_summary(
+        self, session_id: str, summary: Message, kept: int
+    ) -> None:
+        """Append a summary of the older messages of a session.
+
+        Stores that do not override it keep no summaries, and restore the
+        summarized messages verbatim.
+
+        Args:
+            session_id: The session's identifier.
+            summary: The message that replaced the older messages.
+            kept: How many of the messages stored before it are kept
+                after it; the ones before those are replaced by it.
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session and all its messages."""
+
+    @abstractmethod
+    def session_ids(self) -> List[str]:
+        """Return the identifiers of every stored session."""
+
+    def close(self) -> None:
+        """Release the store's resources (files, connections)."""
@@ -1,3 +1,5 @@
 from .agent_service import AgentService
+from .history_compactor import HistoryCompactor
+from .session_manager import SessionManager
 
-__all__ = ['AgentService']
+__all__ = ['AgentService', 'HistoryCompactor', 'SessionManager']
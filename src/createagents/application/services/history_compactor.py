@@ -0,0 +1,253 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ...domain import Deadline, History, Message, MessageRole
+from ...infra import LoggingConfig
+from ..interfaces import ChatRepository
+
+SUMMARY_INSTRUCTIONS = (
+    'You summarize conversations between a user and an assistant. Write a '
+    'concise summary of the conversation you are given that keeps every '
+    'fact, decision, name, number and open question the assistant needs '
+    'to continue it. Reply with the summary only.'
+)
+SUMMARY_PREFIX = 'Summary of the earlier conversation:\n'
+
+
+class HistoryCompactor:
+    """Summarizes the older turns of long histories in the background.
+
+    Once a history holds more than `threshold_tokens`, its older turns are
+    sent to a (usually cheaper) summary model and replaced by one system
+    message with the summary; the most recent turns, up to
+    `keep_recent_tokens`, are kept verbatim. A previous summary is part of
+    the older turns, so summaries roll forward and the prompt stays about
+    the same size however long the conversation runs.
+
+    Compaction never delays a chat: it runs as a task on the event loop,
+    and until it finishes the history is used as is. If the history
+    changes underneath it (cleared or trimmed), the summary is discarded.
+    """
+
+    DEFAULT_THRESHOLD_TOKENS = 4000
+
+    def __init__(
+        self,
+        chat_repository: ChatRepository,
+        model: str,
+        threshold_tokens: int = DEFAULT_THRESHOLD_TOKENS,
+        keep_recent_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initializes the compactor.
+
+        Args:
+            chat_repository: Repository of the summary model.
+            model: Name of the summary model.
+            threshold_tokens: History size, in tokens, above which it is
+                compacted.
+            keep_recent_tokens: Tokens of recent turns kept verbatim
+                (default: half the threshold). The latest turn is always
+                kept.
+            timeout: Time budget of each summary request, in seconds
+                (optional).
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if threshold_tokens <= 0:
+            raise ValueError('threshold_tokens must be greater than zero.')
+        if keep_recent_tokens is None:
+            keep_recent_tokens = threshold_tokens // 2
+        if not 0 <= keep_recent_tokens < threshold_tokens:
+            raise ValueError(
+                'keep_recent_tokens must be between zero and threshold_tokens.'
+            )
+
+        self.__chat_repository = chat_repository
+        self.__model = model
+        self.__threshold_tokens = threshold_tokens
+        self.__keep_recent_tokens = keep_recent_tokens
+        self.__timeout = timeout
+        self.__tasks: Dict[int, asyncio.Task] = {}
+        self.__compactions = 0
+        self.__failed = 0
+        self.__stale = 0
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @property
+    def model(self) -> str:
+        """Name of the summary model."""
+        return self.__model
+
+    @property
+    def threshold_tokens(self) -> int:
+        """History size, in tokens, above which it is compacted."""
+        return self.__threshold_tokens
+
+    def schedule(
+        self,
+        history: History,
+        on_compacted: Optional[Callable[[Message], Awaitable[None]]] = None,
+    ) -> Optional[asyncio.Task]:
+        """
+        Starts compacting a history if it is over the threshold.
+
+        Must be called from a running event loop. A history already being
+        compacted is left alone.
+
+        Args:
+            history: The history to compact.
+            on_compacted: Called with the summary message, as stored in
+                the history, once it replaces the older turns, e.g. to
+                persist it (optional).
+
+        Returns:
+            The compaction task, or None if nothing was started.
+        """
+        if history.total_tokens <= self.__threshold_tokens:
+            return None
+
+        key = id(history)
+        running = self.__tasks.get(key)
+        if running is not None and not running.done():
+            return None
+
+        prefix = self.__older_turns(history.get_messages())
+        if not prefix:
+            return None
+
+        self.__logger.debug(
+            'Compacting %s message(s) (%s tokens in history) with %s',
+            len(prefix),
+            history.total_tokens,
+            self.__model,
+        )
+        task = asyncio.get_running_loop().create_task(
+            self.__compact(history, prefix, on_compacted)
+        )
+        self.__tasks[key] = task
+        task.add_done_callback(lambda done: self.__forget(key, done))
+        return task
+
+    async def wait(self) -> None:
+        """Waits for the compactions in progress to finish."""
+        tasks = list(self.__tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Cancels the compactions in progress and releases the repository.
+
+        The repository is the compactor's own handle on a shared
+        adapter, so closing it leaves the adapter open for the agents
+        that still hold it.
+        """
+        tasks = list(self.__tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self.__chat_repository.aclose()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns compaction counters.
+
+        Returns:
+            Dictionary with compactions (histories compacted), failed
+            (summary requests that failed), stale (summaries discarded
+            because the history changed) and in_progress.
+        """
+        return {
+            'compactions': self.__compactions,
+            'failed': self.__failed,
+            'stale': self.__stale,
+            'in_progress': sum(
+                1 for task in self.__tasks.values() if not task.done()
+            ),
+        }
+
+    def __older_turns(self, messages: List[Message]) -> List[Message]:
+        """Returns the messages before the recent turns kept verbatim."""
+        split: Optional[int] = None
+        kept = 0
+        for index in range(len(messages) - 1, -1, -1):
+            kept += messages[index].token_count or 0
+            if split is not None and kept > self.__keep_recent_tokens:
+                break
+            # Recent turns are kept whole, so the split is at a user turn.
+            if messages[index].role == MessageRole.USER:
+                split = index
+
+        prefix = messages[:split] if split is not None else []
+        # A lone message (e.g. the previous summary) is not worth it.
+        return prefix if len(prefix) > 1 else []
+
+    async def __compact(
+        self,
+        history: History,
+        prefix: List[Message],
+        on_compacted: Optional[Callable[[Message], Awaitable[None]]],
+    ) -> None:
+        transcript = '\n\n'.join(
+            f'{message.role.value}: {message.content}' for message in prefix
+        )
+        call_kwargs: Dict[str, Any] = {}
+        if self.__timeout is not None:
+            call_kwargs['deadline'] = Deadline(self.__timeout)
+
+        try:
+            summary = await self.__chat_repository.chat(
+                model=self.__model,
+                instructions=SUMMARY_INSTRUCTIONS,
+                config=None,
+                tools=None,
+                history=(),
+                user_ask=transcript,
+                **call_kwargs,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.__failed += 1
+            self.__logger.warning('History compaction failed: %s', e)
+            return
+
+        if not isinstance(summary, str) or not summary.strip():
+            self.__failed += 1
+            self.__logger.warning(
+                'History compaction failed: empty summary from %s',
+                self.__model,
+            )
+            return
+
+        replaced = history.replace_prefix(
+            prefix,
+            Message(
+                role=MessageRole.SYSTEM,
+                content=SUMMARY_PREFIX + summary.strip(),
+            ),
+        )
+        if not replaced:
+            self.__stale += 1
+            self.__logger.debug(
+                'History changed during compaction, summary discarded'
+            )
+            return
+        # The history stores the summary with its token count filled in.
+        stored = history.get_messages()[0]
+
+        self.__compactions += 1
+        self.__logger.info(
+            'Compacted %s message(s); history now %s tokens',
+            len(prefix),
+            history.total_tokens,
+        )
+        if on_compacted is not None:
+            await on_compacted(stored)
+
+    def __forget(self, key: int, task: asyncio.Task) -> None:
+        if self.__tasks.get(key) is task:
+            del self.__tasks[key]
@@ -0,0 +1,370 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from ...domain import History, Message
+from ...infra import LoggingConfig
+from ..interfaces import SessionStore
+
+
+class SessionManager:
+    """Keeps the histories of conversation sessions, keyed by session id.
+
+    Histories are created from a template (its size, token budget and
+    token counter). With a store, each finished turn is appended to it and
+    a session missing from memory is restored lazily, loading only what
+    fits in the template's limits. Summaries of compacted histories are
+    stored too, so a restored session resumes from its summary. Sessions
+    unused for `idle_ttl_s`
+    seconds, and the least recently used ones beyond `max_sessions`, are
+    dropped from memory; with a store they are restored on their next
+    use, without one they are forgotten.
+    """
+
+    def __init__(
+        self,
+        template: History,
+        store: Optional[SessionStore] = None,
+        idle_ttl_s: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+    ):
+        """
+        Initializes the manager.
+
+        Args:
+            template: History whose limits and token counter every
+                session history shares. Its messages are not copied.
+            store: Durable storage of the sessions (optional).
+            idle_ttl_s: Seconds after which an unused session is dropped
+                from memory (default: None, sessions are kept).
+            max_sessions: Most sessions held in memory; the least
+                recently used is dropped first (default: None, no limit).
+
+        Raises:
+            ValueError: If idle_ttl_s is not a positive number or
+                max_sessions is not a positive integer.
+        """
+        if idle_ttl_s is not None and (
+            isinstance(idle_ttl_s, bool)
+            or not isinstance(idle_ttl_s, (int, float))
+            or idle_ttl_s <= 0
+        ):
+            raise ValueError('idle_ttl_s must be a positive number.')
+        if max_sessions is not None and (
+            isinstance(max_sessions, bool)
+            or not isinstance(max_sessions, int)
+            or max_sessions <= 0
+        ):
+            raise ValueError('max_sessions must be a positive integer.')
+
+        self.__template = template
+        self.__store = store
+        self.__idle_ttl_s = idle_ttl_s
+        self.__max_sessions = max_sessions
+        # Least recently used first.
+        self.__histories: 'OrderedDict[str, History]' = OrderedDict()
+        self.__last_used: Dict[str, float] = {}
+        # Latest message of each session known to be in the store.
+        self.__persisted: Dict[str, Message] = {}
+        # Keeps a summary's kept count in step with the turns stored.
+        self.__write_lock = threading.Lock()
+        self.__restored = 0
+        self.__evicted_idle = 0
+        self.__evicted_lru = 0
+        self.__last_sweep = time.monotonic()
+        self.__lock = threading.Lock()
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @property
+    def store(self) -> Optional[SessionStore]:
+        """Durable storage of the sessions, if any."""
+        return self.__store
+
+    def get(self, session_id: str) -> History:
+        """
+        Returns a session's history, restoring it from the store if needed.
+
+        Blocks while the store is read; from async code use `aget`.
+
+        Args:
+            session_id: The session's identifier.
+
+        Returns:
+            History: The session's history (empty for a new session).
+        """
+        history = self.__cached(session_id)
+        if history is None:
+            history = self.__install(session_id, self.__load(session_id))
+        return history
+
+    async def aget(self, session_id: str) -> History:
+        """
+        Returns a session's history without blocking the event loop.
+
+        Args:
+            session_id: The session's identifier.
+
+        Returns:
+            History: The session's history (empty for a new session).
+        """
+        history = self.__cached(session_id)
+        if history is None:
+            messages = await asyncio.to_thread(self.__load, session_id)
+            history = self.__install(session_id, messages)
+        return history
+
+    async def record(
+        self, session_id: str, messages: Sequence[Message]
+    ) -> None:
+        """
+        Appends a finished turn to the store.
+
+        The history itself is updated by the caller. A failed write is
+        logged rather than raised, so the chat that produced the turn
+        still succeeds.
+
+        Args:
+            session_id: The session's identifier.
+            messages: The turn's messages, oldest first.
+        """
+        if self.__store is None:
+            return
+        try:
+            await asyncio.to_thread(self.__append, session_id, messages)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.__logger.error(
+                "Could not persist a turn of session '%s': %s", session_id, e
+            )
+
+    async def record_summary(
+        self, session_id: str, history: History, summary: Message
+    ) -> None:
+        """
+        Appends the summary that replaced a history's older turns.
+
+        Its record keeps the stored turns that follow it in the history,
+        so a restored session starts at the summary. A failed write is
+        logged rather than raised.
+
+        Args:
+            session_id: The session's identifier.
+            history: The session's history.
+            summary: The summary message, as stored in the history.
+        """
+        if self.__store is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.__append_summary, session_id, history, summary
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.__logger.error(
+                "Could not persist the summary of session '%s': %s",
+                session_id,
+                e,
+            )
+
+    def clear(self, session_id: str) -> None:
+        """
+        Clears a session, in memory and in the store.
+
+        Args:
+            session_id: The session's identifier.
+        """
+        with self.__lock:
+            history = self.__histories.get(session_id)
+            self.__persisted.pop(session_id, None)
+        if history is not None:
+            history.clear()
+        if self.__store is not None:
+            self.__store.delete(session_id)
+
+    def evict_idle(self) -> int:
+        """
+        Drops the sessions unused for longer than `idle_ttl_s` from memory.
+
+        Returns:
+            int: Number of sessions dropped.
+        """
+        if self.__idle_ttl_s is None:
+            return 0
+
+        now = time.monotonic()
+        idle = []
+        with self.__lock:
+            self.__last_sweep = now
+            # Oldest first, so the sweep stops at the first recent session.
+            for session_id in self.__histories:
+                if now - self.__last_used[session_id] <= self.__idle_ttl_s:
+                    break
+                idle.append(session_id)
+            for session_id in idle:
+                del self.__histories[session_id]
+                del self.__last_used[session_id]
+                self.__persisted.pop(session_id, None)
+            self.__evicted_idle += len(idle)
+
+        if idle:
+            self.__logger.debug('Evicted %s idle session(s)', len(idle))
+        return len(idle)
+
+    def session_ids(self) -> List[str]:
+        """Returns the sessions held in memory, least recently used first."""
+        with self.__lock:
+            return list(self.__histories)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns counters of the sessions held in memory.
+
+        Returns:
+            Dictionary with sessions (held in memory), max_sessions,
+            idle_ttl_s, restored (sessions loaded from the store),
+            evicted_idle, evicted_lru, and messages, tokens and bytes
+            summed over the sessions.
+        """
+        sessions = self.get_session_stats()
+        with self.__lock:
+            stats: Dict[str, Any] = {
+                'sessions': len(sessions),
+                'max_sessions': self.__max_sessions,
+                'idle_ttl_s': self.__idle_ttl_s,
+                'restored': self.__restored,
+                'evicted_idle': self.__evicted_idle,
+                'evicted_lru': self.__evicted_lru,
+            }
+        for key in ('messages', 'tokens', 'bytes'):
+            stats[key] = sum(item[key] for item in sessions.values())
+        return stats
+
+    def get_session_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the memory held by each session.
+
+        Returns:
+            Dictionary keyed by session id; each value holds messages,
+            tokens (as counted for the token budget), bytes (approximate
+            memory of the message contents) and idle_s (seconds since
+            last use).
+        """
+        now = time.monotonic()
+        with self.__lock:
+            sessions = [
+                (session_id, history, self.__last_used[session_id])
+                for session_id, history in self.__histories.items()
+            ]
+        return {
+            session_id: {
+                'messages': len(history),
+                'tokens': history.total_tokens,
+                'bytes': sum(
+                    sys.getsizeof(message.content)
+                    for message in history.get_messages()
+                ),
+                'idle_s': now - last_used,
+            }
+            for session_id, history, last_used in sessions
+        }
+
+    def close(self) -> None:
+        """Closes the store."""
+        if self.__store is not None:
+            self.__store.close()
+
+    def __cached(self, session_id: str) -> Optional[History]:
+        """Returns a session held in memory and marks it as used."""
+        self.__maybe_sweep(session_id)
+        with self.__lock:
+            history = self.__histories.get(session_id)
+            if history is not None:
+                self.__histories.move_to_end(session_id)
+                self.__last_used[session_id] = time.monotonic()
+            return history
+
+    def __load(self, session_id: str) -> List[Message]:
+        if self.__store is None:
+            return []
+        messages = self.__store.load(
+            session_id,
+            max_messages=self.__template.max_size,
+            max_tokens=self.__template.max_tokens,
+        )
+        if messages:
+            self.__logger.debug(
+                "Restored %s message(s) of session '%s'",
+                len(messages),
+                session_id,
+            )
+        return messages
+
+    def __append(self, session_id: str, messages: Sequence[Message]) -> None:
+        assert self.__store is not None
+        with self.__write_lock:
+            self.__store.append(session_id, messages)
+            if messages:
+                with self.__lock:
+                    self.__persisted[session_id] = messages[-1]
+
+    def __append_summary(
+        self, session_id: str, history: History, summary: Message
+    ) -> None:
+        assert self.__store is not None
+        with self.__write_lock:
+            messages = history.get_messages()
+            start = next(
+                (i for i, m in enumerate(messages) if m is summary), None
+            )
+            if start is None:
+                # Replaced by a newer summary or trimmed away meanwhile.
+                return
+            with self.__lock:
+                last = self.__persisted.get(session_id)
+            # Turns still being written land after the summary record.
+            kept = 0
+            for index in range(len(messages) - 1, start, -1):
+                if messages[index] is last:
+                    kept = index - start
+                    break
+            self.__store.append_summary(session_id, summary, kept)
+
+    def __install(self, session_id: str, messages: List[Message]) -> History:
+        history = History.from_messages(
+            messages,
+            max_size=self.__template.max_size,
+            max_tokens=self.__template.max_tokens,
+            token_counter=self.__template.token_counter,
+        )
+        with self.__lock:
+            # Another caller may have restored the session meanwhile.
+            if session_id in self.__histories:
+                history = self.__histories[session_id]
+            else:
+                self.__histories[session_id] = history
+                if messages:
+                    self.__restored += 1
+                    self.__persisted[session_id] = history.get_messages()[-1]
+            self.__histories.move_to_end(session_id)
+            self.__last_used[session_id] = time.monotonic()
+            if self.__max_sessions is not None:
+                while len(self.__histories) > self.__max_sessions:
+                    evicted, _ = self.__histories.popitem(last=False)
+                    del self.__last_used[evicted]
+                    self.__persisted.pop(evicted, None)
+                    self.__evicted_lru += 1
+            return history
+
+    def __maybe_sweep(self, session_id: str) -> None:
+        """Evicts idle sessions, at most twice per `idle_ttl_s`."""
+        if self.__idle_ttl_s is None:
+            return
+        if time.monotonic() - self.__last_sweep < self.__idle_ttl_s / 2:
+            return
+        with self.__lock:
+            # The session being requested is not idle.
+            if session_id in self.__histories:
+                self.__histories.move_to_end(session_id)
+                self.__last_used[session_id] = time.monotonic()
+        self.evict_idle()
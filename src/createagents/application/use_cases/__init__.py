@@ -1,3 +1,4 @@
+from .chat_many_with_agent import ChatManyWithAgentUseCase
 from .chat_with_agent import ChatWithAgentUseCase
 from .create_agent import CreateAgentUseCase
 from .get_all_available_tools import GetAllAvailableToolsUseCase
@@ -7,6 +8,7 @@ from .get_system_available_tools import GetSystemAvailableToolsUseCase
 __all__ = [
     'CreateAgentUseCase',
     'ChatWithAgentUseCase',
+    'ChatManyWithAgentUseCase',
     'GetAgentConfigUseCase',
     'GetAllAvailableToolsUseCase',
     'GetSystemAvailableToolsUseCase',
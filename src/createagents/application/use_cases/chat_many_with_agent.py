@@ -0,0 +1,227 @@
+import asyncio
+import dataclasses
+import time
+from typing import AsyncGenerator, List, Optional, Sequence
+
+from ...domain import Agent
+from ...infra import LoggingConfig, MetricsScope
+from ..dtos import ChatBatchItemDTO, ChatBatchOutputDTO, ChatInputDTO
+from .chat_with_agent import ChatWithAgentUseCase
+
+
+class ChatManyWithAgentUseCase:
+    """
+    Use case for sending many independent messages through one agent.
+
+    Messages fan out over the agent's chat use case (and therefore its
+    cached chat adapter) with at most `concurrency` requests in flight.
+    A failing message is reported in its own result and does not abort
+    the batch.
+    """
+
+    def __init__(self, chat_use_case: ChatWithAgentUseCase):
+        """
+        Initializes the Use Case with its dependencies.
+
+        Args:
+            chat_use_case: The use case that answers a single message.
+        """
+        self.__chat_use_case = chat_use_case
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    async def execute(
+        self,
+        agent: Agent,
+        messages: Sequence[str],
+        concurrency: int,
+        isolated_history: bool = True,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+    ) -> ChatBatchOutputDTO:
+        """
+        Sends every message and returns the results in input order.
+
+        Args:
+            agent: The agent instance.
+            messages: The user messages.
+            concurrency: Maximum number of messages in flight.
+            isolated_history: If True, each message sees a private copy of
+                the agent's current history and the agent's history is
+                left untouched; if False, all messages share (and update)
+                the agent's history.
+            timeout: Optional time budget of each message, in seconds.
+            session_id: Continue this session instead of the agent's own
+                history (optional).
+
+        Returns:
+            ChatBatchOutputDTO: Results in input order plus throughput.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer, or a
+                session id is given but sessions are not enabled.
+        """
+        start_time = time.perf_counter()
+
+        results: List[Optional[ChatBatchItemDTO]] = [None] * len(messages)
+        async for item in self.iterate(
+            agent, messages, concurrency, isolated_history, timeout, session_id
+        ):
+            results[item.index] = item
+
+        # Each item counts the tokens of its own requests; the adapter's
+        # metrics list is shared with anything else running concurrently.
+        tokens = [
+            item.tokens_used for item in results if item and item.tokens_used
+        ]
+
+        return ChatBatchOutputDTO(
+            results=[item for item in results if item is not None],
+            elapsed_ms=(time.perf_counter() - start_time) * 1000,
+            tokens_used=sum(tokens) if tokens else None,
+        )
+
+    async def iterate(
+        self,
+        agent: Agent,
+        messages: Sequence[str],
+        concurrency: int,
+        isolated_history: bool = True,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncGenerator[ChatBatchItemDTO, None]:
+        """
+        Sends every message and yields each result as soon as it completes.
+
+        Closing the iterator early cancels the messages still in flight.
+
+        Args:
+            agent: The agent instance.
+            messages: The user messages.
+            concurrency: Maximum number of messages in flight.
+            isolated_history: See `execute`.
+            timeout: See `execute`.
+            session_id: See `execute`.
+
+        Yields:
+            ChatBatchItemDTO: One result per message, in completion order.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer, or a
+                session id is given but sessions are not enabled.
+        """
+        if (
+            isinstance(concurrency, bool)
+            or not isinstance(concurrency, int)
+            or concurrency <= 0
+        ):
+            raise ValueError(
+                "The 'concurrency' field must be a positive integer."
+            )
+        if session_id is not None:
+            history = await self.__chat_use_case.resolve_history(
+                agent, session_id
+            )
+            if isolated_history:
+                # Copies of the session's history; the session is unchanged.
+                agent = dataclasses.replace(agent, history=history)
+                session_id = None
+
+        self.__logger.info(
+            "Running batch of %s message(s) with agent '%s' "
+            '(concurrency: %s, isolated history: %s)',
+            len(messages),
+            agent.name,
+            concurrency,
+            isolated_history,
+        )
+
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [
+            asyncio.ensure_future(
+                self.__run_one(
+                    agent,
+                    index,
+                    message,
+                    semaphore,
+                    isolated_history,
+                    timeout,
+                    session_id,
+                )
+            )
+            for index, message in enumerate(messages)
+        ]
+        failed = 0
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                if not item.success:
+                    failed += 1
+                yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        elapsed = time.perf_counter() - start_time
+        self.__logger.info(
+            'Batch completed: %s message(s), %s failed, %.2fs, %.2f req/s',
+            len(messages),
+            failed,
+            elapsed,
+            len(messages) / elapsed if elapsed > 0 else 0.0,
+        )
+
+    async def __run_one(
+        self,
+        agent: Agent,
+        index: int,
+        message: str,
+        semaphore: asyncio.Semaphore,
+        isolated_history: bool,
+        timeout: Optional[float],
+        session_id: Optional[str],
+    ) -> ChatBatchItemDTO:
+        async with semaphore:
+            start_time = time.perf_counter()
+            target = self.__isolate(agent) if isolated_history else agent
+            scope = MetricsScope()
+            try:
+                with scope:
+                    result = await self.__chat_use_case.execute(
+                        target,
+                        ChatInputDTO(
+                            message=message,
+                            timeout=timeout,
+                            session_id=session_id,
+                        ),
+                    )
+                    if isinstance(result, AsyncGenerator):
+                        response = ''.join([token async for token in result])
+                    else:
+                        response = result.response
+            except Exception as e:
+                self.__logger.warning(
+                    'Batch message %s failed: %s', index, str(e)
+                )
+                return ChatBatchItemDTO(
+                    index=index,
+                    message=message,
+                    error=str(e),
+                    latency_ms=(time.perf_counter() - start_time) * 1000,
+                    tokens_used=scope.tokens_used,
+                )
+
+            return ChatBatchItemDTO(
+                index=index,
+                message=message,
+                response=response,
+                latency_ms=(time.perf_counter() - start_time) * 1000,
+                tokens_used=scope.tokens_used,
+            )
+
+    @staticmethod
+    def __isolate(agent: Agent) -> Agent:
+        """Returns a copy of the agent with a private copy of its history."""
+        return dataclasses.replace(agent, history=agent.history.copy())
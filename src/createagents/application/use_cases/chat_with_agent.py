@@ -1,9 +1,20 @@
-from typing import AsyncGenerator, List, Union
+import asyncio
+import functools
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
-from ...domain import Agent, ChatException
-from ...infra import ChatMetrics, LoggingConfig
+from ...domain import (
+    Agent,
+    ChatException,
+    Deadline,
+    History,
+    Message,
+    MessageRole,
+)
+from ...infra import ChatMetrics, ConversationScope, LoggingConfig
 from ..dtos import ChatInputDTO, ChatOutputDTO
 from ..interfaces import ChatRepository
+from ..services import HistoryCompactor, SessionManager
 
 
 class ChatWithAgentUseCase:
@@ -16,14 +27,31 @@ class ChatWithAgentUseCase:
     the interaction.
     """
 
-    def __init__(self, chat_repository: ChatRepository):
+    def __init__(
+        self,
+        chat_repository: ChatRepository,
+        tool_pool: Optional[str] = None,
+        compactor: Optional[HistoryCompactor] = None,
+        sessions: Optional[SessionManager] = None,
+    ):
         """
         Initializes the Use Case with its dependencies.
 
         Args:
             chat_repository: Repository for AI communication.
+            tool_pool: `ToolPools` pool for the agent's synchronous tools
+                that do not choose one themselves (optional).
+            compactor: Summarizes the older turns of long histories in
+                the background after each turn (optional).
+            sessions: Histories of the sessions named by
+                `ChatInputDTO.session_id`, persisted turn by turn if it
+                has a store (optional).
         """
         self.__chat_repository = chat_repository
+        self.__tool_pool = tool_pool
+        self.__compactor = compactor
+        self.__sessions = sessions
+        self.__conversation_prefix = uuid.uuid4().hex
         self.__logger = LoggingConfig.get_logger(__name__)
 
     async def execute(
@@ -32,6 +60,9 @@ class ChatWithAgentUseCase:
         """
         Sends a message to the agent and returns the response.
 
+        The conversation continues the session named by
+        `input_dto.session_id`, or else the agent's own history.
+
         Args:
             agent: The agent instance.
             input_dto: DTO with the user's message.
@@ -42,28 +73,48 @@ class ChatWithAgentUseCase:
                 - AsyncGenerator: Token stream (if stream=True)
 
         Raises:
-            ValueError: If the input data is invalid.
+            ValueError: If the input data is invalid, or a session id is
+                given but sessions are not enabled.
+            ChatTimeoutException: If `input_dto.timeout` runs out first.
             ChatException: If an error occurs during AI communication.
         """
         input_dto.validate()
+        history = await self.resolve_history(agent, input_dto.session_id)
 
         self.__logger.info(
             "Running chat with agent '%s' (model: %s)", agent.name, agent.model
         )
         self.__logger.debug('User message: %s...', input_dto.message[:100])
 
+        call_kwargs: Dict[str, Any] = {}
+        if input_dto.timeout is not None:
+            # Repositories written before deadlines existed keep working.
+            call_kwargs['deadline'] = Deadline(input_dto.timeout)
+        if self.__tool_pool is not None:
+            call_kwargs['tool_pool'] = self.__tool_pool
+
+        # Each session (or the agent's own history) is its own
+        # conversation for repositories that keep provider-side state.
+        conversation = (
+            f'{self.__conversation_prefix}/{input_dto.session_id or ""}'
+        )
+
         try:
-            response = await self.__chat_repository.chat(
-                model=agent.model,
-                instructions=agent.instructions,
-                config=agent.config,
-                tools=agent.tools,
-                history=agent.history.to_dict_list(),
-                user_ask=input_dto.message,
-            )
+            with ConversationScope(conversation):
+                response = await self.__chat_repository.chat(
+                    model=agent.model,
+                    instructions=agent.instructions,
+                    config=agent.config,
+                    tools=agent.tools,
+                    history=history.snapshot(),
+                    user_ask=input_dto.message,
+                    **call_kwargs,
+                )
 
             if isinstance(response, AsyncGenerator):
-                return self.__handle_streaming(agent, input_dto, response)
+                return self.__handle_streaming(
+                    agent, history, input_dto, response
+                )
 
             # Standard non-streaming response
             if not response:
@@ -72,8 +123,7 @@ class ChatWithAgentUseCase:
 
             output_dto = ChatOutputDTO(response=response)
 
-            agent.add_user_message(input_dto.message)
-            agent.add_assistant_message(response)
+            await self.__record_turn(history, input_dto, response)
 
             self.__logger.info('Chat executed successfully')
             self.__logger.debug(
@@ -114,6 +164,7 @@ class ChatWithAgentUseCase:
     async def __handle_streaming(
         self,
         agent: Agent,
+        history: History,
         input_dto: ChatInputDTO,
         stream: AsyncGenerator[str, None],
     ) -> AsyncGenerator[str, None]:
@@ -125,8 +176,12 @@ class ChatWithAgentUseCase:
         2. Accumulates the complete response
         3. Updates the agent's conversation history after streaming completes
 
+        If the consumer stops early (closes or cancels the stream), the
+        underlying stream is closed and the history is not updated.
+
         Args:
             agent: The agent instance.
+            history: The history the turn is added to.
             input_dto: DTO with the user's message.
             stream: The token generator from the repository.
 
@@ -152,15 +207,19 @@ class ChatWithAgentUseCase:
                 self.__logger.error('Empty response received from stream')
                 raise ChatException('Empty response received from stream')
 
-            # Update agent's conversation history
-            agent.add_user_message(input_dto.message)
-            agent.add_assistant_message(complete_text)
+            # Update the conversation history
+            await self.__record_turn(history, input_dto, complete_text)
             self.__logger.info('Streaming chat executed successfully')
             self.__logger.debug(
                 'Complete response (first 100 chars): %s...',
                 complete_text[:100] if complete_text else '',
             )
 
+        except (asyncio.CancelledError, GeneratorExit):
+            self.__logger.info(
+                'Streaming cancelled by the consumer, history left unchanged'
+            )
+            raise
         except ChatException:
             self.__logger.error(
                 'ChatException during streaming', exc_info=True
@@ -174,6 +233,96 @@ class ChatWithAgentUseCase:
                 f'Error during streaming: {str(e)}',
                 original_error=e,
             ) from e
+        finally:
+            # Propagates an early stop to the upstream request and tools.
+            await stream.aclose()
+
+    async def warmup(self, agent: Agent) -> None:
+        """
+        Warms up the chat repository for the agent's model.
+
+        Args:
+            agent: The agent instance.
+
+        Raises:
+            ChatException: If the model could not be warmed up.
+        """
+        self.__logger.info('Warming up model %s', agent.model)
+        try:
+            await self.__chat_repository.warmup(agent.model)
+        except ChatException:
+            raise
+        except Exception as e:
+            self.__logger.error(
+                'Error warming up model %s: %s', agent.model, e
+            )
+            raise ChatException(
+                f'Error warming up model {agent.model}: {str(e)}', e
+            ) from e
+
+    async def aclose(self) -> None:
+        """Releases the agent's hold on the chat repository.
+
+        Compactions still in progress are cancelled. A repository shared
+        with other agents is only closed by its last holder.
+        """
+        if self.__compactor is not None:
+            await self.__compactor.aclose()
+        await self.__chat_repository.aclose()
+
+    def get_compaction_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the compactor's counters.
+
+        Returns:
+            The counters, or None if compaction is disabled.
+        """
+        if self.__compactor is None:
+            return None
+        return self.__compactor.get_stats()
+
+    async def resolve_history(
+        self, agent: Agent, session_id: Optional[str] = None
+    ) -> History:
+        """
+        Returns the history a chat continues.
+
+        Args:
+            agent: The agent instance.
+            session_id: A session's identifier (optional).
+
+        Returns:
+            History: The session's history, or the agent's own history
+                when no session id is given.
+
+        Raises:
+            ValueError: If a session id is given but sessions are not
+                enabled.
+        """
+        if session_id is None:
+            return agent.history
+        if self.__sessions is None:
+            raise ValueError('Sessions are not enabled for this agent.')
+        return await self.__sessions.aget(session_id)
+
+    async def __record_turn(
+        self, history: History, input_dto: ChatInputDTO, response: str
+    ) -> None:
+        """Adds a finished turn to the history and persists it."""
+        turn = [
+            history.add(
+                Message(role=MessageRole.USER, content=input_dto.message)
+            ),
+            history.add(Message(role=MessageRole.ASSISTANT, content=response)),
+        ]
+        on_compacted = None
+        if input_dto.session_id is not None and self.__sessions is not None:
+            await self.__sessions.record(input_dto.session_id, turn)
+            on_compacted = functools.partial(
+                self.__sessions.record_summary, input_dto.session_id, history
+            )
+        if self.__compactor is not None:
+            self.__compactor.schedule(history, on_compacted)
 
     def get_metrics(self) -> List[ChatMetrics]:
         """
@@ -52,7 +52,11 @@ class CreateAgentUseCase:
             instructions=input_dto.instructions,
             config=input_dto.config,
             tools=input_dto.tools,  # type: ignore
-            history=History(max_size=input_dto.history_max_size),
+            history=History(
+                max_size=input_dto.history_max_size,
+                max_tokens=input_dto.history_max_tokens,
+                token_counter=input_dto.token_counter,
+            ),
         )
 
         self.__logger.info(
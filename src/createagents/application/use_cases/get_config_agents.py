@@ -36,6 +36,7 @@ class GetAgentConfigUseCase:
             tools=agent.tools,
             history=agent.history.to_dict_list(),
             history_max_size=agent.history.max_size,
+            history_max_tokens=agent.history.max_tokens,
         )
 
         self.__logger.debug(
@@ -3,6 +3,8 @@ from .exceptions import (
     AdapterNotFoundException,
     AgentException,
     ChatException,
+    ChatTimeoutException,
+    CircuitOpenException,
     FileReadException,
     InvalidAgentConfigException,
     InvalidBaseToolException,
@@ -11,10 +13,20 @@ from .exceptions import (
     InvalidProviderException,
     UnsupportedConfigException,
 )
-from .services import ToolExecutionResult, ToolExecutor
+from .interfaces import TokenCounter
+from .services import (
+    ToolExecutionResult,
+    ToolExecutor,
+    ToolPool,
+    ToolPools,
+    ToolResultCache,
+    ToolScheduler,
+)
 from .value_objects import (
+    ApproximateTokenCounter,
     BaseTool,
     ChatResponse,
+    Deadline,
     History,
     Message,
     MessageRole,
@@ -33,14 +45,20 @@ __all__ = [
     'InvalidBaseToolException',
     'ChatException',
     'AdapterNotFoundException',
+    'CircuitOpenException',
+    'ChatTimeoutException',
     'FileReadException',
     'InvalidProviderException',
     'UnsupportedConfigException',
     'InvalidConfigTypeException',
+    # interfaces
+    'TokenCounter',
     # value objects
+    'ApproximateTokenCounter',
     'Message',
     'MessageRole',
     'History',
+    'Deadline',
     'BaseTool',
     'ChatResponse',
     'ToolCallInfo',
@@ -49,4 +67,8 @@ __all__ = [
     # services
     'ToolExecutor',
     'ToolExecutionResult',
+    'ToolPool',
+    'ToolPools',
+    'ToolResultCache',
+    'ToolScheduler',
 ]
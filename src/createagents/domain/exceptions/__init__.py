@@ -2,6 +2,8 @@ from .domain_exceptions import (
     AdapterNotFoundException,
     AgentException,
     ChatException,
+    ChatTimeoutException,
+    CircuitOpenException,
     FileReadException,
     InvalidAgentConfigException,
     InvalidBaseToolException,
@@ -17,6 +19,8 @@ __all__ = [
     'InvalidModelException',
     'ChatException',
     'AdapterNotFoundException',
+    'CircuitOpenException',
+    'ChatTimeoutException',
     'InvalidProviderException',
     'UnsupportedConfigException',
     'InvalidConfigTypeException',
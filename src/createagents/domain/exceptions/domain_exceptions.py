@@ -44,6 +44,41 @@ class AdapterNotFoundException(ChatException):
         super().__init__(message)
 
 
+class CircuitOpenException(ChatException):
+    """Exception raised when a circuit breaker rejects a request.
+
+    Attributes:
+        circuit: Name of the open circuit (provider and model).
+        retry_after: Seconds until the circuit probes for recovery.
+    """
+
+    def __init__(self, circuit: str, retry_after: float):
+        self.circuit = circuit
+        self.retry_after = max(retry_after, 0.0)
+        message = (
+            f"Circuit '{circuit}' is open; the provider is failing. "
+            f'Retry in {self.retry_after:.1f}s.'
+        )
+        super().__init__(message)
+
+
+class ChatTimeoutException(ChatException):
+    """Exception raised when a chat call runs past its deadline.
+
+    Attributes:
+        timeout_s: The time budget of the call, in seconds.
+        stage: What the call was doing when the budget ran out.
+    """
+
+    def __init__(self, timeout_s: float, stage: Optional[str] = None):
+        self.timeout_s = timeout_s
+        self.stage = stage
+        message = f'Chat did not complete within {timeout_s:g}s'
+        if stage:
+            message += f' (while {stage})'
+        super().__init__(message + '.')
+
+
 class InvalidProviderException(AgentException):
     """Exception raised when the provider is not supported."""
 
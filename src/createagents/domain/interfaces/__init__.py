@@ -1,3 +1,4 @@
 from .logger_interface import LoggerInterface
+from .token_counter import TokenCounter
 
-__all__ = ['LoggerInterface']
+__all__ = ['LoggerInterface', 'TokenCounter']
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class TokenCounter(ABC):
+    """Counts the tokens of a text.
+
+    Used by `History` to keep a token budget. Implementations range from
+    an exact tokenizer (e.g. tiktoken) to a cheap estimate.
+    """
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in a text."""
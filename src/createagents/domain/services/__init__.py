@@ -1,3 +1,13 @@
 from .tool_executor import ToolExecutionResult, ToolExecutor
+from .tool_pools import ToolPool, ToolPools
+from .tool_result_cache import ToolResultCache
+from .tool_scheduler import ToolScheduler
 
-__all__ = ['ToolExecutor', 'ToolExecutionResult']
+__all__ = [
+    'ToolExecutor',
+    'ToolExecutionResult',
+    'ToolPool',
+    'ToolPools',
+    'ToolResultCache',
+    'ToolScheduler',
+]
@@ -1,9 +1,19 @@
+import asyncio
 import json
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from ..exceptions import ChatTimeoutException
 from ..interfaces import LoggerInterface
-from ..value_objects import BaseTool
+from ..value_objects import BaseTool, Deadline
+from .tool_pools import ToolPools
+from .tool_result_cache import ToolResultCache
+from .tool_scheduler import ToolScheduler
+
+
+class _ToolTimeout(Exception):
+    """Raised when a tool exceeds its own `timeout_s`."""
 
 
 @dataclass
@@ -58,6 +68,12 @@ class ToolExecutor:
 
     Responsibilities:
     - Execute tools by name with given arguments
+    - Schedule executions according to each tool's declarations
+      (`parallel_safe`, `max_concurrency`, `timeout_s`, `idempotent`)
+      through the process-wide `ToolScheduler`
+    - Reuse results of `cacheable` tools through a `ToolResultCache`
+    - Run synchronous tools on the `ToolPools` pool they (or the agent)
+      select, or on the event loop's default thread pool
     - Handle errors gracefully
     - Return structured results
 
@@ -70,16 +86,40 @@ class ToolExecutor:
         ```
     """
 
-    def __init__(self, tools: List[BaseTool], logger: LoggerInterface):
+    def __init__(
+        self,
+        tools: List[BaseTool],
+        logger: LoggerInterface,
+        result_cache: Optional[ToolResultCache] = None,
+        deadline: Optional[Deadline] = None,
+        default_pool: Optional[str] = None,
+    ):
         """Initialize the executor with available tools and logger.
 
         Args:
             tools: List of tool instances available for execution.
                    If None, no tools will be available.
             logger: Logger instance for logging tool execution events.
+            result_cache: Cache for results of cacheable tools. Defaults
+                   to the process-wide `ToolResultCache.get_shared()`.
+            deadline: Deadline of the chat call the tools run for. Each
+                   execution, including the wait for a scheduler slot, is
+                   bounded by the time left.
+            default_pool: `ToolPools` pool for synchronous tools that do
+                   not name one in their `pool` attribute. None uses the
+                   event loop's default thread pool.
         """
         self._tools_map: Dict[str, BaseTool] = {}
         self.__logger = logger
+        self.__result_cache = (
+            result_cache
+            if result_cache is not None
+            else ToolResultCache.get_shared()
+        )
+        self.__deadline = deadline
+        self.__default_pool = default_pool
+        self.__cache_hits = 0
+        self.__cache_misses = 0
 
         for tool in tools:
             self._tools_map[tool.name] = tool
@@ -116,6 +156,10 @@ class ToolExecutor:
         """
         return tool_name in self._tools_map
 
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return result cache hits and misses seen by this executor."""
+        return {'hits': self.__cache_hits, 'misses': self.__cache_misses}
+
     async def execute_tool(
         self, tool_name: str, **kwargs: Any
     ) -> ToolExecutionResult:
@@ -131,6 +175,10 @@ class ToolExecutor:
         Returns:
             A ToolExecutionResult containing the execution outcome.
 
+        Raises:
+            ChatTimeoutException: If the executor's deadline passes before
+                the tool finishes.
+
         Example:
             ```python
             result = await executor.execute_tool(
@@ -160,27 +208,42 @@ class ToolExecutor:
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
 
+        tool = self._tools_map[tool_name]
+        cacheable = ToolResultCache.is_cacheable(tool)
+        if cacheable:
+            # A hit is served inline, without a scheduler slot or thread hop.
+            hit, cached_result = self.__result_cache.get(tool, kwargs)
+            if hit:
+                self.__cache_hits += 1
+                self.__logger.info("Tool '%s' served from cache", tool_name)
+                return ToolExecutionResult(
+                    tool_name=tool_name,
+                    success=True,
+                    result=cached_result,
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                )
+            self.__cache_misses += 1
+
         try:
-            tool = self._tools_map[tool_name]
             self.__logger.debug(
                 "Executing tool '%s' with %s argument(s)",
                 tool_name,
                 len(kwargs),
             )
 
-            import asyncio  # pylint: disable=import-outside-toplevel
-
-            if asyncio.iscoroutinefunction(tool.execute):
-                result = await tool.execute(**kwargs)
-            else:
-                # Run synchronous tools in a separate thread to avoid blocking
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(
-                    None, lambda: tool.execute(**kwargs)
+            if self.__deadline is not None:
+                result = await self.__deadline.run(
+                    self.__run_tool(tool, kwargs),
+                    f"running tool '{tool_name}'",
                 )
+            else:
+                result = await self.__run_tool(tool, kwargs)
 
             execution_time = (time.time() - start_time) * 1000
 
+            if cacheable:
+                self.__result_cache.set(tool, kwargs, result)
+
             self.__logger.info(
                 "Tool '%s' executed successfully in %.2fms",
                 tool_name,
@@ -197,6 +260,30 @@ class ToolExecutor:
                 execution_time_ms=execution_time,
             )
 
+        except ChatTimeoutException:
+            self.__logger.error(
+                "Deadline reached while running tool '%s'", tool_name
+            )
+            raise
+
+        except asyncio.CancelledError:
+            # Synchronous tools keep their thread until they return.
+            self.__logger.info("Tool '%s' cancelled", tool_name)
+            raise
+
+        except _ToolTimeout:
+            execution_time = (time.time() - start_time) * 1000
+            error_msg = f"Tool '{tool_name}' timed out after {tool.timeout_s}s"
+            self.__logger.error(
+                '%s (execution time: %.2fms)', error_msg, execution_time
+            )
+            return ToolExecutionResult(
+                tool_name=tool_name,
+                success=False,
+                error=error_msg,
+                execution_time_ms=execution_time,
+            )
+
         except TypeError as e:
             error_msg = f"Invalid arguments for tool '{tool_name}': {str(e)}"
             execution_time = (time.time() - start_time) * 1000
@@ -249,7 +336,10 @@ class ToolExecutor:
             )
 
     async def execute_multiple_tools(
-        self, tool_calls: List[Dict[str, Any]], parallel: bool = False
+        self,
+        tool_calls: List[Dict[str, Any]],
+        parallel: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> List[ToolExecutionResult]:
         """Execute multiple tools in sequence or parallel.
 
@@ -260,9 +350,12 @@ class ToolExecutor:
                      If False (default), execute tools sequentially.
                      Use parallel execution with caution as it may cause
                      race conditions if tools have side effects.
+            max_concurrency: Maximum number of tools running at once in
+                     parallel mode (default: unlimited).
 
         Returns:
-            List of ToolExecutionResult objects.
+            List of ToolExecutionResult objects, in the same order as
+            `tool_calls`.
 
         Example:
             ```python
@@ -286,7 +379,7 @@ class ToolExecutor:
         )
 
         if parallel:
-            return await self._execute_parallel(tool_calls)
+            return await self._execute_parallel(tool_calls, max_concurrency)
         else:
             return await self._execute_sequential(tool_calls)
 
@@ -348,22 +441,34 @@ class ToolExecutor:
         return results
 
     async def _execute_parallel(
-        self, tool_calls: List[Dict[str, Any]]
+        self,
+        tool_calls: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
     ) -> List[ToolExecutionResult]:
         """Execute tools in parallel using asyncio.gather().
 
-        WARNING: Parallel execution may cause race conditions if tools
-        have side effects or depend on each other's results.
+        Tools that are not `parallel_safe` are still serialized by the
+        scheduler, and identical calls to `idempotent` tools are executed
+        only once, sharing the result.
 
         Args:
             tool_calls: List of tool call specifications.
+            max_concurrency: Maximum number of tools running at once.
 
         Returns:
             List of ToolExecutionResult objects.
         """
-        import asyncio  # pylint: disable=import-outside-toplevel
+        tasks: List[Any] = []
+        shared: Dict[str, Any] = {}
+        semaphore = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency is not None and max_concurrency > 0
+            else None
+        )
 
-        tasks = []
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
 
         for idx, call in enumerate(tool_calls, 1):
             tool_name = call.get('name', '')
@@ -390,7 +495,9 @@ class ToolExecutor:
                     )
 
                     # Create a coroutine that returns the error result
-                    async def error_result():
+                    async def error_result(
+                        tool_name=tool_name, error_msg=error_msg
+                    ):
                         return ToolExecutionResult(
                             tool_name=tool_name,
                             success=False,
@@ -400,8 +507,23 @@ class ToolExecutor:
                     tasks.append(error_result())
                     continue
 
+            dedup_key = self.get_dedup_key(tool_name, arguments)
+            if dedup_key is not None and dedup_key in shared:
+                self.__logger.debug(
+                    "Reusing identical idempotent call to '%s'", tool_name
+                )
+                tasks.append(shared[dedup_key])
+                continue
+
             # Create task for this tool execution
-            task = self.execute_tool(tool_name, **arguments)
+            task: Awaitable[ToolExecutionResult] = self.execute_tool(
+                tool_name, **arguments
+            )
+            if semaphore is not None:
+                task = bounded(task)
+            if dedup_key is not None:
+                task = asyncio.ensure_future(task)
+                shared[dedup_key] = task
             tasks.append(task)
 
         # Execute all tasks in parallel
@@ -416,3 +538,98 @@ class ToolExecutor:
         )
 
         return list(results)
+
+    async def __run_tool(self, tool: BaseTool, kwargs: Dict[str, Any]) -> Any:
+        """Runs a tool in its scheduler slot, bounded by its `timeout_s`.
+
+        A synchronous tool cannot be interrupted once a worker runs it, so
+        its slot is only freed when the worker returns (or when the call
+        is dropped before starting), even if the caller stopped waiting.
+        """
+        timeout_s = getattr(tool, 'timeout_s', None)
+        if asyncio.iscoroutinefunction(tool.execute):
+            async with ToolScheduler.slot(tool):
+                return await self.__bounded(tool.execute(**kwargs), timeout_s)
+
+        loop = asyncio.get_running_loop()
+        release = await ToolScheduler.acquire(tool)
+        try:
+            future = self.__submit_sync(tool, kwargs)
+        except BaseException:
+            release()
+            raise
+        future.add_done_callback(lambda _: self.__call_soon(loop, release))
+        return await self.__bounded(asyncio.wrap_future(future), timeout_s)
+
+    def __submit_sync(self, tool: BaseTool, kwargs: Dict[str, Any]) -> Future:
+        """Runs a synchronous tool off the loop to avoid blocking it."""
+        pool = getattr(tool, 'pool', None) or self.__default_pool
+        if pool:
+            return ToolPools.get(pool).submit(tool.execute, **kwargs)
+
+        future: Future = Future()
+
+        def call() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(tool.execute(**kwargs))
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+
+        asyncio.get_running_loop().run_in_executor(None, call)
+        return future
+
+    @staticmethod
+    async def __bounded(
+        call: Awaitable[Any], timeout_s: Optional[float]
+    ) -> Any:
+        """Awaits a tool call, raising _ToolTimeout if `timeout_s` passes.
+
+        A TimeoutError raised by the tool itself is passed through.
+        """
+        if not timeout_s:
+            return await call
+        scope = asyncio.timeout(timeout_s)
+        try:
+            async with scope:
+                return await call
+        except TimeoutError:
+            if scope.expired():
+                raise _ToolTimeout() from None
+            raise
+
+    @staticmethod
+    def __call_soon(
+        loop: asyncio.AbstractEventLoop, callback: Callable[[], None]
+    ) -> None:
+        """Schedules a callback on a loop from any thread."""
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            # The loop is closed, and its semaphores with it.
+            pass
+
+    def get_dedup_key(
+        self, tool_name: str, arguments: Dict[str, Any]
+    ) -> Optional[str]:
+        """Return a key identifying an idempotent call, or None.
+
+        Calls with equal keys may share one execution. Calls to tools that
+        are not `idempotent`, or whose arguments cannot be serialized, get
+        None and always run.
+
+        Args:
+            tool_name: Name of the tool to call.
+            arguments: Parsed arguments of the call.
+
+        Returns:
+            The call's key, or None if it must not be shared.
+        """
+        tool = self._tools_map.get(tool_name)
+        if tool is None or not getattr(tool, 'idempotent', False):
+            return None
+        try:
+            return f'{tool_name}:{json.dumps(arguments, sort_keys=True)}'
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,391 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    InvalidStateError,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Dict, Optional, Tuple
+
+POOL_KINDS = ('thread', 'process')
+
+
+def _process_context() -> BaseContext:
+    """Returns the start method of process pool workers.
+
+    Forking a process that runs an event loop and other threads copies
+    their locks in whatever state they are, which can deadlock the child.
+    Workers are started by a fork server instead, or spawned where that
+    is unavailable.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _noop() -> None:
+    """Task submitted to start a worker ahead of time."""
+
+
+def _timed_call(fn: Callable[[], Any]) -> Tuple[float, bool, Any]:
+    """Runs a call in a worker, reporting when it started.
+
+    Errors are returned instead of raised so the start time reaches the
+    caller either way.
+    """
+    started_at = time.time()
+    try:
+        return started_at, True, fn()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return started_at, False, e
+
+
+def _resolve(
+    future: Future,
+    result: Any = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """Settles a future unless the caller has already cancelled it."""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _PoolFuture(Future):
+    """The caller's view of a pool call.
+
+    Like any `concurrent.futures.Future`, it cannot be cancelled once a
+    worker has picked the call up, so it only completes when the call has
+    really finished or was dropped before starting.
+    """
+
+    def __init__(self, inner: Future):
+        super().__init__()
+        self.__inner = inner
+
+    def cancel(self) -> bool:
+        """Drops the call unless a worker is already running it."""
+        if not self.__inner.cancel():
+            return False
+        return super().cancel()
+
+
+class ToolPool:
+    """A named, size-bounded executor for synchronous tools.
+
+    A thread pool suits tools that wait on I/O or release the GIL; a
+    process pool suits CPU-bound tools that hold it. In a process pool
+    the tool instance, its arguments and its result are pickled, and
+    workers are never forked from the running process, so tools must be
+    importable by module name.
+
+    The pool counts calls waiting for a free worker (queue depth) and
+    measures how long each call waited, so pools can be sized.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str = 'thread',
+        max_workers: Optional[int] = None,
+        warm: bool = False,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        """Creates the pool.
+
+        Args:
+            name: Name tools and agents use to select the pool.
+            kind: 'thread' or 'process'.
+            max_workers: Number of workers (default: the CPU count).
+            warm: Start every worker now instead of on first use.
+            initializer: Called once in each worker when it starts, e.g.
+                to import heavy modules.
+
+        Raises:
+            ValueError: If kind or max_workers is invalid.
+        """
+        if kind not in POOL_KINDS:
+            raise ValueError(
+                f"kind must be one of {', '.join(POOL_KINDS)}, got '{kind}'."
+            )
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError('max_workers must be greater than zero.')
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.__executor: Executor
+        if kind == 'process':
+            self.__executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=_process_context(),
+                initializer=initializer,
+            )
+        else:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f'tool-pool-{name}',
+                initializer=initializer,
+            )
+
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.__max_queue_depth = 0
+        self.__submitted = 0
+        self.__completed = 0
+        self.__failed = 0
+        self.__cancelled = 0
+        self.__total_wait_s = 0.0
+        self.__max_wait_s = 0.0
+
+        if warm:
+            self.warm_up()
+
+    def warm_up(self) -> None:
+        """Starts every worker, blocking until they are ready."""
+        futures = [
+            self.__executor.submit(_noop) for _ in range(self.max_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Schedules a call on the pool.
+
+        For callers outside the event loop, e.g. a synchronous tool that
+        fans work out to a process pool. Cancelling the returned future
+        drops the call if no worker has picked it up yet; once a call is
+        running, `cancel()` returns False and the future completes when
+        the call does.
+
+        Args:
+            fn: The function to call; picklable for process pools.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Future: Resolves to the result of the call, or to whatever
+            exception it raised.
+        """
+        call = partial(_timed_call, partial(fn, *args, **kwargs))
+        with self.__lock:
+            self.__submitted += 1
+            self.__in_flight += 1
+            self.__max_queue_depth = max(
+                self.__max_queue_depth, self.__queue_depth()
+            )
+        submitted_at = time.time()
+        try:
+            inner = self.__executor.submit(call)
+        except BaseException:
+            with self.__lock:
+                self.__in_flight -= 1
+                self.__failed += 1
+            raise
+
+        outer = _PoolFuture(inner)
+        inner.add_done_callback(
+            lambda future: self.__settle(future, outer, submitted_at)
+        )
+        return outer
+
+    async def run(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Runs a call on the pool and waits for its result.
+
+        Cancelling the wait behaves like cancelling the future returned
+        by `submit`.
+
+        Args:
+            fn: The function to call; picklable for process pools.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            Exception: Whatever the call raised.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns queue and wait-time statistics.
+
+        Returns:
+            Dictionary with kind, max_workers, in_flight, queue_depth
+            (calls waiting for a worker), max_queue_depth, submitted,
+            completed, failed, cancelled, avg_wait_ms (None before the first
+            completed call) and max_wait_ms.
+        """
+        with self.__lock:
+            completed = self.__completed
+            return {
+                'kind': self.kind,
+                'max_workers': self.max_workers,
+                'in_flight': self.__in_flight,
+                'queue_depth': self.__queue_depth(),
+                'max_queue_depth': self.__max_queue_depth,
+                'submitted': self.__submitted,
+                'completed': completed,
+                'failed': self.__failed,
+                'cancelled': self.__cancelled,
+                'avg_wait_ms': (
+                    self.__total_wait_s / completed * 1000
+                    if completed
+                    else None
+                ),
+                'max_wait_ms': self.__max_wait_s * 1000,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the workers, cancelling calls that have not started."""
+        self.__executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __settle(
+        self, inner: Future, outer: Future, submitted_at: float
+    ) -> None:
+        """Records a finished call and hands its outcome to the caller."""
+        if inner.cancelled():
+            with self.__lock:
+                self.__in_flight -= 1
+                self.__cancelled += 1
+            # Cancelled by the caller or by a shutdown; either way the
+            # caller must not wait forever.
+            outer.cancel()
+            return
+
+        error = inner.exception()
+        if error is not None:
+            # The pool itself failed, e.g. a worker process died.
+            with self.__lock:
+                self.__in_flight -= 1
+                self.__failed += 1
+            _resolve(outer, error=error)
+            return
+
+        started_at, ok, value = inner.result()
+        wait_s = max(started_at - submitted_at, 0.0)
+        with self.__lock:
+            self.__in_flight -= 1
+            self.__completed += 1
+            if not ok:
+                self.__failed += 1
+            self.__total_wait_s += wait_s
+            self.__max_wait_s = max(self.__max_wait_s, wait_s)
+        if ok:
+            _resolve(outer, result=value)
+        else:
+            _resolve(outer, error=value)
+
+    def __queue_depth(self) -> int:
+        return max(self.__in_flight - self.max_workers, 0)
+
+
+class ToolPools:
+    """Process-wide registry of the pools synchronous tools run on.
+
+    By default a synchronous tool runs on the event loop's default thread
+    pool, which it shares with every other `run_in_executor`/`to_thread`
+    call in the application. A tool (through its `pool` attribute) or an
+    agent (through `tool_pool`) can instead name a pool registered here,
+    so a slow tool only competes with the tools sharing its pool.
+
+    Example:
+        ```python
+        ToolPools.register('pdf', kind='process', max_workers=2, warm=True)
+
+        class ParsePdfTool(BaseTool):
+            pool = 'pdf'
+        ```
+    """
+
+    _pools: Dict[str, ToolPool] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def register(
+        cls,
+        name: str,
+        kind: str = 'thread',
+        max_workers: Optional[int] = None,
+        warm: bool = False,
+        initializer: Optional[Callable[[], None]] = None,
+    ) -> ToolPool:
+        """Creates a pool, replacing (and shutting down) any pool with the
+        same name.
+
+        Args:
+            name: Name tools and agents use to select the pool.
+            kind: 'thread' or 'process'.
+            max_workers: Number of workers (default: the CPU count).
+            warm: Start every worker now instead of on first use.
+            initializer: Called once in each worker when it starts.
+
+        Returns:
+            ToolPool: The new pool.
+
+        Raises:
+            ValueError: If the name is empty or a setting is invalid.
+        """
+        if not name:
+            raise ValueError('The pool name cannot be empty.')
+
+        pool = ToolPool(
+            name,
+            kind=kind,
+            max_workers=max_workers,
+            warm=warm,
+            initializer=initializer,
+        )
+        with cls._lock:
+            previous = cls._pools.get(name)
+            cls._pools[name] = pool
+        if previous is not None:
+            previous.shutdown(wait=False)
+        return pool
+
+    @classmethod
+    def get(cls, name: str) -> ToolPool:
+        """Returns a registered pool.
+
+        Raises:
+            ValueError: If no pool has that name.
+        """
+        with cls._lock:
+            pool = cls._pools.get(name)
+        if pool is None:
+            raise ValueError(f"Tool pool '{name}' is not registered.")
+        return pool
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Returns the statistics of every pool, keyed by name."""
+        with cls._lock:
+            pools = dict(cls._pools)
+        return {name: pool.get_stats() for name, pool in pools.items()}
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Shuts down and unregisters every pool."""
+        with cls._lock:
+            pools = list(cls._pools.values())
+            cls._pools = {}
+        for pool in pools:
+            pool.shutdown(wait=wait)
@@ -0,0 +1,201 @@
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..value_objects import BaseTool
+
+_Key = Tuple[Any, ...]
+
+
+class ToolResultCache:
+    """Memory-bounded LRU cache for results of cacheable tools.
+
+    Only tools declaring `cacheable = True` are memoized, and only results
+    the tool accepts (see `BaseTool.is_cacheable_result`). Entries are keyed
+    by the tool's class, name and `cache_scope()`, by the canonicalized
+    arguments and by the tool's `cache_version()` for them, expire after
+    the tool's
+    `cache_ttl_s` (None = until evicted) and are evicted least recently used
+    first once the estimated size exceeds `max_bytes`.
+
+    A single instance is shared by all executors in the process (see
+    `get_shared`), so results are reused across turns and agents.
+
+    Example:
+        ```python
+        cache = ToolResultCache(max_bytes=1024 * 1024)
+        cache.set(tool, {'tz': 'UTC'}, '2025-01-01')
+        cache.get(tool, {'tz': 'UTC'})  # (True, '2025-01-01')
+        ```
+    """
+
+    DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+    _shared: Optional['ToolResultCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initializes an empty cache.
+
+        Args:
+            max_bytes: Approximate memory budget for cached results.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be greater than zero.')
+
+        self.__max_bytes = max_bytes
+        # key -> (result, expires_at, estimated size)
+        self.__entries: OrderedDict[_Key, Tuple[Any, Optional[float], int]] = (
+            OrderedDict()
+        )
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls) -> 'ToolResultCache':
+        """Return the process-wide cache used by default."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Replaces the process-wide cache with an empty one.
+
+        Args:
+            max_bytes: Approximate memory budget for cached results.
+        """
+        cache = cls(max_bytes)
+        with cls._shared_lock:
+            cls._shared = cache
+
+    @staticmethod
+    def is_cacheable(tool: BaseTool) -> bool:
+        """Return whether the tool opted in to result caching."""
+        return bool(getattr(tool, 'cacheable', False))
+
+    @staticmethod
+    def make_key(tool: BaseTool, arguments: Dict[str, Any]) -> Optional[_Key]:
+        """Builds the cache key for a call.
+
+        Args:
+            tool: The tool being called.
+            arguments: The call arguments.
+
+        Returns:
+            The key, or None if the arguments cannot be canonicalized.
+        """
+        try:
+            canonical = json.dumps(
+                arguments, sort_keys=True, separators=(',', ':')
+            )
+        except (TypeError, ValueError):
+            return None
+        return (
+            type(tool),
+            tool.name,
+            tool.cache_scope(),
+            tool.cache_version(arguments),
+            canonical,
+        )
+
+    def get(
+        self, tool: BaseTool, arguments: Dict[str, Any]
+    ) -> Tuple[bool, Any]:
+        """Looks up a cached result.
+
+        Args:
+            tool: The tool being called.
+            arguments: The call arguments.
+
+        Returns:
+            A tuple (hit, result); result is None on a miss.
+        """
+        key = self.make_key(tool, arguments)
+        with self.__lock:
+            entry = self.__entries.get(key) if key is not None else None
+            if key is not None and entry is not None:
+                result, expires_at, size = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return True, result
+                del self.__entries[key]
+                self.__size -= size
+            self.__misses += 1
+            return False, None
+
+    def set(
+        self, tool: BaseTool, arguments: Dict[str, Any], result: Any
+    ) -> None:
+        """Stores a result, evicting the least recently used entries.
+
+        Results larger than the whole budget, and results the tool does
+        not accept for caching, are not stored.
+
+        Args:
+            tool: The tool that produced the result.
+            arguments: The call arguments.
+            result: The tool result.
+        """
+        if not tool.is_cacheable_result(result):
+            return
+        key = self.make_key(tool, arguments)
+        if key is None:
+            return
+
+        size = self.__estimate_size(key, result)
+        if size > self.__max_bytes:
+            return
+
+        ttl = getattr(tool, 'cache_ttl_s', None)
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self.__lock:
+            previous = self.__entries.pop(key, None)
+            if previous is not None:
+                self.__size -= previous[2]
+            self.__entries[key] = (result, expires_at, size)
+            self.__size += size
+            while self.__size > self.__max_bytes:
+                _, (_, _, evicted_size) = self.__entries.popitem(last=False)
+                self.__size -= evicted_size
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+            self.__hits = 0
+            self.__misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hits, misses, entries and estimated size in bytes."""
+        with self.__lock:
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'entries': len(self.__entries),
+                'size_bytes': self.__size,
+            }
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    @staticmethod
+    def __estimate_size(key: _Key, result: Any) -> int:
+        if isinstance(result, (str, bytes, int, float, bool, type(None))):
+            result_size = sys.getsizeof(result)
+        else:
+            result_size = sys.getsizeof(repr(result))
+        return sys.getsizeof(key[-1]) + result_size
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+
+from ..value_objects import BaseTool
+
+
+class _LoopSlots:
+    """Semaphores of one event loop (asyncio primitives are loop-bound)."""
+
+    def __init__(self, global_limit: int):
+        self.global_semaphore = asyncio.Semaphore(global_limit)
+        self.tool_semaphores: Dict[
+            Tuple[type, str, int], asyncio.Semaphore
+        ] = {}
+        self.in_flight = 0
+
+
+class ToolScheduler:
+    """Process-wide admission control for tool executions.
+
+    Every tool execution first takes a slot from its tool's semaphore and
+    then from a global semaphore shared by all agents in the process:
+
+    - a tool with `parallel_safe = False` gets a per-tool limit of 1, so its
+      calls are serialized even when issued concurrently;
+    - a tool with `max_concurrency = N` never has more than N calls in
+      flight;
+    - the global limit caps the total number of tool calls in flight.
+
+    Waiting for the tool slot before the global one keeps a serialized tool
+    from holding global capacity that other tools could use.
+
+    Semaphores are kept per event loop, so the scheduler also works when
+    the caller runs each request in a new loop (e.g. `asyncio.run`).
+    """
+
+    DEFAULT_GLOBAL_LIMIT = 32
+
+    _global_limit: int = DEFAULT_GLOBAL_LIMIT
+    _slots: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, global_limit: int = DEFAULT_GLOBAL_LIMIT) -> None:
+        """Sets the maximum number of tool calls in flight in the process.
+
+        Calls already waiting keep the previous limit; new calls use the
+        new one.
+
+        Args:
+            global_limit: The global limit (must be positive).
+
+        Raises:
+            ValueError: If global_limit is not positive.
+        """
+        if global_limit <= 0:
+            raise ValueError('global_limit must be greater than zero.')
+
+        with cls._lock:
+            cls._global_limit = global_limit
+            cls._slots = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_global_limit(cls) -> int:
+        """Return the global limit of tool calls in flight."""
+        return cls._global_limit
+
+    @classmethod
+    def get_in_flight(cls) -> int:
+        """Return the number of tool calls running on the current loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return 0
+        with cls._lock:
+            slots = cls._slots.get(loop)
+            return slots.in_flight if slots is not None else 0
+
+    @staticmethod
+    def get_tool_limit(tool: BaseTool) -> Optional[int]:
+        """Returns the per-tool concurrency limit declared by a tool.
+
+        Args:
+            tool: The tool instance.
+
+        Returns:
+            1 for tools that are not parallel-safe, the tool's
+            `max_concurrency` if set, or None when unrestricted.
+        """
+        if not getattr(tool, 'parallel_safe', True):
+            return 1
+
+        max_concurrency = getattr(tool, 'max_concurrency', None)
+        if isinstance(max_concurrency, int) and max_concurrency > 0:
+            return max_concurrency
+        return None
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls, tool: BaseTool) -> AsyncIterator[None]:
+        """Waits for permission to execute a tool.
+
+        Args:
+            tool: The tool about to be executed.
+
+        Example:
+            ```python
+            async with ToolScheduler.slot(tool):
+                result = await tool.execute(**kwargs)
+            ```
+        """
+        release = await cls.acquire(tool)
+        try:
+            yield
+        finally:
+            release()
+
+    @classmethod
+    async def acquire(cls, tool: BaseTool) -> Callable[[], None]:
+        """Waits for permission to execute a tool, without a scope.
+
+        For work that may outlive its caller, such as a synchronous tool
+        whose worker keeps running after the caller stopped waiting. The
+        returned function frees the slot; it must be called once, on the
+        event loop's thread (extra calls do nothing).
+
+        Args:
+            tool: The tool about to be executed.
+
+        Returns:
+            The function that frees the slot.
+        """
+        slots = cls.__get_slots()
+        tool_semaphore = cls.__get_tool_semaphore(slots, tool)
+
+        if tool_semaphore is not None:
+            await tool_semaphore.acquire()
+        try:
+            await slots.global_semaphore.acquire()
+        except BaseException:
+            if tool_semaphore is not None:
+                tool_semaphore.release()
+            raise
+        slots.in_flight += 1
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            slots.in_flight -= 1
+            slots.global_semaphore.release()
+            if tool_semaphore is not None:
+                tool_semaphore.release()
+
+        return release
+
+    @classmethod
+    def __get_slots(cls) -> _LoopSlots:
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            slots = cls._slots.get(loop)
+            if slots is None:
+                slots = _LoopSlots(cls._global_limit)
+                cls._slots[loop] = slots
+            return slots
+
+    @classmethod
+    def __get_tool_semaphore(
+        cls, slots: _LoopSlots, tool: BaseTool
+    ) -> Optional[asyncio.Semaphore]:
+        limit = cls.get_tool_limit(tool)
+        if limit is None:
+            return None
+
+        key = (type(tool), tool.name, limit)
+        with cls._lock:
+            semaphore = slots.tool_semaphores.get(key)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(limit)
+                slots.tool_semaphores[key] = semaphore
+            return semaphore
@@ -1,14 +1,18 @@
+from .approximate_token_counter import ApproximateTokenCounter
 from .base_tools import BaseTool
 from .chat_response import ChatResponse, ToolCallInfo
 from .configs_validator import SupportedConfigs
+from .deadline import Deadline
 from .history import History
 from .message import Message, MessageRole
 from .providers import SupportedProviders
 
 __all__ = [
+    'ApproximateTokenCounter',
     'Message',
     'MessageRole',
     'History',
+    'Deadline',
     'SupportedProviders',
     'SupportedConfigs',
     'BaseTool',
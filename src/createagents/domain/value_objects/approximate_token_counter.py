@@ -0,0 +1,16 @@
+from ..interfaces import TokenCounter
+
+
+class ApproximateTokenCounter(TokenCounter):
+    """Estimates tokens from the text length, without a tokenizer.
+
+    English text averages about four characters per token with the
+    OpenAI tokenizers; the estimate rounds up so short texts never count
+    as zero.
+    """
+
+    CHARS_PER_TOKEN = 4
+
+    def count(self, text: str) -> int:
+        """Return the estimated number of tokens in a text."""
+        return -(-len(text) // self.CHARS_PER_TOKEN)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional
 
 
 class BaseTool(ABC):
@@ -15,6 +15,29 @@ class BaseTool(ABC):
                           This description is used by the LLM to decide when to invoke the tool.
         parameters (dict): JSON Schema describing the tool's parameters.
                           Default is an empty object schema.
+        parallel_safe (bool): Whether several calls to this tool may run at
+                          the same time. Set to False for tools with side
+                          effects that must not overlap; their calls are then
+                          serialized process-wide. Default is True.
+        idempotent (bool): Whether repeating a call with the same arguments
+                          yields the same result without extra side effects.
+                          Identical idempotent calls in one turn are executed
+                          once. Default is False.
+        max_concurrency (Optional[int]): Maximum number of calls to this tool
+                          in flight across the process (None = no limit).
+        timeout_s (Optional[float]): Seconds after which a call is reported
+                          as failed (None = no timeout).
+        cacheable (bool): Whether successful results may be reused for calls
+                          with the same arguments. Results are only shared
+                          between tools with the same `cache_scope()` and
+                          while `cache_version()` is unchanged, and
+                          `is_cacheable_result` can keep results out of the
+                          cache. Default is False.
+        cache_ttl_s (Optional[float]): Seconds a cached result stays valid
+                          (None = until evicted).
+        pool (Optional[str]): Name of the `ToolPools` pool a synchronous
+                          `execute` runs on (None = the agent's `tool_pool`,
+                          or the event loop's default thread pool).
 
     Subclasses must:
         1. Set class attributes `name` and `description`
@@ -48,6 +71,13 @@ class BaseTool(ABC):
         'type': 'object',
         'properties': {},
     }
+    parallel_safe: bool = True
+    idempotent: bool = False
+    max_concurrency: Optional[int] = None
+    timeout_s: Optional[float] = None
+    cacheable: bool = False
+    cache_ttl_s: Optional[float] = None
+    pool: Optional[str] = None
 
     @abstractmethod
     def execute(self, *args, **kwargs) -> Any:
@@ -63,6 +93,46 @@ class BaseTool(ABC):
             The result of the tool execution (typically a string).
         """
 
+    def cache_scope(self) -> Hashable:
+        """Identify the configuration that cached results depend on.
+
+        Cached results are only reused by tools of the same class and name
+        with an equal scope. The default is the instance itself, so tools
+        configured differently (base directories, credentials, ...) never
+        see each other's results. Tools without per-instance configuration
+        may return None to share results across instances and agents.
+
+        Returns:
+            A hashable identifying the tool's configuration.
+        """
+        return self
+
+    def cache_version(self, arguments: Dict[str, Any]) -> Hashable:
+        """Identify the state of the data a call with these arguments reads.
+
+        Cached results are only reused while the version is unchanged, so
+        tools that read data which can change underneath them (files,
+        ...) return e.g. its modification time. Default is None.
+
+        Args:
+            arguments: The call arguments.
+
+        Returns:
+            A hashable identifying the data's current state.
+        """
+        return None
+
+    def is_cacheable_result(self, result: Any) -> bool:
+        """Return whether a result of this tool may be cached.
+
+        Tools that report errors as return values override this so that
+        an error is not served again from the cache. Default is True.
+
+        Args:
+            result: The value returned by `execute`.
+        """
+        return True
+
     def get_schema(self) -> Dict[str, Any]:
         """Return a generic schema describing the tool.
 
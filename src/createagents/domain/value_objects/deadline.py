@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Optional, TypeVar
+
+from ..exceptions import ChatTimeoutException
+
+T = TypeVar('T')
+
+
+class Deadline:
+    """Time budget of a single chat call.
+
+    A deadline is created when the call starts and handed to every step
+    of it (model requests, tool executions, stream reads), so each step
+    only gets the time that is left. When the budget runs out the step
+    fails with ChatTimeoutException.
+    """
+
+    def __init__(self, timeout_s: float):
+        """Starts the clock.
+
+        Args:
+            timeout_s: The time budget, in seconds.
+
+        Raises:
+            ValueError: If timeout_s is not positive.
+        """
+        if not isinstance(timeout_s, (int, float)) or timeout_s <= 0:
+            raise ValueError('timeout must be greater than zero.')
+
+        self.timeout_s = float(timeout_s)
+        self.__expires_at = time.monotonic() + self.timeout_s
+
+    @classmethod
+    def after(cls, timeout_s: Optional[float]) -> Optional['Deadline']:
+        """Returns a deadline for `timeout_s`, or None without a timeout."""
+        return cls(timeout_s) if timeout_s is not None else None
+
+    @property
+    def expired(self) -> bool:
+        """Return whether the budget has run out."""
+        return self.remaining() <= 0
+
+    def remaining(self) -> float:
+        """Return the seconds left, never negative."""
+        return max(self.__expires_at - time.monotonic(), 0.0)
+
+    def bound(self, timeout_s: Optional[float]) -> float:
+        """Caps a step's own timeout by the time left."""
+        remaining = self.remaining()
+        if timeout_s is None:
+            return remaining
+        return min(timeout_s, remaining)
+
+    def check(self, stage: Optional[str] = None) -> None:
+        """Fails if the budget has run out.
+
+        Raises:
+            ChatTimeoutException: If the deadline has passed.
+        """
+        if self.expired:
+            raise ChatTimeoutException(self.timeout_s, stage)
+
+    async def run(self, awaitable: Awaitable[T], stage: str) -> T:
+        """Awaits a step, cancelling it when the deadline passes.
+
+        Args:
+            awaitable: The step to run.
+            stage: Description of the step, used in the error.
+
+        Raises:
+            ChatTimeoutException: If the deadline passes first.
+        """
+        try:
+            self.check(stage)
+        except ChatTimeoutException:
+            _discard(awaitable)
+            raise
+
+        try:
+            return await asyncio.wait_for(awaitable, self.remaining())
+        except asyncio.TimeoutError:
+            if not self.expired:
+                # Raised by the step itself, not by the deadline.
+                raise
+            raise ChatTimeoutException(self.timeout_s, stage) from None
+
+    async def iterate(
+        self, stream: AsyncIterator[T], stage: str
+    ) -> AsyncGenerator[T, None]:
+        """Yields the items of a stream, each read bounded by the deadline.
+
+        The stream is closed when the deadline passes or when this
+        iterator is closed early.
+
+        Raises:
+            ChatTimeoutException: If the deadline passes while waiting
+                for the next item.
+        """
+        iterator = stream.__aiter__()
+        try:
+            while True:
+                try:
+                    item = await self.run(iterator.__anext__(), stage)
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            await _close(stream)
+
+
+async def _close(stream: object) -> None:
+    """Closes an async stream, whatever its close method is called."""
+    close = getattr(stream, 'aclose', None) or getattr(stream, 'close', None)
+    if close is None:
+        return
+    result = close()
+    if asyncio.iscoroutine(result):
+        await result
+
+
+def _discard(awaitable: Awaitable[object]) -> None:
+    """Closes a coroutine that will never be awaited."""
+    close = getattr(awaitable, 'close', None)
+    if close is not None:
+        close()
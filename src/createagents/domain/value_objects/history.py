@@ -1,10 +1,20 @@
+import dataclasses
 from collections import deque
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Deque, Dict, List
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
+from ..interfaces import TokenCounter
+from .approximate_token_counter import ApproximateTokenCounter
 from .message import Message, MessageRole
 
+# Tokens a chat format spends on each message besides its content
+# (role and separators).
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Serialized messages shared between callers; never mutate them.
+HistorySnapshot = Tuple[Dict[str, str], ...]
+
 
 @dataclass
 class History:
@@ -15,43 +25,92 @@ class History:
     It uses a deque with `maxlen` for optimized performance, automatically
     removing old messages without recreating the data structure.
 
+    With `max_tokens`, the history also keeps a token budget: each message
+    is counted once, when added, by `token_counter` (default: an estimate
+    from the text length), and whole turns are evicted, oldest first,
+    until the total fits. The running total makes this O(1) amortized.
+
+    Each message is serialized once, when added. `snapshot()` returns a
+    tuple of those dicts that is cached until the next `add` or `clear`,
+    which also bump `version`.
+
     Thread-safe: Uses a lock to ensure safe concurrent access to messages.
     """
 
-    max_size: int = 10
+    max_size: Optional[int] = 10
     _messages: Deque[Message] = field(default_factory=deque)
     _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    max_tokens: Optional[int] = None
+    token_counter: Optional[TokenCounter] = field(
+        default=None, repr=False, compare=False
+    )
+    _total_tokens: int = field(default=0, init=False, repr=False)
+    _dicts: Deque[Dict[str, str]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _snapshot: Optional[HistorySnapshot] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize the history with a deque and a lock.
 
         Raises:
-            ValueError: If max_size is not positive.
+            ValueError: If max_size or max_tokens is not positive. max_size
+                may be None only when max_tokens is set.
         """
-        if not isinstance(self.max_size, int) or self.max_size <= 0:
+        # max_size may only be None when a token budget replaces it.
+        if (self.max_size is not None or self.max_tokens is None) and (
+            not isinstance(self.max_size, int) or self.max_size <= 0
+        ):
             raise ValueError(
                 "The history's max size must be greater than zero."
             )
+        if self.max_tokens is not None and (
+            not isinstance(self.max_tokens, int) or self.max_tokens <= 0
+        ):
+            raise ValueError(
+                "The history's max tokens must be greater than zero."
+            )
+        if self.token_counter is None:
+            object.__setattr__(
+                self, 'token_counter', ApproximateTokenCounter()
+            )
 
         messages = list(self._messages) if self._messages else []
-        object.__setattr__(
-            self, '_messages', deque(messages, maxlen=self.max_size)
-        )
+        object.__setattr__(self, '_messages', deque(maxlen=self.max_size))
         object.__setattr__(self, '_lock', Lock())
+        object.__setattr__(self, '_total_tokens', 0)
+        object.__setattr__(self, '_dicts', deque(maxlen=self.max_size))
+        object.__setattr__(self, '_version', 0)
+        object.__setattr__(self, '_snapshot', None)
+        for message in messages:
+            self.__append(self.__counted(message))
 
-    def add(self, message: Message) -> None:
+    def add(self, message: Message) -> Message:
         """
         Adds a message to the history.
-        The deque with `maxlen` automatically maintains the size limit.
+        The deque with `maxlen` automatically maintains the size limit;
+        with `max_tokens`, the oldest turns are evicted until the total
+        fits.
 
         Args:
             message: The message to be added.
+
+        Returns:
+            The message as stored, with its token count filled in.
         """
         if not isinstance(message, Message):
             raise TypeError('Only Message objects can be added.')
 
+        # Counted outside the lock: a tokenizer can be slow.
+        message = self.__counted(message)
         with self._lock:
-            self._messages.append(message)
+            self.__append(message)
+            self._version += 1
+            self._snapshot = None
+        return message
 
     def add_user_message(self, content: str) -> None:
         """
@@ -93,10 +152,81 @@ class History:
         message = Message(role=MessageRole.TOOL, content=content)
         self.add(message)
 
+    def replace_prefix(
+        self, prefix: Sequence[Message], replacement: Message
+    ) -> bool:
+        """
+        Replaces the oldest messages with a single message, e.g. a summary.
+
+        Nothing changes if the history no longer starts with exactly these
+        messages, e.g. because it was cleared or trimmed in the meantime.
+
+        Args:
+            prefix: The oldest messages, as returned by `get_messages`.
+            replacement: The message that takes their place.
+
+        Returns:
+            True if the messages were replaced.
+        """
+        if not isinstance(replacement, Message):
+            raise TypeError('Only Message objects can be added.')
+
+        replacement = self.__counted(replacement)
+        with self._lock:
+            messages = self._messages
+            if not prefix or len(prefix) > len(messages):
+                return False
+            if any(
+                current is not old for current, old in zip(messages, prefix)
+            ):
+                return False
+
+            for _ in prefix:
+                self.__pop_oldest()
+            messages.appendleft(replacement)
+            self._dicts.appendleft(replacement.to_dict())
+            self._total_tokens += self.message_tokens(replacement)
+            self.__enforce_budget()
+            self._version += 1
+            self._snapshot = None
+        return True
+
     def clear(self) -> None:
         """Clears all messages from the history."""
         with self._lock:
             self._messages.clear()
+            self._dicts.clear()
+            self._total_tokens = 0
+            self._version += 1
+            self._snapshot = None
+
+    @property
+    def total_tokens(self) -> int:
+        """Return the tokens of all messages, overhead included."""
+        with self._lock:
+            return self._total_tokens
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the messages change."""
+        with self._lock:
+            return self._version
+
+    def snapshot(self) -> HistorySnapshot:
+        """
+        Returns the messages as dictionaries, without copying them.
+
+        The tuple is built once per version and shared by every caller
+        until the history changes, so the dictionaries must not be
+        mutated. Use `to_dict_list` for a private copy.
+
+        Returns:
+            A tuple of dictionaries, each with a role and content.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = tuple(self._dicts)
+            return self._snapshot
 
     def get_messages(self) -> List[Message]:
         """
@@ -116,11 +246,73 @@ class History:
             A list of dictionaries, each with a role and content.
         """
         with self._lock:
-            return [message.to_dict() for message in self._messages]
+            return [dict(item) for item in self._dicts]
+
+    def copy(self) -> 'History':
+        """
+        Returns an independent history with the same limits and messages.
+
+        Token counts already computed are reused, not recounted.
+        """
+        with self._lock:
+            messages = deque(self._messages)
+        return History(
+            max_size=self.max_size,
+            _messages=messages,
+            max_tokens=self.max_tokens,
+            token_counter=self.token_counter,
+        )
+
+    @classmethod
+    def from_messages(
+        cls,
+        messages: Sequence[Message],
+        max_size: Optional[int],
+        max_tokens: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ) -> 'History':
+        """
+        Creates a History instance from Message objects.
+
+        Unlike `from_dict_list`, messages are not parsed again, and
+        messages with a token count are not recounted.
+
+        Args:
+            messages: The messages, oldest first.
+            max_size: The maximum size of the history.
+            max_tokens: The token budget of the history (optional).
+            token_counter: Counts message tokens (optional).
+
+        Returns:
+            A new History instance.
+        """
+        return cls(
+            max_size=max_size,
+            _messages=deque(messages),
+            max_tokens=max_tokens,
+            token_counter=token_counter,
+        )
+
+    @staticmethod
+    def message_tokens(message: Message) -> int:
+        """
+        Returns what a message costs against `max_tokens`.
+
+        Args:
+            message: A message with its token count filled in.
+
+        Returns:
+            The message's tokens plus the per-message overhead.
+        """
+        return (message.token_count or 0) + MESSAGE_OVERHEAD_TOKENS
 
     @classmethod
     def from_dict_list(
-        cls, data: List[Dict[str, str]], max_size: int
+        cls,
+        data: List[Dict[str, str]],
+        max_size: Optional[int],
+        max_tokens: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
     ) -> 'History':
         """
         Creates a History instance from a list of dictionaries.
@@ -128,16 +320,60 @@ class History:
         Args:
             data: A list of dictionaries, each with 'role' and 'content'.
             max_size: The maximum size of the history.
+            max_tokens: The token budget of the history (optional).
+            token_counter: Counts message tokens (optional).
 
         Returns:
             A new History instance.
         """
-        history = cls(max_size=max_size)
+        history = cls(
+            max_size=max_size,
+            max_tokens=max_tokens,
+            token_counter=token_counter,
+        )
         for item in data:
             message = Message.from_dict(item)
             history.add(message)
         return history
 
+    def __counted(self, message: Message) -> Message:
+        """Returns the message with its token count filled in."""
+        if message.token_count is not None:
+            return message
+        assert self.token_counter is not None
+        return dataclasses.replace(
+            message, token_count=self.token_counter.count(message.content)
+        )
+
+    def __append(self, message: Message) -> None:
+        """Appends a counted message and enforces the limits (lock held)."""
+        messages = self._messages
+        if messages.maxlen is not None and len(messages) == messages.maxlen:
+            # The deque is about to drop its oldest message.
+            self._total_tokens -= self.message_tokens(messages[0])
+        messages.append(message)
+        self._dicts.append(message.to_dict())
+        self._total_tokens += self.message_tokens(message)
+        self.__enforce_budget()
+
+    def __enforce_budget(self) -> None:
+        """Evicts the oldest turns until the token budget is met."""
+        if self.max_tokens is None:
+            return
+        messages = self._messages
+        while self._total_tokens > self.max_tokens and messages:
+            self.__pop_oldest()
+            # Drop the rest of the evicted turn as well.
+            while messages and messages[0].role not in (
+                MessageRole.USER,
+                MessageRole.SYSTEM,
+            ):
+                self.__pop_oldest()
+
+    def __pop_oldest(self) -> None:
+        self._dicts.popleft()
+        self._total_tokens -= self.message_tokens(self._messages.popleft())
+
     def __len__(self) -> int:
         """Return the number of messages in the history."""
         with self._lock:
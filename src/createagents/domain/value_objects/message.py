@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
 
 
 class MessageRole(str, Enum):
@@ -21,10 +21,14 @@ class Message:
     """
     Represents a message in the chat as a Value Object.
     It is immutable to ensure data integrity.
+
+    `token_count` caches the size of the content in tokens; `History`
+    fills it in once, when the message is added.
     """
 
     role: MessageRole
     content: str
+    token_count: Optional[int] = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         """Validates the message data."""
@@ -34,6 +38,11 @@ class Message:
         if not self.content or not self.content.strip():
             raise ValueError('The message content cannot be empty.')
 
+        if self.token_count is not None and (
+            not isinstance(self.token_count, int) or self.token_count < 0
+        ):
+            raise ValueError("The 'token_count' cannot be negative.")
+
     def to_dict(self) -> Dict[str, str]:
         """
         Converts the message to a dictionary.
@@ -1,21 +1,30 @@
 from .adapters import (
     CurrentDateTool,
     OllamaChatAdapter,
+    OllamaEmbedder,
     OllamaToolCallParser,
     OllamaToolSchemaFormatter,
     OpenAIChatAdapter,
+    SemanticCacheChatAdapter,
     ToolCallParser,
     ToolSchemaFormatter,
 )
 from .config import (
     AvailableTools,
     ChatMetrics,
+    ConversationScope,
     EnvironmentConfig,
     JSONFormatter,
+    JSONLSessionStore,
     LoggingConfig,
     MetricsCollector,
+    MetricsScope,
+    SemanticCache,
     SensitiveDataFilter,
     SensitiveDataFormatter,
+    SQLiteSessionStore,
+    TextEmbedder,
+    TiktokenCounter,
     retry_with_backoff,
 )
 from .factories import ChatAdapterFactory
@@ -28,16 +37,25 @@ __all__ = [
     'SensitiveDataFormatter',
     'ChatMetrics',
     'MetricsCollector',
+    'MetricsScope',
+    'ConversationScope',
     'retry_with_backoff',
     'SensitiveDataFilter',
     'AvailableTools',
+    'JSONLSessionStore',
+    'SQLiteSessionStore',
+    'SemanticCache',
+    'TextEmbedder',
+    'TiktokenCounter',
     # Adapters
     'OllamaChatAdapter',
+    'OllamaEmbedder',
     'OllamaToolCallParser',
     'OllamaToolSchemaFormatter',
     'OpenAIChatAdapter',
     'ToolCallParser',
     'ToolSchemaFormatter',
+    'SemanticCacheChatAdapter',
     # Tools
     'CurrentDateTool',
     # Factories
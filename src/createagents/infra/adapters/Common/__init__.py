@@ -1,3 +1,21 @@
+from .cancellation_utils import close_stream
+from .circuit_breaker_chat_adapter import CircuitBreakerChatAdapter
+from .deadline_utils import iterate_within, run_within
 from .metrics_recorder import MetricsRecorder
+from .response_cache_chat_adapter import ResponseCacheChatAdapter
+from .semantic_cache_chat_adapter import SemanticCacheChatAdapter
+from .shared_chat_adapter import SharedChatAdapter
+from .single_flight_chat_adapter import SingleFlightChatAdapter, StreamTee
 
-__all__ = ['MetricsRecorder']
+__all__ = [
+    'CircuitBreakerChatAdapter',
+    'MetricsRecorder',
+    'ResponseCacheChatAdapter',
+    'SemanticCacheChatAdapter',
+    'SharedChatAdapter',
+    'SingleFlightChatAdapter',
+    'StreamTee',
+    'close_stream',
+    'iterate_within',
+    'run_within',
+]
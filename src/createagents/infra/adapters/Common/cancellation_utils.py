@@ -0,0 +1,23 @@
+from ...config import LoggingConfig
+
+_logger = LoggingConfig.get_logger(__name__)
+
+
+async def close_stream(stream: object) -> None:
+    """Closes an upstream response stream, releasing its connection.
+
+    Works with async generators (`aclose`) and SDK stream objects
+    (`close`). Errors are logged and swallowed, since the stream is
+    being abandoned anyway.
+    """
+    if stream is None:
+        return
+    close = getattr(stream, 'aclose', None) or getattr(stream, 'close', None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if hasattr(result, '__await__'):
+            await result
+    except Exception as e:
+        _logger.debug('Error closing an abandoned stream: %s', e)
@@ -0,0 +1,134 @@
+import itertools
+import re
+import threading
+import uuid
+import weakref
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypedDict,
+)
+
+from ....domain import BaseTool
+
+_TOKEN_PATTERN = re.compile(r'\S+\s*|\s+')
+"""Splits a cached response into word-sized tokens for replay."""
+
+_scope_serials: 'weakref.WeakKeyDictionary[Any, int]' = (
+    weakref.WeakKeyDictionary()
+)
+_next_scope_serial = itertools.count(1)
+_process_token = uuid.uuid4().hex
+_scope_lock = threading.Lock()
+
+
+class ChatCallArgs(TypedDict):
+    """The arguments that identify a chat request, as passed to `chat`."""
+
+    model: str
+    instructions: Optional[str]
+    config: Optional[Dict[str, Any]]
+    tools: Optional[List[BaseTool]]
+    history: Sequence[Dict[str, str]]
+    user_ask: str
+
+
+def has_only_reusable_tools(tools: Optional[List[BaseTool]]) -> bool:
+    """Return whether a request's answer may be reused by another request.
+
+    Answers of requests whose tools are neither `idempotent` nor
+    `cacheable` are not reused, since reusing them would skip the tools'
+    side effects.
+    """
+    return all(
+        getattr(tool, 'idempotent', False) or getattr(tool, 'cacheable', False)
+        for tool in tools or []
+    )
+
+
+def describe_tool(tool: BaseTool) -> Dict[str, Any]:
+    """Return what identifies a tool in a request's key.
+
+    Besides the tool's class and name, this covers the description and
+    parameter schema sent to the model and the tool's `cache_scope()`, so
+    requests whose tools are configured differently never share answers.
+    """
+    tool_type = type(tool)
+    return {
+        'type': f'{tool_type.__module__}.{tool_type.__qualname__}',
+        'name': tool.name,
+        'description': tool.description,
+        'parameters': getattr(tool, 'parameters', None),
+        'scope': _scope_token(tool.cache_scope()),
+    }
+
+
+def _scope_token(scope: Any) -> str:
+    """Return a string that identifies a tool's cache scope.
+
+    Scopes without their own `repr` (e.g. the tool instance, the default)
+    get a serial number instead: their default `repr` holds the object's
+    `id`, which a later object may reuse. Serials are qualified by a
+    per-process token, since keys may outlive the process on disk.
+    """
+    if type(scope).__repr__ is not object.__repr__:
+        return repr(scope)
+    try:
+        with _scope_lock:
+            serial = _scope_serials.get(scope)
+            if serial is None:
+                serial = next(_next_scope_serial)
+                _scope_serials[scope] = serial
+    except TypeError:
+        return repr(scope)
+    return f'<instance {_process_token}:{serial}>'
+
+
+def reuse_ttl_s(tools: Optional[List[BaseTool]]) -> Optional[float]:
+    """Return how long a request's answer may be reused, given its tools.
+
+    Tools that are `cacheable` but not `idempotent` (e.g. the current
+    date) return results that are only valid for their `cache_ttl_s`, so
+    an answer built on them is not reused for longer than the shortest
+    of those. None means the tools set no limit.
+    """
+    limits: List[float] = []
+    for tool in tools or []:
+        ttl_s = getattr(tool, 'cache_ttl_s', None)
+        if ttl_s is not None and not getattr(tool, 'idempotent', False):
+            limits.append(ttl_s)
+    return min(limits) if limits else None
+
+
+async def replay_response(response: str) -> AsyncGenerator[str, None]:
+    """Replays a stored response as a stream of word-sized tokens."""
+    for token in _TOKEN_PATTERN.findall(response):
+        yield token
+
+
+async def record_stream(
+    stream: AsyncGenerator[str, None],
+    on_complete: Callable[[str], Awaitable[None]],
+) -> AsyncGenerator[str, None]:
+    """Passes a token stream through and reports the full text at the end.
+
+    `on_complete` is only called when the stream is fully consumed and
+    produced some text, so interrupted responses are never stored.
+    """
+    tokens: List[str] = []
+    try:
+        async for token in stream:
+            tokens.append(token)
+            yield token
+    finally:
+        # Closing this stream early closes the upstream one too.
+        await stream.aclose()
+    response = ''.join(tokens)
+    if response:
+        await on_complete(response)
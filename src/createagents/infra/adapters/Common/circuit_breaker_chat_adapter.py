@@ -0,0 +1,181 @@
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
+
+from ....application.interfaces import ChatRepository
+from ....domain import BaseTool, Deadline
+from ...config import (
+    ChatMetrics,
+    CircuitBreaker,
+    LoggingConfig,
+    is_retryable_error,
+)
+
+
+class CircuitBreakerChatAdapter(ChatRepository):
+    """Puts a circuit breaker in front of another chat adapter.
+
+    Each chat request is summarized as a ChatMetrics (outcome and latency,
+    measured until a stream's first token) and recorded in the breaker.
+    Only provider and transport failures, as classified by
+    `is_retryable_error`, count against the circuit; the caller's own
+    deadline, bad requests and tool errors do not. While the circuit is
+    open, requests fail immediately with CircuitOpenException instead of
+    waiting for timeouts and retries.
+    """
+
+    def __init__(self, adapter: ChatRepository, breaker: CircuitBreaker):
+        """Initialize the wrapper.
+
+        Args:
+            adapter: The adapter that talks to the provider.
+            breaker: The circuit breaker guarding the adapter.
+        """
+        self.__adapter = adapter
+        self.__breaker = breaker
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @property
+    def wrapped(self) -> ChatRepository:
+        """Return the adapter behind the circuit breaker."""
+        return self.__adapter
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker."""
+        return self.__breaker
+
+    async def chat(
+        self,
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Send a message through the circuit breaker.
+
+        Raises:
+            CircuitOpenException: If the circuit is open.
+            ChatException: If the wrapped adapter fails.
+        """
+        probe = self.__breaker.acquire()
+        start_time = time.perf_counter()
+        try:
+            result = await self.__adapter.chat(
+                model=model,
+                instructions=instructions,
+                config=config,
+                tools=tools,
+                history=history,
+                user_ask=user_ask,
+                deadline=deadline,
+                tool_pool=tool_pool,
+            )
+        except asyncio.CancelledError:
+            self.__release(probe)
+            raise
+        except Exception as e:
+            self.__record_error(model, self.__elapsed_ms(start_time), probe, e)
+            raise
+
+        if isinstance(result, AsyncGenerator):
+            return self.__guard_stream(model, result, start_time, probe)
+
+        self.__record(model, self.__elapsed_ms(start_time), probe)
+        return result
+
+    async def warmup(self, model: str) -> None:
+        """Warm up the wrapped adapter."""
+        await self.__adapter.warmup(model)
+
+    async def aclose(self) -> None:
+        """Release the wrapped adapter's resources."""
+        await self.__adapter.aclose()
+
+    def get_metrics(self) -> List[ChatMetrics]:
+        """Return the metrics collected by the wrapped adapter.
+
+        Returns:
+            List[ChatMetrics]: The list of metrics.
+        """
+        get_metrics = getattr(self.__adapter, 'get_metrics', None)
+        if get_metrics is None:
+            return []
+        metrics: List[ChatMetrics] = get_metrics()
+        return metrics
+
+    async def __guard_stream(
+        self,
+        model: str,
+        stream: AsyncGenerator[str, None],
+        start_time: float,
+        probe: bool,
+    ) -> AsyncGenerator[str, None]:
+        # The consumer's reading time is not the provider's latency.
+        latency_ms: Optional[float] = None
+        completed = False
+        recorded = False
+        try:
+            async for token in stream:
+                if latency_ms is None:
+                    latency_ms = self.__elapsed_ms(start_time)
+                yield token
+            completed = True
+        except Exception as e:
+            recorded = True
+            if latency_ms is None:
+                latency_ms = self.__elapsed_ms(start_time)
+            self.__record_error(model, latency_ms, probe, e)
+            raise
+        finally:
+            await stream.aclose()
+            if completed:
+                if latency_ms is None:
+                    latency_ms = self.__elapsed_ms(start_time)
+                self.__record(model, latency_ms, probe)
+            elif not recorded:
+                self.__release(probe)
+
+    @staticmethod
+    def __elapsed_ms(start_time: float) -> float:
+        return (time.perf_counter() - start_time) * 1000
+
+    def __record_error(
+        self, model: str, latency_ms: float, probe: bool, error: Exception
+    ) -> None:
+        """Records a provider failure; other errors leave the circuit."""
+        if is_retryable_error(error):
+            self.__record(model, latency_ms, probe, error)
+        else:
+            self.__release(probe)
+
+    def __record(
+        self,
+        model: str,
+        latency_ms: float,
+        probe: bool,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.__breaker.record(
+            ChatMetrics(
+                model=model,
+                latency_ms=latency_ms,
+                success=error is None,
+                error_message=str(error) if error else None,
+            ),
+            probe=probe,
+        )
+        if error is not None:
+            self.__logger.debug(
+                "Circuit '%s' recorded a failure: %s",
+                self.__breaker.name,
+                error,
+            )
+
+    def __release(self, probe: bool) -> None:
+        if probe:
+            self.__breaker.release()
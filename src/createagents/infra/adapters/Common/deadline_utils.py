@@ -0,0 +1,32 @@
+from typing import AsyncIterator, Awaitable, Optional, TypeVar
+
+from ....domain import Deadline
+
+T = TypeVar('T')
+
+
+async def run_within(
+    deadline: Optional[Deadline], awaitable: Awaitable[T], stage: str
+) -> T:
+    """Awaits a step of a chat call, bounded by its deadline if any.
+
+    Raises:
+        ChatTimeoutException: If the deadline passes first.
+    """
+    if deadline is None:
+        return await awaitable
+    return await deadline.run(awaitable, stage)
+
+
+def iterate_within(
+    deadline: Optional[Deadline], stream: AsyncIterator[T], stage: str
+) -> AsyncIterator[T]:
+    """Returns a stream whose reads are bounded by the deadline if any.
+
+    Raises:
+        ChatTimeoutException: If the deadline passes while waiting for
+            the next item.
+    """
+    if deadline is None:
+        return stream
+    return deadline.iterate(stream, stage)
@@ -1,7 +1,7 @@
 import time
 from typing import Any, List, Optional
 
-from ...config import ChatMetrics, LoggingConfig
+from ...config import ChatMetrics, LoggingConfig, MetricsScope
 
 
 class MetricsRecorder:
@@ -27,6 +27,10 @@ class MetricsRecorder:
         start_time: float,
         response_api: Any,
         provider_type: str = 'generic',
+        model_loads: Optional[int] = None,
+        model_unloads: Optional[int] = None,
+        tool_cache_hits: Optional[int] = None,
+        tool_cache_misses: Optional[int] = None,
     ) -> None:
         """Record metrics for a successful operation.
 
@@ -35,6 +39,10 @@ class MetricsRecorder:
             start_time: The timestamp when the operation started.
             response_api: The response object from the API.
             provider_type: Type of provider ('openai' or 'ollama') for specific handling.
+            model_loads: Model load count reported by a residency manager.
+            model_unloads: Model unload count reported by a residency manager.
+            tool_cache_hits: Tool calls served from the tool result cache.
+            tool_cache_misses: Cacheable tool calls that were executed.
         """
         latency = (time.time() - start_time) * 1000
 
@@ -69,8 +77,12 @@ class MetricsRecorder:
             prompt_eval_duration_ms=prompt_eval_duration_ms,
             eval_duration_ms=eval_duration_ms,
             success=True,
+            model_loads=model_loads,
+            model_unloads=model_unloads,
+            tool_cache_hits=tool_cache_hits,
+            tool_cache_misses=tool_cache_misses,
         )
-        self._metrics.append(metrics)
+        self.record(metrics)
         self._logger.info('Chat completed: %s', metrics)
 
     def record_error_metrics(
@@ -92,7 +104,90 @@ class MetricsRecorder:
             success=False,
             error_message=error_message,
         )
+        self.record(metrics)
+
+    def record_timeout_metrics(
+        self,
+        model: str,
+        start_time: float,
+        error: Any,
+        tokens_used: Optional[int] = None,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        tool_cache_hits: Optional[int] = None,
+        tool_cache_misses: Optional[int] = None,
+    ) -> None:
+        """Record partial metrics for an operation that ran past its deadline.
+
+        Args:
+            model: The model name used for the operation.
+            start_time: The timestamp when the operation started.
+            error: The timeout error.
+            tokens_used: Tokens used by the requests that completed.
+            prompt_tokens: Prompt tokens of the requests that completed.
+            completion_tokens: Response tokens of the requests that completed.
+            tool_cache_hits: Tool calls served from the tool result cache.
+            tool_cache_misses: Cacheable tool calls that were executed.
+        """
+        metrics = ChatMetrics(
+            model=model,
+            latency_ms=(time.time() - start_time) * 1000,
+            tokens_used=tokens_used or None,
+            prompt_tokens=prompt_tokens or None,
+            completion_tokens=completion_tokens or None,
+            success=False,
+            error_message=str(error),
+            tool_cache_hits=tool_cache_hits,
+            tool_cache_misses=tool_cache_misses,
+            timed_out=True,
+        )
+        self.record(metrics)
+        self._logger.warning('Chat timed out: %s', metrics)
+
+    def record_cancelled_metrics(
+        self,
+        model: str,
+        start_time: float,
+        tokens_used: Optional[int] = None,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        tool_cache_hits: Optional[int] = None,
+        tool_cache_misses: Optional[int] = None,
+    ) -> None:
+        """Record partial metrics for an operation cancelled by its caller.
+
+        Args:
+            model: The model name used for the operation.
+            start_time: The timestamp when the operation started.
+            tokens_used: Tokens used by the requests that completed.
+            prompt_tokens: Prompt tokens of the requests that completed.
+            completion_tokens: Response tokens of the requests that completed.
+            tool_cache_hits: Tool calls served from the tool result cache.
+            tool_cache_misses: Cacheable tool calls that were executed.
+        """
+        metrics = ChatMetrics(
+            model=model,
+            latency_ms=(time.time() - start_time) * 1000,
+            tokens_used=tokens_used or None,
+            prompt_tokens=prompt_tokens or None,
+            completion_tokens=completion_tokens or None,
+            success=False,
+            error_message='Cancelled by the caller',
+            tool_cache_hits=tool_cache_hits,
+            tool_cache_misses=tool_cache_misses,
+            cancelled=True,
+        )
+        self.record(metrics)
+        self._logger.info('Chat cancelled: %s', metrics)
+
+    def record(self, metrics: ChatMetrics) -> None:
+        """Store a request's metrics and report them to the active scope.
+
+        Args:
+            metrics: The metrics of the request.
+        """
         self._metrics.append(metrics)
+        MetricsScope.report(metrics)
 
     def get_metrics(self) -> List[ChatMetrics]:
         """Return a copy of collected metrics.
@@ -102,6 +197,35 @@ class MetricsRecorder:
         """
         return self._metrics.copy()
 
+    @staticmethod
+    def extract_total_tokens(
+        response_api: Any, provider_type: str
+    ) -> Optional[int]:
+        """Return the total tokens billed for a response, if reported.
+
+        Args:
+            response_api: The response object from the API.
+            provider_type: Type of provider ('openai' or 'ollama').
+
+        Returns:
+            The total number of tokens, or None if usage is unavailable.
+        """
+        try:
+            if provider_type == 'openai':
+                tokens_used: Optional[int] = (
+                    MetricsRecorder._extract_openai_tokens(response_api)[0]
+                )
+                return tokens_used
+            if provider_type == 'ollama':
+                prompt_eval_count = response_api.get('prompt_eval_count')
+                eval_count = response_api.get('eval_count')
+                if prompt_eval_count is None and eval_count is None:
+                    return None
+                return (prompt_eval_count or 0) + (eval_count or 0)
+        except (AttributeError, TypeError):
+            return None
+        return None
+
     @staticmethod
     def _extract_openai_tokens(response_api: Any) -> tuple:
         """Extract token information from OpenAI response.
@@ -0,0 +1,175 @@
+import hashlib
+import json
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
+
+from ....application.interfaces import ChatRepository
+from ....domain import BaseTool, Deadline
+from ...config import ChatMetrics, LoggingConfig, ResponseCache
+from .chat_cache_utils import (
+    ChatCallArgs,
+    describe_tool,
+    has_only_reusable_tools,
+    record_stream,
+    replay_response,
+    reuse_ttl_s,
+)
+
+
+class ResponseCacheChatAdapter(ChatRepository):
+    """Answers repeated chat requests from a response cache.
+
+    Requests are keyed on a canonical hash of provider, model,
+    instructions, config, tool schemas and cache scopes, history and
+    message. A hit is returned without calling
+    the provider; in streaming mode the cached text is replayed as a
+    token stream. In 'deterministic' mode only requests with
+    `temperature` 0 are cached. Requests with tools that are neither
+    `idempotent` nor `cacheable` are never cached, and answers built on
+    `cacheable` tools that are not `idempotent` expire with the shortest
+    `cache_ttl_s` of those tools.
+    """
+
+    def __init__(
+        self,
+        adapter: ChatRepository,
+        cache: ResponseCache,
+        provider: Optional[str] = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            adapter: The adapter that answers cache misses.
+            cache: The response cache.
+            provider: The provider the adapter calls, so providers serving
+                a model of the same name do not share entries.
+        """
+        self.__adapter = adapter
+        self.__cache = cache
+        self.__provider = provider
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @property
+    def wrapped(self) -> ChatRepository:
+        """Return the adapter behind the cache."""
+        return self.__adapter
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Return the response cache."""
+        return self.__cache
+
+    @staticmethod
+    def make_key(
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+        provider: Optional[str] = None,
+    ) -> str:
+        """Returns a hash identifying a chat request.
+
+        The `stream` flag is left out, so streamed and complete requests
+        share entries.
+
+        Returns:
+            str: Hex digest of the request's canonical JSON form.
+        """
+        payload = {
+            'provider': provider,
+            'model': model,
+            'instructions': instructions,
+            'config': {
+                key: value
+                for key, value in (config or {}).items()
+                if key != 'stream'
+            },
+            'tools': [describe_tool(tool) for tool in tools or []],
+            'history': history,
+            'user_ask': user_ask,
+        }
+        serialized = json.dumps(
+            payload, sort_keys=True, separators=(',', ':'), default=str
+        )
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    async def chat(
+        self,
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Send a message, answering from the cache when possible.
+
+        Raises:
+            ChatException: If the wrapped adapter fails.
+        """
+        call_kwargs: ChatCallArgs = {
+            'model': model,
+            'instructions': instructions,
+            'config': config,
+            'tools': tools,
+            'history': history,
+            'user_ask': user_ask,
+        }
+        if not self.__is_cacheable(config, tools):
+            return await self.__adapter.chat(
+                **call_kwargs, deadline=deadline, tool_pool=tool_pool
+            )
+
+        key = self.make_key(**call_kwargs, provider=self.__provider)
+        streaming = bool(config and config.get('stream'))
+        cached = await self.__cache.get(key)
+        if cached is not None:
+            self.__logger.debug('Response cache hit for model %s', model)
+            return replay_response(cached) if streaming else cached
+
+        result = await self.__adapter.chat(
+            **call_kwargs, deadline=deadline, tool_pool=tool_pool
+        )
+        max_ttl_s = reuse_ttl_s(tools)
+        if isinstance(result, AsyncGenerator):
+            return record_stream(
+                result,
+                lambda response: self.__cache.set(key, response, max_ttl_s),
+            )
+        if result:
+            await self.__cache.set(key, result, max_ttl_s)
+        return result
+
+    async def warmup(self, model: str) -> None:
+        """Warm up the wrapped adapter."""
+        await self.__adapter.warmup(model)
+
+    async def aclose(self) -> None:
+        """Release the wrapped adapter's resources."""
+        await self.__adapter.aclose()
+
+    def get_metrics(self) -> List[ChatMetrics]:
+        """Return the metrics collected by the wrapped adapter.
+
+        Returns:
+            List[ChatMetrics]: The list of metrics.
+        """
+        get_metrics = getattr(self.__adapter, 'get_metrics', None)
+        if get_metrics is None:
+            return []
+        metrics: List[ChatMetrics] = get_metrics()
+        return metrics
+
+    def __is_cacheable(
+        self,
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+    ) -> bool:
+        if self.__cache.mode == 'deterministic' and (
+            not config or config.get('temperature') != 0
+        ):
+            return False
+        return has_only_reusable_tools(tools)
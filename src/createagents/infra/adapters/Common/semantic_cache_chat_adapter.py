@@ -0,0 +1,189 @@
+import json
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
+
+from ....application.interfaces import ChatRepository
+from ....domain import BaseTool, ChatTimeoutException, Deadline
+from ...config import ChatMetrics, LoggingConfig, SemanticCache
+from .chat_cache_utils import (
+    ChatCallArgs,
+    has_only_reusable_tools,
+    record_stream,
+    replay_response,
+    reuse_ttl_s,
+)
+from .deadline_utils import run_within
+
+
+class SemanticCacheChatAdapter(ChatRepository):
+    """Answers chat requests that resemble earlier ones from a cache.
+
+    The user message is embedded and compared with the messages already
+    answered under the same model, instructions, tool schemas, config and
+    history; if one is similar enough, its response is returned without
+    calling the provider. In streaming mode the cached text is replayed
+    as a token stream. Requests with tools that are neither `idempotent`
+    nor `cacheable`, or that do not ask for deterministic answers
+    (`temperature` 0; providers sample when it is unset), are never cached; answers built on `cacheable` tools that are not
+    `idempotent` expire with the shortest `cache_ttl_s` of those tools. If
+    the embedding fails, the request goes straight to the provider.
+    """
+
+    def __init__(self, adapter: ChatRepository, cache: SemanticCache):
+        """Initialize the wrapper.
+
+        Args:
+            adapter: The adapter that answers cache misses.
+            cache: The semantic cache.
+        """
+        self.__adapter = adapter
+        self.__cache = cache
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @property
+    def wrapped(self) -> ChatRepository:
+        """Return the adapter behind the cache."""
+        return self.__adapter
+
+    @property
+    def cache(self) -> SemanticCache:
+        """Return the semantic cache."""
+        return self.__cache
+
+    @staticmethod
+    def make_context(
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+    ) -> int:
+        """Returns the hash of everything but the user message.
+
+        The `stream` flag is left out, so streamed and complete requests
+        share entries.
+
+        Returns:
+            int: The context hash used by the semantic cache.
+        """
+        serialized = json.dumps(
+            {
+                'config': {
+                    key: value
+                    for key, value in (config or {}).items()
+                    if key != 'stream'
+                },
+                'tools': [
+                    {
+                        'name': tool.name,
+                        'description': tool.description,
+                        'parameters': getattr(tool, 'parameters', None),
+                    }
+                    for tool in tools or []
+                ],
+                'history': history,
+            },
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str,
+        )
+        return SemanticCache.make_context(
+            model, instructions or '', serialized
+        )
+
+    async def chat(
+        self,
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Send a message, answering from the cache when possible.
+
+        Raises:
+            ChatTimeoutException: If the deadline passes.
+            ChatException: If the wrapped adapter fails.
+        """
+        call_kwargs: ChatCallArgs = {
+            'model': model,
+            'instructions': instructions,
+            'config': config,
+            'tools': tools,
+            'history': history,
+            'user_ask': user_ask,
+        }
+        if not self.__is_cacheable(config, tools):
+            return await self.__adapter.chat(
+                **call_kwargs, deadline=deadline, tool_pool=tool_pool
+            )
+
+        try:
+            vector = await run_within(
+                deadline,
+                self.__cache.embed(user_ask),
+                'embedding the message',
+            )
+        except ChatTimeoutException:
+            raise
+        except Exception as e:
+            self.__logger.warning(
+                'Semantic cache bypassed, embedding failed: %s', e
+            )
+            return await self.__adapter.chat(
+                **call_kwargs, deadline=deadline, tool_pool=tool_pool
+            )
+
+        context = self.make_context(
+            model, instructions, config, tools, history
+        )
+        cached = self.__cache.search(context, vector)
+        if cached is not None:
+            self.__logger.debug('Semantic cache hit for model %s', model)
+            streaming = bool(config and config.get('stream'))
+            return replay_response(cached) if streaming else cached
+
+        max_ttl_s = reuse_ttl_s(tools)
+
+        async def store(response: str) -> None:
+            self.__cache.add(context, vector, response, max_ttl_s)
+
+        result = await self.__adapter.chat(
+            **call_kwargs, deadline=deadline, tool_pool=tool_pool
+        )
+        if isinstance(result, AsyncGenerator):
+            return record_stream(result, store)
+        if result:
+            await store(result)
+        return result
+
+    async def warmup(self, model: str) -> None:
+        """Warm up the wrapped adapter."""
+        await self.__adapter.warmup(model)
+
+    async def aclose(self) -> None:
+        """Release the wrapped adapter's resources."""
+        await self.__adapter.aclose()
+
+    def get_metrics(self) -> List[ChatMetrics]:
+        """Return the metrics collected by the wrapped adapter.
+
+        Returns:
+            List[ChatMetrics]: The list of metrics.
+        """
+        get_metrics = getattr(self.__adapter, 'get_metrics', None)
+        if get_metrics is None:
+            return []
+        metrics: List[ChatMetrics] = get_metrics()
+        return metrics
+
+    @staticmethod
+    def __is_cacheable(
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+    ) -> bool:
+        if (config or {}).get('temperature') != 0:
+            return False
+        return has_only_reusable_tools(tools)
@@ -0,0 +1,114 @@
+import threading
+import weakref
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
+
+from ....application.interfaces import ChatRepository
+from ....domain import BaseTool, Deadline
+from ...config import ChatMetrics, LoggingConfig
+
+
+class SharedChatAdapter(ChatRepository):
+    """One holder's handle on a chat adapter shared by several agents.
+
+    Cached adapters are shared by every agent on the same provider and
+    model, so closing one on behalf of a single agent would drop the
+    connections the others are using. Each handle holds the adapter once;
+    `aclose` drops that hold, and the adapter itself is only closed when
+    no handle holds it any more. A closed handle holds the adapter again
+    on its next call.
+    """
+
+    _holders: 'weakref.WeakKeyDictionary[ChatRepository, int]' = (
+        weakref.WeakKeyDictionary()
+    )
+    _lock = threading.Lock()
+
+    def __init__(self, adapter: ChatRepository):
+        """Initialize the handle and hold the adapter.
+
+        Args:
+            adapter: The shared adapter.
+        """
+        self.__adapter = adapter
+        self.__held = False
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__hold()
+
+    @property
+    def wrapped(self) -> ChatRepository:
+        """Return the shared adapter."""
+        return self.__adapter
+
+    @classmethod
+    def holders(cls, adapter: ChatRepository) -> int:
+        """Return how many handles hold an adapter."""
+        with cls._lock:
+            return cls._holders.get(adapter, 0)
+
+    async def chat(
+        self,
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Send a message through the shared adapter."""
+        self.__hold()
+        return await self.__adapter.chat(
+            model=model,
+            instructions=instructions,
+            config=config,
+            tools=tools,
+            history=history,
+            user_ask=user_ask,
+            deadline=deadline,
+            tool_pool=tool_pool,
+        )
+
+    async def warmup(self, model: str) -> None:
+        """Warm up the shared adapter."""
+        self.__hold()
+        await self.__adapter.warmup(model)
+
+    async def aclose(self) -> None:
+        """Drop this handle's hold; the last holder closes the adapter."""
+        if not self.__held:
+            return
+        self.__held = False
+        with self._lock:
+            count = self._holders.get(self.__adapter, 0) - 1
+            if count > 0:
+                self._holders[self.__adapter] = count
+            else:
+                self._holders.pop(self.__adapter, None)
+        if count > 0:
+            self.__logger.debug(
+                'Adapter still held by %s other handle(s); not closed', count
+            )
+            return
+        await self.__adapter.aclose()
+
+    def get_metrics(self) -> List[ChatMetrics]:
+        """Return the metrics collected by the shared adapter.
+
+        Returns:
+            List[ChatMetrics]: The list of metrics.
+        """
+        get_metrics = getattr(self.__adapter, 'get_metrics', None)
+        if get_metrics is None:
+            return []
+        metrics: List[ChatMetrics] = get_metrics()
+        return metrics
+
+    def __hold(self) -> None:
+        if self.__held:
+            return
+        self.__held = True
+        with self._lock:
+            self._holders[self.__adapter] = (
+                self._holders.get(self.__adapter, 0) + 1
+            )
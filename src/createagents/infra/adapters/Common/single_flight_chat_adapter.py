@@ -0,0 +1,331 @@
+import asyncio
+import hashlib
+import json
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ....application.interfaces import ChatRepository
+from ....domain import BaseTool, ChatTimeoutException, Deadline
+from ...config import ChatMetrics, LoggingConfig
+from .chat_cache_utils import (
+    ChatCallArgs,
+    describe_tool,
+    has_only_reusable_tools,
+)
+from .deadline_utils import run_within
+
+_FlightKey = Tuple[asyncio.AbstractEventLoop, str]
+
+
+class StreamTee:
+    """Fans one token stream out to several consumers.
+
+    The source is read once, by a background task started when the first
+    consumer begins iterating; every consumer replays the tokens from the
+    start, so consumers that join late miss nothing. If every consumer
+    stops early, the source is closed.
+    """
+
+    def __init__(
+        self,
+        source: AsyncGenerator[str, None],
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the tee.
+
+        Args:
+            source: The upstream token stream.
+            on_done: Called once the source is exhausted, failed or closed.
+        """
+        self.__source = source
+        self.__on_done = on_done
+        self.__tokens: List[str] = []
+        self.__error: Optional[BaseException] = None
+        self.__finished = False
+        self.__changed = asyncio.Event()
+        self.__pump: Optional['asyncio.Task[None]'] = None
+        self.__consumers = 0
+
+    @property
+    def abandoned(self) -> bool:
+        """Return whether the source was closed because nobody read it."""
+        return isinstance(self.__error, asyncio.CancelledError)
+
+    def subscribe(self) -> AsyncGenerator[str, None]:
+        """Returns a new consumer of the stream.
+
+        Returns:
+            AsyncGenerator[str, None]: All tokens of the stream, from the
+                first one.
+        """
+        self.__consumers += 1
+        return self.__consume()
+
+    async def __consume(self) -> AsyncGenerator[str, None]:
+        index = 0
+        try:
+            if self.__pump is None:
+                self.__pump = asyncio.ensure_future(self.__run())
+            while True:
+                while index < len(self.__tokens):
+                    yield self.__tokens[index]
+                    index += 1
+                if self.__finished:
+                    if self.__error is not None:
+                        raise self.__error
+                    return
+                await self.__changed.wait()
+        finally:
+            self.__consumers -= 1
+            if (
+                self.__consumers == 0
+                and self.__pump is not None
+                and not self.__pump.done()
+            ):
+                self.__pump.cancel()
+
+    async def __run(self) -> None:
+        try:
+            async for token in self.__source:
+                self.__tokens.append(token)
+                self.__notify()
+        except asyncio.CancelledError:
+            self.__error = asyncio.CancelledError()
+            await self.__source.aclose()
+            raise
+        except Exception as e:
+            self.__error = e
+        finally:
+            self.__finished = True
+            self.__notify()
+            if self.__on_done is not None:
+                self.__on_done()
+
+    def __notify(self) -> None:
+        self.__changed.set()
+        self.__changed = asyncio.Event()
+
+
+_Flight = asyncio.Future[Union[str, StreamTee]]
+
+
+class SingleFlightChatAdapter(ChatRepository):
+    """Shares one upstream call among identical concurrent chat requests.
+
+    Requests are identical when model, instructions, config, tools,
+    history and user message all match. While such a request is in flight,
+    new identical requests wait for its response instead of calling the
+    provider again; streaming requests each receive a tee of the same
+    token stream. Requests whose tools are neither `idempotent` nor
+    `cacheable` are never shared, since sharing would skip tool side
+    effects.
+
+    The upstream call runs under the deadline of the request that started
+    it; every other request waits only as long as its own deadline allows.
+    If the shared call times out while a waiter still has time left, the
+    waiter calls the provider itself.
+    """
+
+    def __init__(self, adapter: ChatRepository):
+        """Initialize the wrapper.
+
+        Args:
+            adapter: The adapter that performs the upstream calls.
+        """
+        self.__adapter = adapter
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__in_flight: Dict[_FlightKey, _Flight] = {}
+        self.__waiters: Dict[_Flight, int] = {}
+        self.__requests = 0
+        self.__shared = 0
+
+    @property
+    def wrapped(self) -> ChatRepository:
+        """Return the adapter behind the single-flight layer."""
+        return self.__adapter
+
+    @staticmethod
+    def make_key(
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+    ) -> str:
+        """Returns a hash identifying a chat request.
+
+        Returns:
+            str: Hex digest of the request's canonical JSON form.
+        """
+        payload = {
+            'model': model,
+            'instructions': instructions,
+            'config': config,
+            'tools': [describe_tool(tool) for tool in tools or []],
+            'history': history,
+            'user_ask': user_ask,
+        }
+        serialized = json.dumps(
+            payload, sort_keys=True, separators=(',', ':'), default=str
+        )
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    async def chat(
+        self,
+        model: str,
+        instructions: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        history: Sequence[Dict[str, str]],
+        user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Send a message, sharing the call with identical requests.
+
+        Raises:
+            ChatTimeoutException: If the deadline passes.
+            ChatException: If the shared upstream call fails.
+        """
+        self.__requests += 1
+        call_kwargs: ChatCallArgs = {
+            'model': model,
+            'instructions': instructions,
+            'config': config,
+            'tools': tools,
+            'history': history,
+            'user_ask': user_ask,
+        }
+        if not has_only_reusable_tools(tools):
+            return await self.__adapter.chat(
+                **call_kwargs, deadline=deadline, tool_pool=tool_pool
+            )
+
+        key = (asyncio.get_running_loop(), self.make_key(**call_kwargs))
+        flight = self.__in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self.__call(key, call_kwargs, deadline, tool_pool)
+            )
+            self.__in_flight[key] = flight
+        else:
+            self.__shared += 1
+            self.__logger.debug(
+                'Sharing in-flight request for model %s', model
+            )
+
+        self.__waiters[flight] = self.__waiters.get(flight, 0) + 1
+        try:
+            result = await run_within(
+                deadline,
+                asyncio.shield(flight),
+                'waiting for a shared request',
+            )
+        except BaseException as e:
+            if self.__leave(flight) == 0 and not flight.done():
+                flight.cancel()
+            if not self.__is_foreign_timeout(e, flight, deadline):
+                raise
+            return await self.__adapter.chat(
+                **call_kwargs, deadline=deadline, tool_pool=tool_pool
+            )
+        self.__leave(flight)
+
+        if isinstance(result, StreamTee):
+            if result.abandoned:
+                return await self.__adapter.chat(
+                    **call_kwargs, deadline=deadline, tool_pool=tool_pool
+                )
+            stream = result.subscribe()
+            if deadline is None:
+                return stream
+            return deadline.iterate(stream, 'streaming a shared response')
+        return result
+
+    async def warmup(self, model: str) -> None:
+        """Warm up the wrapped adapter."""
+        await self.__adapter.warmup(model)
+
+    async def aclose(self) -> None:
+        """Release the wrapped adapter's resources."""
+        await self.__adapter.aclose()
+
+    def get_metrics(self) -> List[ChatMetrics]:
+        """Return the metrics collected by the wrapped adapter.
+
+        Returns:
+            List[ChatMetrics]: The list of metrics.
+        """
+        get_metrics = getattr(self.__adapter, 'get_metrics', None)
+        if get_metrics is None:
+            return []
+        metrics: List[ChatMetrics] = get_metrics()
+        return metrics
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns how many requests were received and how many shared.
+
+        Returns:
+            Dictionary with requests, shared and in_flight counts.
+        """
+        return {
+            'requests': self.__requests,
+            'shared': self.__shared,
+            'in_flight': len(self.__in_flight),
+        }
+
+    async def __call(
+        self,
+        key: _FlightKey,
+        call_kwargs: ChatCallArgs,
+        deadline: Optional[Deadline],
+        tool_pool: Optional[str],
+    ) -> Union[str, StreamTee]:
+        try:
+            result = await self.__adapter.chat(
+                **call_kwargs, deadline=deadline, tool_pool=tool_pool
+            )
+        except BaseException:
+            self.__forget(key)
+            raise
+
+        if isinstance(result, AsyncGenerator):
+            # Identical requests keep joining until the stream has ended.
+            return StreamTee(result, on_done=lambda: self.__forget(key))
+
+        self.__forget(key)
+        return result
+
+    @staticmethod
+    def __is_foreign_timeout(
+        error: BaseException,
+        flight: _Flight,
+        deadline: Optional[Deadline],
+    ) -> bool:
+        """Whether the shared call ran out of another request's budget."""
+        return (
+            isinstance(error, ChatTimeoutException)
+            and flight.done()
+            and not flight.cancelled()
+            and flight.exception() is error
+            and (deadline is None or not deadline.expired)
+        )
+
+    def __leave(self, flight: _Flight) -> int:
+        remaining = self.__waiters.pop(flight, 1) - 1
+        if remaining > 0:
+            self.__waiters[flight] = remaining
+        return remaining
+
+    def __forget(self, key: _FlightKey) -> None:
+        self.__in_flight.pop(key, None)
@@ -1,9 +1,11 @@
 from .ollama_chat_adapter import OllamaChatAdapter
+from .ollama_embedder import OllamaEmbedder
 from .ollama_tool_call_parser import OllamaToolCallParser
 from .ollama_tool_schema_formatter import OllamaToolSchemaFormatter
 
 __all__ = [
     'OllamaChatAdapter',
+    'OllamaEmbedder',
     'OllamaToolCallParser',
     'OllamaToolSchemaFormatter',
 ]
@@ -1,7 +1,7 @@
-from typing import Any, Dict, AsyncGenerator, List, Optional, Union
+from typing import Any, Dict, AsyncGenerator, List, Optional, Sequence, Union
 
 from ....application.interfaces import ChatRepository
-from ....domain import BaseTool, ChatException
+from ....domain import BaseTool, ChatException, Deadline
 from ...config import ChatMetrics, LoggingConfig
 from .ollama_client import OllamaClient
 from .ollama_handler import OllamaHandler
@@ -35,8 +35,10 @@ class OllamaChatAdapter(ChatRepository):
         instructions: Optional[str],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
-        history: List[Dict[str, str]],
+        history: Sequence[Dict[str, str]],
         user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
     ) -> Union[str, AsyncGenerator[str, None]]:
         """
         Sends a message to Ollama and returns the response.
@@ -48,6 +50,8 @@ class OllamaChatAdapter(ChatRepository):
             history: The conversation history.
             user_ask: The user's question.
             tools: Optional list of tools (native Ollama API).
+            deadline: Optional deadline bounding the whole tool loop.
+            tool_pool: Optional pool for synchronous tools without one.
 
         Returns:
             Union[str, AsyncGenerator[str, None]]:
@@ -55,6 +59,7 @@ class OllamaChatAdapter(ChatRepository):
                 - AsyncGenerator[str, None]: Token stream (if stream=True)
 
         Raises:
+            ChatTimeoutException: If the deadline passes.
             ChatException: If a communication error occurs or if streaming
                 is used with tool calling.
         """
@@ -63,11 +68,18 @@ class OllamaChatAdapter(ChatRepository):
                 'Starting chat with model %s on Ollama.', model
             )
 
-            messages = []
-            if instructions and instructions.strip():
-                messages.append({'role': 'system', 'content': instructions})
-            messages.extend(history)
-            messages.append({'role': 'user', 'content': user_ask})
+            system = (
+                [{'role': 'system', 'content': instructions}]
+                if instructions and instructions.strip()
+                else []
+            )
+            # The history's dicts are shared, read-only; only the list is
+            # new, as the tool loop appends to it.
+            messages = [
+                *system,
+                *history,
+                {'role': 'user', 'content': user_ask},
+            ]
 
             # Check if streaming mode is enabled
             if config and config.get('stream'):
@@ -76,14 +88,19 @@ class OllamaChatAdapter(ChatRepository):
                 )
                 self.__logger.debug('Streaming mode enabled for Ollama')
                 result_stream = stream_handler.handle_stream(
-                    model, messages, config, tools
+                    model,
+                    messages,
+                    config,
+                    tools,
+                    deadline,
+                    tool_pool=tool_pool,
                 )
                 return result_stream
 
             # Non-streaming mode - Tool calling loop
             handler = OllamaHandler(self.__client, self.__metrics)
             result: str = await handler.execute_tool_loop(
-                model, messages, config, tools
+                model, messages, config, tools, deadline, tool_pool=tool_pool
             )
             return result
 
@@ -98,6 +115,35 @@ class OllamaChatAdapter(ChatRepository):
                 original_error=e,
             ) from e
 
+    async def warmup(self, model: str) -> None:
+        """Load the model into memory before the first chat request.
+
+        Args:
+            model: The name of the model.
+
+        Raises:
+            ChatException: If the model could not be loaded.
+        """
+        try:
+            load_duration_ms = await self.__client.warmup(model)
+        except Exception as e:
+            self.__logger.error(
+                'Error warming up Ollama model %s: %s', model, e
+            )
+            raise ChatException(
+                f'Error warming up Ollama model {model}: {str(e)}',
+                original_error=e,
+            ) from e
+
+        self.__logger.info(
+            'Ollama model %s warmed up (load: %sms)', model, load_duration_ms
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connection to the Ollama host."""
+        await self.__client.aclose()
+        self.__logger.info('Ollama adapter connections closed')
+
     def get_metrics(self) -> List[ChatMetrics]:
         """Return the list of collected metrics.
 
@@ -1,25 +1,47 @@
-import subprocess  # nosec B404
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from ollama import AsyncClient, ChatResponse
+from ollama import ChatResponse
 
-from ...config import EnvironmentConfig, LoggingConfig, retry_with_backoff
+from ....domain import Deadline
+from ...config import (
+    EnvironmentConfig,
+    LoggingConfig,
+    RateLimiter,
+    RequestHedger,
+    is_retryable_error,
+    retry_with_backoff,
+)
+from ...config.retry import get_retry_after
+from ..Common import MetricsRecorder
+from .ollama_connection_pool import OllamaConnectionPool
+from .ollama_residency_manager import OllamaResidencyManager
 
 
 class OllamaClient:
     """Handles direct communication with the Ollama API."""
 
-    def __init__(self):
+    RETRY_BUDGET_SECONDS = 30.0
+    DEFAULT_HOST = 'http://localhost:11434'
+
+    def __init__(self) -> None:
         self.__logger = LoggingConfig.get_logger(__name__)
-        self.__host = EnvironmentConfig.get_env(
-            'OLLAMA_HOST', 'http://localhost:11434'
+        self.__host = (
+            EnvironmentConfig.get_env('OLLAMA_HOST', self.DEFAULT_HOST)
+            or self.DEFAULT_HOST
         )
         self.__max_retries = int(
-            EnvironmentConfig.get_env('OLLAMA_MAX_RETRIES', '3')
+            EnvironmentConfig.get_env('OLLAMA_MAX_RETRIES', '3') or '3'
         )
+        self.__residency = OllamaResidencyManager.for_host(self.__host)
+        self.__attached = False
+        self.__attach()
 
     @retry_with_backoff(
-        max_attempts=3, initial_delay=1.0, exceptions=(Exception,)
+        max_attempts=3,
+        initial_delay=1.0,
+        exceptions=(Exception,),
+        retry_if=is_retryable_error,
+        max_retry_time=RETRY_BUDGET_SECONDS,
     )
     async def call_api(
         self,
@@ -27,49 +49,212 @@ class OllamaClient:
         messages: List[Dict[str, str]],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Union[ChatResponse, AsyncIterator[ChatResponse]]:
-        """Calls the Ollama API with automatic retries."""
+        """Calls the Ollama API with automatic retries.
+
+        When `OLLAMA_RPM_LIMIT` or `OLLAMA_TPM_LIMIT` is set, the call
+        first waits for the shared rate limiter of the model. With
+        `OLLAMA_HEDGING=true`, a slow call is hedged with a duplicate.
+        An attempt is not started once the deadline, if any, has passed.
+
+        Raises:
+            ChatTimeoutException: If the deadline has already passed.
+        """
+        if deadline is not None:
+            deadline.check('calling Ollama')
+        self.__attach()
+
+        stream = config.get('stream', False) if config else False
+        chat_kwargs: Dict[str, Any] = {
+            'model': model,
+            'messages': messages,
+            'keep_alive': self.__residency.request_keep_alive(),
+        }
+
+        if tools:
+            chat_kwargs['tools'] = tools
+        if config:
+            config_copy = config.copy()
+            if 'think' in config_copy:
+                chat_kwargs['think'] = config_copy.pop('think')
+            if 'max_tokens' in config_copy:
+                config_copy['num_predict'] = config_copy.pop('max_tokens')
+            chat_kwargs['options'] = config_copy
+
+        hedger = RequestHedger.for_model('ollama', model)
+        if stream:
+            if hedger is None:
+                return await self.__send_stream(chat_kwargs)
+            return await hedger.run_stream(
+                lambda: self.__send_stream(chat_kwargs)
+            )
+        if hedger is None:
+            return await self.__send(chat_kwargs)
+        return await hedger.run(lambda: self.__send(chat_kwargs))
+
+    async def __send(self, chat_kwargs: Dict[str, Any]) -> ChatResponse:
+        """Sends one request through the model's rate limiter, if any."""
+        rate_limiter, estimated_tokens = await self.__admit(chat_kwargs)
         try:
-            chat_kwargs: Dict[str, Any] = {
-                'model': model,
-                'messages': messages,
-                'stream': config.get('stream', False) if config else False,
-            }
-
-            if tools:
-                chat_kwargs['tools'] = tools
-            if config:
-                config_copy = config.copy()
-                if 'think' in config_copy:
-                    chat_kwargs['think'] = config_copy.pop('think')
-                if 'max_tokens' in config_copy:
-                    config_copy['num_predict'] = config_copy.pop('max_tokens')
-                chat_kwargs['options'] = config_copy
-
-            client = AsyncClient(host=self.__host)
-            result: Union[
-                ChatResponse, AsyncIterator[ChatResponse]
-            ] = await client.chat(**chat_kwargs)
-            return result
+            client = OllamaConnectionPool.get_client(self.__host)
+            response = await client.chat(stream=False, **chat_kwargs)
         except Exception as e:
-            self.__logger.error(
-                "Error calling Ollama API for model '%s': %s", model, e
+            self.__on_request_error(
+                chat_kwargs, e, rate_limiter, estimated_tokens
             )
             raise
 
-    def stop_model(self, model: str) -> None:
-        """Stops the Ollama model after use to free up memory."""
+        if rate_limiter is not None:
+            rate_limiter.reconcile(
+                estimated_tokens,
+                MetricsRecorder.extract_total_tokens(response, 'ollama'),
+            )
+        return response
+
+    async def __send_stream(
+        self, chat_kwargs: Dict[str, Any]
+    ) -> AsyncIterator[ChatResponse]:
+        """Opens one stream through the model's rate limiter, if any.
+
+        The limiter learns the real usage when the stream ends.
+        """
+        rate_limiter, estimated_tokens = await self.__admit(chat_kwargs)
         try:
-            subprocess.run(  # nosec B603 B607
-                ['ollama', 'stop', model],
-                capture_output=True,
-                timeout=10,
-                check=False,
+            client = OllamaConnectionPool.get_client(self.__host)
+            stream = await client.chat(stream=True, **chat_kwargs)
+        except Exception as e:
+            self.__on_request_error(
+                chat_kwargs, e, rate_limiter, estimated_tokens
             )
-            self.__logger.debug('Model %s stopped successfully.', model)
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as e:
-            self.__logger.warning('Could not stop model %s: %s', model, e)
+            raise
+
+        if rate_limiter is None:
+            return stream
+        return rate_limiter.track_stream(
+            stream, estimated_tokens, self.__stream_usage
+        )
+
+    async def __admit(
+        self, chat_kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[RateLimiter], int]:
+        """Waits for the model's rate limiter, if any.
+
+        Returns:
+            The limiter and the tokens reserved on it.
+        """
+        rate_limiter = RateLimiter.for_model('ollama', chat_kwargs['model'])
+        if rate_limiter is None:
+            return None, 0
+        estimated_tokens = RateLimiter.estimate_tokens(
+            None,
+            chat_kwargs['messages'],
+            chat_kwargs.get('tools'),
+            chat_kwargs.get('options', {}).get('num_predict'),
+        )
+        try:
+            await rate_limiter.acquire(estimated_tokens)
         except Exception as e:
-            self.__logger.warning(
-                'Error trying to stop model %s: %s', model, e
+            self.__on_request_error(
+                chat_kwargs, e, rate_limiter, estimated_tokens
+            )
+            raise
+        return rate_limiter, estimated_tokens
+
+    def __on_request_error(
+        self,
+        chat_kwargs: Dict[str, Any],
+        error: Exception,
+        rate_limiter: Optional[RateLimiter],
+        estimated_tokens: int,
+    ) -> None:
+        """Logs a failed request and returns its tokens to the limiter."""
+        self.__logger.error(
+            "Error calling Ollama API for model '%s': %s",
+            chat_kwargs['model'],
+            error,
+        )
+        if rate_limiter is not None and estimated_tokens:
+            rate_limiter.reconcile(estimated_tokens, 0)
+            if getattr(error, 'status_code', None) == 429:
+                rate_limiter.pause(get_retry_after(error) or 1.0)
+
+    @staticmethod
+    def __stream_usage(chunk: Any) -> Optional[int]:
+        """Return the usage reported by the final chunk of a stream."""
+        if not chunk.get('done'):
+            return None
+        return MetricsRecorder.extract_total_tokens(chunk, 'ollama')
+
+    async def warmup(self, model: str) -> Optional[float]:
+        """
+        Loads the model into memory with a zero-token request.
+
+        An empty generate call makes Ollama load the model without
+        producing any output, using the same keep-alive as chat requests.
+
+        Args:
+            model: The name of the model.
+
+        Returns:
+            The server-reported load duration in milliseconds, if any.
+        """
+        self.__attach()
+        self.__residency.acquire(model)
+        try:
+            client = OllamaConnectionPool.get_client(self.__host)
+            response = await client.generate(
+                model=model,
+                keep_alive=self.__residency.request_keep_alive(),
             )
+        finally:
+            self.__residency.release(model)
+
+        load_duration = response.get('load_duration')
+        return load_duration / 1_000_000 if load_duration is not None else None
+
+    def touch_model(self, model: str) -> bool:
+        """Marks the start of a request; returns True if it must be loaded.
+
+        Every call must be paired with `release_model`; the model is not
+        unloaded while a request against it is in flight.
+        """
+        self.__attach()
+        return self.__residency.acquire(model)
+
+    def release_model(self, model: str) -> None:
+        """Marks the end of a request, restarting the model's idle clock.
+
+        Unloading is left to the residency manager, which runs in the
+        background according to its policy.
+        """
+        self.__residency.release(model)
+
+    def get_residency_stats(self, model: str) -> Tuple[int, int]:
+        """Returns the (loads, unloads) counts tracked for the model."""
+        return self.__residency.get_stats(model)
+
+    async def unload_model(self, model: str) -> bool:
+        """Unloads the model from memory now, without a subprocess."""
+        return await self.__residency.unload(model)
+
+    async def aclose(self) -> None:
+        """Releases the shared residency manager and pooled client.
+
+        Background residency work and the pooled connection are only
+        stopped when no other client on the same host still holds them.
+        The client stays usable: the next call acquires them again.
+        """
+        if not self.__attached:
+            return
+        self.__attached = False
+        await self.__residency.detach()
+        await OllamaConnectionPool.release(self.__host)
+
+    def __attach(self) -> None:
+        """Holds the shared residency manager and pooled client."""
+        if self.__attached:
+            return
+        self.__attached = True
+        self.__residency.attach()
+        OllamaConnectionPool.acquire(self.__host)
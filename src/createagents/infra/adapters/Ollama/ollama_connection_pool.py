@@ -0,0 +1,192 @@
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from ollama import AsyncClient
+
+from ...config import EnvironmentConfig, LoggingConfig
+
+
+class OllamaConnectionPool:
+    """
+    A process-wide registry of long-lived Ollama clients, one per host.
+
+    Each client owns an HTTP connection pool that is reused across requests
+    and tool-loop iterations, avoiding a new TCP setup on every round trip.
+    Clients are bound to the event loop that created them: when a call runs
+    on a different loop (e.g. after a new `asyncio.run`), a fresh client is
+    built for that loop and the stale one is discarded.
+
+    Clients that share a host hold a reference with `acquire` and drop it
+    with `release`; the pooled client is only closed when the last holder
+    releases it. `aclose` closes clients regardless of holders and is meant
+    for process-level shutdown.
+
+    Connection limits and keep-alive are read from the environment:
+    `OLLAMA_MAX_CONNECTIONS`, `OLLAMA_MAX_KEEPALIVE_CONNECTIONS` and
+    `OLLAMA_KEEPALIVE_EXPIRY` (seconds).
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+    DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+    _clients: Dict[str, Tuple[AsyncClient, asyncio.AbstractEventLoop]] = {}
+    _refs: Dict[str, int] = {}
+    _lock: threading.Lock = threading.Lock()
+    _logger = LoggingConfig.get_logger(__name__)
+
+    @classmethod
+    def get_limits(cls) -> httpx.Limits:
+        """
+        Builds the connection limits for pooled clients.
+
+        Returns:
+            The httpx limits configured from the environment.
+        """
+        max_connections = int(
+            EnvironmentConfig.get_env(
+                'OLLAMA_MAX_CONNECTIONS', str(cls.DEFAULT_MAX_CONNECTIONS)
+            )
+            or cls.DEFAULT_MAX_CONNECTIONS
+        )
+        max_keepalive = int(
+            EnvironmentConfig.get_env(
+                'OLLAMA_MAX_KEEPALIVE_CONNECTIONS',
+                str(cls.DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+            )
+            or cls.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        )
+        keepalive_expiry = float(
+            EnvironmentConfig.get_env(
+                'OLLAMA_KEEPALIVE_EXPIRY', str(cls.DEFAULT_KEEPALIVE_EXPIRY)
+            )
+            or cls.DEFAULT_KEEPALIVE_EXPIRY
+        )
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+    @classmethod
+    def get_client(cls, host: str) -> AsyncClient:
+        """
+        Returns the pooled client for a host, creating it if needed.
+
+        Must be called from within a running event loop.
+
+        Args:
+            host: The Ollama host URL.
+
+        Returns:
+            The long-lived AsyncClient for the host and the current loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        with cls._lock:
+            cached = cls._clients.get(host)
+            if cached is not None and cached[1] is loop:
+                return cached[0]
+
+            if cached is not None:
+                cls._logger.debug(
+                    'Discarding Ollama client for %s bound to another loop',
+                    host,
+                )
+
+            client = AsyncClient(host=host, limits=cls.get_limits())
+            cls._clients[host] = (client, loop)
+            cls._logger.info('Created pooled Ollama client for %s', host)
+            return client
+
+    @classmethod
+    def acquire(cls, host: str) -> None:
+        """
+        Registers a holder of the pooled client for a host.
+
+        Args:
+            host: The Ollama host URL.
+        """
+        with cls._lock:
+            cls._refs[host] = cls._refs.get(host, 0) + 1
+
+    @classmethod
+    async def release(cls, host: str) -> None:
+        """
+        Drops a holder of the pooled client for a host.
+
+        The client is closed once no holder is left; other holders keep
+        using it otherwise.
+
+        Args:
+            host: The Ollama host URL.
+        """
+        with cls._lock:
+            count = cls._refs.get(host, 0) - 1
+            if count > 0:
+                cls._refs[host] = count
+                return
+            cls._refs.pop(host, None)
+            entries = (
+                [(host, cls._clients.pop(host))]
+                if host in cls._clients
+                else []
+            )
+        await cls.__close_entries(entries)
+
+    @classmethod
+    async def aclose(cls, host: Optional[str] = None) -> None:
+        """
+        Closes pooled clients and releases their connections.
+
+        Clients bound to another (or closed) event loop are dropped without
+        being awaited, since their connections cannot be reused anyway.
+
+        Args:
+            host: The host whose client should be closed. If None, all
+                  pooled clients are closed.
+        """
+        with cls._lock:
+            if host is None:
+                entries = list(cls._clients.items())
+                cls._clients.clear()
+            elif host in cls._clients:
+                entries = [(host, cls._clients.pop(host))]
+            else:
+                entries = []
+        await cls.__close_entries(entries)
+
+    @classmethod
+    async def __close_entries(
+        cls,
+        entries: List[
+            Tuple[str, Tuple[AsyncClient, asyncio.AbstractEventLoop]]
+        ],
+    ) -> None:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            loop = None
+
+        for client_host, (client, client_loop) in entries:
+            if client_loop is not loop or client_loop.is_closed():
+                continue
+            try:
+                await client.close()
+                cls._logger.info(
+                    'Closed pooled Ollama client for %s', client_host
+                )
+            except Exception as e:
+                cls._logger.warning(
+                    'Error closing Ollama client for %s: %s', client_host, e
+                )
+
+    @classmethod
+    def size(cls) -> int:
+        """Return the number of pooled clients."""
+        with cls._lock:
+            return len(cls._clients)
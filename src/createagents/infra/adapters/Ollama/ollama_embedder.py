@@ -0,0 +1,40 @@
+from typing import List, Optional
+
+from ...config import EnvironmentConfig, LoggingConfig, TextEmbedder
+from .ollama_client import OllamaClient
+from .ollama_connection_pool import OllamaConnectionPool
+
+
+class OllamaEmbedder(TextEmbedder):
+    """Embeds texts with a local Ollama embedding model.
+
+    Requests go through the pooled client of `OLLAMA_HOST`. The model is
+    read from `OLLAMA_EMBED_MODEL` (default: 'nomic-embed-text').
+    """
+
+    DEFAULT_MODEL = 'nomic-embed-text'
+
+    def __init__(self, model: Optional[str] = None):
+        """Initialize the embedder.
+
+        Args:
+            model: The embedding model (default: from the environment).
+        """
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__host = (
+            EnvironmentConfig.get_env('OLLAMA_HOST', OllamaClient.DEFAULT_HOST)
+            or OllamaClient.DEFAULT_HOST
+        )
+        self.model = model or (
+            EnvironmentConfig.get_env('OLLAMA_EMBED_MODEL')
+            or self.DEFAULT_MODEL
+        )
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return one embedding vector per text, in input order."""
+        client = OllamaConnectionPool.get_client(self.__host)
+        response = await client.embed(model=self.model, input=texts)
+        self.__logger.debug(
+            'Embedded %s text(s) with %s', len(texts), self.model
+        )
+        return [list(vector) for vector in response['embeddings']]
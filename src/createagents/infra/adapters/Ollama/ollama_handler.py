@@ -1,14 +1,21 @@
+import asyncio
 import time
 from typing import Any, Dict, List, Optional
 
-from ....domain import BaseTool, ChatException, ToolExecutor
+from ....domain import (
+    BaseTool,
+    ChatException,
+    ChatTimeoutException,
+    Deadline,
+    ToolExecutor,
+)
 from ...config import (
     ChatMetrics,
     EnvironmentConfig,
     LoggingConfig,
     create_logger,
 )
-from ..Common import MetricsRecorder
+from ..Common import MetricsRecorder, run_within
 from .ollama_client import OllamaClient
 from .ollama_tool_schema_formatter import OllamaToolSchemaFormatter
 
@@ -28,6 +35,9 @@ class OllamaHandler:
             EnvironmentConfig.get_env('OLLAMA_MAX_TOOL_ITERATIONS', '100')
             or '100'
         )
+        self.__max_parallel_tools = int(
+            EnvironmentConfig.get_env('OLLAMA_MAX_PARALLEL_TOOLS', '4') or '4'
+        )
 
     async def execute_tool_loop(
         self,
@@ -35,15 +45,28 @@ class OllamaHandler:
         messages: List[Dict[str, str]],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
     ) -> str:
-        """Executes the tool calling loop."""
+        """Executes the tool calling loop.
+
+        With a deadline, every API call and tool execution gets only the
+        time left; once it passes, the loop stops with
+        ChatTimeoutException and partial metrics are recorded. Cancelling
+        the call cancels the pending request and tools and records a
+        cancelled metric.
+        """
         start_time = time.time()
+        self.__client.touch_model(model)
 
         tool_executor = None
         tool_schemas = None
         if tools:
             tool_executor = ToolExecutor(
-                tools, create_logger(f'{__name__}.ToolExecutor')
+                tools,
+                create_logger(f'{__name__}.ToolExecutor'),
+                deadline=deadline,
+                default_pool=tool_pool,
             )
             tool_schemas = OllamaToolSchemaFormatter.format_tools_for_ollama(
                 tools
@@ -54,6 +77,7 @@ class OllamaHandler:
         empty_response_count = 0
         max_empty_responses = 2
         response_api = None
+        tokens_so_far = 0
 
         try:
             while iteration < self.__max_tool_iterations:
@@ -64,20 +88,29 @@ class OllamaHandler:
                     self.__max_tool_iterations,
                 )
 
-                response_api = await self.__client.call_api(
-                    model, messages, config, tool_schemas
+                response = await run_within(
+                    deadline,
+                    self.__client.call_api(
+                        model, messages, config, tool_schemas, deadline
+                    ),
+                    'waiting for Ollama',
+                )
+                response_api = response
+                tokens_so_far += (
+                    MetricsRecorder.extract_total_tokens(response, 'ollama')
+                    or 0
                 )
 
                 if (
-                    hasattr(response_api.message, 'tool_calls')
-                    and response_api.message.tool_calls
+                    hasattr(response.message, 'tool_calls')
+                    and response.message.tool_calls
                 ):
                     await self.__handle_tool_calls(
-                        response_api, messages, tool_executor
+                        response, messages, tool_executor
                     )
                     continue
 
-                content = response_api.message.content
+                content = response.message.content
 
                 if not content:
                     empty_response_count += 1
@@ -102,10 +135,21 @@ class OllamaHandler:
                             ),
                         }
                     )
-                    response_api = await self.__client.call_api(
-                        model, retry_messages, config, None
+                    response = await run_within(
+                        deadline,
+                        self.__client.call_api(
+                            model, retry_messages, config, None, deadline
+                        ),
+                        'waiting for Ollama',
                     )
-                    content = response_api.message.content
+                    response_api = response
+                    tokens_so_far += (
+                        MetricsRecorder.extract_total_tokens(
+                            response, 'ollama'
+                        )
+                        or 0
+                    )
+                    content = response.message.content
                     if content:
                         final_response = content
                         break
@@ -120,29 +164,75 @@ class OllamaHandler:
                     f'({self.__max_tool_iterations}) exceeded'
                 )
 
+            model_loads, model_unloads = self.__client.get_residency_stats(
+                model
+            )
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
             self.__metrics_recorder.record_success_metrics(
-                model, start_time, response_api, provider_type='ollama'
+                model,
+                start_time,
+                response_api,
+                provider_type='ollama',
+                model_loads=model_loads,
+                model_unloads=model_unloads,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
             )
             return final_response
 
+        except ChatTimeoutException as e:
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            self.__metrics_recorder.record_timeout_metrics(
+                model,
+                start_time,
+                e,
+                tokens_used=tokens_so_far,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
+        except asyncio.CancelledError:
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            self.__metrics_recorder.record_cancelled_metrics(
+                model,
+                start_time,
+                tokens_used=tokens_so_far,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
         except Exception as e:
             self.__metrics_recorder.record_error_metrics(model, start_time, e)
             raise
         finally:
-            self.__client.stop_model(model)
+            self.__client.release_model(model)
 
     async def __handle_tool_calls(
         self, response_api, messages, tool_executor
     ) -> None:
-        tool_calls = response_api.message.tool_calls
+        tool_calls = [
+            {
+                'name': tool_call.function.name,
+                'arguments': tool_call.function.arguments,
+            }
+            for tool_call in response_api.message.tool_calls
+        ]
         messages.append(response_api.message)
 
-        for tool_call in tool_calls:
-            tool_name = tool_call.function.name
-            tool_args = tool_call.function.arguments
-            execution_result = await tool_executor.execute_tool(
-                tool_name, **tool_args
-            )
+        # Independent calls run concurrently; results keep the call order.
+        execution_results = await tool_executor.execute_multiple_tools(
+            tool_calls,
+            parallel=self.__max_parallel_tools > 1,
+            max_concurrency=self.__max_parallel_tools,
+        )
+
+        for tool_call, execution_result in zip(tool_calls, execution_results):
             result_text = (
                 str(execution_result.result)
                 if execution_result.success
@@ -151,7 +241,7 @@ class OllamaHandler:
             messages.append(
                 {
                     'role': 'tool',
-                    'tool_name': tool_name,
+                    'tool_name': tool_call['name'],
                     'content': result_text,
                 }
             )
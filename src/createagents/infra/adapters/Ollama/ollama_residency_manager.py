@@ -0,0 +1,426 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Dict, Optional, Set, Tuple, Union
+
+from ...config import EnvironmentConfig, LoggingConfig
+from .ollama_connection_pool import OllamaConnectionPool
+
+
+class ResidencyPolicy(str, Enum):
+    """Policies that decide how long an Ollama model stays in memory."""
+
+    KEEP_ALIVE = 'keep_alive'
+    LRU = 'lru'
+    IDLE = 'idle'
+
+    def __str__(self) -> str:
+        """Return the string value of the policy."""
+        return self.value
+
+
+class OllamaResidencyManager:
+    """
+    Tracks which models are resident on an Ollama host and unloads them
+    according to a configurable policy, without blocking the event loop.
+
+    Policies:
+    - `keep_alive`: every request carries `keep_alive`, so the server keeps
+      the model warm for that long; nothing is unloaded explicitly.
+    - `lru`: models stay loaded indefinitely, but when more than
+      `max_resident_models` are resident the least recently used one is
+      unloaded in the background.
+    - `idle`: a background sweeper unloads models that have been idle for
+      `idle_timeout` seconds. Requests also carry the same `keep_alive`, so
+      the server enforces the limit even when no sweeper is running.
+
+    Unloading uses the Ollama API (`keep_alive=0`) through the pooled
+    client instead of spawning an `ollama stop` subprocess. Requests are
+    bracketed with `acquire` and `release`, and a model with a request in
+    flight is never unloaded by the sweeper or by LRU eviction.
+
+    One manager exists per host; use `for_host` to obtain it. Clients that
+    share it register with `attach` and leave with `detach`; background
+    work stops when the last one detaches.
+    """
+
+    DEFAULT_POLICY = ResidencyPolicy.IDLE
+    DEFAULT_KEEP_ALIVE = '5m'
+    DEFAULT_MAX_RESIDENT_MODELS = 2
+    DEFAULT_IDLE_TIMEOUT = 300.0
+
+    _managers: Dict[str, 'OllamaResidencyManager'] = {}
+    _registry_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: str,
+        policy: Union[ResidencyPolicy, str] = DEFAULT_POLICY,
+        keep_alive: Union[str, float] = DEFAULT_KEEP_ALIVE,
+        max_resident_models: int = DEFAULT_MAX_RESIDENT_MODELS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        sweep_interval: Optional[float] = None,
+    ):
+        """
+        Initializes the residency manager.
+
+        Args:
+            host: The Ollama host URL.
+            policy: The residency policy.
+            keep_alive: The keep-alive sent with requests (`keep_alive` policy).
+            max_resident_models: Maximum resident models (`lru` policy).
+            idle_timeout: Seconds of inactivity before unloading (`idle` policy).
+            sweep_interval: Seconds between idle sweeps (default: a quarter
+                            of `idle_timeout`, at most 30 seconds).
+
+        Raises:
+            ValueError: If the policy or limits are invalid.
+        """
+        try:
+            self.policy = ResidencyPolicy(policy)
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid residency policy: '{policy}'. "
+                f'Valid values are: {[p.value for p in ResidencyPolicy]}'
+            ) from e
+
+        if max_resident_models <= 0:
+            raise ValueError('max_resident_models must be greater than zero.')
+        if idle_timeout <= 0:
+            raise ValueError('idle_timeout must be greater than zero.')
+
+        self.host = host
+        self.keep_alive = keep_alive
+        self.max_resident_models = max_resident_models
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = (
+            sweep_interval
+            if sweep_interval is not None
+            else min(idle_timeout / 4, 30.0)
+        )
+
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__lock = threading.Lock()
+        self.__resident: 'OrderedDict[str, float]' = OrderedDict()
+        self.__loads: Dict[str, int] = {}
+        self.__unloads: Dict[str, int] = {}
+        self.__in_flight: Dict[str, int] = {}
+        self.__holders = 0
+        self.__sweeper: Optional[asyncio.Task] = None
+        self.__pending: Set[asyncio.Task] = set()
+
+    @classmethod
+    def for_host(cls, host: str) -> 'OllamaResidencyManager':
+        """
+        Returns the shared manager for a host, configured from the
+        environment (`OLLAMA_RESIDENCY_POLICY`, `OLLAMA_KEEP_ALIVE`,
+        `OLLAMA_MAX_RESIDENT_MODELS`, `OLLAMA_IDLE_TIMEOUT`).
+
+        Args:
+            host: The Ollama host URL.
+
+        Returns:
+            The residency manager for the host.
+        """
+        with cls._registry_lock:
+            manager = cls._managers.get(host)
+            if manager is None:
+                manager = cls(
+                    host=host,
+                    policy=EnvironmentConfig.get_env(
+                        'OLLAMA_RESIDENCY_POLICY', cls.DEFAULT_POLICY.value
+                    )
+                    or cls.DEFAULT_POLICY.value,
+                    keep_alive=EnvironmentConfig.get_env(
+                        'OLLAMA_KEEP_ALIVE', cls.DEFAULT_KEEP_ALIVE
+                    )
+                    or cls.DEFAULT_KEEP_ALIVE,
+                    max_resident_models=int(
+                        EnvironmentConfig.get_env(
+                            'OLLAMA_MAX_RESIDENT_MODELS',
+                            str(cls.DEFAULT_MAX_RESIDENT_MODELS),
+                        )
+                        or cls.DEFAULT_MAX_RESIDENT_MODELS
+                    ),
+                    idle_timeout=float(
+                        EnvironmentConfig.get_env(
+                            'OLLAMA_IDLE_TIMEOUT',
+                            str(cls.DEFAULT_IDLE_TIMEOUT),
+                        )
+                        or cls.DEFAULT_IDLE_TIMEOUT
+                    ),
+                )
+                cls._managers[host] = manager
+            return manager
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all shared managers (useful for tests)."""
+        with cls._registry_lock:
+            cls._managers.clear()
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Stops the background work of every shared manager."""
+        with cls._registry_lock:
+            managers = list(cls._managers.values())
+        for manager in managers:
+            await manager.aclose()
+
+    def request_keep_alive(self) -> Union[str, float]:
+        """
+        Returns the `keep_alive` value to send with a chat request.
+
+        Returns:
+            The keep-alive duration understood by the Ollama API.
+        """
+        if self.policy == ResidencyPolicy.LRU:
+            return -1
+        if self.policy == ResidencyPolicy.IDLE:
+            return f'{int(self.idle_timeout)}s'
+        return self.keep_alive
+
+    def touch(self, model: str) -> bool:
+        """
+        Marks a model as used right now.
+
+        Under the `lru` policy this may schedule the eviction of the least
+        recently used model; under the `idle` policy it makes sure the
+        background sweeper is running.
+
+        Args:
+            model: The model name.
+
+        Returns:
+            True if the model was not resident (the request will load it).
+        """
+        with self.__lock:
+            loaded = model not in self.__resident
+            self.__resident[model] = time.monotonic()
+            self.__resident.move_to_end(model)
+            if loaded:
+                self.__loads[model] = self.__loads.get(model, 0) + 1
+
+            victims = []
+            if self.policy == ResidencyPolicy.LRU:
+                excess = len(self.__resident) - self.max_resident_models
+                for candidate in list(self.__resident):
+                    if excess <= 0:
+                        break
+                    if self.__in_flight.get(candidate):
+                        continue
+                    del self.__resident[candidate]
+                    victims.append(candidate)
+                    excess -= 1
+
+        if loaded:
+            self.__logger.debug('Model %s is being loaded', model)
+
+        for victim in victims:
+            self.__logger.info(
+                'Evicting least recently used model %s from %s',
+                victim,
+                self.host,
+            )
+            self.__schedule(self.__unload(victim))
+
+        if self.policy == ResidencyPolicy.IDLE:
+            self.__ensure_sweeper()
+
+        return loaded
+
+    def acquire(self, model: str) -> bool:
+        """
+        Marks the start of a request against a model.
+
+        The model counts as in flight until the matching `release`, and is
+        not unloaded in the meantime.
+
+        Args:
+            model: The model name.
+
+        Returns:
+            True if the model was not resident (the request will load it).
+        """
+        with self.__lock:
+            self.__in_flight[model] = self.__in_flight.get(model, 0) + 1
+        return self.touch(model)
+
+    def release(self, model: str) -> None:
+        """
+        Marks the end of a request, restarting the model's idle clock.
+
+        Args:
+            model: The model name.
+        """
+        with self.__lock:
+            count = self.__in_flight.get(model, 0) - 1
+            if count > 0:
+                self.__in_flight[model] = count
+            else:
+                self.__in_flight.pop(model, None)
+            if model in self.__resident:
+                self.__resident[model] = time.monotonic()
+
+    def in_flight(self, model: str) -> int:
+        """Return the number of requests running against the model."""
+        with self.__lock:
+            return self.__in_flight.get(model, 0)
+
+    def is_resident(self, model: str) -> bool:
+        """Return True if the model is believed to be loaded."""
+        with self.__lock:
+            return model in self.__resident
+
+    def get_stats(self, model: str) -> Tuple[int, int]:
+        """
+        Returns the load and unload counts for a model.
+
+        Args:
+            model: The model name.
+
+        Returns:
+            Tuple of (loads, unloads).
+        """
+        with self.__lock:
+            return self.__loads.get(model, 0), self.__unloads.get(model, 0)
+
+    async def unload(self, model: str) -> bool:
+        """
+        Unloads a model from memory now.
+
+        Args:
+            model: The model name.
+
+        Returns:
+            True if the server acknowledged the unload.
+        """
+        with self.__lock:
+            self.__resident.pop(model, None)
+        return await self.__unload(model)
+
+    async def sweep(self) -> int:
+        """
+        Unloads every model that has been idle longer than `idle_timeout`.
+
+        Returns:
+            The number of models unloaded.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            idle_models = [
+                model
+                for model, last_used in self.__resident.items()
+                if now - last_used >= self.idle_timeout
+                and not self.__in_flight.get(model)
+            ]
+            for model in idle_models:
+                self.__resident.pop(model, None)
+
+        unloaded = 0
+        for model in idle_models:
+            self.__logger.info(
+                'Unloading model %s after %.0fs idle', model, self.idle_timeout
+            )
+            if await self.__unload(model):
+                unloaded += 1
+        return unloaded
+
+    def attach(self) -> None:
+        """Registers a client that shares this manager."""
+        with self.__lock:
+            self.__holders += 1
+
+    async def detach(self) -> None:
+        """Unregisters a client; the last one out stops background work."""
+        with self.__lock:
+            self.__holders = max(self.__holders - 1, 0)
+            if self.__holders:
+                return
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stops the background sweeper and waits for pending unloads.
+
+        A sweeper bound to another event loop is cancelled there without
+        waiting; unloads pending on another (or closed) loop are dropped.
+        """
+        loop = asyncio.get_running_loop()
+
+        sweeper = self.__sweeper
+        self.__sweeper = None
+        if sweeper is not None and not sweeper.done():
+            if sweeper.get_loop() is loop:
+                sweeper.cancel()
+                try:
+                    await sweeper
+                except asyncio.CancelledError:
+                    pass
+            else:
+                self.__cancel_elsewhere(sweeper)
+
+        pending = [
+            task
+            for task in self.__pending
+            if not task.done() and task.get_loop() is loop
+        ]
+        self.__pending.clear()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __unload(self, model: str) -> bool:
+        try:
+            client = OllamaConnectionPool.get_client(self.host)
+            await client.generate(model=model, keep_alive=0)
+        except Exception as e:
+            self.__logger.warning('Could not unload model %s: %s', model, e)
+            return False
+
+        with self.__lock:
+            self.__unloads[model] = self.__unloads.get(model, 0) + 1
+        self.__logger.debug('Model %s unloaded successfully.', model)
+        return True
+
+    def __schedule(self, coro) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            return
+
+        task = loop.create_task(coro)
+        self.__pending.add(task)
+        task.add_done_callback(self.__pending.discard)
+
+    def __ensure_sweeper(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        sweeper = self.__sweeper
+        if sweeper is not None and not sweeper.done():
+            if sweeper.get_loop() is loop:
+                return
+            self.__cancel_elsewhere(sweeper)
+
+        self.__sweeper = loop.create_task(self.__sweep_forever())
+
+    @staticmethod
+    def __cancel_elsewhere(task: asyncio.Task) -> None:
+        """Cancels a task bound to another event loop, if it still runs."""
+        try:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # The loop is closed; the task can no longer run.
+            pass
+
+    async def __sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.sweep()
+            with self.__lock:
+                if not self.__resident:
+                    return
@@ -1,13 +1,26 @@
+import asyncio
 import time
 from typing import Any, Dict, AsyncGenerator, List, Optional
 
-from ....domain import ChatException, BaseTool, ToolExecutor
+from ....domain import (
+    BaseTool,
+    ChatException,
+    ChatTimeoutException,
+    Deadline,
+    ToolExecutor,
+)
 from ...config import (
     ChatMetrics,
     EnvironmentConfig,
     LoggingConfig,
     create_logger,
 )
+from ..Common import (
+    MetricsRecorder,
+    close_stream,
+    iterate_within,
+    run_within,
+)
 from .ollama_client import OllamaClient
 from .ollama_tool_schema_formatter import OllamaToolSchemaFormatter
 
@@ -27,6 +40,9 @@ class OllamaStreamHandler:
             EnvironmentConfig.get_env('OLLAMA_MAX_TOOL_ITERATIONS', '100')
             or '100'
         )
+        self.__max_parallel_tools = int(
+            EnvironmentConfig.get_env('OLLAMA_MAX_PARALLEL_TOOLS', '4') or '4'
+        )
 
     async def handle_stream(
         self,
@@ -34,14 +50,20 @@ class OllamaStreamHandler:
         messages: List[Dict[str, str]],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
     ) -> AsyncGenerator[str, None]:
         """Yields tokens from the Ollama API as they arrive.
 
         Supports tool calling with interrupted streaming: when tools are
         called during streaming, token yield is paused, tools are executed,
-        and streaming resumes with the tool results.
+        and streaming resumes with the tool results. With a deadline, the
+        stream fails with ChatTimeoutException once it passes. If the consumer
+        cancels or closes the stream, the upstream response is closed,
+        running tools are cancelled and a cancelled metric is recorded.
         """
         start_time = time.time()
+        self.__client.touch_model(model)
 
         # Prepare tool schemas and executor if tools are provided
         tool_schemas = None
@@ -51,7 +73,10 @@ class OllamaStreamHandler:
                 tools
             )
             tool_executor = ToolExecutor(
-                tools, create_logger(f'{__name__}.ToolExecutor')
+                tools,
+                create_logger(f'{__name__}.ToolExecutor'),
+                deadline=deadline,
+                default_pool=tool_pool,
             )
             self.__logger.debug(
                 'Streaming with tools enabled: %s',
@@ -65,6 +90,7 @@ class OllamaStreamHandler:
         last_prompt_eval_duration_ms: Optional[float] = None
         last_eval_duration_ms: Optional[float] = None
 
+        stream_response: Any = None
         iteration = 0
         try:
             while iteration < self.__max_tool_iterations:
@@ -75,8 +101,12 @@ class OllamaStreamHandler:
                     self.__max_tool_iterations,
                 )
 
-                stream_response = await self.__client.call_api(
-                    model, messages, config, tool_schemas
+                stream_response = await run_within(
+                    deadline,
+                    self.__client.call_api(
+                        model, messages, config, tool_schemas, deadline
+                    ),
+                    'waiting for Ollama',
                 )
 
                 has_yielded_content = False
@@ -84,7 +114,9 @@ class OllamaStreamHandler:
                 tool_call_detected = False
 
                 # OPTIMIZATION: Check for tool calls in EACH chunk as it arrives
-                async for chunk in stream_response:
+                async for chunk in iterate_within(
+                    deadline, stream_response, 'streaming from Ollama'
+                ):
                     last_chunk = chunk
 
                     # EARLY DETECTION: Check if THIS chunk has tool calls
@@ -110,6 +142,10 @@ class OllamaStreamHandler:
                             yield token
                             has_yielded_content = True
 
+                if tool_call_detected:
+                    # The rest of this response is not needed.
+                    await close_stream(stream_response)
+
                 # Extract metrics from the last chunk (Ollama sends metrics in final chunk)
                 if last_chunk:
                     # Token counts
@@ -153,26 +189,29 @@ class OllamaStreamHandler:
                     # Add assistant message with tool calls to history
                     messages.append(last_chunk.message)
 
-                    # Execute tool calls
-                    tool_calls = last_chunk.message.tool_calls
+                    # Execute tool calls concurrently, keeping the call order
+                    tool_calls = [
+                        {
+                            'name': tool_call.function.name,
+                            'arguments': tool_call.function.arguments,
+                        }
+                        for tool_call in last_chunk.message.tool_calls
+                    ]
                     self.__logger.debug(
                         'Executing %s tool(s)', len(tool_calls)
                     )
 
-                    for tool_call in tool_calls:
-                        tool_name = tool_call.function.name
-                        tool_args = tool_call.function.arguments
-
-                        self.__logger.debug(
-                            "Executing tool '%s' with args: %s",
-                            tool_name,
-                            tool_args,
-                        )
-
-                        execution_result = await tool_executor.execute_tool(
-                            tool_name, **tool_args
+                    execution_results = (
+                        await tool_executor.execute_multiple_tools(
+                            tool_calls,
+                            parallel=self.__max_parallel_tools > 1,
+                            max_concurrency=self.__max_parallel_tools,
                         )
+                    )
 
+                    for tool_call, execution_result in zip(
+                        tool_calls, execution_results
+                    ):
                         result_text = (
                             str(execution_result.result)
                             if execution_result.success
@@ -182,7 +221,7 @@ class OllamaStreamHandler:
                         messages.append(
                             {
                                 'role': 'tool',
-                                'tool_name': tool_name,
+                                'tool_name': tool_call['name'],
                                 'content': result_text,
                             }
                         )
@@ -224,6 +263,12 @@ class OllamaStreamHandler:
                 if total_prompt_tokens or total_completion_tokens
                 else None
             )
+            model_loads, model_unloads = self.__client.get_residency_stats(
+                model
+            )
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
             metrics = ChatMetrics(
                 model=model,
                 latency_ms=latency,
@@ -240,14 +285,49 @@ class OllamaStreamHandler:
                 prompt_eval_duration_ms=last_prompt_eval_duration_ms,
                 eval_duration_ms=last_eval_duration_ms,
                 success=True,
+                model_loads=model_loads,
+                model_unloads=model_unloads,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
             )
-            self.__metrics.append(metrics)
+            MetricsRecorder(self.__metrics).record(metrics)
             self.__logger.info(
                 'Streaming chat completed: %s (accumulated over %s iteration(s))',
                 metrics,
                 iteration,
             )
 
+        except ChatTimeoutException as e:
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            MetricsRecorder(self.__metrics).record_timeout_metrics(
+                model,
+                start_time,
+                e,
+                tokens_used=total_prompt_tokens + total_completion_tokens,
+                prompt_tokens=total_prompt_tokens,
+                completion_tokens=total_completion_tokens,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            # Nobody reads the rest: stop paying for it right away.
+            await close_stream(stream_response)
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            MetricsRecorder(self.__metrics).record_cancelled_metrics(
+                model,
+                start_time,
+                tokens_used=total_prompt_tokens + total_completion_tokens,
+                prompt_tokens=total_prompt_tokens,
+                completion_tokens=total_completion_tokens,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
         except Exception as e:
             latency = (time.time() - start_time) * 1000
             metrics = ChatMetrics(
@@ -256,13 +336,13 @@ class OllamaStreamHandler:
                 success=False,
                 error_message=str(e),
             )
-            self.__metrics.append(metrics)
+            MetricsRecorder(self.__metrics).record(metrics)
             self.__logger.error('Error during streaming: %s', e)
             raise ChatException(
                 f'Error during Ollama streaming: {str(e)}', original_error=e
             ) from e
         finally:
-            self.__client.stop_model(model)
+            self.__client.release_model(model)
 
     def get_metrics(self) -> List[ChatMetrics]:
         """Returns the list of collected metrics."""
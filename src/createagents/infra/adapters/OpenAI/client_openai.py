@@ -10,11 +10,15 @@ class ClientOpenAI:
     def get_client(api_key: str) -> AsyncOpenAI:
         """Create and return an OpenAI client instance.
 
+        The SDK's own retries are disabled: `OpenAIClient` retries with
+        its own classification, budget and `Retry-After` handling, and
+        both layers together would multiply the attempts.
+
         Args:
             api_key: The OpenAI API key.
 
         Returns:
             AsyncOpenAI: The configured OpenAI client.
         """
-        client = AsyncOpenAI(api_key=api_key)
+        client = AsyncOpenAI(api_key=api_key, max_retries=0)
         return client
@@ -1,10 +1,16 @@
-from typing import Any, Dict, AsyncGenerator, List, Optional, Union
+from typing import Any, Dict, AsyncGenerator, List, Optional, Sequence, Union
 
 from ....application.interfaces import ChatRepository
-from ....domain import BaseTool, ChatException
-from ...config import ChatMetrics, LoggingConfig
+from ....domain import BaseTool, ChatException, Deadline
+from ...config import (
+    ChatMetrics,
+    ConversationScope,
+    EnvironmentConfig,
+    LoggingConfig,
+)
 from .openai_client import OpenAIClient
 from .openai_handler import OpenAIHandler
+from .openai_response_chain import OpenAIResponseChain
 from .openai_stream_handler import OpenAIStreamHandler
 
 
@@ -14,6 +20,11 @@ class OpenAIChatAdapter(ChatRepository):
     def __init__(self):
         """Initialize the OpenAI adapter.
 
+        When `OPENAI_STATEFUL_RESPONSES` is true, requests are chained with
+        `previous_response_id` so only new input items are sent; a full
+        replay is used whenever the server-side state is unavailable. Only
+        requests of the same `ConversationScope` continue each other.
+
         Raises:
             ChatException: If the API key is missing or invalid.
         """
@@ -22,14 +33,26 @@ class OpenAIChatAdapter(ChatRepository):
 
         self.__client = OpenAIClient()
 
+        stateful = (
+            EnvironmentConfig.get_env('OPENAI_STATEFUL_RESPONSES', 'false')
+            or 'false'
+        )
+        self.__response_chain: Optional[OpenAIResponseChain] = (
+            OpenAIResponseChain() if stateful.lower() == 'true' else None
+        )
+        if self.__response_chain is not None:
+            self.__logger.info('OpenAI incremental conversation state enabled')
+
     async def chat(
         self,
         model: str,
         instructions: Optional[str],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
-        history: List[Dict[str, str]],
+        history: Sequence[Dict[str, str]],
         user_ask: str,
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
     ) -> Union[str, AsyncGenerator[str, None]]:
         """
         Sends a message to OpenAI and returns the response.
@@ -50,6 +73,8 @@ class OpenAIChatAdapter(ChatRepository):
             history: The conversation history.
             user_ask: The user's question.
             tools: Optional list of tools available to the agent.
+            deadline: Optional deadline bounding the whole tool loop.
+            tool_pool: Optional pool for synchronous tools without one.
 
         Returns:
             Union[str, AsyncGenerator[str, None]]:
@@ -57,6 +82,7 @@ class OpenAIChatAdapter(ChatRepository):
                 - AsyncGenerator[str, None]: Token stream (if stream=True)
 
         Raises:
+            ChatTimeoutException: If the deadline passes.
             ChatException: If a communication error occurs or if streaming
                 is used with tool calling.
         """
@@ -65,23 +91,40 @@ class OpenAIChatAdapter(ChatRepository):
                 'Starting chat with model %s on OpenAI.', model
             )
 
-            messages = history.copy()
-            messages.append({'role': 'user', 'content': user_ask})
+            # The history's dicts are shared, read-only; only the list is
+            # new, as the tool loop appends to it.
+            messages = [*history, {'role': 'user', 'content': user_ask}]
 
             # Check if streaming mode is enabled
             if config and config.get('stream'):
                 stream_handler = OpenAIStreamHandler(
-                    self.__client, self.__metrics
+                    self.__client, self.__metrics, self.__response_chain
                 )
                 result_stream = stream_handler.handle_stream(
-                    model, instructions, messages, config, tools
+                    model,
+                    instructions,
+                    messages,
+                    config,
+                    tools,
+                    deadline,
+                    tool_pool=tool_pool,
+                    session=ConversationScope.current(),
                 )
 
                 return result_stream
 
-            handler = OpenAIHandler(self.__client, self.__metrics)
+            handler = OpenAIHandler(
+                self.__client, self.__metrics, self.__response_chain
+            )
             result = await handler.execute_tool_loop(
-                model, instructions, messages, config, tools
+                model,
+                instructions,
+                messages,
+                config,
+                tools,
+                deadline,
+                tool_pool=tool_pool,
+                session=ConversationScope.current(),
             )
 
             return result
@@ -97,6 +140,33 @@ class OpenAIChatAdapter(ChatRepository):
                 original_error=e,
             ) from e
 
+    async def warmup(self, model: str) -> None:
+        """Establish the API connection before the first chat request.
+
+        Args:
+            model: The name of the model.
+
+        Raises:
+            ChatException: If the OpenAI API could not be reached.
+        """
+        try:
+            await self.__client.warmup(model)
+        except Exception as e:
+            self.__logger.error(
+                'Error warming up OpenAI model %s: %s', model, e
+            )
+            raise ChatException(
+                f'Error warming up OpenAI model {model}: {str(e)}',
+                original_error=e,
+            ) from e
+
+        self.__logger.info('OpenAI connection warmed up for model %s', model)
+
+    async def aclose(self) -> None:
+        """Close the connections opened to the OpenAI API."""
+        await self.__client.aclose()
+        self.__logger.info('OpenAI adapter connections closed')
+
     def get_metrics(self) -> List[ChatMetrics]:
         """Return the list of collected metrics.
 
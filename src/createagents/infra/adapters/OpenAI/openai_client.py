@@ -1,13 +1,24 @@
 from typing import Any, Dict, List, Optional
 
-from ....domain import ChatException
-from ...config import EnvironmentConfig, LoggingConfig, retry_with_backoff
+from ....domain import ChatException, Deadline
+from ...config import (
+    EnvironmentConfig,
+    LoggingConfig,
+    RateLimiter,
+    RequestHedger,
+    is_retryable_error,
+    retry_with_backoff,
+)
+from ...config.retry import get_retry_after
+from ..Common import MetricsRecorder
 from .client_openai import ClientOpenAI
 
 
 class OpenAIClient:
     """Handles direct communication with the OpenAI API."""
 
+    RETRY_BUDGET_SECONDS = 30.0
+
     def __init__(self):
         """Initialize the OpenAI client.
 
@@ -17,13 +28,21 @@ class OpenAIClient:
         self.__logger = LoggingConfig.get_logger(__name__)
         self.__timeout = int(EnvironmentConfig.get_env('OPENAI_TIMEOUT', '30'))
         self.__max_retries = int(
-            EnvironmentConfig.get_env('OPENAI_MAX_RETRIES', '3')
+            EnvironmentConfig.get_env('OPENAI_MAX_RETRIES', '2')
         )
+        self.__call_with_retries = retry_with_backoff(
+            max_attempts=max(self.__max_retries, 0) + 1,
+            initial_delay=1.0,
+            exceptions=(Exception,),
+            retry_if=is_retryable_error,
+            max_retry_time=self.RETRY_BUDGET_SECONDS,
+        )(self.__call_once)
 
         try:
             api_key = EnvironmentConfig.get_api_key(
                 ClientOpenAI.API_OPENAI_NAME
             )
+            self.__api_key = api_key
             self.__client = ClientOpenAI.get_client(api_key)
             self.__logger.info(
                 'OpenAI client initialized (timeout: %ss, max_retries: %s)',
@@ -36,9 +55,6 @@ class OpenAIClient:
                 f'Error configuring OpenAI: {str(e)}', e
             ) from e
 
-    @retry_with_backoff(
-        max_attempts=3, initial_delay=1.0, exceptions=(Exception,)
-    )
     async def call_api(
         self,
         model: str,
@@ -46,27 +62,74 @@ class OpenAIClient:
         messages: List[Dict[str, str]],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
+        previous_response_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Any:
         """
         Calls the OpenAI API with automatic retries.
 
+        Transient errors are retried up to `OPENAI_MAX_RETRIES` times
+        (default: 2) within a budget of `RETRY_BUDGET_SECONDS`, honouring
+        `Retry-After`. When `OPENAI_RPM_LIMIT` or `OPENAI_TPM_LIMIT` is set, the call
+        first waits for the shared rate limiter of the model. With
+        `OPENAI_HEDGING=true`, a slow call is hedged with a duplicate.
+        Each attempt times out after `OPENAI_TIMEOUT` seconds, or sooner
+        if the deadline leaves less time.
+
         Args:
             model: The name of the model.
             messages: A list of messages.
             config: Internal AI configuration.
             tools: Optional list of tool schemas for function calling.
+            previous_response_id: Optional stored response to continue
+                from; `messages` then holds only the new input items.
+            deadline: Optional deadline of the chat call.
 
         Returns:
             The API response.
+
+        Raises:
+            ChatTimeoutException: If the deadline has already passed.
         """
+        return await self.__call_with_retries(
+            model,
+            instructions,
+            messages,
+            config,
+            tools,
+            previous_response_id,
+            deadline,
+        )
+
+    async def __call_once(
+        self,
+        model: str,
+        instructions: Optional[str],
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        previous_response_id: Optional[str],
+        deadline: Optional[Deadline],
+    ) -> Any:
+        """Makes one attempt of `call_api`."""
+        if deadline is not None:
+            deadline.check('calling OpenAI')
+
         chat_kwargs: Dict[str, Any] = {
             'model': model,
             'instructions': instructions,
             'input': messages,
+            'timeout': (
+                deadline.bound(self.__timeout)
+                if deadline is not None
+                else self.__timeout
+            ),
         }
 
         if tools:
             chat_kwargs['tools'] = tools
+        if previous_response_id:
+            chat_kwargs['previous_response_id'] = previous_response_id
         if config:
             config_copy = config.copy()
 
@@ -87,7 +150,74 @@ class OpenAIClient:
                 else:
                     chat_kwargs[key] = config_data
 
-        # Using await with responses.create as requested
-        response_api = await self.__client.responses.create(**chat_kwargs)
+        hedger = RequestHedger.for_model('openai', model)
+        if hedger is None:
+            return await self.__send(chat_kwargs)
+        if chat_kwargs.get('stream'):
+            return await hedger.run_stream(lambda: self.__send(chat_kwargs))
+        return await hedger.run(lambda: self.__send(chat_kwargs))
+
+    async def __send(self, chat_kwargs: Dict[str, Any]) -> Any:
+        """Sends one request through the model's rate limiter, if any."""
+        rate_limiter = RateLimiter.for_model('openai', chat_kwargs['model'])
+        if rate_limiter is None:
+            return await self.__client.responses.create(**chat_kwargs)
+
+        estimated_tokens = RateLimiter.estimate_tokens(
+            chat_kwargs['instructions'],
+            chat_kwargs['input'],
+            chat_kwargs.get('tools'),
+            chat_kwargs.get('max_output_tokens'),
+        )
+        await rate_limiter.acquire(estimated_tokens)
+        try:
+            response_api = await self.__client.responses.create(**chat_kwargs)
+        except Exception as e:
+            rate_limiter.reconcile(estimated_tokens, 0)
+            if getattr(e, 'status_code', None) == 429:
+                rate_limiter.pause(get_retry_after(e) or 1.0)
+            raise
 
+        if chat_kwargs.get('stream'):
+            return rate_limiter.track_stream(
+                response_api, estimated_tokens, self.__stream_usage
+            )
+
+        rate_limiter.reconcile(
+            estimated_tokens,
+            MetricsRecorder.extract_total_tokens(response_api, 'openai'),
+        )
         return response_api
+
+    @staticmethod
+    def __stream_usage(event: Any) -> Optional[int]:
+        """Return the usage reported by a `response.completed` event."""
+        if getattr(event, 'type', None) != 'response.completed':
+            return None
+        return MetricsRecorder.extract_total_tokens(
+            getattr(event, 'response', None), 'openai'
+        )
+
+    async def warmup(self, model: str) -> None:
+        """
+        Opens the connection and TLS session ahead of the first request.
+
+        Retrieving the model is a cheap, token-free call that goes through
+        the same HTTP connection pool as chat requests, so the connection
+        it establishes is kept alive and reused by the next call.
+
+        Args:
+            model: The name of the model.
+        """
+        await self.__client.models.retrieve(model)
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP connections opened on the current event loop.
+
+        A fresh, unconnected client replaces the closed one, so a later
+        call (possibly on another event loop) opens new connections.
+        """
+        client = self.__client
+        self.__client = ClientOpenAI.get_client(self.__api_key)
+        await client.close()
@@ -1,15 +1,23 @@
+import asyncio
 import time
 from typing import Any, Dict, List, Optional
 
-from ....domain import BaseTool, ChatException, ToolExecutor
+from ....domain import (
+    BaseTool,
+    ChatException,
+    ChatTimeoutException,
+    Deadline,
+    ToolExecutor,
+)
 from ...config import (
     ChatMetrics,
     EnvironmentConfig,
     LoggingConfig,
     create_logger,
 )
-from ..Common import MetricsRecorder
+from ..Common import MetricsRecorder, run_within
 from .openai_client import OpenAIClient
+from .openai_response_chain import OpenAIResponseChain
 from .tool_call_parser import ToolCallParser
 from .tool_schema_formatter import ToolSchemaFormatter
 
@@ -21,14 +29,19 @@ class OpenAIHandler:
         self,
         client: OpenAIClient,
         metrics_list: Optional[List[ChatMetrics]] = None,
+        response_chain: Optional[OpenAIResponseChain] = None,
     ):
         self.__client = client
+        self.__response_chain = response_chain
         self.__logger = LoggingConfig.get_logger(__name__)
         self.__metrics_recorder = MetricsRecorder(metrics_list)
         self.__max_tool_iterations = int(
             EnvironmentConfig.get_env('OPENAI_MAX_TOOL_ITERATIONS', '100')
             or '100'
         )
+        self.__max_parallel_tools = int(
+            EnvironmentConfig.get_env('OPENAI_MAX_PARALLEL_TOOLS', '4') or '4'
+        )
 
     async def execute_tool_loop(
         self,
@@ -37,8 +50,19 @@ class OpenAIHandler:
         messages: List[Dict[str, str]],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+        session: Optional[str] = None,
     ) -> str:
-        """Executes the tool calling loop."""
+        """Executes the tool calling loop.
+
+        With a deadline, every API call and tool execution gets only the
+        time left; once it passes, the loop stops with
+        ChatTimeoutException and partial metrics are recorded. Cancelling
+        the call cancels the pending request and tools and records a
+        cancelled metric. With a response chain, only responses stored for
+        the same `session` are continued.
+        """
         start_time = time.time()
 
         # Prepare tool schemas if tools are provided
@@ -49,13 +73,36 @@ class OpenAIHandler:
                 tools
             )
             tool_executor = ToolExecutor(
-                tools, create_logger(f'{__name__}.ToolExecutor')
+                tools,
+                create_logger(f'{__name__}.ToolExecutor'),
+                deadline=deadline,
+                default_pool=tool_pool,
             )
             self.__logger.debug(
                 'Tools enabled: %s', [tool.name for tool in tools]
             )
 
+        # Incremental mode: chain requests with previous_response_id and
+        # send only the new items, keeping `messages` for a full replay.
+        conversation = list(messages)
+        pending = messages
+        previous_response_id = None
+        chain_context = ''
+        if self.__response_chain is not None:
+            chain_context = OpenAIResponseChain.context(
+                model, instructions, tool_schemas
+            )
+            previous_response_id = self.__response_chain.lookup(
+                messages[:-1], chain_context, session
+            )
+            if previous_response_id:
+                pending = messages[-1:]
+                self.__logger.debug(
+                    'Continuing from stored response %s', previous_response_id
+                )
+
         iteration = 0
+        tokens_so_far = 0
         try:
             while iteration < self.__max_tool_iterations:
                 iteration += 1
@@ -69,8 +116,25 @@ class OpenAIHandler:
                 )
 
                 # Call OpenAI API
-                response_api = await self.__client.call_api(
-                    model, instructions, messages, config, tool_schemas
+                response_api = await run_within(
+                    deadline,
+                    self.__call_api(
+                        model,
+                        instructions,
+                        messages,
+                        pending,
+                        previous_response_id,
+                        config,
+                        tool_schemas,
+                        deadline,
+                    ),
+                    'waiting for OpenAI',
+                )
+                tokens_so_far += (
+                    MetricsRecorder.extract_total_tokens(
+                        response_api, 'openai'
+                    )
+                    or 0
                 )
 
                 if ToolCallParser.has_tool_calls(response_api):
@@ -101,25 +165,24 @@ class OpenAIHandler:
                         'Executing %s tool(s)', len(tool_calls)
                     )
 
-                    for tool_call in tool_calls:
-                        tool_name = tool_call['name']
-                        tool_args = tool_call['arguments']
-                        tool_id = tool_call['id']
-
-                        self.__logger.debug(
-                            "Executing tool '%s' with args: %s",
-                            tool_name,
-                            tool_args,
-                        )
-
-                        execution_result = await tool_executor.execute_tool(
-                            tool_name, **tool_args
+                    # Independent calls run concurrently; results keep the
+                    # order of the calls, as the API expects.
+                    execution_results = (
+                        await tool_executor.execute_multiple_tools(
+                            tool_calls,
+                            parallel=self.__max_parallel_tools > 1,
+                            max_concurrency=self.__max_parallel_tools,
                         )
+                    )
 
+                    tool_outputs = []
+                    for tool_call, execution_result in zip(
+                        tool_calls, execution_results
+                    ):
                         tool_result_msg = (
                             ToolCallParser.format_tool_results_for_llm(
-                                tool_call_id=tool_id,
-                                tool_name=tool_name,
+                                tool_call_id=tool_call['id'],
+                                tool_name=tool_call['name'],
                                 result=(
                                     str(execution_result.result)
                                     if execution_result.success
@@ -128,6 +191,13 @@ class OpenAIHandler:
                             )
                         )
                         messages.append(tool_result_msg)
+                        tool_outputs.append(tool_result_msg)
+
+                    if self.__response_chain is not None:
+                        previous_response_id = getattr(
+                            response_api, 'id', None
+                        )
+                        pending = tool_outputs
 
                     continue
 
@@ -137,10 +207,27 @@ class OpenAIHandler:
                     raise ChatException('OpenAI returned an empty response.')
 
                 # Record metrics
+                cache_stats = (
+                    tool_executor.get_cache_stats() if tool_executor else {}
+                )
                 self.__metrics_recorder.record_success_metrics(
-                    model, start_time, response_api, provider_type='openai'
+                    model,
+                    start_time,
+                    response_api,
+                    provider_type='openai',
+                    tool_cache_hits=cache_stats.get('hits'),
+                    tool_cache_misses=cache_stats.get('misses'),
                 )
 
+                if self.__response_chain is not None:
+                    self.__response_chain.remember(
+                        conversation
+                        + [{'role': 'assistant', 'content': content}],
+                        getattr(response_api, 'id', None),
+                        chain_context,
+                        session,
+                    )
+
                 self.__logger.debug(
                     'Response (first 100 chars): %s...', content[:100]
                 )
@@ -160,6 +247,31 @@ class OpenAIHandler:
                 f'({self.__max_tool_iterations}) exceeded'
             )
 
+        except ChatTimeoutException as e:
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            self.__metrics_recorder.record_timeout_metrics(
+                model,
+                start_time,
+                e,
+                tokens_used=tokens_so_far,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
+        except asyncio.CancelledError:
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            self.__metrics_recorder.record_cancelled_metrics(
+                model,
+                start_time,
+                tokens_used=tokens_so_far,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
         except ChatException:
             self.__metrics_recorder.record_error_metrics(
                 model, start_time, 'OpenAI chat error'
@@ -202,6 +314,62 @@ class OpenAIHandler:
                 f'Error communicating with OpenAI: {str(e)}', original_error=e
             ) from e
 
+    async def __call_api(
+        self,
+        model: str,
+        instructions: Optional[str],
+        messages: List[Dict[str, Any]],
+        pending: List[Dict[str, Any]],
+        previous_response_id: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tool_schemas: Optional[List[Dict[str, Any]]],
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Sends only the pending items when chained, else the full list.
+
+        If the server no longer holds the previous response, the request
+        is replayed with the full conversation.
+        """
+        if not previous_response_id:
+            return await self.__client.call_api(
+                model,
+                instructions,
+                messages,
+                config,
+                tool_schemas,
+                deadline=deadline,
+            )
+
+        try:
+            return await self.__client.call_api(
+                model,
+                instructions,
+                pending,
+                config,
+                tool_schemas,
+                previous_response_id=previous_response_id,
+                deadline=deadline,
+            )
+        except Exception as e:
+            if not OpenAIResponseChain.is_missing_state_error(e):
+                raise
+            self.__logger.warning(
+                'Stored response %s is unavailable, replaying the full '
+                'conversation: %s',
+                previous_response_id,
+                e,
+            )
+            if self.__response_chain is not None:
+                self.__response_chain.forget(previous_response_id)
+            return await self.__client.call_api(
+                model,
+                instructions,
+                messages,
+                config,
+                tool_schemas,
+                deadline=deadline,
+            )
+
     def get_metrics(self) -> List[ChatMetrics]:
         """Return the list of collected metrics."""
         return self.__metrics_recorder.get_metrics()
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...config import LoggingConfig
+
+_ChainKey = Tuple[Optional[str], str]
+"""A session and context, or no session and a conversation fingerprint."""
+
+
+class OpenAIResponseChain:
+    """
+    Maps conversations to the stored Responses API response that ends them.
+
+    With the Responses API the server keeps every stored response, so a
+    follow-up request can reference it with `previous_response_id` and send
+    only the items that are new since then (the next user message, or the
+    tool outputs of the current tool loop) instead of replaying the whole
+    conversation.
+
+    Conversations are identified by a fingerprint of their messages and
+    their context (model, instructions and tool schemas), so an agent
+    whose history was cleared, truncated or edited, or whose context
+    changed, simply finds no entry and falls back to a full replay.
+
+    The server-side state of a response also holds tool calls and outputs
+    that the agent's history does not show, so a response is only
+    continued by the session that created it: each session keeps one
+    entry per context, replaced at every turn. Requests made outside a
+    session (see `ConversationScope`) are keyed by fingerprint alone.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+    MISSING_STATE_CODES = frozenset({'previous_response_not_found'})
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initializes the chain.
+
+        Args:
+            max_entries: Maximum number of conversations remembered; the
+                         least recently used entries are dropped first.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError('max_entries must be greater than zero.')
+
+        self.__max_entries = max_entries
+        self.__entries: 'OrderedDict[_ChainKey, Tuple[str, str]]' = (
+            OrderedDict()
+        )
+        self.__lock = threading.Lock()
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @staticmethod
+    def fingerprint(messages: List[Dict[str, Any]], context: str = '') -> str:
+        """
+        Computes a stable fingerprint for a list of input items.
+
+        Args:
+            messages: The conversation items.
+            context: The requests' context (see `context`).
+
+        Returns:
+            A hex digest identifying the conversation.
+        """
+        payload = json.dumps(
+            [context, messages],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def context(
+        model: str,
+        instructions: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> str:
+        """
+        Computes a stable fingerprint for what requests depend on besides
+        their messages.
+
+        Args:
+            model: The model name.
+            instructions: The system instructions.
+            tools: The tool schemas sent with the requests.
+
+        Returns:
+            A hex digest identifying the context.
+        """
+        payload = json.dumps(
+            {'model': model, 'instructions': instructions, 'tools': tools},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def lookup(
+        self,
+        messages: List[Dict[str, Any]],
+        context: str = '',
+        session: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Returns the response that ends the given conversation, if known.
+
+        Args:
+            messages: The conversation items (e.g. the agent's history).
+            context: The requests' context (see `context`).
+            session: The conversation the requests belong to, if any.
+
+        Returns:
+            The response id to chain from, or None.
+        """
+        if not messages:
+            return None
+
+        fingerprint = self.fingerprint(messages, context)
+        key = self.__key(fingerprint, context, session)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                return None
+            self.__entries.move_to_end(key)
+        return entry[1]
+
+    def remember(
+        self,
+        messages: List[Dict[str, Any]],
+        response_id: Optional[str],
+        context: str = '',
+        session: Optional[str] = None,
+    ) -> None:
+        """
+        Records the response that ends a conversation.
+
+        Args:
+            messages: The conversation items, including the final answer.
+            response_id: The id of the stored response.
+            context: The requests' context (see `context`).
+            session: The conversation the requests belong to, if any.
+        """
+        if not messages or not response_id:
+            return
+
+        fingerprint = self.fingerprint(messages, context)
+        key = self.__key(fingerprint, context, session)
+        with self.__lock:
+            self.__entries[key] = (fingerprint, response_id)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def forget(self, response_id: str) -> None:
+        """
+        Drops every conversation that ends with the given response.
+
+        Args:
+            response_id: The response whose server-side state is gone.
+        """
+        with self.__lock:
+            stale = [
+                key
+                for key, (_, value) in self.__entries.items()
+                if value == response_id
+            ]
+            for key in stale:
+                del self.__entries[key]
+
+        if stale:
+            self.__logger.debug(
+                'Forgot %s conversation(s) chained to %s',
+                len(stale),
+                response_id,
+            )
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    @staticmethod
+    def __key(
+        fingerprint: str, context: str, session: Optional[str]
+    ) -> _ChainKey:
+        if session is None:
+            return (None, fingerprint)
+        return (session, context)
+
+    @classmethod
+    def is_missing_state_error(cls, error: BaseException) -> bool:
+        """
+        Tells whether an API error means the previous response is gone.
+
+        This happens when the response expired, was deleted, was created
+        with `store=False`, or belongs to another project.
+
+        Args:
+            error: The exception raised by the API call.
+
+        Returns:
+            True if the request should be replayed without chaining.
+        """
+        if getattr(error, 'status_code', None) not in (400, 404):
+            return False
+
+        if getattr(error, 'code', None) in cls.MISSING_STATE_CODES:
+            return True
+
+        message = str(error).lower()
+        return 'previous response' in message or (
+            'previous_response_id' in message
+        )
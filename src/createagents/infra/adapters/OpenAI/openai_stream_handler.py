@@ -1,14 +1,29 @@
+import asyncio
 import time
 from typing import Any, Dict, AsyncGenerator, List, Optional
 
-from ....domain import BaseTool, ChatException, ToolExecutor
+from ....domain import (
+    BaseTool,
+    ChatException,
+    ChatTimeoutException,
+    Deadline,
+    ToolExecutor,
+)
 from ...config import (
     ChatMetrics,
     EnvironmentConfig,
     LoggingConfig,
     create_logger,
 )
+from ..Common import (
+    MetricsRecorder,
+    close_stream,
+    iterate_within,
+    run_within,
+)
 from .openai_client import OpenAIClient
+from .openai_response_chain import OpenAIResponseChain
+from .stream_tool_dispatcher import StreamToolDispatcher
 from .tool_call_parser import ToolCallParser
 from .tool_schema_formatter import ToolSchemaFormatter
 
@@ -20,14 +35,19 @@ class OpenAIStreamHandler:
         self,
         client: OpenAIClient,
         metrics_list: Optional[List[ChatMetrics]] = None,
+        response_chain: Optional[OpenAIResponseChain] = None,
     ):
         self.__client = client
+        self.__response_chain = response_chain
         self.__logger = LoggingConfig.get_logger(__name__)
         self.__metrics = metrics_list if metrics_list is not None else []
         self.__max_tool_iterations = int(
             EnvironmentConfig.get_env('OPENAI_MAX_TOOL_ITERATIONS', '100')
             or '100'
         )
+        self.__max_parallel_tools = int(
+            EnvironmentConfig.get_env('OPENAI_MAX_PARALLEL_TOOLS', '4') or '4'
+        )
 
     async def handle_stream(
         self,
@@ -36,12 +56,19 @@ class OpenAIStreamHandler:
         messages: List[Dict[str, str]],
         config: Optional[Dict[str, Any]],
         tools: Optional[List[BaseTool]],
+        deadline: Optional[Deadline] = None,
+        tool_pool: Optional[str] = None,
+        session: Optional[str] = None,
     ) -> AsyncGenerator[str, None]:
         """Yields tokens from the OpenAI API as they arrive.
 
         Supports tool calling with interrupted streaming: when tools are
         called during streaming, token yield is paused, tools are executed,
-        and streaming resumes with the tool results.
+        and streaming resumes with the tool results. Each tool call starts
+        as soon as its item is complete in the stream, overlapping with the
+        rest of the response. With a deadline, the stream fails with
+        ChatTimeoutException once it passes. With a response chain, only
+        responses stored for the same `session` are continued.
         """
         start_time = time.time()
 
@@ -53,7 +80,10 @@ class OpenAIStreamHandler:
                 tools
             )
             tool_executor = ToolExecutor(
-                tools, create_logger(f'{__name__}.ToolExecutor')
+                tools,
+                create_logger(f'{__name__}.ToolExecutor'),
+                deadline=deadline,
+                default_pool=tool_pool,
             )
             self.__logger.debug(
                 'Streaming with tools enabled: %s',
@@ -66,6 +96,29 @@ class OpenAIStreamHandler:
         total_prompt_tokens = 0
         total_completion_tokens = 0
 
+        # Incremental mode: chain requests with previous_response_id and
+        # send only the new items, keeping `messages` for a full replay.
+        conversation = list(messages)
+        pending = messages
+        previous_response_id = None
+        chain_context = ''
+        if self.__response_chain is not None:
+            chain_context = OpenAIResponseChain.context(
+                model, instructions, tool_schemas
+            )
+            previous_response_id = self.__response_chain.lookup(
+                messages[:-1], chain_context, session
+            )
+            if previous_response_id:
+                pending = messages[-1:]
+                self.__logger.debug(
+                    'Continuing from stored response %s', previous_response_id
+                )
+        streamed_text: List[str] = []
+        last_response_id = None
+        dispatcher: Optional[StreamToolDispatcher] = None
+
+        stream_response: Any = None
         iteration = 0
         try:
             while iteration < self.__max_tool_iterations:
@@ -77,8 +130,19 @@ class OpenAIStreamHandler:
                 )
 
                 # Call OpenAI API with streaming enabled
-                stream_response = await self.__client.call_api(
-                    model, instructions, messages, config, tool_schemas
+                stream_response = await run_within(
+                    deadline,
+                    self.__call_api(
+                        model,
+                        instructions,
+                        messages,
+                        pending,
+                        previous_response_id,
+                        config,
+                        tool_schemas,
+                        deadline,
+                    ),
+                    'waiting for OpenAI',
                 )
 
                 self.__logger.debug(
@@ -88,9 +152,15 @@ class OpenAIStreamHandler:
                 # Track response state
                 full_response = None
                 has_yielded_content = False
+                if tool_executor is not None:
+                    dispatcher = StreamToolDispatcher(
+                        tool_executor, self.__max_parallel_tools
+                    )
 
                 # Process streaming events from OpenAI Responses API
-                async for event in stream_response:
+                async for event in iterate_within(
+                    deadline, stream_response, 'streaming from OpenAI'
+                ):
                     event_type = getattr(event, 'type', None)
 
                     # Yield text tokens as they arrive
@@ -98,6 +168,7 @@ class OpenAIStreamHandler:
                         if hasattr(event, 'delta'):
                             token = event.delta
                             if token:
+                                streamed_text.append(token)
                                 yield token
                                 has_yielded_content = True
 
@@ -107,9 +178,19 @@ class OpenAIStreamHandler:
                             if hasattr(content_part, 'text'):
                                 token = content_part.text
                                 if token:
+                                    streamed_text.append(token)
                                     yield token
                                     has_yielded_content = True
 
+                    # Start tool calls as soon as they are complete
+                    elif event_type in (
+                        'response.output_item.added',
+                        'response.output_item.done',
+                        'response.function_call_arguments.done',
+                    ):
+                        if dispatcher is not None:
+                            dispatcher.on_event(event)
+
                     # Capture the completed event with full response
                     elif event_type == 'response.completed':
                         full_response = getattr(event, 'response', None)
@@ -121,6 +202,8 @@ class OpenAIStreamHandler:
                     )
                     break
 
+                last_response_id = getattr(full_response, 'id', None)
+
                 # Extract text from full response if no deltas were streamed
                 if not has_yielded_content:
                     if (
@@ -132,6 +215,7 @@ class OpenAIStreamHandler:
                             if item_type == 'text':
                                 text_content = getattr(item, 'text', None)
                                 if text_content:
+                                    streamed_text.append(text_content)
                                     yield text_content
                                     has_yielded_content = True
 
@@ -152,7 +236,7 @@ class OpenAIStreamHandler:
                     )
 
                 # Execute tool calls if present
-                if tool_executor and ToolCallParser.has_tool_calls(
+                if dispatcher is not None and ToolCallParser.has_tool_calls(
                     full_response
                 ):
                     # Add output items to messages for context
@@ -170,21 +254,18 @@ class OpenAIStreamHandler:
                     )
                     self.__logger.info('Executing %s tool(s)', len(tool_calls))
 
-                    for tool_call in tool_calls:
-                        tool_name = tool_call['name']
-                        tool_args = tool_call['arguments']
-                        tool_id = tool_call['id']
-
-                        self.__logger.debug("Executing tool '%s'", tool_name)
-
-                        execution_result = await tool_executor.execute_tool(
-                            tool_name, **tool_args
-                        )
+                    # Calls started mid-stream are joined here; results keep
+                    # the order of the calls, as the API expects.
+                    execution_results = await dispatcher.join(tool_calls)
 
+                    tool_outputs = []
+                    for tool_call, execution_result in zip(
+                        tool_calls, execution_results
+                    ):
                         tool_result_msg = (
                             ToolCallParser.format_tool_results_for_llm(
-                                tool_call_id=tool_id,
-                                tool_name=tool_name,
+                                tool_call_id=tool_call['id'],
+                                tool_name=tool_call['name'],
                                 result=(
                                     str(execution_result.result)
                                     if execution_result.success
@@ -193,11 +274,29 @@ class OpenAIStreamHandler:
                             )
                         )
                         messages.append(tool_result_msg)
+                        tool_outputs.append(tool_result_msg)
+
+                    if self.__response_chain is not None:
+                        previous_response_id = last_response_id
+                        pending = tool_outputs
 
                     # Continue to next iteration for final response
                     continue
 
                 # Response complete, no tool calls - end stream
+                if self.__response_chain is not None and streamed_text:
+                    self.__response_chain.remember(
+                        conversation
+                        + [
+                            {
+                                'role': 'assistant',
+                                'content': ''.join(streamed_text),
+                            }
+                        ],
+                        last_response_id,
+                        chain_context,
+                        session,
+                    )
                 break
 
             if iteration >= self.__max_tool_iterations:
@@ -213,6 +312,9 @@ class OpenAIStreamHandler:
                 if total_prompt_tokens or total_completion_tokens
                 else None
             )
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
             metrics = ChatMetrics(
                 model=model,
                 latency_ms=latency,
@@ -224,14 +326,47 @@ class OpenAIStreamHandler:
                 if total_completion_tokens
                 else None,
                 success=True,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
             )
-            self.__metrics.append(metrics)
+            MetricsRecorder(self.__metrics).record(metrics)
             self.__logger.info(
                 'Streaming chat completed: %s (accumulated over %s iteration(s))',
                 metrics,
                 iteration,
             )
 
+        except ChatTimeoutException as e:
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            MetricsRecorder(self.__metrics).record_timeout_metrics(
+                model,
+                start_time,
+                e,
+                tokens_used=total_prompt_tokens + total_completion_tokens,
+                prompt_tokens=total_prompt_tokens,
+                completion_tokens=total_completion_tokens,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            # Nobody reads the rest: stop paying for it right away.
+            await close_stream(stream_response)
+            cache_stats = (
+                tool_executor.get_cache_stats() if tool_executor else {}
+            )
+            MetricsRecorder(self.__metrics).record_cancelled_metrics(
+                model,
+                start_time,
+                tokens_used=total_prompt_tokens + total_completion_tokens,
+                prompt_tokens=total_prompt_tokens,
+                completion_tokens=total_completion_tokens,
+                tool_cache_hits=cache_stats.get('hits'),
+                tool_cache_misses=cache_stats.get('misses'),
+            )
+            raise
         except Exception as e:
             latency = (time.time() - start_time) * 1000
             metrics = ChatMetrics(
@@ -240,12 +375,72 @@ class OpenAIStreamHandler:
                 success=False,
                 error_message=str(e),
             )
-            self.__metrics.append(metrics)
+            MetricsRecorder(self.__metrics).record(metrics)
             self.__logger.error('Error during streaming: %s', e)
             raise ChatException(
                 f'Error during OpenAI streaming: {str(e)}',
                 original_error=e,
             ) from e
+        finally:
+            # Tools started for a response that was not joined are dropped
+            if dispatcher is not None:
+                dispatcher.cancel()
+
+    async def __call_api(
+        self,
+        model: str,
+        instructions: Optional[str],
+        messages: List[Dict[str, Any]],
+        pending: List[Dict[str, Any]],
+        previous_response_id: Optional[str],
+        config: Optional[Dict[str, Any]],
+        tool_schemas: Optional[List[Dict[str, Any]]],
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Sends only the pending items when chained, else the full list.
+
+        If the server no longer holds the previous response, the request
+        is replayed with the full conversation.
+        """
+        if not previous_response_id:
+            return await self.__client.call_api(
+                model,
+                instructions,
+                messages,
+                config,
+                tool_schemas,
+                deadline=deadline,
+            )
+
+        try:
+            return await self.__client.call_api(
+                model,
+                instructions,
+                pending,
+                config,
+                tool_schemas,
+                previous_response_id=previous_response_id,
+                deadline=deadline,
+            )
+        except Exception as e:
+            if not OpenAIResponseChain.is_missing_state_error(e):
+                raise
+            self.__logger.warning(
+                'Stored response %s is unavailable, replaying the full '
+                'conversation: %s',
+                previous_response_id,
+                e,
+            )
+            if self.__response_chain is not None:
+                self.__response_chain.forget(previous_response_id)
+            return await self.__client.call_api(
+                model,
+                instructions,
+                messages,
+                config,
+                tool_schemas,
+                deadline=deadline,
+            )
 
     def get_metrics(self) -> List[ChatMetrics]:
         """Returns the list of collected metrics."""
@@ -0,0 +1,176 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from ....domain import ToolExecutionResult, ToolExecutor
+from ...config import LoggingConfig
+
+
+class StreamToolDispatcher:
+    """Starts tool calls while a Responses API stream is still running.
+
+    A function_call item is complete as soon as its
+    `response.output_item.done` (or `response.function_call_arguments.done`)
+    event arrives, so its execution can overlap with the rest of the
+    stream. `join` then waits for those executions, runs the calls that
+    were not started early, and returns the results in call order.
+
+    Early and late calls share one concurrency limit (`max_concurrency`)
+    and identical calls to `idempotent` tools are executed once, whichever
+    of them started first.
+
+    One dispatcher is meant for a single streamed response.
+    """
+
+    def __init__(self, tool_executor: ToolExecutor, max_concurrency: int):
+        self.__tool_executor = tool_executor
+        self.__semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__added_items: Dict[str, Any] = {}
+        self.__started: Dict[str, 'asyncio.Task[ToolExecutionResult]'] = {}
+        self.__shared: Dict[str, 'asyncio.Task[ToolExecutionResult]'] = {}
+
+    def on_event(self, event: Any) -> None:
+        """Inspects a stream event and starts a completed tool call.
+
+        Args:
+            event: A Responses API stream event.
+        """
+        event_type = getattr(event, 'type', None)
+
+        if event_type == 'response.output_item.added':
+            item = getattr(event, 'item', None)
+            item_id = getattr(item, 'id', None)
+            if getattr(item, 'type', None) == 'function_call' and item_id:
+                self.__added_items[item_id] = item
+
+        elif event_type == 'response.output_item.done':
+            item = getattr(event, 'item', None)
+            if getattr(item, 'type', None) == 'function_call':
+                self.__start(
+                    getattr(item, 'call_id', None),
+                    getattr(item, 'name', None),
+                    getattr(item, 'arguments', None),
+                )
+
+        elif event_type == 'response.function_call_arguments.done':
+            item_id = getattr(event, 'item_id', None)
+            item = self.__added_items.get(item_id) if item_id else None
+            if item is not None:
+                self.__start(
+                    getattr(item, 'call_id', None),
+                    getattr(event, 'name', None)
+                    or getattr(item, 'name', None),
+                    getattr(event, 'arguments', None),
+                )
+
+    async def join(
+        self, tool_calls: List[Dict[str, Any]]
+    ) -> List[ToolExecutionResult]:
+        """Returns the results of the response's tool calls in order.
+
+        Calls started mid-stream are awaited; the others are executed now.
+        Started executions that do not belong to `tool_calls` are cancelled.
+
+        Args:
+            tool_calls: The tool calls parsed from the completed response.
+
+        Returns:
+            One ToolExecutionResult per tool call, in the same order.
+        """
+        call_ids = {call.get('id') for call in tool_calls}
+        kept = {
+            task
+            for call_id, task in self.__started.items()
+            if call_id in call_ids
+        }
+        for task in set(self.__started.values()) - kept:
+            task.cancel()
+        self.__started = {
+            call_id: task
+            for call_id, task in self.__started.items()
+            if call_id in call_ids
+        }
+        self.__shared = {
+            key: task for key, task in self.__shared.items() if task in kept
+        }
+        if self.__started:
+            self.__logger.debug(
+                '%s tool call(s) had started mid-stream', len(self.__started)
+            )
+
+        tasks: List['asyncio.Task[ToolExecutionResult]'] = []
+        for call in tool_calls:
+            if call['id'] not in self.__started:
+                self.__started[call['id']] = self.__submit(call)
+            tasks.append(self.__started[call['id']])
+
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            self.__started.clear()
+            self.__shared.clear()
+
+    def cancel(self) -> None:
+        """Cancels executions that were started but not joined."""
+        for task in self.__started.values():
+            if not task.done():
+                task.cancel()
+        self.__started.clear()
+        self.__shared.clear()
+
+    def __start(
+        self, call_id: Optional[str], name: Optional[str], arguments: Any
+    ) -> None:
+        if (
+            not call_id
+            or not name
+            or arguments is None
+            or call_id in self.__started
+        ):
+            return
+
+        self.__logger.debug(
+            "Starting tool '%s' (call_id: %s) mid-stream", name, call_id
+        )
+        tool_call = {'id': call_id, 'name': name, 'arguments': arguments}
+        self.__started[call_id] = self.__submit(tool_call)
+
+    def __submit(
+        self, tool_call: Dict[str, Any]
+    ) -> 'asyncio.Task[ToolExecutionResult]':
+        """Starts a call, or returns the identical idempotent one running."""
+        key = self.__get_dedup_key(tool_call)
+        task = self.__shared.get(key) if key is not None else None
+        if task is not None:
+            self.__logger.debug(
+                "Reusing identical idempotent call to '%s'",
+                tool_call.get('name'),
+            )
+            return task
+        task = asyncio.ensure_future(self.__execute(tool_call))
+        if key is not None:
+            self.__shared[key] = task
+        return task
+
+    def __get_dedup_key(self, tool_call: Dict[str, Any]) -> Optional[str]:
+        arguments = tool_call.get('arguments', {})
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments)
+            except json.JSONDecodeError:
+                return None
+        if not isinstance(arguments, dict):
+            return None
+        return self.__tool_executor.get_dedup_key(
+            tool_call.get('name', ''), arguments
+        )
+
+    async def __execute(
+        self, tool_call: Dict[str, Any]
+    ) -> ToolExecutionResult:
+        async with self.__semaphore:
+            results = await self.__tool_executor.execute_multiple_tools(
+                [tool_call]
+            )
+        return results[0]
@@ -77,11 +77,25 @@ class CurrentDateTool(BaseTool):
         },
         'required': ['action', 'tz'],
     }
+    # Output has one-second resolution, so results live for one second.
+    cacheable = True
+    cache_ttl_s = 1.0
 
     def __init__(self) -> None:
         """Initialize the CurrentDateTool."""
         self.__logger = LoggingConfig.get_logger(__name__)
 
+    def cache_scope(self) -> None:
+        """Share results across instances; the tool has no configuration."""
+        return None
+
+    def is_cacheable_result(self, result: Any) -> bool:
+        """Do not cache error messages."""
+        return not (
+            isinstance(result, str)
+            and result.startswith('[CurrentDateTool Error]')
+        )
+
     @staticmethod
     def __resolve_zone(tz: str) -> ZoneInfo:
         """Resolve the timezone string to a ZoneInfo object.
@@ -1,5 +1,7 @@
+from .document_parser import DocumentParser
 from .read_local_file_tool import ReadLocalFileTool
 
 __all__ = [
+    'DocumentParser',
     'ReadLocalFileTool',
 ]
@@ -0,0 +1,370 @@
+import io
+import sys
+import threading
+import warnings
+from concurrent.futures import FIRST_EXCEPTION, Future, wait
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from .....domain import FileReadException, ToolPool, ToolPools
+from ....config import EnvironmentConfig, LoggingConfig
+
+# Text of one extracted element and the page it came from (if known).
+PageText = Tuple[Optional[int], str]
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+def _preload() -> None:
+    """Imports unstructured in a new worker, ahead of its first document."""
+    try:
+        import unstructured.partition.auto  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+        import unstructured.partition.pdf  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        pass
+
+
+def _partition_quietly(
+    partition: Callable[..., List[Any]], label: str, **kwargs: Any
+) -> List[Any]:
+    """Runs an unstructured partition function, logging what it prints.
+
+    C libraries used by unstructured write to stderr and emit warnings;
+    both are captured and logged, except the known `max_size` noise.
+    """
+    # Redirect stderr to capture warnings from C libraries
+    stderr_capture = io.StringIO()
+    old_stderr = sys.stderr
+
+    try:
+        sys.stderr = stderr_capture
+
+        with warnings.catch_warnings(record=True) as w:
+            # Suppress specific deprecation warnings from dependencies FIRST
+            warnings.filterwarnings(
+                'ignore', message='.*max_size.*deprecated.*'
+            )
+            warnings.filterwarnings(
+                'ignore',
+                category=DeprecationWarning,
+                module='.*unstructured.*',
+            )
+            # Then enable all other warnings
+            warnings.simplefilter('always')
+
+            elements = partition(
+                strategy='auto',  # Auto chooses best strategy (fast, hi_res, ocr)
+                infer_table_structure=True,  # Extract tables as structured data
+                languages=['eng'],  # Suppress "No languages specified" warning
+                **kwargs,
+            )
+    finally:
+        # Ensure stderr is always restored
+        sys.stderr = old_stderr
+
+    # Log stderr warnings that aren't about max_size
+    stderr_output = stderr_capture.getvalue()
+    if stderr_output:
+        for line in stderr_output.strip().split('\n'):
+            if line and 'max_size' not in line.lower():
+                logger.warning('%s processing stderr: %s', label, line)
+
+    # Log any Python warnings that weren't filtered
+    for warning in w:
+        if 'max_size' not in str(warning.message).lower():
+            logger.warning(
+                'Warning during %s processing: %s',
+                label.lower(),
+                warning.message,
+            )
+    return elements
+
+
+def _to_page_texts(elements: List[Any]) -> List[PageText]:
+    """Keeps the non-empty text of each element and its page number.
+
+    Plain tuples are returned so results cross process boundaries
+    cheaply.
+    """
+    page_texts: List[PageText] = []
+    for element in elements:
+        text = str(element).strip()
+        if not text:
+            continue
+        metadata = getattr(element, 'metadata', None)
+        page_texts.append((getattr(metadata, 'page_number', None), text))
+    return page_texts
+
+
+def _extract_pages(path: str, first_page: int, last_page: int) -> io.BytesIO:
+    """Copies a range of pages (1-based, inclusive) into a new PDF."""
+    from pypdf import PdfReader, PdfWriter  # pylint: disable=import-outside-toplevel
+
+    reader = PdfReader(path)
+    writer = PdfWriter()
+    for index in range(first_page - 1, last_page):
+        writer.add_page(reader.pages[index])
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def _count_pages(path: Path) -> Optional[int]:
+    """Returns the page count of a PDF, or None if pypdf cannot read it."""
+    try:
+        from pypdf import PdfReader  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    try:
+        return len(PdfReader(str(path)).pages)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug('Could not count pages of %s: %s', path, e)
+        return None
+
+
+def partition_pdf_pages(
+    path: str, first_page: int = 1, last_page: Optional[int] = None
+) -> List[PageText]:
+    """Extracts the text of a PDF, or of a range of its pages.
+
+    Runs in a pool worker, so it takes and returns plain values.
+
+    Args:
+        path: Path to the PDF file.
+        first_page: First page of the range (1-based).
+        last_page: Last page of the range, inclusive (None = whole file).
+
+    Returns:
+        List[PageText]: The text of each element, with its page number.
+    """
+    from unstructured.partition.pdf import partition_pdf  # pylint: disable=import-outside-toplevel
+
+    if last_page is None:
+        elements = _partition_quietly(partition_pdf, 'PDF', filename=path)
+    else:
+        elements = _partition_quietly(
+            partition_pdf,
+            'PDF',
+            file=_extract_pages(path, first_page, last_page),
+            starting_page_number=first_page,
+        )
+    return _to_page_texts(elements)
+
+
+def partition_document(path: str) -> List[PageText]:
+    """Extracts the text of a Word, PowerPoint, OpenDocument, etc. file.
+
+    Runs in a pool worker, so it takes and returns plain values.
+
+    Args:
+        path: Path to the document.
+
+    Returns:
+        List[PageText]: The text of each element, with its page number.
+    """
+    from unstructured.partition.auto import partition  # pylint: disable=import-outside-toplevel
+
+    elements = _partition_quietly(partition, 'Document', filename=path)
+    return _to_page_texts(elements)
+
+
+class DocumentParser:
+    """Parses PDFs and office documents with unstructured in a process pool.
+
+    Partitioning is CPU-bound and holds the GIL, so it runs in the
+    `documents` pool of `ToolPools`: a process pool whose workers import
+    unstructured once when they start. PDFs longer than `pages_per_chunk`
+    are split into page ranges that are parsed in parallel and merged back
+    in page order. A document that takes longer than `timeout_s` fails
+    with FileReadException; ranges still running finish in the background.
+
+    The pool is created on first use. Registering a `documents` pool in
+    `ToolPools` beforehand overrides its size and kind.
+    """
+
+    POOL_NAME = 'documents'
+    DEFAULT_WORKERS = 2
+    DEFAULT_PAGES_PER_CHUNK = 20
+    DEFAULT_TIMEOUT_S = 300.0
+
+    _shared: Optional['DocumentParser'] = None
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        pages_per_chunk: int = DEFAULT_PAGES_PER_CHUNK,
+        timeout_s: Optional[float] = DEFAULT_TIMEOUT_S,
+    ):
+        """Initialize the parser.
+
+        Args:
+            workers: Size of the process pool. 0 parses in the calling
+                thread, without splitting or timeout.
+            pages_per_chunk: Pages per range when splitting a PDF.
+            timeout_s: Time limit per document, in seconds (None = no
+                limit).
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if workers < 0:
+            raise ValueError('workers cannot be negative.')
+        if pages_per_chunk <= 0:
+            raise ValueError('pages_per_chunk must be greater than zero.')
+        if timeout_s is not None and timeout_s <= 0:
+            raise ValueError('timeout_s must be greater than zero.')
+
+        self.workers = workers
+        self.pages_per_chunk = pages_per_chunk
+        self.timeout_s = timeout_s
+
+    @classmethod
+    def from_env(cls) -> 'DocumentParser':
+        """Creates a parser configured from the environment.
+
+        `DOCUMENT_PARSER_WORKERS`, `DOCUMENT_PARSER_PAGES_PER_CHUNK` and
+        `DOCUMENT_PARSER_TIMEOUT` override the defaults.
+        """
+        return cls(
+            workers=int(
+                EnvironmentConfig.get_env('DOCUMENT_PARSER_WORKERS')
+                or cls.DEFAULT_WORKERS
+            ),
+            pages_per_chunk=int(
+                EnvironmentConfig.get_env('DOCUMENT_PARSER_PAGES_PER_CHUNK')
+                or cls.DEFAULT_PAGES_PER_CHUNK
+            ),
+            timeout_s=float(
+                EnvironmentConfig.get_env('DOCUMENT_PARSER_TIMEOUT')
+                or cls.DEFAULT_TIMEOUT_S
+            ),
+        )
+
+    @classmethod
+    def get_shared(cls) -> 'DocumentParser':
+        """Return the process-wide parser, created from the environment."""
+        with cls._lock:
+            if cls._shared is None:
+                cls._shared = cls.from_env()
+            return cls._shared
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Drop the process-wide parser (the pool is left registered)."""
+        with cls._lock:
+            cls._shared = None
+
+    def warmup(self) -> None:
+        """Starts the pool's workers ahead of the first document."""
+        self.__get_pool()
+
+    def parse_pdf(self, file_path: Path) -> List[PageText]:
+        """Extracts the text of a PDF, splitting long ones by pages.
+
+        Args:
+            file_path: Path to the PDF file.
+
+        Returns:
+            List[PageText]: Element texts in page order.
+
+        Raises:
+            FileReadException: If parsing times out.
+        """
+        path = str(file_path)
+        pool = self.__get_pool()
+        page_count = _count_pages(file_path) if pool is not None else None
+
+        if page_count is None or page_count <= self.pages_per_chunk:
+            ranges: List[Tuple[Any, ...]] = [(path, 1, None)]
+        else:
+            ranges = [
+                (
+                    path,
+                    first,
+                    min(first + self.pages_per_chunk - 1, page_count),
+                )
+                for first in range(1, page_count + 1, self.pages_per_chunk)
+            ]
+            logger.debug(
+                'Parsing %s pages of %s in %s range(s)',
+                page_count,
+                file_path,
+                len(ranges),
+            )
+
+        chunks = self.__run(pool, file_path, partition_pdf_pages, ranges)
+        return [page_text for chunk in chunks for page_text in chunk]
+
+    def parse_document(self, file_path: Path) -> List[PageText]:
+        """Extracts the text of a Word, PowerPoint, etc. document.
+
+        Args:
+            file_path: Path to the document.
+
+        Returns:
+            List[PageText]: Element texts in document order.
+
+        Raises:
+            FileReadException: If parsing times out.
+        """
+        (chunk,) = self.__run(
+            self.__get_pool(),
+            file_path,
+            partition_document,
+            [(str(file_path),)],
+        )
+        return chunk
+
+    def __get_pool(self) -> Optional[ToolPool]:
+        if self.workers == 0:
+            return None
+        with DocumentParser._lock:
+            try:
+                return ToolPools.get(self.POOL_NAME)
+            except ValueError:
+                logger.info(
+                    "Starting document pool '%s' with %s worker(s)",
+                    self.POOL_NAME,
+                    self.workers,
+                )
+                return ToolPools.register(
+                    self.POOL_NAME,
+                    kind='process',
+                    max_workers=self.workers,
+                    warm=True,
+                    initializer=_preload,
+                )
+
+    def __run(
+        self,
+        pool: Optional[ToolPool],
+        file_path: Path,
+        partition: Callable[..., List[PageText]],
+        calls: List[Tuple[Any, ...]],
+    ) -> List[List[PageText]]:
+        """Runs the partition calls and returns their results in order."""
+        if pool is None:
+            return [partition(*args) for args in calls]
+
+        futures: List[Future] = [
+            pool.submit(partition, *args) for args in calls
+        ]
+        done, pending = wait(
+            futures, timeout=self.timeout_s, return_when=FIRST_EXCEPTION
+        )
+        if pending:
+            for future in pending:
+                future.cancel()
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    raise error
+            raise FileReadException(
+                str(file_path),
+                f'Parsing timed out after {self.timeout_s:g}s',
+            )
+        return [future.result() for future in futures]
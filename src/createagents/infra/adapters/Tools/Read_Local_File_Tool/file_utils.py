@@ -1,8 +1,6 @@
+import importlib.util
 from pathlib import Path
-import warnings
-import sys
-import io
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from .....domain import FileReadException
 from ....config import LoggingConfig
@@ -14,6 +12,7 @@ from .constants import (
     TIKTOKEN_ENCODING,
     FileType,
 )
+from .document_parser import DocumentParser, PageText
 
 if TYPE_CHECKING:
     import tiktoken  # pylint: disable=import-outside-toplevel
@@ -352,12 +351,66 @@ def read_parquet_file(file_path: Path) -> str:
     ) from last_error
 
 
+def _require_unstructured(purpose: str) -> None:
+    """Fails early when unstructured is missing.
+
+    Only the module spec is checked: the import itself happens in the
+    parser's worker processes.
+
+    Raises:
+        RuntimeError: If unstructured is not installed.
+    """
+    if importlib.util.find_spec('unstructured') is None:
+        raise RuntimeError(
+            f'unstructured is required for {purpose}. '
+            'Install with: pip install ai-agent[file-tools]'
+        )
+
+
+def format_pdf_pages(page_texts: List[PageText]) -> str:
+    """Join extracted PDF texts, grouped under a header per page.
+
+    Args:
+        page_texts: Element texts with their page numbers, in page order.
+
+    Returns:
+        The text of the document.
+    """
+    content_parts: list[str] = []
+    current_page = None
+    page_content: list[str] = []
+
+    for element_page, element_text in page_texts:
+        if element_page is not None and element_page != current_page:
+            # Save previous page content
+            if page_content:
+                content_parts.append(
+                    f'--- Page {current_page} ---\n' + '\n'.join(page_content)
+                )
+                page_content = []
+            current_page = element_page
+
+        page_content.append(element_text)
+
+    # Add last page
+    if page_content:
+        if current_page is not None:
+            content_parts.append(
+                f'--- Page {current_page} ---\n' + '\n'.join(page_content)
+            )
+        else:
+            content_parts.extend(page_content)
+
+    return '\n\n'.join(content_parts)
+
+
 def read_pdf_file(file_path: Path) -> str:
     """Read a PDF file and extract text from all pages with error handling.
 
     Uses unstructured library for robust PDF parsing that handles various formats,
-    including scanned PDFs with OCR capabilities. Supports additional
-    document types beyond basic PDFs.
+    including scanned PDFs with OCR capabilities. Parsing runs in the
+    `DocumentParser` process pool; long PDFs are split into page ranges
+    parsed in parallel.
 
     Args:
         file_path: Path to the PDF file.
@@ -366,16 +419,10 @@ def read_pdf_file(file_path: Path) -> str:
         Extracted text from all PDF pages.
 
     Raises:
-        FileReadException: If PDF reading fails.
+        FileReadException: If PDF reading fails or times out.
         RuntimeError: If unstructured is not installed.
     """
-    try:
-        from unstructured.partition.pdf import partition_pdf  # pylint: disable=import-outside-toplevel
-    except ImportError as e:
-        raise RuntimeError(
-            'unstructured is required for PDF reading. '
-            'Install with: pip install ai-agent[file-tools]'
-        ) from e
+    _require_unstructured('PDF reading')
 
     try:
         logger.debug('Reading PDF file: %s', file_path)
@@ -385,99 +432,16 @@ def read_pdf_file(file_path: Path) -> str:
         # - OCR for scanned PDFs (if pytesseract is available)
         # - Layout detection and element classification
         # - Tables, images, and other structured content
-        # Redirect stderr to capture warnings from C libraries
-        stderr_capture = io.StringIO()
-        old_stderr = sys.stderr
-
-        try:
-            sys.stderr = stderr_capture
-
-            with warnings.catch_warnings(record=True) as w:
-                # Suppress specific deprecation warnings from dependencies FIRST
-                warnings.filterwarnings(
-                    'ignore', message='.*max_size.*deprecated.*'
-                )
-                warnings.filterwarnings(
-                    'ignore',
-                    category=DeprecationWarning,
-                    module='.*unstructured.*',
-                )
-                # Then enable all other warnings
-                warnings.simplefilter('always')
-
-                elements = partition_pdf(
-                    filename=str(file_path),
-                    strategy='auto',  # Auto chooses best strategy (fast, hi_res, ocr)
-                    infer_table_structure=True,  # Extract tables as structured data
-                    languages=[
-                        'eng'
-                    ],  # Suppress "No languages specified" warning
-                )
-
-            # Restore stderr
-            sys.stderr = old_stderr
+        page_texts = DocumentParser.get_shared().parse_pdf(file_path)
 
-            # Log stderr warnings that aren't about max_size
-            stderr_output = stderr_capture.getvalue()
-            if stderr_output:
-                for line in stderr_output.strip().split('\n'):
-                    if line and 'max_size' not in line.lower():
-                        logger.warning('PDF processing stderr: %s', line)
-
-            # Log any Python warnings that weren't filtered
-            for warning in w:
-                if 'max_size' not in str(warning.message).lower():
-                    logger.warning(
-                        'Warning during PDF processing: %s', warning.message
-                    )
-        finally:
-            # Ensure stderr is always restored
-            sys.stderr = old_stderr
-
-        if not elements:
+        if not page_texts:
             raise FileReadException(
                 str(file_path), 'No readable content found in PDF'
             )
 
-        # Combine all extracted text elements
-        content_parts: list[str] = []
-        current_page = None
-        page_content: list[str] = []
-
-        for element in elements:
-            # Group content by page if metadata is available
-            element_page = (
-                getattr(element.metadata, 'page_number', None)
-                if hasattr(element, 'metadata')
-                else None
-            )
-
-            if element_page is not None and element_page != current_page:
-                # Save previous page content
-                if page_content:
-                    content_parts.append(
-                        f'--- Page {current_page} ---\n'
-                        + '\n'.join(page_content)
-                    )
-                    page_content = []
-                current_page = element_page
-
-            element_text = str(element).strip()
-            if element_text:
-                page_content.append(element_text)
-
-        # Add last page
-        if page_content:
-            if current_page is not None:
-                content_parts.append(
-                    f'--- Page {current_page} ---\n' + '\n'.join(page_content)
-                )
-            else:
-                content_parts.extend(page_content)
-
-        result = '\n\n'.join(content_parts)
+        result = format_pdf_pages(page_texts)
         logger.debug(
-            'Successfully extracted %s elements from PDF', len(elements)
+            'Successfully extracted %s elements from PDF', len(page_texts)
         )
         return result
 
@@ -499,7 +463,8 @@ def read_document_file(file_path: Path) -> str:
     """Read various document formats using unstructured library.
 
     Supports Word documents (.doc, .docx), PowerPoint (.ppt, .pptx),
-    OpenDocument (.odt), EPUB, MSG, RTF, and other formats.
+    OpenDocument (.odt), EPUB, MSG, RTF, and other formats. Parsing runs
+    in the `DocumentParser` process pool.
 
     Args:
         file_path: Path to the document file.
@@ -508,86 +473,26 @@ def read_document_file(file_path: Path) -> str:
         Extracted text from the document.
 
     Raises:
-        FileReadException: If document reading fails.
+        FileReadException: If document reading fails or times out.
         RuntimeError: If unstructured is not installed.
     """
-    try:
-        from unstructured.partition.auto import partition  # pylint: disable=import-outside-toplevel
-    except ImportError as e:
-        raise RuntimeError(
-            'unstructured is required for document reading. '
-            'Install with: pip install ai-agent[file-tools]'
-        ) from e
+    _require_unstructured('document reading')
 
     try:
         logger.debug('Reading document file: %s', file_path)
 
         # partition automatically detects file type and uses appropriate parser
+        page_texts = DocumentParser.get_shared().parse_document(file_path)
 
-        # Redirect stderr to capture warnings from C libraries
-        stderr_capture = io.StringIO()
-        old_stderr = sys.stderr
-
-        try:
-            sys.stderr = stderr_capture
-
-            with warnings.catch_warnings(record=True) as w:
-                # Suppress specific deprecation warnings from dependencies FIRST
-                warnings.filterwarnings(
-                    'ignore', message='.*max_size.*deprecated.*'
-                )
-                warnings.filterwarnings(
-                    'ignore',
-                    category=DeprecationWarning,
-                    module='.*unstructured.*',
-                )
-                # Then enable all other warnings
-                warnings.simplefilter('always')
-
-                elements = partition(
-                    filename=str(file_path),
-                    strategy='auto',
-                    infer_table_structure=True,
-                    languages=[
-                        'eng'
-                    ],  # Suppress "No languages specified" warning
-                )
-
-            # Restore stderr
-            sys.stderr = old_stderr
-
-            # Log stderr warnings that aren't about max_size
-            stderr_output = stderr_capture.getvalue()
-            if stderr_output:
-                for line in stderr_output.strip().split('\n'):
-                    if line and 'max_size' not in line.lower():
-                        logger.warning('Document processing stderr: %s', line)
-
-            # Log any Python warnings that weren't filtered
-            for warning in w:
-                if 'max_size' not in str(warning.message).lower():
-                    logger.warning(
-                        'Warning during document processing: %s',
-                        warning.message,
-                    )
-        finally:
-            # Ensure stderr is always restored
-            sys.stderr = old_stderr
-
-        if not elements:
+        if not page_texts:
             raise FileReadException(
                 str(file_path), 'No readable content found in document'
             )
 
-        content_parts = [
-            str(element).strip()
-            for element in elements
-            if str(element).strip()
-        ]
-
-        result = '\n\n'.join(content_parts)
+        result = '\n\n'.join(text for _, text in page_texts)
         logger.debug(
-            'Successfully extracted %s elements from document', len(elements)
+            'Successfully extracted %s elements from document',
+            len(page_texts),
         )
         return result
 
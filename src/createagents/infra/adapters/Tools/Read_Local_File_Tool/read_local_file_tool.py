@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Hashable
 
 from .....domain import BaseTool, FileReadException
 from ....config import LoggingConfig
@@ -59,6 +60,10 @@ class ReadLocalFileTool(BaseTool):
         },
         'required': ['path', 'max_tokens'],
     }
+    # Repeated reads of an unchanged file within a few seconds reuse the
+    # result (see cache_version).
+    cacheable = True
+    cache_ttl_s = 10.0
 
     MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_BYTES
 
@@ -80,6 +85,25 @@ class ReadLocalFileTool(BaseTool):
         self.__logger = LoggingConfig.get_logger(__name__)
         self.__encoding = initialize_tiktoken()
 
+    def cache_scope(self) -> None:
+        """Share results across instances; the tool has no configuration."""
+        return None
+
+    def cache_version(self, arguments: Dict[str, Any]) -> Hashable:
+        """Tie a cached read to the file's modification time and size."""
+        try:
+            stat = os.stat(Path(arguments.get('path', '')).resolve())
+        except (OSError, TypeError, ValueError):
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def is_cacheable_result(self, result: Any) -> bool:
+        """Do not cache error messages, e.g. for a file not created yet."""
+        return not (
+            isinstance(result, str)
+            and result.startswith('[ReadLocalFileTool Error]')
+        )
+
     def execute(
         self,
         path: str,
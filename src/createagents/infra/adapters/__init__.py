@@ -1,7 +1,9 @@
 from typing import TYPE_CHECKING
 
+from .Common import SemanticCacheChatAdapter
 from .Ollama import (
     OllamaChatAdapter,
+    OllamaEmbedder,
     OllamaToolCallParser,
     OllamaToolSchemaFormatter,
 )
@@ -18,12 +20,15 @@ if TYPE_CHECKING:
 __all__ = [
     # ollama
     'OllamaChatAdapter',
+    'OllamaEmbedder',
     'OllamaToolCallParser',
     'OllamaToolSchemaFormatter',
     # openai
     'OpenAIChatAdapter',
     'ToolCallParser',
     'ToolSchemaFormatter',
+    # common
+    'SemanticCacheChatAdapter',
     # tools
     'ReadLocalFileTool',
     'CurrentDateTool',
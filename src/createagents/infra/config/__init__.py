@@ -1,14 +1,27 @@
 from .available_tools import AvailableTools
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .conversation_scope import ConversationScope
 from .environment import EnvironmentConfig
+from .hedging import RequestHedger
 from .logging_config import (
     JSONFormatter,
     LoggingConfig,
     SensitiveDataFormatter,
 )
-from .metrics import ChatMetrics, MetricsCollector
-from .retry import retry_with_backoff
+from .metrics import ChatMetrics, MetricsCollector, MetricsScope
+from .rate_limiter import RateLimiter
+from .response_cache import (
+    MemoryResponseCache,
+    ResponseCache,
+    ResponseCacheBackend,
+    SQLiteResponseCache,
+)
+from .retry import is_retryable_error, retry_with_backoff
+from .semantic_cache import SemanticCache, TextEmbedder
 from .sensitive_data_filter import SensitiveDataFilter
+from .session_store import JSONLSessionStore, SQLiteSessionStore
 from .standard_logger import create_logger
+from .token_counters import TiktokenCounter
 
 __all__ = [
     'EnvironmentConfig',
@@ -17,7 +30,23 @@ __all__ = [
     'SensitiveDataFormatter',
     'ChatMetrics',
     'MetricsCollector',
+    'MetricsScope',
+    'ConversationScope',
+    'RateLimiter',
+    'RequestHedger',
+    'ResponseCache',
+    'ResponseCacheBackend',
+    'MemoryResponseCache',
+    'SQLiteResponseCache',
+    'JSONLSessionStore',
+    'SQLiteSessionStore',
+    'SemanticCache',
+    'TextEmbedder',
+    'TiktokenCounter',
+    'CircuitBreaker',
+    'CircuitState',
     'retry_with_backoff',
+    'is_retryable_error',
     'SensitiveDataFilter',
     'AvailableTools',
     'create_logger',
@@ -0,0 +1,269 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Optional, Tuple
+
+from ...domain import CircuitOpenException
+from .environment import EnvironmentConfig
+from .logging_config import LoggingConfig
+from .metrics import ChatMetrics
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __str__(self) -> str:
+        """Return the string value of the state."""
+        return self.value
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker driven by the rolling outcome of chat requests.
+
+    Every recorded ChatMetrics counts as a failure when it was not
+    successful or, if `slow_call_ms` is set, when its latency exceeds that
+    threshold. States:
+
+    - `closed`: requests flow; once at least `min_requests` outcomes fall
+      inside the last `window_s` seconds and the failure rate reaches
+      `failure_rate`, the circuit opens.
+    - `open`: requests are rejected immediately for `open_s` seconds.
+    - `half_open`: a single probe request is let through; its outcome
+      closes the circuit or opens it again.
+    """
+
+    DEFAULT_WINDOW_S = 60.0
+    DEFAULT_MIN_REQUESTS = 5
+    DEFAULT_FAILURE_RATE = 0.5
+    DEFAULT_OPEN_S = 30.0
+
+    def __init__(
+        self,
+        name: str = 'default',
+        window_s: float = DEFAULT_WINDOW_S,
+        min_requests: int = DEFAULT_MIN_REQUESTS,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        open_s: float = DEFAULT_OPEN_S,
+        slow_call_ms: Optional[float] = None,
+    ):
+        """
+        Creates a closed circuit breaker.
+
+        Args:
+            name: Name used in logs (e.g. 'openai:gpt-4').
+            window_s: Length of the rolling window in seconds.
+            min_requests: Outcomes needed in the window before tripping.
+            failure_rate: Failure rate (0-1] that opens the circuit.
+            open_s: Seconds to stay open before probing for recovery.
+            slow_call_ms: Latency above which a request counts as failed.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if window_s <= 0 or open_s <= 0:
+            raise ValueError('window_s and open_s must be greater than zero.')
+        if min_requests < 1:
+            raise ValueError('min_requests must be at least 1.')
+        if not 0 < failure_rate <= 1:
+            raise ValueError('failure_rate must be in the range (0, 1].')
+        if slow_call_ms is not None and slow_call_ms <= 0:
+            raise ValueError('slow_call_ms must be greater than zero.')
+
+        self.name = name
+        self.window_s = window_s
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.open_s = open_s
+        self.slow_call_ms = slow_call_ms
+
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__lock = threading.Lock()
+        self.__state = CircuitState.CLOSED
+        self.__outcomes: Deque[Tuple[float, bool]] = deque()
+        self.__opened_at = 0.0
+        self.__probe_in_flight = False
+        self.__times_opened = 0
+        self.__rejected = 0
+
+    @classmethod
+    def from_env(cls, name: str) -> Optional['CircuitBreaker']:
+        """
+        Creates a breaker configured from the environment.
+
+        Returns None unless `CIRCUIT_BREAKER_ENABLED` is true. The other
+        settings are `CIRCUIT_BREAKER_WINDOW_S`,
+        `CIRCUIT_BREAKER_MIN_REQUESTS`, `CIRCUIT_BREAKER_FAILURE_RATE`,
+        `CIRCUIT_BREAKER_OPEN_S` and `CIRCUIT_BREAKER_SLOW_CALL_MS`.
+
+        Args:
+            name: Name used in logs.
+
+        Returns:
+            The circuit breaker, or None if disabled.
+        """
+        enabled = (
+            EnvironmentConfig.get_env('CIRCUIT_BREAKER_ENABLED', 'false')
+            or 'false'
+        )
+        if enabled.lower() != 'true':
+            return None
+
+        slow_call_ms = EnvironmentConfig.get_env(
+            'CIRCUIT_BREAKER_SLOW_CALL_MS'
+        )
+        return cls(
+            name=name,
+            window_s=float(
+                EnvironmentConfig.get_env('CIRCUIT_BREAKER_WINDOW_S')
+                or cls.DEFAULT_WINDOW_S
+            ),
+            min_requests=int(
+                EnvironmentConfig.get_env('CIRCUIT_BREAKER_MIN_REQUESTS')
+                or cls.DEFAULT_MIN_REQUESTS
+            ),
+            failure_rate=float(
+                EnvironmentConfig.get_env('CIRCUIT_BREAKER_FAILURE_RATE')
+                or cls.DEFAULT_FAILURE_RATE
+            ),
+            open_s=float(
+                EnvironmentConfig.get_env('CIRCUIT_BREAKER_OPEN_S')
+                or cls.DEFAULT_OPEN_S
+            ),
+            slow_call_ms=float(slow_call_ms) if slow_call_ms else None,
+        )
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state; an expired open circuit reads half-open."""
+        with self.__lock:
+            if self.__state == CircuitState.OPEN and self.__retry_after() <= 0:
+                return CircuitState.HALF_OPEN
+            return self.__state
+
+    def acquire(self) -> bool:
+        """
+        Lets a request through or rejects it.
+
+        In the half-open state the first caller becomes the probe; it must
+        report the request with `record(..., probe=True)` or `release`.
+
+        Returns:
+            True if the request is the recovery probe.
+
+        Raises:
+            CircuitOpenException: If the circuit rejects the request.
+        """
+        with self.__lock:
+            if self.__state == CircuitState.CLOSED:
+                return False
+
+            if self.__state == CircuitState.OPEN:
+                retry_after = self.__retry_after()
+                if retry_after > 0:
+                    self.__rejected += 1
+                    raise CircuitOpenException(self.name, retry_after)
+                self.__state = CircuitState.HALF_OPEN
+                self.__probe_in_flight = False
+                self.__logger.info(
+                    "Circuit '%s' half-open, probing for recovery", self.name
+                )
+
+            if self.__probe_in_flight:
+                self.__rejected += 1
+                raise CircuitOpenException(self.name, 0.0)
+            self.__probe_in_flight = True
+            return True
+
+    def record(self, metrics: ChatMetrics, probe: bool = False) -> None:
+        """
+        Records the outcome of a request.
+
+        Args:
+            metrics: The metrics of the finished request.
+            probe: Whether the request was the half-open probe; outcomes of
+                other requests do not decide recovery.
+        """
+        failed = not metrics.success or (
+            self.slow_call_ms is not None
+            and metrics.latency_ms is not None
+            and metrics.latency_ms > self.slow_call_ms
+        )
+
+        with self.__lock:
+            if self.__state == CircuitState.HALF_OPEN:
+                if not probe:
+                    return
+                self.__probe_in_flight = False
+                if failed:
+                    self.__open('probe request failed')
+                else:
+                    self.__state = CircuitState.CLOSED
+                    self.__outcomes.clear()
+                    self.__logger.info(
+                        "Circuit '%s' closed, provider recovered", self.name
+                    )
+                return
+
+            if self.__state == CircuitState.OPEN:
+                return
+
+            now = time.monotonic()
+            self.__outcomes.append((now, failed))
+            self.__trim(now)
+
+            total = len(self.__outcomes)
+            if total < self.min_requests:
+                return
+            failures = sum(1 for _, outcome in self.__outcomes if outcome)
+            if failures / total >= self.failure_rate:
+                self.__open(
+                    f'{failures}/{total} failed requests in the last '
+                    f'{self.window_s:g}s'
+                )
+
+    def release(self) -> None:
+        """Gives up a probe slot whose request ended without an outcome."""
+        with self.__lock:
+            self.__probe_in_flight = False
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Returns the breaker's state and counters.
+
+        Returns:
+            Dictionary with state, window counts, times opened and the
+            number of rejected requests.
+        """
+        state = self.state
+        with self.__lock:
+            self.__trim(time.monotonic())
+            failures = sum(1 for _, outcome in self.__outcomes if outcome)
+            return {
+                'state': state.value,
+                'window_requests': len(self.__outcomes),
+                'window_failures': failures,
+                'times_opened': self.__times_opened,
+                'rejected': self.__rejected,
+            }
+
+    def __open(self, reason: str) -> None:
+        self.__state = CircuitState.OPEN
+        self.__opened_at = time.monotonic()
+        self.__outcomes.clear()
+        self.__times_opened += 1
+        self.__logger.warning(
+            "Circuit '%s' opened for %.1fs: %s", self.name, self.open_s, reason
+        )
+
+    def __retry_after(self) -> float:
+        return self.__opened_at + self.open_s - time.monotonic()
+
+    def __trim(self, now: float) -> None:
+        while self.__outcomes and now - self.__outcomes[0][0] > self.window_s:
+            self.__outcomes.popleft()
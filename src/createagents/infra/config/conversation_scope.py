@@ -0,0 +1,53 @@
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Optional, Type
+
+
+class ConversationScope:
+    """
+    Names the conversation the current task's chat requests belong to.
+
+    Adapters that keep conversation state on the provider's side (e.g.
+    the OpenAI response chain) only continue state created in the same
+    conversation, so two sessions with the same visible history never
+    continue each other's hidden tool calls and outputs. The name is held
+    in a context variable, so it follows the task that opened the scope
+    (and the tasks it starts); adapters read it when `chat` is called.
+
+    Example:
+        >>> with ConversationScope('agent-1:user-1'):
+        ...     await chat_repository.chat(...)
+    """
+
+    def __init__(self, conversation_id: str) -> None:
+        """Initializes the scope.
+
+        Args:
+            conversation_id: Identifies the conversation.
+        """
+        self.__conversation_id = conversation_id
+        self.__token: Optional[Token[Optional[str]]] = None
+
+    def __enter__(self) -> 'ConversationScope':
+        self.__token = _active_conversation.set(self.__conversation_id)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self.__token is not None:
+            _active_conversation.reset(self.__token)
+            self.__token = None
+
+    @staticmethod
+    def current() -> Optional[str]:
+        """Returns the active conversation's id, if any."""
+        return _active_conversation.get()
+
+
+_active_conversation: ContextVar[Optional[str]] = ContextVar(
+    'createagents_conversation', default=None
+)
@@ -0,0 +1,312 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .environment import EnvironmentConfig
+from .logging_config import LoggingConfig
+
+T = TypeVar('T')
+
+_EMPTY = object()
+"""Marks a stream that ended before producing its first item."""
+
+
+class RequestHedger:
+    """Sends a duplicate request when the first one is unusually slow.
+
+    If an attempt has not answered (a full response, or the first item of
+    a stream) within the configured percentile of recent latencies, a
+    second identical attempt is fired. The first successful answer wins
+    and the other attempt is cancelled. Hedges are limited by a budget
+    expressed as a fraction of all requests.
+
+    Instances are shared process-wide per provider and model (see
+    `for_model`).
+    """
+
+    DEFAULT_PERCENTILE = 95.0
+    DEFAULT_BUDGET = 0.05
+    DEFAULT_MIN_SAMPLES = 20
+    DEFAULT_MAX_SAMPLES = 200
+
+    _registry: Dict[Tuple[str, str], Optional['RequestHedger']] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        budget: float = DEFAULT_BUDGET,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+    ):
+        """Creates a hedger.
+
+        Args:
+            percentile: Latency percentile (0-100) used as hedge delay.
+            budget: Maximum fraction of requests that may be hedged.
+            min_samples: Latencies needed before hedging starts.
+            max_samples: Number of recent latencies kept.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be in the range (0, 100).')
+        if not 0 < budget <= 1:
+            raise ValueError('budget must be in the range (0, 1].')
+        if min_samples < 1 or max_samples < min_samples:
+            raise ValueError(
+                'min_samples must be at least 1 and at most max_samples.'
+            )
+
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__lock = threading.Lock()
+        self.__latencies: Deque[float] = deque(maxlen=max_samples)
+        self.__requests = 0
+        self.__hedges_fired = 0
+        self.__hedges_won = 0
+
+    @classmethod
+    def for_model(cls, provider: str, model: str) -> Optional['RequestHedger']:
+        """Returns the shared hedger for a provider and model.
+
+        Hedging is enabled by `<PROVIDER>_HEDGING=true` (e.g.
+        `OPENAI_HEDGING`) and tuned by `<PROVIDER>_HEDGE_PERCENTILE`,
+        `<PROVIDER>_HEDGE_BUDGET` and `<PROVIDER>_HEDGE_MIN_SAMPLES`.
+
+        Args:
+            provider: The provider name ('openai' or 'ollama').
+            model: The model name.
+
+        Returns:
+            The hedger, or None if hedging is disabled.
+        """
+        key = (provider.lower(), model)
+        with cls._registry_lock:
+            if key not in cls._registry:
+                prefix = provider.upper()
+                enabled = (
+                    EnvironmentConfig.get_env(f'{prefix}_HEDGING', 'false')
+                    or 'false'
+                )
+                cls._registry[key] = (
+                    cls(
+                        percentile=float(
+                            EnvironmentConfig.get_env(
+                                f'{prefix}_HEDGE_PERCENTILE'
+                            )
+                            or cls.DEFAULT_PERCENTILE
+                        ),
+                        budget=float(
+                            EnvironmentConfig.get_env(f'{prefix}_HEDGE_BUDGET')
+                            or cls.DEFAULT_BUDGET
+                        ),
+                        min_samples=int(
+                            EnvironmentConfig.get_env(
+                                f'{prefix}_HEDGE_MIN_SAMPLES'
+                            )
+                            or cls.DEFAULT_MIN_SAMPLES
+                        ),
+                    )
+                    if enabled.lower() == 'true'
+                    else None
+                )
+            return cls._registry[key]
+
+    @classmethod
+    def reset_registry(cls) -> None:
+        """Forgets all shared hedgers so settings are read again."""
+        with cls._registry_lock:
+            cls._registry.clear()
+
+    def get_threshold(self) -> Optional[float]:
+        """Returns the hedge delay in seconds, or None while warming up."""
+        with self.__lock:
+            if len(self.__latencies) < self.min_samples:
+                return None
+            ordered = sorted(self.__latencies)
+        index = min(
+            int(len(ordered) * self.percentile / 100), len(ordered) - 1
+        )
+        return ordered[index]
+
+    def record_latency(self, seconds: float) -> None:
+        """Adds the latency of a successful attempt to the window."""
+        with self.__lock:
+            self.__latencies.append(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns request and hedge counters and the current delay.
+
+        Returns:
+            Dictionary with requests, hedges_fired, hedges_won and
+            threshold_ms (None while warming up).
+        """
+        threshold = self.get_threshold()
+        with self.__lock:
+            return {
+                'requests': self.__requests,
+                'hedges_fired': self.__hedges_fired,
+                'hedges_won': self.__hedges_won,
+                'threshold_ms': (
+                    round(threshold * 1000, 2)
+                    if threshold is not None
+                    else None
+                ),
+            }
+
+    async def run(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        discard: Optional[Callable[[T], Awaitable[None]]] = None,
+    ) -> T:
+        """Runs `attempt`, hedging it with a duplicate when it is slow.
+
+        Args:
+            attempt: Starts one attempt of the request.
+            discard: Releases the result of an attempt that lost the race
+                after completing (e.g. closes an open stream).
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            Exception: The error of the primary attempt if every attempt
+                failed.
+        """
+        with self.__lock:
+            self.__requests += 1
+        threshold = self.get_threshold()
+
+        started: Dict['asyncio.Future[T]', float] = {}
+        primary = self.__start(attempt, started)
+        tasks = [primary]
+        winner: Optional['asyncio.Future[T]'] = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=threshold)
+            if not done and self.__take_budget():
+                self.__logger.debug(
+                    'No answer after %.0fms, sending a hedged request',
+                    (threshold or 0) * 1000,
+                )
+                tasks.append(self.__start(attempt, started))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next(
+                    (
+                        task
+                        for task in tasks
+                        if task in done and _succeeded(task)
+                    ),
+                    None,
+                )
+                if winner is not None:
+                    break
+
+            if winner is None:
+                return primary.result()
+
+            self.record_latency(time.monotonic() - started[winner])
+            if winner is not primary:
+                with self.__lock:
+                    self.__hedges_won += 1
+                self.__logger.debug('Hedged request answered first')
+            return winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif (
+                    _succeeded(task)
+                    and task is not winner
+                    and discard is not None
+                ):
+                    await discard(task.result())
+
+    async def run_stream(
+        self, attempt: Callable[[], Awaitable[AsyncIterator[Any]]]
+    ) -> AsyncIterator[Any]:
+        """Hedges a streaming request on the arrival of its first item.
+
+        Args:
+            attempt: Opens one stream for the request.
+
+        Returns:
+            The winning stream, starting with its first item; the losing
+            stream is closed.
+        """
+
+        async def first_item() -> Tuple[AsyncIterator[Any], Any]:
+            stream = await attempt()
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, _EMPTY
+            except BaseException:
+                await _close_stream(stream)
+                raise
+
+        async def discard(result: Tuple[AsyncIterator[Any], Any]) -> None:
+            await _close_stream(result[0])
+
+        stream, first = await self.run(first_item, discard)
+        return _chain(first, stream)
+
+    def __start(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        started: Dict['asyncio.Future[T]', float],
+    ) -> 'asyncio.Future[T]':
+        task = asyncio.ensure_future(attempt())
+        started[task] = time.monotonic()
+        return task
+
+    def __take_budget(self) -> bool:
+        with self.__lock:
+            if self.__hedges_fired + 1 > self.budget * self.__requests:
+                return False
+            self.__hedges_fired += 1
+            return True
+
+
+def _succeeded(task: 'asyncio.Future[Any]') -> bool:
+    return task.done() and not task.cancelled() and task.exception() is None
+
+
+async def _chain(first: Any, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    try:
+        if first is not _EMPTY:
+            yield first
+        async for item in stream:
+            yield item
+    finally:
+        await _close_stream(stream)
+
+
+async def _close_stream(stream: Any) -> None:
+    close = getattr(stream, 'aclose', None) or getattr(stream, 'close', None)
+    if close is None:
+        return
+    result = close()
+    if asyncio.iscoroutine(result):
+        await result
@@ -1,8 +1,10 @@
 import json
 import threading
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from types import TracebackType
+from typing import List, Optional, Type
 
 
 @dataclass
@@ -19,6 +21,18 @@ class ChatMetrics:
         timestamp: The timestamp of the request.
         success: A boolean indicating whether the request was successful.
         error_message: An error message, if any.
+        model_loads: How many times the model has been loaded into memory
+            on its host so far, if tracked (Ollama only).
+        model_unloads: How many times the model has been unloaded from
+            memory on its host so far, if tracked (Ollama only).
+        tool_cache_hits: Tool calls answered from the tool result cache
+            during the request, if tools were used.
+        tool_cache_misses: Calls to cacheable tools that had to be executed
+            during the request, if tools were used.
+        timed_out: Whether the request ran past its deadline; its token
+            counts then cover only the work finished before that.
+        cancelled: Whether the caller cancelled the request (e.g. stopped
+            reading the stream); token counts are partial as well.
     """
 
     model: str
@@ -32,6 +46,12 @@ class ChatMetrics:
     timestamp: datetime = field(default_factory=datetime.now)
     success: bool = True
     error_message: Optional[str] = None
+    model_loads: Optional[int] = None
+    model_unloads: Optional[int] = None
+    tool_cache_hits: Optional[int] = None
+    tool_cache_misses: Optional[int] = None
+    timed_out: bool = False
+    cancelled: bool = False
 
     def __post_init__(self) -> None:
         """Rounds float metrics to 2 decimal places."""
@@ -60,6 +80,12 @@ class ChatMetrics:
             'timestamp': self.timestamp.isoformat(),
             'success': self.success,
             'error_message': self.error_message,
+            'model_loads': self.model_loads,
+            'model_unloads': self.model_unloads,
+            'tool_cache_hits': self.tool_cache_hits,
+            'tool_cache_misses': self.tool_cache_misses,
+            'timed_out': self.timed_out,
+            'cancelled': self.cancelled,
         }
 
     def __str__(self) -> str:
@@ -74,10 +100,90 @@ class ChatMetrics:
             detailed_timing += f', p_eval={self.prompt_eval_duration_ms:.2f}ms'
         if self.eval_duration_ms:
             detailed_timing += f', eval={self.eval_duration_ms:.2f}ms'
+        if self.model_loads is not None:
+            detailed_timing += (
+                f', loads={self.model_loads}, unloads={self.model_unloads}'
+            )
+        if self.tool_cache_hits is not None:
+            detailed_timing += (
+                f', tool_cache={self.tool_cache_hits}/'
+                f'{self.tool_cache_hits + (self.tool_cache_misses or 0)}'
+            )
+        if self.timed_out:
+            detailed_timing += ', timed out'
+        if self.cancelled:
+            detailed_timing += ', cancelled'
         status = '✓' if self.success else '✗'
         return f'[{status}] {self.model}: {self.latency_ms:.2f}ms{tokens_info}{detailed_timing}'
 
 
+class MetricsScope:
+    """
+    Collects the metrics recorded by the current task while it is open.
+
+    Handlers report the metrics of each request they record with
+    `report`. Metrics are attributed through a context variable, so they
+    follow the task that opened the scope (and the tasks it starts) even
+    when many tasks record into the same adapter concurrently. Nested
+    scopes also report to the scopes around them.
+
+    Example:
+        >>> with MetricsScope() as scope:
+        ...     await chat_use_case.execute(agent, input_dto)
+        >>> scope.tokens_used
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty scope."""
+        self.__metrics: List[ChatMetrics] = []
+        self.__parent: Optional['MetricsScope'] = None
+        self.__token: Optional[Token[Optional['MetricsScope']]] = None
+
+    def __enter__(self) -> 'MetricsScope':
+        self.__parent = _active_scope.get()
+        self.__token = _active_scope.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self.__token is not None:
+            _active_scope.reset(self.__token)
+            self.__token = None
+
+    @staticmethod
+    def report(metrics: ChatMetrics) -> None:
+        """Adds a request's metrics to the active scope, if any."""
+        scope = _active_scope.get()
+        if scope is not None:
+            scope.add(metrics)
+
+    def add(self, metrics: ChatMetrics) -> None:
+        """Adds metrics to this scope and the scopes around it."""
+        self.__metrics.append(metrics)
+        if self.__parent is not None:
+            self.__parent.add(metrics)
+
+    @property
+    def metrics(self) -> List[ChatMetrics]:
+        """Return a copy of the metrics recorded in this scope."""
+        return self.__metrics.copy()
+
+    @property
+    def tokens_used(self) -> Optional[int]:
+        """Return the tokens of the metrics in this scope, if any reported."""
+        tokens = [m.tokens_used for m in self.__metrics if m.tokens_used]
+        return sum(tokens) if tokens else None
+
+
+_active_scope: ContextVar[Optional[MetricsScope]] = ContextVar(
+    'createagents_metrics_scope', default=None
+)
+
+
 class MetricsCollector:
     """
     A thread-safe collector for aggregated metrics analysis.
@@ -126,6 +232,8 @@ class MetricsCollector:
             total_requests = len(self._metrics)
             successful = sum(1 for m in self._metrics if m.success)
             failed = total_requests - successful
+            timed_out = sum(1 for m in self._metrics if m.timed_out)
+            cancelled = sum(1 for m in self._metrics if m.cancelled)
 
             latencies = [m.latency_ms for m in self._metrics]
             avg_latency = sum(latencies) / len(latencies)
@@ -138,15 +246,26 @@ class MetricsCollector:
                 if m.tokens_used is not None
             )
 
+            tool_cache_hits = sum(
+                m.tool_cache_hits or 0 for m in self._metrics
+            )
+            tool_cache_misses = sum(
+                m.tool_cache_misses or 0 for m in self._metrics
+            )
+
             return {
                 'total_requests': total_requests,
                 'successful': successful,
                 'failed': failed,
+                'timed_out': timed_out,
+                'cancelled': cancelled,
                 'success_rate': (successful / total_requests) * 100,
                 'avg_latency_ms': avg_latency,
                 'min_latency_ms': min_latency,
                 'max_latency_ms': max_latency,
                 'total_tokens': total_tokens,
+                'tool_cache_hits': tool_cache_hits,
+                'tool_cache_misses': tool_cache_misses,
             }
 
     def clear(self) -> None:
@@ -186,8 +305,13 @@ class MetricsCollector:
         - `chat_requests_total`: Total number of requests.
         - `chat_requests_success_total`: Total number of successful requests.
         - `chat_requests_failed_total`: Total number of failed requests.
+        - `chat_requests_timed_out_total`: Requests that ran past their
+          deadline.
+        - `chat_requests_cancelled_total`: Requests cancelled by the caller.
         - `chat_latency_ms`: A histogram of latencies.
         - `chat_tokens_total`: The total number of tokens used.
+        - `chat_tool_cache_hits_total` / `chat_tool_cache_misses_total`:
+          Tool result cache hits and misses.
 
         Returns:
             A string with the metrics in Prometheus format.
@@ -220,6 +344,22 @@ class MetricsCollector:
         lines.append(f'chat_requests_failed_total {summary["failed"]}')
         lines.append('')
 
+        lines.append(
+            '# HELP chat_requests_timed_out_total Chat requests that ran past '
+            'their deadline'
+        )
+        lines.append('# TYPE chat_requests_timed_out_total counter')
+        lines.append(f'chat_requests_timed_out_total {summary["timed_out"]}')
+        lines.append('')
+
+        lines.append(
+            '# HELP chat_requests_cancelled_total Chat requests cancelled by '
+            'the caller'
+        )
+        lines.append('# TYPE chat_requests_cancelled_total counter')
+        lines.append(f'chat_requests_cancelled_total {summary["cancelled"]}')
+        lines.append('')
+
         lines.append(
             '# HELP chat_latency_ms_avg Average latency in milliseconds'
         )
@@ -246,6 +386,24 @@ class MetricsCollector:
         lines.append(f'chat_tokens_total {summary["total_tokens"]}')
         lines.append('')
 
+        lines.append(
+            '# HELP chat_tool_cache_hits_total Tool calls served from cache'
+        )
+        lines.append('# TYPE chat_tool_cache_hits_total counter')
+        lines.append(
+            f'chat_tool_cache_hits_total {summary["tool_cache_hits"]}'
+        )
+        lines.append('')
+
+        lines.append(
+            '# HELP chat_tool_cache_misses_total Cacheable tool calls executed'
+        )
+        lines.append('# TYPE chat_tool_cache_misses_total counter')
+        lines.append(
+            f'chat_tool_cache_misses_total {summary["tool_cache_misses"]}'
+        )
+        lines.append('')
+
         lines.append('# HELP chat_requests_by_model Total requests by model')
         lines.append('# TYPE chat_requests_by_model counter')
 
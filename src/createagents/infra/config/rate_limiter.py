@@ -0,0 +1,277 @@
+import asyncio
+import json
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .environment import EnvironmentConfig
+from .logging_config import LoggingConfig
+
+CHARS_PER_TOKEN = 4
+"""Rough number of characters per token used to estimate request cost."""
+
+
+class TokenBucket:
+    """A token bucket refilled continuously up to its per-minute capacity.
+
+    The level may go negative when a request turns out to cost more than
+    estimated; later requests then wait until the debt is paid back.
+    """
+
+    def __init__(self, per_minute: float):
+        """Creates a full bucket.
+
+        Args:
+            per_minute: Capacity, refilled evenly over one minute.
+        """
+        self.capacity = float(per_minute)
+        self.__rate = self.capacity / 60.0
+        self.__level = self.capacity
+        self.__updated_at = time.monotonic()
+
+    @property
+    def level(self) -> float:
+        """Return the current level after refilling."""
+        self.__refill()
+        return self.__level
+
+    def wait_time(self, amount: float) -> float:
+        """Returns how long to wait until `amount` can be taken.
+
+        Amounts above the capacity are clamped so that they are admitted
+        once the bucket is full instead of waiting forever.
+        """
+        self.__refill()
+        missing = min(amount, self.capacity) - self.__level
+        return max(missing, 0.0) / self.__rate
+
+    def take(self, amount: float) -> None:
+        """Removes `amount` from the bucket (may go negative)."""
+        self.__refill()
+        self.__level -= amount
+
+    def give_back(self, amount: float) -> None:
+        """Returns `amount` to the bucket, up to its capacity."""
+        self.__refill()
+        self.__level = min(self.__level + amount, self.capacity)
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.__updated_at
+        self.__updated_at = now
+        self.__level = min(self.capacity, self.__level + elapsed * self.__rate)
+
+
+class RateLimiter:
+    """Client-side limiter for requests and tokens per minute.
+
+    Every API call first acquires one request and its estimated token cost;
+    once the real usage is known the difference is reconciled, so the
+    limiter tracks what the provider actually bills. A rate-limit error
+    reported by the provider pauses all callers for the requested delay.
+
+    Instances are shared process-wide per provider and model (see
+    `for_model`), and are safe to use from several event loops.
+    """
+
+    _registry: Dict[Tuple[str, str], Optional['RateLimiter']] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        """Creates a limiter; a None limit is not enforced.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        for limit in (requests_per_minute, tokens_per_minute):
+            if limit is not None and limit <= 0:
+                raise ValueError('Rate limits must be greater than zero.')
+
+        self.__requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.__tokens = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self.__paused_until = 0.0
+        self.__lock = threading.Lock()
+        self.__logger = LoggingConfig.get_logger(__name__)
+
+    @classmethod
+    def for_model(cls, provider: str, model: str) -> Optional['RateLimiter']:
+        """Returns the shared limiter for a provider and model.
+
+        Limits come from `<PROVIDER>_RPM_LIMIT` and `<PROVIDER>_TPM_LIMIT`
+        (e.g. `OPENAI_TPM_LIMIT`); when neither is set, no limiter is used.
+
+        Args:
+            provider: The provider name ('openai' or 'ollama').
+            model: The model name.
+
+        Returns:
+            The limiter, or None if no limit is configured.
+        """
+        key = (provider.lower(), model)
+        with cls._registry_lock:
+            if key not in cls._registry:
+                prefix = provider.upper()
+                rpm = EnvironmentConfig.get_env(f'{prefix}_RPM_LIMIT')
+                tpm = EnvironmentConfig.get_env(f'{prefix}_TPM_LIMIT')
+                cls._registry[key] = (
+                    cls(
+                        float(rpm) if rpm else None,
+                        float(tpm) if tpm else None,
+                    )
+                    if rpm or tpm
+                    else None
+                )
+            return cls._registry[key]
+
+    @classmethod
+    def reset_registry(cls) -> None:
+        """Forgets all shared limiters so limits are read again."""
+        with cls._registry_lock:
+            cls._registry.clear()
+
+    def get_available(self) -> Dict[str, Optional[float]]:
+        """Return the requests and tokens available now (None = no limit)."""
+        with self.__lock:
+            return {
+                'requests': (
+                    self.__requests.level if self.__requests else None
+                ),
+                'tokens': self.__tokens.level if self.__tokens else None,
+            }
+
+    @staticmethod
+    def estimate_tokens(
+        instructions: Optional[str] = None,
+        messages: Optional[Sequence[Any]] = None,
+        tools: Optional[Sequence[Any]] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> int:
+        """Estimates the token cost of a request before sending it.
+
+        The prompt is approximated from the serialized instructions,
+        history and tool schemas (about four characters per token); the
+        requested output budget is added when known.
+
+        Returns:
+            The estimated number of tokens (at least 1).
+        """
+        text_size = len(instructions or '')
+        for part in (messages, tools):
+            if part:
+                text_size += len(json.dumps(part, default=str))
+        prompt_tokens = text_size // CHARS_PER_TOKEN
+        return max(prompt_tokens + (max_output_tokens or 0), 1)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Waits until one request with the estimated cost may be sent.
+
+        Args:
+            estimated_tokens: The estimated token cost of the request.
+        """
+        waited = 0.0
+        while True:
+            with self.__lock:
+                delay = self.__paused_until - time.monotonic()
+                if self.__requests is not None:
+                    delay = max(delay, self.__requests.wait_time(1))
+                if self.__tokens is not None:
+                    delay = max(
+                        delay, self.__tokens.wait_time(estimated_tokens)
+                    )
+                if delay <= 0:
+                    if self.__requests is not None:
+                        self.__requests.take(1)
+                    if self.__tokens is not None:
+                        self.__tokens.take(estimated_tokens)
+                    break
+            waited += delay
+            await asyncio.sleep(delay)
+
+        if waited:
+            self.__logger.debug(
+                'Rate limiter delayed request by %.2fs (estimate: %s tokens)',
+                waited,
+                estimated_tokens,
+            )
+
+    def reconcile(
+        self, estimated_tokens: int, actual_tokens: Optional[int]
+    ) -> None:
+        """Corrects the token bucket once the real usage is known.
+
+        Args:
+            estimated_tokens: The estimate passed to `acquire`.
+            actual_tokens: The tokens actually used, or None if unknown
+                (the estimate is kept).
+        """
+        if self.__tokens is None or actual_tokens is None:
+            return
+
+        difference = estimated_tokens - actual_tokens
+        with self.__lock:
+            if difference > 0:
+                self.__tokens.give_back(difference)
+            elif difference < 0:
+                self.__tokens.take(-difference)
+
+    def pause(self, seconds: float) -> None:
+        """Holds every caller back for `seconds` (e.g. after a 429)."""
+        with self.__lock:
+            self.__paused_until = max(
+                self.__paused_until, time.monotonic() + seconds
+            )
+        self.__logger.warning(
+            'Provider rate limit reached, pausing requests for %.2fs', seconds
+        )
+
+    async def track_stream(
+        self,
+        stream: AsyncIterator[Any],
+        estimated_tokens: int,
+        usage_of: Callable[[Any], Optional[int]],
+    ) -> AsyncIterator[Any]:
+        """Passes a stream through and reconciles with its reported usage.
+
+        When the consumer stops early (cancellation, a deadline, a lost
+        hedge), the provider stream is closed and the bucket reconciled
+        with whatever usage was reported so far.
+
+        Args:
+            stream: The provider stream.
+            estimated_tokens: The estimate passed to `acquire`.
+            usage_of: Returns the total tokens reported by an item, or None.
+
+        Yields:
+            The items of `stream`, unchanged.
+        """
+        # Imported here: the adapters package imports this one.
+        from ..adapters.Common.cancellation_utils import (  # pylint: disable=import-outside-toplevel
+            close_stream,
+        )
+
+        actual_tokens = None
+        try:
+            async for item in stream:
+                usage = usage_of(item)
+                if usage is not None:
+                    actual_tokens = usage
+                yield item
+        finally:
+            await close_stream(stream)
+            self.reconcile(estimated_tokens, actual_tokens)
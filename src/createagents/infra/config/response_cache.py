@@ -0,0 +1,427 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .environment import EnvironmentConfig
+from .logging_config import LoggingConfig
+
+
+class ResponseCacheBackend(ABC):
+    """Storage tier of the response cache.
+
+    Backends map request keys to response texts; each entry carries its
+    own expiry time. Implementations must be safe to call from several
+    threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, response: str, ttl_s: Optional[float]) -> None:
+        """Store a response; a None ttl_s never expires."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Return the cached response and its expiry time, if any.
+
+        The expiry is a `time.time()` timestamp, or None if the entry never
+        expires. Backends that do not track expiry times can rely on this
+        default, which reports None.
+        """
+        response = self.get(key)
+        return (response, None) if response is not None else None
+
+
+class MemoryResponseCache(ResponseCacheBackend):
+    """In-memory LRU tier bounded by number of entries."""
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Creates an empty tier.
+
+        Args:
+            max_entries: Entries kept before the least recently used one
+                is evicted.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError('max_entries must be greater than zero.')
+
+        self.__max_entries = max_entries
+        self.__entries: 'OrderedDict[str, Tuple[str, Optional[float]]]' = (
+            OrderedDict()
+        )
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Return the cached response and its expiry time, if any."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.time():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, response: str, ttl_s: Optional[float]) -> None:
+        """Store a response; a None ttl_s never expires."""
+        expires_at = time.time() + ttl_s if ttl_s is not None else None
+        with self.__lock:
+            self.__entries[key] = (response, expires_at)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self.__lock:
+            return len(self.__entries)
+
+
+class SQLiteResponseCache(ResponseCacheBackend):
+    """On-disk tier stored in a SQLite database.
+
+    Entries survive restarts. Expired entries are ignored on read and
+    purged on write; once the stored responses exceed `max_bytes`, the
+    least recently read ones are evicted.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Opens (or creates) the database.
+
+        Args:
+            path: Path of the database file.
+            max_bytes: Size budget for the stored responses.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be greater than zero.')
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute('PRAGMA journal_mode=WAL')
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, '
+                'response TEXT NOT NULL, '
+                'size INTEGER NOT NULL, '
+                'expires_at REAL, '
+                'accessed_at REAL NOT NULL)'
+            )
+            self.__connection.execute(
+                'CREATE INDEX IF NOT EXISTS responses_accessed_at '
+                'ON responses (accessed_at)'
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Return the cached response and its expiry time, if any."""
+        now = time.time()
+        with self.__lock, self.__connection:
+            row: Optional[Tuple[str, Optional[float]]] = (
+                self.__connection.execute(
+                    'SELECT response, expires_at FROM responses WHERE key = ?',
+                    (key,),
+                ).fetchone()
+            )
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self.__connection.execute(
+                    'DELETE FROM responses WHERE key = ?', (key,)
+                )
+                return None
+            self.__connection.execute(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?',
+                (now, key),
+            )
+            return row
+
+    def set(self, key: str, response: str, ttl_s: Optional[float]) -> None:
+        """Store a response; a None ttl_s never expires."""
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, response, size, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    key,
+                    response,
+                    size,
+                    now + ttl_s if ttl_s is not None else None,
+                    now,
+                ),
+            )
+            self.__connection.execute(
+                'DELETE FROM responses WHERE expires_at <= ?', (now,)
+            )
+            self.__evict()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self.__lock:
+            count: int = self.__connection.execute(
+                'SELECT COUNT(*) FROM responses'
+            ).fetchone()[0]
+            return count
+
+    def __evict(self) -> None:
+        total = self.__connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()[0]
+        while total > self.__max_bytes:
+            row = self.__connection.execute(
+                'SELECT key, size FROM responses ORDER BY accessed_at LIMIT 1'
+            ).fetchone()
+            if row is None:
+                return
+            self.__connection.execute(
+                'DELETE FROM responses WHERE key = ?', (row[0],)
+            )
+            total -= row[1]
+
+
+class ResponseCache:
+    """Two-tier cache of chat responses.
+
+    Reads go to the memory tier first and fall back to the optional disk
+    tier, promoting hits to memory for the rest of their lifetime; writes
+    go to both. Disk access runs in a worker thread so it never blocks the
+    event loop, and disk errors are logged and treated as misses.
+    """
+
+    MODES = ('off', 'deterministic', 'always')
+    DEFAULT_TTL_S = 24 * 60 * 60.0
+
+    _shared: Optional['ResponseCache'] = None
+    _shared_loaded = False
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        memory: Optional[ResponseCacheBackend] = None,
+        disk: Optional[ResponseCacheBackend] = None,
+        ttl_s: Optional[float] = DEFAULT_TTL_S,
+        mode: str = 'deterministic',
+    ):
+        """Creates the cache.
+
+        Args:
+            memory: The fast tier (default: a MemoryResponseCache).
+            disk: An optional persistent tier (e.g. SQLiteResponseCache).
+            ttl_s: Lifetime of stored responses; None never expires.
+            mode: 'deterministic' caches only requests with temperature 0;
+                'always' caches every request.
+
+        Raises:
+            ValueError: If the mode or ttl_s is invalid.
+        """
+        if mode not in self.MODES[1:]:
+            raise ValueError(
+                f"mode must be 'deterministic' or 'always', got '{mode}'."
+            )
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError('ttl_s must be greater than zero.')
+
+        self.memory = memory if memory is not None else MemoryResponseCache()
+        self.disk = disk
+        self.ttl_s = ttl_s
+        self.mode = mode
+        self.__logger = LoggingConfig.get_logger(__name__)
+        self.__lock = threading.Lock()
+        self.__memory_hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+
+    @classmethod
+    def get_shared(cls) -> Optional['ResponseCache']:
+        """Returns the process-wide cache configured from the environment.
+
+        `RESPONSE_CACHE_MODE` selects 'off' (default), 'deterministic' or
+        'always'. `RESPONSE_CACHE_TTL_S` and `RESPONSE_CACHE_MAX_ENTRIES`
+        tune the memory tier; `RESPONSE_CACHE_PATH` adds a SQLite tier
+        bounded by `RESPONSE_CACHE_MAX_BYTES`.
+
+        Returns:
+            The shared cache, or None if caching is off.
+        """
+        with cls._shared_lock:
+            if not cls._shared_loaded:
+                cls._shared = cls.__from_env()
+                cls._shared_loaded = True
+            return cls._shared
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Forgets the shared cache so the environment is read again."""
+        with cls._shared_lock:
+            cls._shared = None
+            cls._shared_loaded = False
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a request key, if any."""
+        response = self.memory.get(key)
+        if response is not None:
+            self.__count('memory')
+            return response
+
+        if self.disk is not None:
+            try:
+                entry = await asyncio.to_thread(self.disk.get_entry, key)
+            except sqlite3.Error as e:
+                self.__logger.warning('Could not read cached response: %s', e)
+                entry = None
+            if entry is not None:
+                response, expires_at = entry
+                ttl_s = (
+                    expires_at - time.time()
+                    if expires_at is not None
+                    else None
+                )
+                if ttl_s is None or ttl_s > 0:
+                    self.memory.set(key, response, ttl_s)
+                    self.__count('disk')
+                    return response
+
+        self.__count('miss')
+        return None
+
+    async def set(
+        self, key: str, response: str, max_ttl_s: Optional[float] = None
+    ) -> None:
+        """Store the response for a request key in every tier.
+
+        Args:
+            key: The request key.
+            response: The response text.
+            max_ttl_s: Upper bound for this entry's lifetime, below the
+                cache's own `ttl_s` (optional).
+        """
+        ttl_s = self.ttl_s
+        if max_ttl_s is not None:
+            ttl_s = max_ttl_s if ttl_s is None else min(ttl_s, max_ttl_s)
+        self.memory.set(key, response, ttl_s)
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, response, ttl_s)
+            except sqlite3.Error as e:
+                self.__logger.warning(
+                    'Could not persist cached response: %s', e
+                )
+
+    def clear(self) -> None:
+        """Remove every entry from every tier."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns hit and miss counters.
+
+        Returns:
+            Dictionary with memory_hits, disk_hits, misses and entries
+            (memory tier).
+        """
+        with self.__lock:
+            return {
+                'memory_hits': self.__memory_hits,
+                'disk_hits': self.__disk_hits,
+                'misses': self.__misses,
+                'entries': len(self.memory),
+            }
+
+    def __count(self, outcome: str) -> None:
+        with self.__lock:
+            if outcome == 'memory':
+                self.__memory_hits += 1
+            elif outcome == 'disk':
+                self.__disk_hits += 1
+            else:
+                self.__misses += 1
+
+    @classmethod
+    def __from_env(cls) -> Optional['ResponseCache']:
+        mode = (
+            EnvironmentConfig.get_env('RESPONSE_CACHE_MODE', 'off') or 'off'
+        ).lower()
+        if mode == 'off':
+            return None
+
+        ttl_s = float(
+            EnvironmentConfig.get_env('RESPONSE_CACHE_TTL_S')
+            or cls.DEFAULT_TTL_S
+        )
+        memory = MemoryResponseCache(
+            int(
+                EnvironmentConfig.get_env('RESPONSE_CACHE_MAX_ENTRIES')
+                or MemoryResponseCache.DEFAULT_MAX_ENTRIES
+            )
+        )
+        path = EnvironmentConfig.get_env('RESPONSE_CACHE_PATH')
+        disk = (
+            SQLiteResponseCache(
+                path,
+                int(
+                    EnvironmentConfig.get_env('RESPONSE_CACHE_MAX_BYTES')
+                    or SQLiteResponseCache.DEFAULT_MAX_BYTES
+                ),
+            )
+            if path
+            else None
+        )
+        return cls(memory=memory, disk=disk, ttl_s=ttl_s, mode=mode)
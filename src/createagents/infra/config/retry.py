@@ -1,10 +1,115 @@
+import asyncio
+import inspect
 import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Optional, Tuple, Type
+from typing import Any, Callable, FrozenSet, Optional, Tuple, Type
 
+import httpx
+
+from ...domain import ChatTimeoutException
 from .logging_config import LoggingConfig
 
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset(
+    {408, 409, 425, 429, 500, 502, 503, 504}
+)
+"""HTTP status codes that indicate a transient failure worth retrying."""
+
+MAX_RETRY_AFTER_SECONDS = 60.0
+"""Upper bound applied to server-provided `Retry-After` values."""
+
+
+def _iter_error_chain(error: BaseException):
+    """Yield the error followed by its chained causes and contexts."""
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__ or current.__context__
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Classifies an error as transient (retryable) or permanent.
+
+    Rate limits (429), server errors (5xx) and a few other transient HTTP
+    statuses are retryable, as are connection resets and timeouts. Any
+    other 4xx status (bad request, authentication, not found...) and
+    errors without transport information are treated as permanent.
+    An exhausted chat deadline is never retried.
+
+    Args:
+        error: The exception raised by the API call.
+
+    Returns:
+        True if the call should be retried, False otherwise.
+    """
+    for current in _iter_error_chain(error):
+        if isinstance(current, ChatTimeoutException):
+            return False
+
+        status_code = getattr(current, 'status_code', None)
+        if isinstance(status_code, int) and status_code > 0:
+            return status_code in RETRYABLE_STATUS_CODES
+
+        if isinstance(
+            current,
+            (
+                ConnectionError,
+                TimeoutError,
+                asyncio.TimeoutError,
+                httpx.TransportError,
+            ),
+        ):
+            return True
+
+    return False
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Extracts the server-requested delay from a `Retry-After` header.
+
+    Both the `retry-after-ms` extension and the standard `Retry-After`
+    header (delta-seconds or HTTP-date) are supported.
+
+    Args:
+        error: The exception raised by the API call.
+
+    Returns:
+        The delay in seconds, or None if the server did not provide one.
+    """
+    for current in _iter_error_chain(error):
+        response = getattr(current, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            continue
+
+        try:
+            retry_after_ms = headers.get('retry-after-ms')
+            if retry_after_ms is not None:
+                return max(float(retry_after_ms) / 1000, 0.0)
+
+            retry_after = headers.get('retry-after')
+            if retry_after is None:
+                continue
+
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                retry_date = parsedate_to_datetime(retry_after)
+                if retry_date.tzinfo is None:
+                    retry_date = retry_date.replace(tzinfo=timezone.utc)
+                delta = retry_date - datetime.now(timezone.utc)
+                return max(delta.total_seconds(), 0.0)
+        except (TypeError, ValueError, AttributeError):
+            continue
+
+    return None
+
 
 def retry_with_backoff(
     max_attempts: int = 3,
@@ -13,10 +118,18 @@ def retry_with_backoff(
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
     jitter: bool = True,
     on_retry: Optional[Callable[[int, Exception], None]] = None,
+    retry_if: Optional[Callable[[Exception], bool]] = None,
+    max_retry_time: Optional[float] = None,
+    respect_retry_after: bool = True,
 ):
     """
     A decorator for retrying with exponential backoff and jitter.
 
+    Works with both regular functions and coroutine functions. Coroutine
+    functions get an async wrapper that awaits the call (so errors raised
+    while awaiting are retried) and waits with `asyncio.sleep`, never
+    blocking the event loop.
+
     Args:
         max_attempts: The maximum number of attempts.
         initial_delay: The initial delay in seconds.
@@ -26,6 +139,14 @@ def retry_with_backoff(
                 the "thundering herd" problem in distributed systems.
         on_retry: An optional callback to be called on each retry, receiving
                   the attempt number and the exception.
+        retry_if: An optional predicate that decides whether a caught
+                  exception is retryable (e.g. `is_retryable_error`).
+                  Exceptions rejected by it are raised immediately.
+        max_retry_time: The per-call retry budget in seconds. A retry whose
+                        delay would push the total time spent on the call
+                        past this budget is not attempted.
+        respect_retry_after: If True, a server-provided `Retry-After` delay
+                             is honoured when it is longer than the backoff.
 
     Returns:
         A decorator function.
@@ -37,50 +158,98 @@ def retry_with_backoff(
     """
     logger = LoggingConfig.get_logger(__name__)
 
+    def next_delay(
+        attempt: int, delay: float, error: Exception, started_at: float
+    ) -> Optional[float]:
+        """Return the delay before the next attempt, or None to give up."""
+        if attempt >= max_attempts:
+            logger.error('Failure after %s attempts: %s', max_attempts, error)
+            return None
+
+        if retry_if is not None and not retry_if(error):
+            logger.debug('Error is not retryable: %s', error)
+            return None
+
+        if on_retry:
+            try:
+                on_retry(attempt, error)
+            except Exception as callback_error:
+                logger.warning('Error in retry callback: %s', callback_error)
+
+        actual_delay = delay
+        if jitter:
+            jitter_factor = 1 + random.uniform(-0.1, 0.1)  # nosec
+            actual_delay = delay * jitter_factor
+
+        if respect_retry_after:
+            retry_after = get_retry_after(error)
+            if retry_after is not None:
+                actual_delay = max(
+                    actual_delay, min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                )
+
+        if max_retry_time is not None:
+            elapsed = time.monotonic() - started_at
+            if elapsed + actual_delay > max_retry_time:
+                logger.error(
+                    'Retry budget of %.2fs exhausted after %s attempt(s): %s',
+                    max_retry_time,
+                    attempt,
+                    error,
+                )
+                return None
+
+        logger.warning(
+            'Attempt %s/%s failed: %s. Waiting %.2fs before retrying...',
+            attempt,
+            max_attempts,
+            error,
+            actual_delay,
+        )
+        return actual_delay
+
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                delay = initial_delay
+                started_at = time.monotonic()
+
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        actual_delay = next_delay(
+                            attempt, delay, e, started_at
+                        )
+                        if actual_delay is None:
+                            raise
+
+                        await asyncio.sleep(actual_delay)
+                        delay *= backoff_factor
+
+                return None
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             delay = initial_delay
-            last_exception = None
+            started_at = time.monotonic()
 
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-
-                    if attempt == max_attempts:
-                        logger.error(
-                            'Failure after %s attempts: %s', max_attempts, e
-                        )
+                    actual_delay = next_delay(attempt, delay, e, started_at)
+                    if actual_delay is None:
                         raise
 
-                    if on_retry:
-                        try:
-                            on_retry(attempt, e)
-                        except Exception as callback_error:
-                            logger.warning(
-                                'Error in retry callback: %s', callback_error
-                            )
-
-                    actual_delay = delay
-                    if jitter:
-                        jitter_factor = 1 + random.uniform(-0.1, 0.1)  # nosec
-                        actual_delay = delay * jitter_factor
-
-                    logger.warning(
-                        'Attempt %s/%s failed: %s. Waiting %.2fs before retrying...',
-                        attempt,
-                        max_attempts,
-                        e,
-                        actual_delay,
-                    )
-
                     time.sleep(actual_delay)
                     delay *= backoff_factor
 
-            if last_exception:
-                raise last_exception
+            return None
 
         return wrapper
 
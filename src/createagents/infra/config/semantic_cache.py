@@ -0,0 +1,254 @@
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from .environment import EnvironmentConfig
+
+
+def _load_numpy() -> Any:
+    """Imports NumPy, which backs the semantic cache's vector index.
+
+    Raises:
+        RuntimeError: If NumPy is not installed.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise RuntimeError(
+            'numpy is required for the semantic cache. '
+            'Install with: pip install createagents[semantic-cache]'
+        ) from e
+    return numpy
+
+
+class TextEmbedder(ABC):
+    """Turns texts into embedding vectors for the semantic cache."""
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return one embedding vector per text, in input order."""
+
+
+class SemanticCache:
+    """Cache of chat responses looked up by meaning instead of exact text.
+
+    Each entry holds the normalized float32 embedding of a user message,
+    the response given to it and a context hash (model, instructions,
+    tools, config and history). A lookup embeds the new message and runs a
+    vectorized cosine search over the entries of the same context; the
+    best match is returned if its similarity reaches the threshold. Entries
+    expire after `ttl_s` (or a shorter lifetime given when they are added);
+    once `max_entries` is reached, an expired or else the least recently
+    used entry is replaced.
+    """
+
+    DEFAULT_THRESHOLD = 0.95
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_TTL_S = 24 * 60 * 60.0
+
+    def __init__(
+        self,
+        embedder: TextEmbedder,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_s: Optional[float] = DEFAULT_TTL_S,
+    ):
+        """Creates an empty cache.
+
+        Args:
+            embedder: Produces the embeddings of user messages.
+            threshold: Minimum cosine similarity for a hit, in (0, 1].
+            max_entries: Entries kept before eviction starts.
+            ttl_s: Lifetime of stored responses; None never expires.
+
+        Raises:
+            ValueError: If a setting is out of range.
+            RuntimeError: If NumPy is not installed.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError('threshold must be in the range (0, 1].')
+        if max_entries <= 0:
+            raise ValueError('max_entries must be greater than zero.')
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError('ttl_s must be greater than zero.')
+
+        self.__np = _load_numpy()
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+
+        self.__lock = threading.Lock()
+        self.__vectors: Optional[Any] = None
+        self.__contexts = self.__np.zeros(max_entries, dtype=self.__np.int64)
+        self.__last_used = self.__np.zeros(max_entries, dtype=self.__np.int64)
+        self.__expires_at = self.__np.full(max_entries, self.__np.inf)
+        self.__responses: List[Optional[str]] = [None] * max_entries
+        self.__size = 0
+        self.__clock = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @classmethod
+    def from_env(cls, embedder: TextEmbedder) -> 'SemanticCache':
+        """Creates a cache configured from the environment.
+
+        `SEMANTIC_CACHE_THRESHOLD`, `SEMANTIC_CACHE_MAX_ENTRIES` and
+        `SEMANTIC_CACHE_TTL_S` override the defaults.
+
+        Args:
+            embedder: Produces the embeddings of user messages.
+        """
+        return cls(
+            embedder,
+            threshold=float(
+                EnvironmentConfig.get_env('SEMANTIC_CACHE_THRESHOLD')
+                or cls.DEFAULT_THRESHOLD
+            ),
+            max_entries=int(
+                EnvironmentConfig.get_env('SEMANTIC_CACHE_MAX_ENTRIES')
+                or cls.DEFAULT_MAX_ENTRIES
+            ),
+            ttl_s=float(
+                EnvironmentConfig.get_env('SEMANTIC_CACHE_TTL_S')
+                or cls.DEFAULT_TTL_S
+            ),
+        )
+
+    @staticmethod
+    def make_context(*parts: str) -> int:
+        """Returns a 64-bit hash identifying a request context."""
+        digest = hashlib.sha256('\x00'.join(parts).encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big', signed=True)
+
+    async def embed(self, text: str) -> Any:
+        """Returns the normalized float32 embedding of a text.
+
+        Raises:
+            ValueError: If the embedder returns an empty or zero vector.
+        """
+        vectors = await self.embedder.embed([text])
+        vector = self.__np.asarray(vectors[0], dtype=self.__np.float32)
+        norm = float(self.__np.linalg.norm(vector))
+        if vector.ndim != 1 or vector.size == 0 or norm == 0:
+            raise ValueError('The embedder returned an unusable vector.')
+        return vector / norm
+
+    def search(self, context: int, vector: Any) -> Optional[str]:
+        """Returns the cached response closest to an embedding, if any.
+
+        Args:
+            context: Hash of the request context (see `make_context`).
+            vector: Normalized embedding from `embed`.
+
+        Returns:
+            The response of the most similar unexpired entry with the same
+            context whose similarity reaches the threshold, or None.
+        """
+        np = self.__np
+        now = time.time()
+        with self.__lock:
+            index = None
+            if self.__vectors is not None and self.__size:
+                size = self.__size
+                if self.__vectors.shape[1] == vector.shape[0]:
+                    scores = self.__vectors[:size] @ vector
+                    scores[self.__contexts[:size] != context] = -np.inf
+                    scores[self.__expires_at[:size] <= now] = -np.inf
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        index = best
+
+            if index is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__clock += 1
+            self.__last_used[index] = self.__clock
+            return self.__responses[index]
+
+    def add(
+        self,
+        context: int,
+        vector: Any,
+        response: str,
+        max_ttl_s: Optional[float] = None,
+    ) -> None:
+        """Stores a response, replacing an old entry when the cache is full.
+
+        An expired entry is replaced first, or else the least recently used
+        one.
+
+        Args:
+            context: Hash of the request context (see `make_context`).
+            vector: Normalized embedding from `embed`.
+            response: The response to cache.
+            max_ttl_s: Upper bound for this entry's lifetime, below the
+                cache's own `ttl_s` (optional).
+        """
+        np = self.__np
+        now = time.time()
+        ttl_s = self.ttl_s
+        if max_ttl_s is not None:
+            ttl_s = max_ttl_s if ttl_s is None else min(ttl_s, max_ttl_s)
+        with self.__lock:
+            if (
+                self.__vectors is None
+                or self.__vectors.shape[1] != vector.shape[0]
+            ):
+                # The embedding model changed; older vectors are useless.
+                self.__vectors = np.zeros(
+                    (self.max_entries, vector.shape[0]), dtype=np.float32
+                )
+                self.__size = 0
+
+            if self.__size < self.max_entries:
+                index = self.__size
+                self.__size += 1
+            else:
+                expired = np.flatnonzero(self.__expires_at <= now)
+                if expired.size:
+                    index = int(expired[0])
+                else:
+                    index = int(np.argmin(self.__last_used))
+                    self.__evictions += 1
+
+            self.__clock += 1
+            self.__vectors[index] = vector
+            self.__contexts[index] = context
+            self.__last_used[index] = self.__clock
+            self.__expires_at[index] = (
+                now + ttl_s if ttl_s is not None else np.inf
+            )
+            self.__responses[index] = response
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self.__lock:
+            self.__size = 0
+            self.__responses = [None] * self.max_entries
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self.__lock:
+            return self.__size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns hit and eviction counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate (0-1, None before the
+            first lookup), entries and evictions.
+        """
+        with self.__lock:
+            lookups = self.__hits + self.__misses
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'hit_rate': self.__hits / lookups if lookups else None,
+                'entries': self.__size,
+                'evictions': self.__evictions,
+            }
@@ -0,0 +1,398 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote, unquote
+
+from ...application.interfaces import SessionStore
+from ...domain import History, Message, MessageRole
+from .logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+def _check_session_id(session_id: str) -> None:
+    if not isinstance(session_id, str) or not session_id:
+        raise ValueError('The session id must be a non-empty string.')
+
+
+def _to_message(role: str, content: str, tokens: Optional[int]) -> Message:
+    return Message(role=MessageRole(role), content=content, token_count=tokens)
+
+
+class _Summary(NamedTuple):
+    """A stored summary of the messages before the `kept` ones."""
+
+    message: Message
+    kept: int
+
+
+def _apply_summaries(
+    newest_first: Iterable[Union[Message, _Summary]],
+) -> Iterator[Message]:
+    """Yields the messages, newest first, up to the latest summary.
+
+    The summary is yielded after the messages it keeps, in place of the
+    older ones, which are never read. Earlier summaries among the kept
+    messages are skipped.
+    """
+    summary: Optional[_Summary] = None
+    remaining = 0
+    for record in newest_first:
+        if isinstance(record, _Summary):
+            if summary is None:
+                summary = record
+                remaining = record.kept
+                if remaining <= 0:
+                    break
+            continue
+        yield record
+        if summary is not None:
+            remaining -= 1
+            if remaining <= 0:
+                break
+    if summary is not None:
+        yield summary.message
+
+
+def select_recent(
+    newest_first: Iterable[Message],
+    max_messages: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> List[Message]:
+    """Takes the most recent messages that fit the limits.
+
+    Reads `newest_first` only as far as needed. When a limit cuts the
+    session, leading messages up to the next user (or system) message are
+    dropped, so the result starts at a turn boundary.
+
+    Returns:
+        List[Message]: The selected messages, oldest first.
+    """
+    selected: List[Message] = []
+    tokens = 0
+    cut = False
+    for message in newest_first:
+        if max_messages is not None and len(selected) >= max_messages:
+            cut = True
+            break
+        cost = History.message_tokens(message)
+        if max_tokens is not None and tokens + cost > max_tokens:
+            cut = True
+            break
+        selected.append(message)
+        tokens += cost
+
+    selected.reverse()
+    if cut:
+        start = 0
+        while start < len(selected) and selected[start].role not in (
+            MessageRole.USER,
+            MessageRole.SYSTEM,
+        ):
+            start += 1
+        selected = selected[start:]
+    return selected
+
+
+class JSONLSessionStore(SessionStore):
+    """Stores each session as an append-only JSON Lines file.
+
+    Every message is one line in `<directory>/<session id>.jsonl`, and a
+    summary is a line with a `kept` count. Loading reads the file
+    backwards in blocks and stops once the limits are met, so restoring a
+    long session costs about as much as a short one.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, directory: str, fsync: bool = False):
+        """Creates the directory if needed.
+
+        Args:
+            directory: Directory of the session files.
+            fsync: Force each turn to disk before returning; slower, but
+                survives a power loss, not just a process crash.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.__fsync = fsync
+        self.__lock = threading.Lock()
+
+    def append(self, session_id: str, messages: Sequence[Message]) -> None:
+        """Append messages to the end of a session."""
+        _check_session_id(session_id)
+        self.__write(
+            session_id, [self.__record(message) for message in messages]
+        )
+
+    def append_summary(
+        self, session_id: str, summary: Message, kept: int
+    ) -> None:
+        """Append a summary of the older messages of a session."""
+        _check_session_id(session_id)
+        record = self.__record(summary)
+        record['kept'] = kept
+        self.__write(session_id, [record])
+
+    def load(
+        self,
+        session_id: str,
+        max_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[Message]:
+        """Return the most recent messages of a session, oldest first."""
+        _check_session_id(session_id)
+        path = self.__path(session_id)
+        with self.__lock:
+            if not os.path.exists(path):
+                return []
+            with open(path, 'rb') as f:
+                return select_recent(
+                    _apply_summaries(self.__read_backwards(f)),
+                    max_messages,
+                    max_tokens,
+                )
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session and all its messages."""
+        _check_session_id(session_id)
+        with self.__lock:
+            try:
+                os.remove(self.__path(session_id))
+            except FileNotFoundError:
+                pass
+
+    def session_ids(self) -> List[str]:
+        """Return the identifiers of every stored session."""
+        return sorted(
+            unquote(name[: -len('.jsonl')])
+            for name in os.listdir(self.directory)
+            if name.endswith('.jsonl')
+        )
+
+    def __path(self, session_id: str) -> str:
+        # Quoting keeps any session id a single, reversible file name.
+        return os.path.join(
+            self.directory, quote(session_id, safe='') + '.jsonl'
+        )
+
+    @staticmethod
+    def __record(message: Message) -> Dict[str, Any]:
+        return {
+            'role': message.role.value,
+            'content': message.content,
+            'tokens': message.token_count,
+        }
+
+    def __write(self, session_id: str, records: List[Dict[str, Any]]) -> None:
+        """Appends records to a session file, one JSON line each."""
+        lines = ''.join(
+            json.dumps(record, ensure_ascii=False) + '\n' for record in records
+        )
+        data = lines.encode('utf-8')
+        with self.__lock:
+            with open(self.__path(session_id), 'a+b') as f:
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        # A write cut short by a crash; start a new line.
+                        data = b'\n' + data
+                f.write(data)
+                if self.__fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def __read_backwards(self, f) -> Iterator[Union[Message, _Summary]]:
+        """Yields the file's records, last line first."""
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        while position > 0:
+            size = min(self.BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b'\n')
+            # The first piece may be the end of a line in the previous block.
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                record = self.__parse(line)
+                if record is not None:
+                    yield record
+        record = self.__parse(remainder)
+        if record is not None:
+            yield record
+
+    @staticmethod
+    def __parse(line: bytes) -> Optional[Union[Message, _Summary]]:
+        """Parses a line; blank and damaged lines are skipped."""
+        if not line.strip():
+            return None
+        try:
+            record = json.loads(line)
+            message = _to_message(
+                record['role'], record['content'], record.get('tokens')
+            )
+            if 'kept' in record:
+                return _Summary(message, int(record['kept']))
+            return message
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning('Skipping damaged session line: %s', e)
+            return None
+
+
+class SQLiteSessionStore(SessionStore):
+    """Stores sessions in a SQLite database.
+
+    Each message is one row, inserted when its turn finishes; a summary is
+    a row with `kept` set. Loading walks a session's rows newest first
+    through an index and stops once the limits are met.
+    """
+
+    def __init__(self, path: str):
+        """Opens (or creates) the database.
+
+        Args:
+            path: Path of the database file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute('PRAGMA journal_mode=WAL')
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS session_messages ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'session_id TEXT NOT NULL, '
+                'role TEXT NOT NULL, '
+                'content TEXT NOT NULL, '
+                'tokens INTEGER, '
+                'kept INTEGER, '
+                'created_at REAL NOT NULL)'
+            )
+            columns = {
+                row[1]
+                for row in self.__connection.execute(
+                    'PRAGMA table_info(session_messages)'
+                )
+            }
+            if 'kept' not in columns:
+                # Databases created before summaries were stored.
+                self.__connection.execute(
+                    'ALTER TABLE session_messages ADD COLUMN kept INTEGER'
+                )
+            self.__connection.execute(
+                'CREATE INDEX IF NOT EXISTS session_messages_session '
+                'ON session_messages (session_id, id)'
+            )
+
+    def append(self, session_id: str, messages: Sequence[Message]) -> None:
+        """Append messages to the end of a session."""
+        _check_session_id(session_id)
+        now = time.time()
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                'INSERT INTO session_messages '
+                '(session_id, role, content, tokens, created_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [
+                    (
+                        session_id,
+                        message.role.value,
+                        message.content,
+                        message.token_count,
+                        now,
+                    )
+                    for message in messages
+                ],
+            )
+
+    def append_summary(
+        self, session_id: str, summary: Message, kept: int
+    ) -> None:
+        """Append a summary of the older messages of a session."""
+        _check_session_id(session_id)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT INTO session_messages '
+                '(session_id, role, content, tokens, kept, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    session_id,
+                    summary.role.value,
+                    summary.content,
+                    summary.token_count,
+                    kept,
+                    time.time(),
+                ),
+            )
+
+    def load(
+        self,
+        session_id: str,
+        max_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[Message]:
+        """Return the most recent messages of a session, oldest first."""
+        _check_session_id(session_id)
+        with self.__lock:
+            cursor = self.__connection.execute(
+                'SELECT role, content, tokens, kept FROM session_messages '
+                'WHERE session_id = ? ORDER BY id DESC',
+                (session_id,),
+            )
+            try:
+                return select_recent(
+                    _apply_summaries(self.__records(cursor)),
+                    max_messages,
+                    max_tokens,
+                )
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def __records(
+        rows: Iterable[Tuple[str, str, Optional[int], Optional[int]]],
+    ) -> Iterator[Union[Message, _Summary]]:
+        for role, content, tokens, kept in rows:
+            message = _to_message(role, content, tokens)
+            yield message if kept is None else _Summary(message, kept)
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session and all its messages."""
+        _check_session_id(session_id)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'DELETE FROM session_messages WHERE session_id = ?',
+                (session_id,),
+            )
+
+    def session_ids(self) -> List[str]:
+        """Return the identifiers of every stored session."""
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT DISTINCT session_id FROM session_messages '
+                'ORDER BY session_id'
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.__lock:
+            self.__connection.close()
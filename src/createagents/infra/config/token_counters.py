@@ -0,0 +1,42 @@
+from typing import Any
+
+from ...domain import TokenCounter
+
+
+def _load_tiktoken() -> Any:
+    """Imports tiktoken, which backs the exact token counter.
+
+    Raises:
+        RuntimeError: If tiktoken is not installed.
+    """
+    try:
+        import tiktoken  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise RuntimeError(
+            'tiktoken is required for exact token counting. '
+            'Install with: pip install createagents[file-tools]'
+        ) from e
+    return tiktoken
+
+
+class TiktokenCounter(TokenCounter):
+    """Counts tokens exactly with a tiktoken encoding.
+
+    Suits OpenAI models; for other models it is a close estimate. The
+    encoding is loaded when the counter is created.
+    """
+
+    def __init__(self, encoding: str = 'cl100k_base'):
+        """Loads the encoding.
+
+        Args:
+            encoding: Name of the tiktoken encoding.
+
+        Raises:
+            RuntimeError: If tiktoken is not installed.
+        """
+        self.__encoding = _load_tiktoken().get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in a text."""
+        return len(self.__encoding.encode(text, disallowed_special=()))
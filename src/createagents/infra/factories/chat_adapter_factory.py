@@ -2,7 +2,18 @@ from typing import Dict, Tuple
 
 from ...application.interfaces import ChatRepository
 from ..adapters import OllamaChatAdapter, OpenAIChatAdapter
-from ..config import LoggingConfig
+from ..adapters.Common import (
+    CircuitBreakerChatAdapter,
+    ResponseCacheChatAdapter,
+    SharedChatAdapter,
+    SingleFlightChatAdapter,
+)
+from ..config import (
+    CircuitBreaker,
+    EnvironmentConfig,
+    LoggingConfig,
+    ResponseCache,
+)
 
 
 class ChatAdapterFactory:
@@ -25,6 +36,13 @@ class ChatAdapterFactory:
         """
         Creates the appropriate adapter with caching.
 
+        When `CIRCUIT_BREAKER_ENABLED` is true, the adapter is wrapped in a
+        CircuitBreakerChatAdapter, so each provider/model pair has its own
+        circuit. When `SINGLE_FLIGHT_ENABLED` is true, identical concurrent
+        requests share one upstream call (SingleFlightChatAdapter). When
+        `RESPONSE_CACHE_MODE` is set, repeated requests are answered from
+        the shared ResponseCache (ResponseCacheChatAdapter).
+
         Args:
             model: The name of the model (e.g., "gpt-4", "llama2").
             provider: The specific provider ("openai", "ollama").
@@ -64,11 +82,61 @@ class ChatAdapterFactory:
             cls.__logger.error('Invalid provider requested: %s', provider)
             raise ValueError(f'Invalid provider: {provider}.')
 
+        breaker = CircuitBreaker.from_env(f'{provider_lower}:{model}')
+        if breaker is not None:
+            cls.__logger.debug('Wrapping adapter with a circuit breaker')
+            adapter = CircuitBreakerChatAdapter(adapter, breaker)
+
+        single_flight = (
+            EnvironmentConfig.get_env('SINGLE_FLIGHT_ENABLED', 'false')
+            or 'false'
+        )
+        if single_flight.lower() == 'true':
+            cls.__logger.debug('Wrapping adapter with single-flight sharing')
+            adapter = SingleFlightChatAdapter(adapter)
+
+        response_cache = ResponseCache.get_shared()
+        if response_cache is not None:
+            cls.__logger.debug('Wrapping adapter with the response cache')
+            adapter = ResponseCacheChatAdapter(
+                adapter, response_cache, provider=provider_lower
+            )
+
         cls.__cache[cache_key] = adapter
         cls.__logger.debug('Adapter cached with key: %s', cache_key)
 
         return adapter
 
+    @classmethod
+    def acquire(cls, provider: str, model: str) -> ChatRepository:
+        """
+        Returns one holder's handle on the cached adapter.
+
+        The adapter is shared by every holder of the same provider and
+        model; closing the handle drops its hold, and the adapter is only
+        closed by the last holder (or by `aclose`).
+
+        Args:
+            provider: The specific provider ("openai", "ollama").
+            model: The name of the model (e.g., "gpt-4", "llama2").
+
+        Returns:
+            A SharedChatAdapter holding the cached adapter.
+
+        Raises:
+            ValueError: If the provider is not "openai" or "ollama".
+        """
+        return SharedChatAdapter(cls.create(provider, model))
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the connections held by every cached adapter."""
+        for adapter in list(cls.__cache.values()):
+            await adapter.aclose()
+        cls.__logger.info(
+            'Closed connections for %s cached adapter(s)', len(cls.__cache)
+        )
+
     @classmethod
     def clear_cache(cls) -> None:
         """Clear the adapter cache."""
@@ -1,15 +1,24 @@
 from typing import Any, Dict, Optional, Sequence, Union
 
 from ...application.dtos import CreateAgentInputDTO
+from ...application.interfaces import ChatRepository, SessionStore
+from ...application.services import HistoryCompactor, SessionManager
 from ...application.use_cases import (
+    ChatManyWithAgentUseCase,
     ChatWithAgentUseCase,
     CreateAgentUseCase,
     GetAgentConfigUseCase,
     GetAllAvailableToolsUseCase,
     GetSystemAvailableToolsUseCase,
 )
-from ...domain import Agent, BaseTool
-from ...infra import ChatAdapterFactory, LoggingConfig
+from ...domain import Agent, BaseTool, History, TokenCounter
+from ...infra import (
+    ChatAdapterFactory,
+    LoggingConfig,
+    OllamaEmbedder,
+    SemanticCache,
+    SemanticCacheChatAdapter,
+)
 
 
 class AgentComposer:
@@ -28,7 +37,9 @@ class AgentComposer:
         instructions: Optional[str] = None,
         config: Optional[Dict[str, Any]] = None,
         tools: Optional[Sequence[Union[str, BaseTool]]] = None,
-        history_max_size: int = 10,
+        history_max_size: Optional[int] = 10,
+        history_max_tokens: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
     ) -> Agent:
         """
         Creates a new agent using the CreateAgentUseCase.
@@ -40,6 +51,8 @@ class AgentComposer:
             instructions: The agent's instructions (optional).
             config: Extra agent configurations, such as `max_tokens` and `temperature` (optional).
             history_max_size: The maximum history size (default: 10).
+            history_max_tokens: The token budget of the history (optional).
+            token_counter: Counts history tokens (optional).
 
         Returns:
             A new agent instance.
@@ -69,6 +82,8 @@ class AgentComposer:
             config=config,
             tools=tools,
             history_max_size=history_max_size,
+            history_max_tokens=history_max_tokens,
+            token_counter=token_counter,
         )
 
         use_case = CreateAgentUseCase()
@@ -83,6 +98,10 @@ class AgentComposer:
     def create_chat_use_case(
         provider: str,
         model: str,
+        semantic_cache: Optional[SemanticCache] = None,
+        tool_pool: Optional[str] = None,
+        compactor: Optional[HistoryCompactor] = None,
+        sessions: Optional[SessionManager] = None,
     ) -> ChatWithAgentUseCase:
         """
         Creates the ChatWithAgentUseCase with its dependencies injected.
@@ -90,6 +109,13 @@ class AgentComposer:
         Args:
             provider: The specific provider ("openai" or "ollama").
             model: The name of the AI model.
+            semantic_cache: If given, answers similar messages from this
+                cache (optional).
+            tool_pool: `ToolPools` pool for synchronous tools that do not
+                choose one themselves (optional).
+            compactor: Summarizes long histories in the background
+                (optional).
+            sessions: Histories of named sessions (optional).
 
         Returns:
             A configured ChatWithAgentUseCase.
@@ -100,12 +126,117 @@ class AgentComposer:
             model,
         )
 
-        chat_adapter = ChatAdapterFactory.create(provider, model)
-        use_case = ChatWithAgentUseCase(chat_repository=chat_adapter)
+        # The agent's own hold on the shared adapter, released by aclose.
+        chat_adapter: ChatRepository = ChatAdapterFactory.acquire(
+            provider, model
+        )
+        if semantic_cache is not None:
+            chat_adapter = SemanticCacheChatAdapter(
+                chat_adapter, semantic_cache
+            )
+        use_case = ChatWithAgentUseCase(
+            chat_repository=chat_adapter,
+            tool_pool=tool_pool,
+            compactor=compactor,
+            sessions=sessions,
+        )
 
         AgentComposer.__logger.debug('Chat use case composed successfully')
         return use_case
 
+    @staticmethod
+    def create_history_compactor(
+        provider: str,
+        model: str,
+        threshold_tokens: int = HistoryCompactor.DEFAULT_THRESHOLD_TOKENS,
+    ) -> HistoryCompactor:
+        """
+        Creates a HistoryCompactor that summarizes with the given model.
+
+        Args:
+            provider: Provider of the summary model ("openai" or "ollama").
+            model: Name of the summary model.
+            threshold_tokens: History size, in tokens, above which it is
+                compacted.
+
+        Returns:
+            A configured HistoryCompactor.
+        """
+        AgentComposer.__logger.debug(
+            'Composing history compactor - Provider: %s, Model: %s',
+            provider,
+            model,
+        )
+        return HistoryCompactor(
+            ChatAdapterFactory.acquire(provider, model),
+            model,
+            threshold_tokens=threshold_tokens,
+        )
+
+    @staticmethod
+    def create_session_manager(
+        template: History,
+        store: Optional[SessionStore] = None,
+        idle_ttl_s: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+    ) -> SessionManager:
+        """
+        Creates a SessionManager whose histories copy the template's limits.
+
+        Args:
+            template: History with the limits and token counter to use.
+            store: Durable storage of the sessions (optional).
+            idle_ttl_s: Seconds after which an unused session is dropped
+                from memory (optional).
+            max_sessions: Most sessions held in memory (optional).
+
+        Returns:
+            A configured SessionManager.
+        """
+        AgentComposer.__logger.debug(
+            'Composing session manager - Store: %s',
+            type(store).__name__ if store is not None else None,
+        )
+        return SessionManager(
+            template,
+            store=store,
+            idle_ttl_s=idle_ttl_s,
+            max_sessions=max_sessions,
+        )
+
+    @staticmethod
+    def create_semantic_cache() -> SemanticCache:
+        """
+        Creates a SemanticCache backed by a local Ollama embedding model.
+
+        The threshold and size come from `SEMANTIC_CACHE_THRESHOLD` and
+        `SEMANTIC_CACHE_MAX_ENTRIES`, the model from `OLLAMA_EMBED_MODEL`.
+
+        Returns:
+            A new, empty SemanticCache.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        AgentComposer.__logger.debug('Composing semantic cache')
+        return SemanticCache.from_env(OllamaEmbedder())
+
+    @staticmethod
+    def create_chat_many_use_case(
+        chat_use_case: ChatWithAgentUseCase,
+    ) -> ChatManyWithAgentUseCase:
+        """
+        Creates the ChatManyWithAgentUseCase on top of a chat use case.
+
+        Args:
+            chat_use_case: The use case that answers a single message.
+
+        Returns:
+            A configured ChatManyWithAgentUseCase.
+        """
+        AgentComposer.__logger.debug('Composing chat many use case')
+        return ChatManyWithAgentUseCase(chat_use_case=chat_use_case)
+
     @staticmethod
     def create_get_config_use_case() -> GetAgentConfigUseCase:
         """
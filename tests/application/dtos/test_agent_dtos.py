@@ -226,6 +226,47 @@ class TestCreateAgentInputDTO:
         ):
             dto.validate()
 
+    def test_validate_token_budget_allows_no_max_size(self):
+        dto = CreateAgentInputDTO(
+            provider='openai',
+            model='gpt-5-nano',
+            history_max_size=None,
+            history_max_tokens=2000,
+        )
+
+        dto.validate()
+
+    def test_validate_requires_max_size_without_token_budget(self):
+        dto = CreateAgentInputDTO(
+            provider='openai', model='gpt-5-nano', history_max_size=None
+        )
+
+        with pytest.raises(
+            ValueError, match='history_max_size.*positive integer'
+        ):
+            dto.validate()
+
+    @pytest.mark.parametrize('max_tokens', [0, -1, True, '100'])
+    def test_validate_invalid_history_max_tokens(self, max_tokens):
+        dto = CreateAgentInputDTO(
+            provider='openai',
+            model='gpt-5-nano',
+            history_max_tokens=max_tokens,
+        )
+
+        with pytest.raises(
+            ValueError, match='history_max_tokens.*positive integer'
+        ):
+            dto.validate()
+
+    def test_validate_invalid_token_counter(self):
+        dto = CreateAgentInputDTO(
+            provider='openai', model='gpt-5-nano', token_counter=len
+        )
+
+        with pytest.raises(ValueError, match="'token_counter'"):
+            dto.validate()
+
     def test_validate_invalid_config_type(self):
         dto = CreateAgentInputDTO(
             provider='openai',
@@ -680,6 +721,7 @@ class TestAgentConfigOutputDTO:
             'tools',
             'history',
             'history_max_size',
+            'history_max_tokens',
         }
         assert set(result.keys()) == expected_keys
 
@@ -768,6 +810,26 @@ class TestChatInputDTO:
         with pytest.raises(ValueError, match="'message'.*required"):
             dto.validate()
 
+    def test_timeout_defaults_to_none(self):
+        assert ChatInputDTO(message='Hello').timeout is None
+
+    def test_validate_positive_timeout(self):
+        ChatInputDTO(message='Hello', timeout=2.5).validate()
+
+    @pytest.mark.parametrize('timeout', [0, -1, True, '5'])
+    def test_validate_invalid_timeout(self, timeout):
+        dto = ChatInputDTO(message='Hello', timeout=timeout)
+
+        with pytest.raises(ValueError, match="'timeout'"):
+            dto.validate()
+
+    @pytest.mark.parametrize('session_id', ['', 7])
+    def test_validate_invalid_session_id(self, session_id):
+        dto = ChatInputDTO(message='Hello', session_id=session_id)
+
+        with pytest.raises(ValueError, match="'session_id'"):
+            dto.validate()
+
     def test_validate_whitespace_message(self):
         dto = ChatInputDTO(message='   ')
 
@@ -131,3 +131,83 @@ class TestStreamingResponseDTO:
         result = await dto
         assert result == 'ABCD'
         assert dto._consumed is True
+
+    @pytest.mark.asyncio
+    async def test_scenario_aclose_stops_the_generator(self):
+        finalized = []
+
+        async def generator():
+            try:
+                yield 'A'
+                yield 'B'
+            finally:
+                finalized.append(True)
+
+        dto = StreamingResponseDTO(generator())
+        assert await dto.__anext__() == 'A'
+
+        await dto.aclose()
+
+        assert finalized == [True]
+        assert dto.closed is True
+        assert [token async for token in dto] == []
+        assert repr(dto) == 'StreamingResponseDTO(closed, length=1)'
+
+    @pytest.mark.asyncio
+    async def test_scenario_aclose_after_consumed_is_noop(self):
+        dto = StreamingResponseDTO(mock_generator(['A']))
+        await dto
+
+        await dto.aclose()
+
+        assert dto.closed is False
+        assert str(dto) == 'A'
+
+    @pytest.mark.asyncio
+    async def test_scenario_context_manager_closes_on_exit(self):
+        finalized = []
+
+        async def generator():
+            try:
+                yield 'A'
+                yield 'B'
+            finally:
+                finalized.append(True)
+
+        async with StreamingResponseDTO(generator()) as dto:
+            async for token in dto:
+                assert token == 'A'
+                break
+
+        assert finalized == [True]
+        assert dto.closed is True
+
+    @pytest.mark.asyncio
+    async def test_scenario_cancelled_reader_closes_the_stream(self):
+        import asyncio
+
+        started = asyncio.Event()
+        finalized = []
+
+        async def generator():
+            try:
+                yield 'A'
+                started.set()
+                await asyncio.sleep(10)
+                yield 'B'
+            finally:
+                finalized.append(True)
+
+        dto = StreamingResponseDTO(generator())
+
+        async def read():
+            return [token async for token in dto]
+
+        task = asyncio.ensure_future(read())
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert finalized == [True]
+        assert dto.closed is True
@@ -3,7 +3,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from createagents.application import CreateAgent
-from createagents.domain import InvalidAgentConfigException
+from createagents.domain import (
+    ApproximateTokenCounter,
+    InvalidAgentConfigException,
+)
 
 
 @pytest.mark.unit
@@ -90,6 +93,21 @@ class TestCreateAgentInitialization:
         agent = controller._CreateAgent__agent
         assert agent.history.max_size == 10
 
+    def test_initialization_with_history_token_budget(self):
+        counter = ApproximateTokenCounter()
+        controller = CreateAgent(
+            provider='openai',
+            model='gpt-5',
+            history_max_size=None,
+            history_max_tokens=500,
+            token_counter=counter,
+        )
+
+        history = controller._CreateAgent__agent.history
+        assert history.max_size is None
+        assert history.max_tokens == 500
+        assert history.token_counter is counter
+
     def test_initialization_with_invalid_provider_raises_error(self):
         with pytest.raises(Exception):
             CreateAgent(
@@ -1668,3 +1686,612 @@ class TestCreateAgentGetAllAvailableTools:
 
         tools_again = controller.get_all_available_tools()
         assert 'fake_tool' not in tools_again
+
+
+def _responses_payload(text: str) -> dict:
+    return {
+        'id': 'resp_fake',
+        'object': 'response',
+        'created_at': 0,
+        'model': 'gpt-5-nano',
+        'status': 'completed',
+        'parallel_tool_calls': True,
+        'tool_choice': 'auto',
+        'tools': [],
+        'output': [
+            {
+                'type': 'message',
+                'id': 'msg_fake',
+                'status': 'completed',
+                'role': 'assistant',
+                'content': [
+                    {'type': 'output_text', 'text': text, 'annotations': []}
+                ],
+            }
+        ],
+    }
+
+
+@pytest.mark.unit
+class TestCreateAgentLifecycle:
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_aclose_releases_chat_use_case(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        mock_use_case = Mock()
+        mock_use_case.aclose = AsyncMock()
+        mock_create_chat.return_value = mock_use_case
+
+        controller = CreateAgent(
+            provider='ollama', model='gemma3:4b', name='Test'
+        )
+
+        await controller.aclose()
+
+        mock_use_case.aclose.assert_awaited_once()
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_warmup_delegates_to_chat_use_case(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        mock_use_case = Mock()
+        mock_use_case.warmup = AsyncMock()
+        mock_create_chat.return_value = mock_use_case
+
+        controller = CreateAgent(
+            provider='ollama', model='gemma3:4b', name='Test'
+        )
+        await controller.warmup()
+
+        mock_use_case.warmup.assert_awaited_once()
+        assert mock_use_case.warmup.await_args.args[0].model == 'gemma3:4b'
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    def test_preload_without_event_loop_warms_up_synchronously(
+        self, mock_create_chat
+    ):
+        from unittest.mock import AsyncMock
+
+        mock_use_case = Mock()
+        mock_use_case.warmup = AsyncMock()
+        mock_use_case.aclose = AsyncMock()
+        mock_create_chat.return_value = mock_use_case
+
+        CreateAgent(provider='ollama', model='gemma3:4b', preload=True)
+
+        mock_use_case.warmup.assert_awaited_once()
+        mock_use_case.aclose.assert_awaited_once()
+
+    def test_preload_without_event_loop_then_asyncio_run_chat(
+        self, fake_http_server
+    ):
+        import asyncio
+
+        from openai import AsyncOpenAI
+
+        from createagents.infra import ChatAdapterFactory
+
+        def handler(request):
+            if request['path'].endswith('/responses'):
+                return 200, {}, _responses_payload('Hello after preload')
+            return 200, {}, {'id': 'gpt-5-nano', 'object': 'model'}
+
+        fake_http_server.handler = handler
+        ChatAdapterFactory.clear_cache()
+        try:
+            with (
+                patch(
+                    'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_api_key',
+                    return_value='test-api-key',
+                ),
+                patch(
+                    'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client',
+                    side_effect=lambda api_key: AsyncOpenAI(
+                        api_key=api_key,
+                        base_url=f'{fake_http_server.url}/v1',
+                        max_retries=0,
+                    ),
+                ),
+            ):
+                agent = CreateAgent(
+                    provider='openai', model='gpt-5-nano', preload=True
+                )
+                response = asyncio.run(agent.chat('Hi'))
+        finally:
+            ChatAdapterFactory.clear_cache()
+
+        assert response == 'Hello after preload'
+        assert [r['path'] for r in fake_http_server.requests] == [
+            '/v1/models/gpt-5-nano',
+            '/v1/responses',
+        ]
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_preload_in_event_loop_completes_before_first_chat(
+        self, mock_create_chat
+    ):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from createagents.application import ChatOutputDTO
+
+        events = []
+
+        async def slow_warmup(agent):
+            await asyncio.sleep(0.01)
+            events.append('warmup')
+
+        async def execute(agent, input_dto):
+            events.append('chat')
+            return ChatOutputDTO(response='Hi')
+
+        mock_use_case = Mock()
+        mock_use_case.warmup = AsyncMock(side_effect=slow_warmup)
+        mock_use_case.execute = AsyncMock(side_effect=execute)
+        mock_create_chat.return_value = mock_use_case
+
+        controller = CreateAgent(
+            provider='ollama', model='gemma3:4b', preload=True
+        )
+        response = await controller.chat('Hello')
+
+        assert response == 'Hi'
+        assert events == ['warmup', 'chat']
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_preload_failure_does_not_break_chat(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        from createagents.application import ChatOutputDTO
+        from createagents.domain import ChatException
+
+        mock_use_case = Mock()
+        mock_use_case.warmup = AsyncMock(
+            side_effect=ChatException('Ollama is not running')
+        )
+        mock_use_case.execute = AsyncMock(
+            return_value=ChatOutputDTO(response='Hi')
+        )
+        mock_create_chat.return_value = mock_use_case
+
+        controller = CreateAgent(
+            provider='ollama', model='gemma3:4b', preload=True
+        )
+
+        assert await controller.chat('Hello') == 'Hi'
+
+
+@pytest.mark.unit
+class TestCreateAgentChatMany:
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_chat_many_returns_results_in_order(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        async def execute(agent, input_dto):
+            return Mock(response=input_dto.message.upper())
+
+        mock_use_case = Mock()
+        mock_use_case.execute = AsyncMock(side_effect=execute)
+        mock_use_case.get_metrics.return_value = []
+        mock_create_chat.return_value = mock_use_case
+
+        controller = CreateAgent(provider='openai', model='gpt-5')
+
+        batch = await controller.chat_many(['a', 'b', 'c'], concurrency=2)
+
+        assert batch.responses == ['A', 'B', 'C']
+        assert batch.failed == 0
+        assert controller.get_configs()['history'] == []
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_iter_chat_many_yields_every_item(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        mock_use_case = Mock()
+        mock_use_case.execute = AsyncMock(return_value=Mock(response='ok'))
+        mock_use_case.get_metrics.return_value = []
+        mock_create_chat.return_value = mock_use_case
+
+        controller = CreateAgent(provider='openai', model='gpt-5')
+
+        items = [item async for item in controller.iter_chat_many(['a', 'b'])]
+
+        assert sorted(item.index for item in items) == [0, 1]
+        assert all(item.response == 'ok' for item in items)
+
+
+@pytest.mark.unit
+class TestCreateAgentSemanticCache:
+    def test_semantic_cache_is_disabled_by_default(self):
+        controller = CreateAgent(provider='ollama', model='llama3')
+
+        assert controller.get_semantic_cache_stats() is None
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    def test_semantic_cache_instance_is_used(self, mock_create_chat):
+        pytest.importorskip('numpy')
+        from createagents.infra import OllamaEmbedder, SemanticCache
+
+        cache = SemanticCache(OllamaEmbedder())
+        controller = CreateAgent(
+            provider='ollama', model='llama3', semantic_cache=cache
+        )
+
+        assert mock_create_chat.call_args.kwargs['semantic_cache'] is cache
+        assert controller.get_semantic_cache_stats()['entries'] == 0
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_semantic_cache'
+    )
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    def test_semantic_cache_true_builds_default_cache(
+        self, mock_create_chat, mock_create_cache
+    ):
+        controller = CreateAgent(
+            provider='ollama', model='llama3', semantic_cache=True
+        )
+
+        mock_create_cache.assert_called_once_with()
+        assert (
+            mock_create_chat.call_args.kwargs['semantic_cache']
+            is mock_create_cache.return_value
+        )
+        assert (
+            controller.get_semantic_cache_stats()
+            is mock_create_cache.return_value.get_stats.return_value
+        )
+
+
+@pytest.mark.unit
+class TestCreateAgentTimeout:
+    @pytest.mark.parametrize('timeout', [0, -2, 'fast'])
+    def test_invalid_default_timeout_is_rejected(self, timeout):
+        with pytest.raises(ValueError, match="'timeout'"):
+            CreateAgent(provider='ollama', model='llama3', timeout=timeout)
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_chat_uses_agent_default_timeout(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        mock_use_case = Mock()
+        mock_use_case.execute = AsyncMock(return_value=Mock(response='ok'))
+        mock_create_chat.return_value = mock_use_case
+        controller = CreateAgent(provider='ollama', model='llama3', timeout=30)
+
+        await controller.chat('Hello')
+
+        assert mock_use_case.execute.call_args[0][1].timeout == 30
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_chat_timeout_overrides_default(self, mock_create_chat):
+        from unittest.mock import AsyncMock
+
+        mock_use_case = Mock()
+        mock_use_case.execute = AsyncMock(return_value=Mock(response='ok'))
+        mock_create_chat.return_value = mock_use_case
+        controller = CreateAgent(provider='ollama', model='llama3', timeout=30)
+
+        await controller.chat('Hello', timeout=2)
+
+        assert mock_use_case.execute.call_args[0][1].timeout == 2
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_many_use_case'
+    )
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    @pytest.mark.asyncio
+    async def test_chat_many_passes_timeout(
+        self, mock_create_chat, mock_create_many
+    ):
+        from unittest.mock import AsyncMock
+
+        mock_many = Mock()
+        mock_many.execute = AsyncMock(
+            return_value=Mock(succeeded=1, total=1, requests_per_second=1.0)
+        )
+        mock_create_many.return_value = mock_many
+        controller = CreateAgent(provider='ollama', model='llama3', timeout=30)
+
+        await controller.chat_many(['Hello'])
+
+        assert mock_many.execute.call_args[0][4] == 30
+
+
+@pytest.mark.unit
+class TestCreateAgentToolPool:
+    @pytest.mark.parametrize('tool_pool', ['', '  ', 3])
+    def test_invalid_tool_pool_is_rejected(self, tool_pool):
+        with pytest.raises(ValueError, match="'tool_pool'"):
+            CreateAgent(provider='ollama', model='llama3', tool_pool=tool_pool)
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    def test_tool_pool_is_passed_to_chat_use_case(self, mock_create_chat):
+        CreateAgent(provider='ollama', model='llama3', tool_pool='io')
+
+        assert mock_create_chat.call_args.kwargs['tool_pool'] == 'io'
+
+    def test_get_tool_pool_stats(self):
+        from createagents.domain import ToolPools
+
+        ToolPools.register('io', max_workers=2)
+        try:
+            stats = CreateAgent.get_tool_pool_stats()
+        finally:
+            ToolPools.shutdown()
+
+        assert stats['io']['max_workers'] == 2
+        assert stats['io']['queue_depth'] == 0
+
+
+@pytest.mark.unit
+class TestCreateAgentCompaction:
+    @pytest.mark.parametrize('threshold', [0, -1, 2.5, True])
+    def test_invalid_threshold_is_rejected(self, threshold):
+        with pytest.raises(ValueError, match="'compaction_threshold'"):
+            CreateAgent(
+                provider='ollama',
+                model='llama3',
+                compaction_model='qwen2.5:0.5b',
+                compaction_threshold=threshold,
+            )
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    def test_compaction_is_disabled_by_default(self, mock_create_chat):
+        CreateAgent(provider='ollama', model='llama3')
+
+        assert mock_create_chat.call_args.kwargs['compactor'] is None
+
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_history_compactor'
+    )
+    @patch(
+        'createagents.application.facade.client.AgentComposer.create_chat_use_case'
+    )
+    def test_compactor_uses_the_agent_provider_by_default(
+        self, mock_create_chat, mock_create_compactor
+    ):
+        CreateAgent(
+            provider='ollama',
+            model='llama3',
+            compaction_model='qwen2.5:0.5b',
+            compaction_threshold=2000,
+        )
+
+        mock_create_compactor.assert_called_once_with(
+            provider='ollama', model='qwen2.5:0.5b', threshold_tokens=2000
+        )
+        assert (
+            mock_create_chat.call_args.kwargs['compactor']
+            is mock_create_compactor.return_value
+        )
+
+    def test_compaction_stats(self):
+        agent = CreateAgent(
+            provider='ollama',
+            model='llama3',
+            compaction_model='qwen2.5:0.5b',
+            compaction_provider='ollama',
+        )
+
+        assert agent.get_compaction_stats() == {
+            'compactions': 0,
+            'failed': 0,
+            'stale': 0,
+            'in_progress': 0,
+        }
+
+
+@pytest.mark.unit
+class TestCreateAgentSessions:
+    @staticmethod
+    def _adapter():
+        from unittest.mock import AsyncMock
+
+        adapter = Mock()
+        adapter.chat = AsyncMock(return_value='Stored answer')
+        return adapter
+
+    @pytest.mark.parametrize('session_id', ['', 42])
+    def test_invalid_session_id_is_rejected(self, session_id):
+        with pytest.raises(ValueError, match="'session_id'"):
+            CreateAgent(
+                provider='ollama', model='llama3', session_id=session_id
+            )
+
+    @pytest.mark.parametrize('max_sessions', [0, -1, True])
+    def test_invalid_max_sessions_is_rejected(self, max_sessions):
+        with pytest.raises(ValueError, match='max_sessions'):
+            CreateAgent(
+                provider='ollama', model='llama3', max_sessions=max_sessions
+            )
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_the_agent_but_not_the_history(self):
+        adapter = self._adapter()
+        with patch(
+            'createagents.main.composers.agent_composer.'
+            'ChatAdapterFactory.create',
+            return_value=adapter,
+        ) as create_adapter:
+            agent = CreateAgent(provider='ollama', model='llama3')
+            await agent.chat('I am Ana', session_id='ana')
+            await agent.chat('I am Bruno', session_id='bruno')
+            await agent.chat('Who am I?', session_id='ana')
+
+        create_adapter.assert_called_once()
+        last_history = adapter.chat.call_args.kwargs['history']
+        assert [item['content'] for item in last_history] == [
+            'I am Ana',
+            'Stored answer',
+        ]
+        assert agent.get_configs()['history'] == []
+        assert len(agent.get_configs(session_id='bruno')['history']) == 2
+
+        agent.clear_history(session_id='ana')
+
+        assert agent.get_configs(session_id='ana')['history'] == []
+        assert len(agent.get_configs(session_id='bruno')['history']) == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_keeps_the_adapter_other_agents_share(self):
+        from unittest.mock import AsyncMock
+
+        adapter = self._adapter()
+        adapter.aclose = AsyncMock()
+        with patch(
+            'createagents.main.composers.agent_composer.'
+            'ChatAdapterFactory.create',
+            return_value=adapter,
+        ):
+            first = CreateAgent(provider='ollama', model='llama3')
+            second = CreateAgent(
+                provider='ollama',
+                model='llama3',
+                compaction_model='llama3',
+            )
+
+            await first.aclose()
+            adapter.aclose.assert_not_awaited()
+            await second.chat('Still connected?')
+
+            await second.aclose()
+
+        # The agent's and its compactor's holds were the last ones.
+        adapter.aclose.assert_awaited_once()
+
+    def test_preload_without_loop_keeps_a_shared_adapter_open(self):
+        from unittest.mock import AsyncMock
+
+        adapter = self._adapter()
+        adapter.warmup = AsyncMock()
+        adapter.aclose = AsyncMock()
+        with patch(
+            'createagents.main.composers.agent_composer.'
+            'ChatAdapterFactory.create',
+            return_value=adapter,
+        ):
+            CreateAgent(provider='ollama', model='llama3')
+            CreateAgent(provider='ollama', model='llama3', preload=True)
+
+        adapter.warmup.assert_awaited_once_with('llama3')
+        adapter.aclose.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_session_is_evicted(self, tmp_path):
+        from createagents.infra import JSONLSessionStore
+
+        adapter = self._adapter()
+        with patch(
+            'createagents.main.composers.agent_composer.'
+            'ChatAdapterFactory.create',
+            return_value=adapter,
+        ):
+            agent = CreateAgent(
+                provider='ollama',
+                model='llama3',
+                session_store=JSONLSessionStore(str(tmp_path)),
+                max_sessions=2,
+            )
+            for session_id in ('a', 'b', 'c'):
+                await agent.chat('Hello', session_id=session_id)
+            stats = agent.get_session_stats()
+            await agent.chat('Again', session_id='a')
+
+        assert stats['sessions'] == 2
+        assert stats['evicted_lru'] == 1
+        assert set(stats['per_session']) == {'b', 'c'}
+        assert stats['per_session']['b']['messages'] == 2
+        assert stats['per_session']['b']['bytes'] > 0
+        assert stats['messages'] == 4
+        # The evicted session is restored from the store.
+        assert len(adapter.chat.call_args.kwargs['history']) == 2
+        assert agent.get_session_stats()['restored'] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_is_persisted_and_restored(self, tmp_path):
+        from createagents.infra import SQLiteSessionStore
+
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+        adapter = self._adapter()
+        with patch(
+            'createagents.main.composers.agent_composer.'
+            'ChatAdapterFactory.create',
+            return_value=adapter,
+        ):
+            first = CreateAgent(
+                provider='ollama',
+                model='llama3',
+                session_id='user-1',
+                session_store=store,
+            )
+            await first.chat('Remember me')
+
+            restarted = CreateAgent(
+                provider='ollama',
+                model='llama3',
+                session_id='user-1',
+                session_store=store,
+            )
+            history = restarted.get_configs()['history']
+            await restarted.chat('Do you remember?')
+        store.close()
+
+        assert [item['content'] for item in history] == [
+            'Remember me',
+            'Stored answer',
+        ]
+        assert adapter.chat.call_args.kwargs['history'] == tuple(history)
+
+    def test_clear_history_deletes_the_session(self, tmp_path):
+        from createagents.domain import Message, MessageRole
+        from createagents.infra import JSONLSessionStore
+
+        store = JSONLSessionStore(str(tmp_path))
+        store.append('user-1', [Message(MessageRole.USER, 'Hello')])
+        agent = CreateAgent(
+            provider='ollama',
+            model='llama3',
+            session_id='user-1',
+            session_store=store,
+        )
+
+        agent.clear_history()
+
+        assert agent.get_configs()['history'] == []
+        assert store.session_ids() == []
@@ -135,3 +135,27 @@ class TestChatRepository:
         assert len(repo.last_call['tools']) == 1
         assert repo.last_call['history'] == [{'role': 'user', 'content': 'Hi'}]
         assert repo.last_call['user_ask'] == 'Hello'
+
+    @pytest.mark.asyncio
+    async def test_scenario_default_aclose_is_noop(self):
+        class ConcreteRepository(ChatRepository):
+            async def chat(
+                self, model, instructions, config, tools, history, user_ask
+            ):
+                return 'ok'
+
+        repo = ConcreteRepository()
+
+        assert await repo.aclose() is None
+
+    @pytest.mark.asyncio
+    async def test_scenario_default_warmup_is_noop(self):
+        class ConcreteRepository(ChatRepository):
+            async def chat(
+                self, model, instructions, config, tools, history, user_ask
+            ):
+                return 'ok'
+
+        repo = ConcreteRepository()
+
+        assert await repo.warmup('gpt-5-nano') is None
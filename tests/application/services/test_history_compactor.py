@@ -0,0 +1,182 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from createagents.application.services import HistoryCompactor
+from createagents.domain import History, MessageRole, TokenCounter
+
+
+class WordCounter(TokenCounter):
+    def count(self, text: str) -> int:
+        return len(text.split())
+
+
+def _history(turns: int) -> History:
+    """A history of `turns` user/assistant turns, 10 tokens per message."""
+    history = History(max_size=100, token_counter=WordCounter())
+    for turn in range(turns):
+        history.add_user_message(f'question {turn} ' + 'word ' * 8)
+        history.add_assistant_message(f'answer {turn} ' + 'word ' * 8)
+    return history
+
+
+def _repository(summary='The user asked several questions.'):
+    repository = Mock()
+    repository.chat = AsyncMock(return_value=summary)
+    repository.aclose = AsyncMock()
+    return repository
+
+
+@pytest.mark.unit
+class TestHistoryCompactor:
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {'threshold_tokens': 0},
+            {'threshold_tokens': 100, 'keep_recent_tokens': 100},
+            {'threshold_tokens': 100, 'keep_recent_tokens': -1},
+        ],
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            HistoryCompactor(_repository(), 'small', **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_history_under_threshold_is_left_alone(self):
+        repository = _repository()
+        compactor = HistoryCompactor(
+            repository, 'small', threshold_tokens=1000
+        )
+
+        assert compactor.schedule(_history(3)) is None
+        repository.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_older_turns_are_replaced_by_a_summary(self):
+        repository = _repository()
+        compactor = HistoryCompactor(
+            repository, 'small', threshold_tokens=100, keep_recent_tokens=40
+        )
+        history = _history(6)
+        recent = history.get_messages()[-4:]
+
+        await compactor.schedule(history)
+
+        messages = history.get_messages()
+        assert messages[0].role == MessageRole.SYSTEM
+        assert messages[0].content.endswith(
+            'The user asked several questions.'
+        )
+        assert messages[1:] == recent
+        assert history.total_tokens < 100
+        assert compactor.get_stats()['compactions'] == 1
+
+        call = repository.chat.call_args.kwargs
+        assert call['model'] == 'small'
+        assert call['history'] == ()
+        assert call['user_ask'].startswith('user: question 0')
+        assert 'question 3' in call['user_ask']
+        assert 'question 4' not in call['user_ask']
+
+    @pytest.mark.asyncio
+    async def test_latest_turn_is_always_kept(self):
+        compactor = HistoryCompactor(
+            _repository(), 'small', threshold_tokens=50, keep_recent_tokens=0
+        )
+        history = _history(4)
+        latest = history.get_messages()[-2:]
+
+        await compactor.schedule(history)
+
+        assert history.get_messages()[1:] == latest
+
+    @pytest.mark.asyncio
+    async def test_on_compacted_receives_the_stored_summary(self):
+        compactor = HistoryCompactor(
+            _repository(), 'small', threshold_tokens=50, keep_recent_tokens=0
+        )
+        history = _history(4)
+        on_compacted = AsyncMock()
+
+        await compactor.schedule(history, on_compacted)
+
+        on_compacted.assert_awaited_once()
+        summary = on_compacted.await_args.args[0]
+        assert summary is history.get_messages()[0]
+        assert summary.token_count is not None
+
+    @pytest.mark.asyncio
+    async def test_schedule_does_not_wait_for_the_summary(self):
+        release = asyncio.Event()
+
+        async def slow_chat(**kwargs):
+            await release.wait()
+            return 'summary'
+
+        repository = _repository()
+        repository.chat = AsyncMock(side_effect=slow_chat)
+        compactor = HistoryCompactor(repository, 'small', threshold_tokens=50)
+        history = _history(6)
+
+        task = compactor.schedule(history)
+        # A second turn while the first compaction runs starts nothing.
+        history.add_user_message('another question')
+        assert compactor.schedule(history) is None
+        assert compactor.get_stats()['in_progress'] == 1
+
+        release.set()
+        await compactor.wait()
+
+        assert task.done()
+        assert history.get_messages()[0].role == MessageRole.SYSTEM
+        assert history.get_messages()[-1].content == 'another question'
+
+    @pytest.mark.asyncio
+    async def test_summary_is_discarded_if_history_changed(self):
+        release = asyncio.Event()
+
+        async def slow_chat(**kwargs):
+            await release.wait()
+            return 'summary'
+
+        repository = _repository()
+        repository.chat = AsyncMock(side_effect=slow_chat)
+        compactor = HistoryCompactor(repository, 'small', threshold_tokens=50)
+        history = _history(6)
+
+        compactor.schedule(history)
+        history.clear()
+        release.set()
+        await compactor.wait()
+
+        assert len(history) == 0
+        assert compactor.get_stats()['stale'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_keeps_the_history(self):
+        repository = _repository()
+        repository.chat.side_effect = RuntimeError('model unavailable')
+        compactor = HistoryCompactor(repository, 'small', threshold_tokens=50)
+        history = _history(6)
+
+        await compactor.schedule(history)
+
+        assert len(history) == 12
+        assert compactor.get_stats()['failed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_compactions(self):
+        async def endless_chat(**kwargs):
+            await asyncio.sleep(10)
+
+        repository = _repository()
+        repository.chat = AsyncMock(side_effect=endless_chat)
+        compactor = HistoryCompactor(repository, 'small', threshold_tokens=50)
+
+        task = compactor.schedule(_history(6))
+        await asyncio.sleep(0)
+        await compactor.aclose()
+
+        assert task.cancelled()
+        repository.aclose.assert_awaited_once()
@@ -0,0 +1,213 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from createagents.application.services import SessionManager
+from createagents.domain import History, Message, MessageRole
+from createagents.infra import JSONLSessionStore
+
+MODULE = 'createagents.application.services.session_manager'
+
+
+def _turn(index: int):
+    return [
+        Message(MessageRole.USER, f'question {index}'),
+        Message(MessageRole.ASSISTANT, f'answer {index}'),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JSONLSessionStore(str(tmp_path))
+
+
+@pytest.mark.unit
+class TestSessionManager:
+    @pytest.mark.parametrize('ttl', [0, -1, True, 'soon'])
+    def test_rejects_invalid_idle_ttl(self, ttl):
+        with pytest.raises(ValueError):
+            SessionManager(History(), idle_ttl_s=ttl)
+
+    def test_new_session_uses_the_template_limits(self):
+        template = History(max_size=None, max_tokens=500)
+        manager = SessionManager(template)
+
+        history = manager.get('s1')
+
+        assert len(history) == 0
+        assert history is not template
+        assert history.max_tokens == 500
+        assert history.token_counter is template.token_counter
+        assert manager.get('s1') is history
+
+    @pytest.mark.asyncio
+    async def test_session_is_restored_lazily_within_limits(self, store):
+        for index in range(5):
+            store.append('s1', _turn(index))
+        manager = SessionManager(History(max_size=4), store)
+
+        history = await manager.aget('s1')
+
+        assert [m.content for m in history.get_messages()] == [
+            'question 3',
+            'answer 3',
+            'question 4',
+            'answer 4',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_record_appends_to_the_store(self, store):
+        manager = SessionManager(History(), store)
+
+        await manager.record('s1', _turn(1))
+        await manager.record('s1', _turn(2))
+
+        assert store.load('s1') == _turn(1) + _turn(2)
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_logged_not_raised(self):
+        store = Mock()
+        store.append.side_effect = OSError('disk full')
+        manager = SessionManager(History(), store)
+
+        await manager.record('s1', _turn(1))
+
+        store.append.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_restored_session_starts_at_the_summary(self, store):
+        manager = SessionManager(History(), store)
+        history = await manager.aget('s1')
+        for index in range(3):
+            await manager.record('s1', [history.add(m) for m in _turn(index)])
+        summary = Message(MessageRole.SYSTEM, 'summary', token_count=5)
+        history.replace_prefix(history.get_messages()[:4], summary)
+
+        await manager.record_summary('s1', history, summary)
+
+        restored = SessionManager(History(), store).get('s1')
+        assert restored.get_messages() == [summary] + _turn(2)
+
+    @pytest.mark.asyncio
+    async def test_summary_does_not_keep_unwritten_turns(self, store):
+        manager = SessionManager(History(), store)
+        history = await manager.aget('s1')
+        await manager.record('s1', [history.add(m) for m in _turn(0)])
+        await manager.record('s1', [history.add(m) for m in _turn(1)])
+        # Added to the history, but its write has not happened yet.
+        pending = [history.add(m) for m in _turn(2)]
+        summary = Message(MessageRole.SYSTEM, 'summary', token_count=5)
+        history.replace_prefix(history.get_messages()[:2], summary)
+
+        await manager.record_summary('s1', history, summary)
+        await manager.record('s1', pending)
+
+        restored = SessionManager(History(), store).get('s1')
+        assert restored.get_messages() == [summary] + _turn(1) + _turn(2)
+
+    @pytest.mark.asyncio
+    async def test_stale_summary_is_not_stored(self, store):
+        manager = SessionManager(History(), store)
+        history = await manager.aget('s1')
+        await manager.record('s1', [history.add(m) for m in _turn(0)])
+        summary = Message(MessageRole.SYSTEM, 'summary', token_count=5)
+
+        await manager.record_summary('s1', history, summary)
+
+        assert store.load('s1') == _turn(0)
+
+    def test_clear_empties_memory_and_store(self, store):
+        store.append('s1', _turn(1))
+        manager = SessionManager(History(), store)
+        history = manager.get('s1')
+
+        manager.clear('s1')
+
+        assert len(history) == 0
+        assert store.load('s1') == []
+
+    def test_idle_sessions_are_evicted_and_restored(self, store):
+        store.append('s1', _turn(1))
+        manager = SessionManager(History(), store, idle_ttl_s=60)
+        now = [1000.0]
+
+        with patch(f'{MODULE}.time.monotonic', side_effect=lambda: now[0]):
+            first = manager.get('s1')
+            manager.get('s2')
+            now[0] += 30
+            manager.get('s2')
+            now[0] += 45
+            evicted = manager.evict_idle()
+
+            assert evicted == 1
+            assert manager.session_ids() == ['s2']
+
+            restored = manager.get('s1')
+
+        assert restored is not first
+        assert restored.get_messages() == _turn(1)
+
+    def test_sessions_are_kept_without_idle_ttl(self):
+        manager = SessionManager(History())
+        manager.get('s1')
+
+        assert manager.evict_idle() == 0
+        assert manager.session_ids() == ['s1']
+
+    @pytest.mark.parametrize('max_sessions', [0, -1, True, 2.5])
+    def test_rejects_invalid_max_sessions(self, max_sessions):
+        with pytest.raises(ValueError):
+            SessionManager(History(), max_sessions=max_sessions)
+
+    def test_least_recently_used_session_is_evicted(self):
+        manager = SessionManager(History(), max_sessions=2)
+        manager.get('a')
+        manager.get('b')
+        manager.get('a')
+
+        manager.get('c')
+
+        assert manager.session_ids() == ['a', 'c']
+        assert manager.get_stats()['evicted_lru'] == 1
+
+    def test_idle_sweep_stops_at_the_first_recent_session(self):
+        manager = SessionManager(History(), idle_ttl_s=60)
+        now = [1000.0]
+
+        with patch(f'{MODULE}.time.monotonic', side_effect=lambda: now[0]):
+            manager.get('a')
+            now[0] += 50
+            manager.get('b')
+            now[0] += 20
+            assert manager.evict_idle() == 1
+
+        assert manager.session_ids() == ['b']
+        assert manager.get_stats()['evicted_idle'] == 1
+
+    def test_stats_report_memory_per_session(self, store):
+        store.append('s1', _turn(1))
+        manager = SessionManager(History(), store, idle_ttl_s=60)
+        manager.get('s1')
+        manager.get('s2').add_user_message('hi')
+
+        per_session = manager.get_session_stats()
+        stats = manager.get_stats()
+
+        assert per_session['s1']['messages'] == 2
+        assert per_session['s2']['messages'] == 1
+        assert per_session['s1']['tokens'] > per_session['s2']['tokens']
+        assert per_session['s1']['bytes'] > per_session['s2']['bytes'] > 0
+        assert per_session['s1']['idle_s'] >= 0
+        assert stats['sessions'] == 2
+        assert stats['restored'] == 1
+        assert stats['messages'] == 3
+        assert stats['idle_ttl_s'] == 60
+        assert stats['bytes'] == sum(
+            item['bytes'] for item in per_session.values()
+        )
+
+    def test_close_closes_the_store(self):
+        store = Mock()
+        SessionManager(History(), store).close()
+
+        store.close.assert_called_once()
@@ -0,0 +1,222 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+
+from createagents.application import (
+    ChatManyWithAgentUseCase,
+    ChatWithAgentUseCase,
+)
+from createagents.application.services import SessionManager
+from createagents.domain import Agent, History
+from createagents.infra import ChatMetrics
+from createagents.infra.adapters.Common import MetricsRecorder
+
+
+class FakeRepository:
+    """Answers with the upper-cased message after an optional delay."""
+
+    def __init__(self, delays=None, fail_on=()):
+        self.delays = delays or {}
+        self.fail_on = set(fail_on)
+        self.in_flight = 0
+        self.peak = 0
+        self.histories = []
+        self.metrics = []
+
+    async def chat(
+        self, model, instructions, config, tools, history, user_ask
+    ):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.histories.append(list(history))
+        try:
+            await asyncio.sleep(self.delays.get(user_ask, 0.01))
+            if user_ask in self.fail_on:
+                raise RuntimeError(f'failed {user_ask}')
+            MetricsRecorder(self.metrics).record(
+                ChatMetrics(model=model, latency_ms=1.0, tokens_used=5)
+            )
+            return user_ask.upper()
+        finally:
+            self.in_flight -= 1
+
+    def get_metrics(self):
+        return list(self.metrics)
+
+
+def _make(repository):
+    return ChatManyWithAgentUseCase(ChatWithAgentUseCase(repository))
+
+
+def _agent():
+    return Agent(provider='openai', model='gpt-5-nano', name='Batch')
+
+
+@pytest.mark.unit
+class TestChatManyWithAgentUseCase:
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        repository = FakeRepository(delays={'a': 0.05, 'b': 0.0})
+
+        output = await _make(repository).execute(
+            _agent(), ['a', 'b', 'c'], concurrency=3
+        )
+
+        assert output.responses == ['A', 'B', 'C']
+        assert [item.index for item in output.results] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        repository = FakeRepository()
+
+        await _make(repository).execute(
+            _agent(), [str(i) for i in range(10)], concurrency=3
+        )
+
+        assert repository.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_do_not_abort_the_batch(self):
+        repository = FakeRepository(fail_on={'b'})
+
+        output = await _make(repository).execute(
+            _agent(), ['a', 'b', 'c'], concurrency=2
+        )
+
+        assert output.succeeded == 2
+        assert output.failed == 1
+        assert output.results[1].response is None
+        assert 'failed b' in output.results[1].error
+
+    @pytest.mark.asyncio
+    async def test_isolated_history_leaves_agent_untouched(self):
+        repository = FakeRepository()
+        agent = _agent()
+        agent.add_user_message('earlier')
+        agent.add_assistant_message('reply')
+
+        await _make(repository).execute(agent, ['a', 'b'], concurrency=2)
+
+        assert len(agent.history) == 2
+        assert all(len(h) == 2 for h in repository.histories)
+
+    @pytest.mark.asyncio
+    async def test_shared_history_is_updated(self):
+        repository = FakeRepository()
+        agent = _agent()
+
+        await _make(repository).execute(
+            agent, ['a', 'b'], concurrency=1, isolated_history=False
+        )
+
+        assert len(agent.history) == 4
+        assert repository.histories[1][0]['content'] == 'a'
+
+    @pytest.mark.asyncio
+    async def test_session_history_is_copied_when_isolated(self):
+        repository = FakeRepository()
+        sessions = SessionManager(History())
+        session = sessions.get('s1')
+        session.add_user_message('earlier')
+        use_case = ChatManyWithAgentUseCase(
+            ChatWithAgentUseCase(repository, sessions=sessions)
+        )
+
+        await use_case.execute(
+            _agent(), ['a', 'b'], concurrency=2, session_id='s1'
+        )
+
+        assert len(session) == 1
+        assert all(h[0]['content'] == 'earlier' for h in repository.histories)
+
+    @pytest.mark.asyncio
+    async def test_shared_session_history_is_updated(self):
+        repository = FakeRepository()
+        sessions = SessionManager(History())
+        use_case = ChatManyWithAgentUseCase(
+            ChatWithAgentUseCase(repository, sessions=sessions)
+        )
+        agent = _agent()
+
+        await use_case.execute(
+            agent,
+            ['a', 'b'],
+            concurrency=1,
+            isolated_history=False,
+            session_id='s1',
+        )
+
+        assert len(sessions.get('s1')) == 4
+        assert len(agent.history) == 0
+
+    @pytest.mark.asyncio
+    async def test_reports_throughput_and_tokens(self):
+        repository = FakeRepository()
+
+        output = await _make(repository).execute(
+            _agent(), ['a', 'b'], concurrency=2
+        )
+
+        assert output.elapsed_ms > 0
+        assert output.requests_per_second > 0
+        assert output.tokens_used == 10
+        assert output.to_dict()['total'] == 2
+
+    @pytest.mark.asyncio
+    async def test_tokens_ignore_concurrent_chats_on_the_same_adapter(self):
+        repository = FakeRepository(delays={'a': 0.02, 'b': 0.02})
+        chat_use_case = ChatWithAgentUseCase(repository)
+        use_case = ChatManyWithAgentUseCase(chat_use_case)
+        outside = await asyncio.gather(
+            use_case.execute(_agent(), ['a', 'b'], concurrency=2),
+            repository.chat('m', None, None, None, [], 'outside'),
+        )
+
+        output = outside[0]
+        assert len(repository.get_metrics()) == 3
+        assert [item.tokens_used for item in output.results] == [5, 5]
+        assert output.tokens_used == 10
+
+    @pytest.mark.asyncio
+    async def test_iterate_yields_in_completion_order(self):
+        repository = FakeRepository(delays={'slow': 0.05, 'fast': 0.0})
+
+        items = [
+            item
+            async for item in _make(repository).iterate(
+                _agent(), ['slow', 'fast'], concurrency=2
+            )
+        ]
+
+        assert [item.message for item in items] == ['fast', 'slow']
+
+    @pytest.mark.asyncio
+    async def test_streaming_responses_are_collected(self):
+        async def stream():
+            yield 'Hel'
+            yield 'lo'
+
+        repository = Mock()
+        repository.chat = Mock(
+            side_effect=lambda **kwargs: _returning(stream())
+        )
+        repository.get_metrics = Mock(return_value=[])
+
+        output = await _make(repository).execute(
+            _agent(), ['x'], concurrency=1
+        )
+
+        assert output.responses == ['Hello']
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('concurrency', [0, -1, 1.5, True])
+    async def test_rejects_invalid_concurrency(self, concurrency):
+        with pytest.raises(ValueError):
+            await _make(FakeRepository()).execute(
+                _agent(), ['a'], concurrency=concurrency
+            )
+
+
+async def _returning(value):
+    return value
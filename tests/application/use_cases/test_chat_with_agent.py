@@ -2,7 +2,18 @@ import pytest
 from unittest.mock import AsyncMock, Mock
 
 from createagents.application import ChatInputDTO, ChatWithAgentUseCase
-from createagents.domain import Agent, ChatException
+from createagents.application.services import (
+    HistoryCompactor,
+    SessionManager,
+)
+from createagents.domain import (
+    Agent,
+    ChatException,
+    History,
+    Message,
+    MessageRole,
+)
+from createagents.infra import ConversationScope, JSONLSessionStore
 
 
 @pytest.fixture
@@ -79,7 +90,7 @@ class TestChatWithAgentUseCase:
             instructions='Instructions',
             config=None,
             user_ask='Test message',
-            history=[],
+            history=(),
             tools=None,
         )
 
@@ -100,11 +111,142 @@ class TestChatWithAgentUseCase:
         agent.add_user_message('Previous message')
         agent.add_assistant_message('Previous response')
         input_dto = ChatInputDTO(message='New message')
+        snapshot = agent.history.snapshot()
 
         await use_case.execute(agent, input_dto)
 
         call_args = mock_async_chat_repository.chat.call_args
         assert len(call_args.kwargs['history']) == 2
+        # The cached snapshot is passed as is, not rebuilt.
+        assert call_args.kwargs['history'] is snapshot
+
+    @pytest.mark.asyncio
+    async def test_execute_schedules_compaction_after_the_turn(
+        self, mock_async_chat_repository
+    ):
+        compactor = Mock()
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository, compactor=compactor
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano')
+
+        await use_case.execute(agent, ChatInputDTO(message='Hello'))
+
+        compactor.schedule.assert_called_once_with(agent.history, None)
+        assert len(agent.history) == 2
+        assert use_case.get_compaction_stats() is compactor.get_stats()
+
+    def test_compaction_stats_without_compactor(
+        self, mock_async_chat_repository
+    ):
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+
+        assert use_case.get_compaction_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_execute_continues_and_records_the_session(
+        self, mock_async_chat_repository, tmp_path
+    ):
+        store = JSONLSessionStore(str(tmp_path))
+        store.append(
+            's1',
+            [
+                Message(MessageRole.USER, 'Earlier question'),
+                Message(MessageRole.ASSISTANT, 'Earlier answer'),
+            ],
+        )
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository,
+            sessions=SessionManager(History(), store),
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano')
+
+        await use_case.execute(
+            agent, ChatInputDTO(message='Hello', session_id='s1')
+        )
+
+        call = mock_async_chat_repository.chat.call_args.kwargs
+        assert call['history'][0]['content'] == 'Earlier question'
+        assert len(agent.history) == 0
+        stored = store.load('s1')
+        assert [m.content for m in stored[2:]] == ['Hello', 'AI response']
+        assert stored[2].token_count is not None
+
+    @pytest.mark.asyncio
+    async def test_each_session_is_its_own_conversation(self, tmp_path):
+        conversations = []
+
+        async def chat(**kwargs):
+            conversations.append(ConversationScope.current())
+            return 'AI response'
+
+        repository = Mock()
+        repository.chat = AsyncMock(side_effect=chat)
+        sessions = SessionManager(History(), JSONLSessionStore(str(tmp_path)))
+        use_case = ChatWithAgentUseCase(
+            chat_repository=repository, sessions=sessions
+        )
+        other = ChatWithAgentUseCase(
+            chat_repository=repository, sessions=sessions
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano')
+
+        for session_id in ['s1', 's1', 's2', None]:
+            await use_case.execute(
+                agent, ChatInputDTO(message='Hello', session_id=session_id)
+            )
+        await other.execute(agent, ChatInputDTO(message='Hello'))
+
+        assert None not in conversations
+        assert conversations[0] == conversations[1]
+        assert len(set(conversations)) == 4
+        assert ConversationScope.current() is None
+
+    @pytest.mark.asyncio
+    async def test_session_compaction_is_persisted(
+        self, mock_async_chat_repository, tmp_path
+    ):
+        store = JSONLSessionStore(str(tmp_path))
+        summarizer = Mock()
+        summarizer.chat = AsyncMock(return_value='They said hello.')
+        compactor = HistoryCompactor(
+            summarizer, 'small', threshold_tokens=30, keep_recent_tokens=0
+        )
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository,
+            compactor=compactor,
+            sessions=SessionManager(History(), store),
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano')
+
+        for index in range(3):
+            await use_case.execute(
+                agent, ChatInputDTO(message=f'Hello {index}', session_id='s1')
+            )
+            await compactor.wait()
+
+        restored = SessionManager(History(), store).get('s1')
+        messages = restored.get_messages()
+        assert messages[0].role == MessageRole.SYSTEM
+        assert messages[0].content.endswith('They said hello.')
+        assert messages[-2].content == 'Hello 2'
+
+    @pytest.mark.asyncio
+    async def test_session_id_without_sessions_is_rejected(
+        self, mock_async_chat_repository
+    ):
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano')
+
+        with pytest.raises(ValueError, match='Sessions are not enabled'):
+            await use_case.execute(
+                agent, ChatInputDTO(message='Hello', session_id='s1')
+            )
+        mock_async_chat_repository.chat.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_with_empty_message_raises_error(
@@ -307,7 +449,7 @@ class TestChatWithAgentUseCase:
             instructions='Test',
             config=config,
             user_ask='Test message',
-            history=[],
+            history=(),
             tools=None,
         )
 
@@ -453,3 +595,174 @@ class TestChatWithAgentUseCase:
         assert len(agent.history) == 4
         messages = agent.history.get_messages()
         assert messages[0].content == 'Message 1'
+
+    @pytest.mark.asyncio
+    async def test_aclose_delegates_to_repository(
+        self, mock_async_chat_repository
+    ):
+        mock_async_chat_repository.aclose = AsyncMock()
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+
+        await use_case.aclose()
+
+        mock_async_chat_repository.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_delegates_to_repository_with_agent_model(
+        self, mock_async_chat_repository
+    ):
+        mock_async_chat_repository.warmup = AsyncMock()
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='ollama', model='gemma3:4b', name='Test')
+
+        await use_case.warmup(agent)
+
+        mock_async_chat_repository.warmup.assert_awaited_once_with('gemma3:4b')
+
+    @pytest.mark.asyncio
+    async def test_warmup_wraps_unexpected_errors(
+        self, mock_async_chat_repository
+    ):
+        mock_async_chat_repository.warmup = AsyncMock(
+            side_effect=RuntimeError('boom')
+        )
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='ollama', model='gemma3:4b', name='Test')
+
+        with pytest.raises(ChatException, match='boom'):
+            await use_case.warmup(agent)
+
+
+@pytest.mark.unit
+class TestChatWithAgentUseCaseDeadline:
+    @pytest.mark.asyncio
+    async def test_timeout_is_passed_as_deadline(
+        self, mock_async_chat_repository
+    ):
+        from createagents.domain import Deadline
+
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano', name='Test')
+
+        await use_case.execute(agent, ChatInputDTO(message='Hi', timeout=5))
+
+        deadline = mock_async_chat_repository.chat.call_args.kwargs['deadline']
+        assert isinstance(deadline, Deadline)
+        assert deadline.timeout_s == 5
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_without_timeout(
+        self, mock_async_chat_repository
+    ):
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano', name='Test')
+
+        await use_case.execute(agent, ChatInputDTO(message='Hi'))
+
+        assert (
+            'deadline' not in mock_async_chat_repository.chat.call_args.kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_tool_pool_is_passed_only_when_set(
+        self, mock_async_chat_repository
+    ):
+        agent = Agent(provider='openai', model='gpt-5-nano', name='Test')
+
+        await ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository, tool_pool='io'
+        ).execute(agent, ChatInputDTO(message='Hi'))
+        assert (
+            mock_async_chat_repository.chat.call_args.kwargs['tool_pool']
+            == 'io'
+        )
+
+        await ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        ).execute(agent, ChatInputDTO(message='Hi'))
+        assert (
+            'tool_pool' not in mock_async_chat_repository.chat.call_args.kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_timeout_propagates_and_leaves_history_untouched(
+        self, mock_async_chat_repository
+    ):
+        from createagents.domain import ChatTimeoutException
+
+        mock_async_chat_repository.chat.side_effect = ChatTimeoutException(1)
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano', name='Test')
+
+        with pytest.raises(ChatTimeoutException):
+            await use_case.execute(
+                agent, ChatInputDTO(message='Hi', timeout=1)
+            )
+
+        assert len(agent.history) == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_timeout_propagates_unwrapped(
+        self, mock_async_chat_repository
+    ):
+        from createagents.domain import ChatTimeoutException
+
+        async def stream():
+            yield 'Hel'
+            raise ChatTimeoutException(1, 'streaming')
+
+        mock_async_chat_repository.chat.return_value = stream()
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano', name='Test')
+
+        result = await use_case.execute(
+            agent, ChatInputDTO(message='Hi', timeout=1)
+        )
+        with pytest.raises(ChatTimeoutException):
+            async for _ in result:
+                pass
+
+        assert len(agent.history) == 0
+
+
+@pytest.mark.unit
+class TestChatWithAgentUseCaseCancellation:
+    @pytest.mark.asyncio
+    async def test_closed_stream_skips_history_and_closes_upstream(
+        self, mock_async_chat_repository
+    ):
+        closed = []
+
+        async def stream():
+            try:
+                yield 'Hel'
+                yield 'lo'
+            finally:
+                closed.append(True)
+
+        mock_async_chat_repository.chat.return_value = stream()
+        use_case = ChatWithAgentUseCase(
+            chat_repository=mock_async_chat_repository
+        )
+        agent = Agent(provider='openai', model='gpt-5-nano', name='Test')
+
+        result = await use_case.execute(agent, ChatInputDTO(message='Hi'))
+        assert await result.__anext__() == 'Hel'
+        await result.aclose()
+
+        assert closed == [True]
+        assert len(agent.history) == 0
@@ -121,3 +121,109 @@ def pytest_configure(config):
         config.addinivalue_line(
             'markers', f'{marker_name}: {marker_description}'
         )
+
+
+class FakeHTTPServer:
+    """A local HTTP server that replays scripted responses.
+
+    Responses are queued with `enqueue` and served in order; once the queue
+    is empty, `default_response` is served. A custom `handler` callable can
+    replace the queue entirely for stateful fakes. Every request is recorded
+    in `requests` as a dict with 'method', 'path', 'headers', 'body' and
+    'client_address' (which reveals whether connections are reused).
+    """
+
+    def __init__(self):
+        import threading
+        from collections import deque
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.requests = []
+        self.handler = None
+        self.default_response = (200, {}, {})
+        self._queue = deque()
+        self._lock = threading.Lock()
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _serve(self):
+                import json
+
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = raw.decode('utf-8', errors='replace')
+
+                request = {
+                    'method': self.command,
+                    'path': self.path,
+                    'headers': dict(self.headers),
+                    'body': body,
+                    'client_address': self.client_address,
+                }
+                status, headers, payload = fake._next_response(request)
+
+                if isinstance(payload, (dict, list)):
+                    data = json.dumps(payload).encode('utf-8')
+                    headers = {'Content-Type': 'application/json', **headers}
+                elif isinstance(payload, str):
+                    data = payload.encode('utf-8')
+                else:
+                    data = payload or b''
+
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, str(value))
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _serve
+            do_POST = _serve
+            do_DELETE = _serve
+
+            def log_message(self, format, *args):  # noqa: A002
+                return
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={'poll_interval': 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def enqueue(self, status=200, payload=None, headers=None):
+        with self._lock:
+            self._queue.append((status, headers or {}, payload or {}))
+
+    def _next_response(self, request):
+        with self._lock:
+            self.requests.append(request)
+            handler = self.handler
+            if handler is None:
+                if self._queue:
+                    return self._queue.popleft()
+                return self.default_response
+        return handler(request)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def fake_http_server():
+    """Start a local scripted HTTP server for failure-injection tests."""
+    server = FakeHTTPServer()
+    yield server
+    server.close()
@@ -604,3 +604,487 @@ class TestParallelExecution:
         assert results[1].success is False
         assert 'invalid json' in results[1].error.lower()
         assert results[2].success is True
+
+    @pytest.mark.asyncio
+    async def test_parallel_execution_respects_max_concurrency(
+        self, mock_logger
+    ):
+        """Test that no more than max_concurrency tools run at once."""
+        import asyncio
+
+        state = {'running': 0, 'peak': 0}
+
+        class TrackingTool(BaseTool):
+            name = 'tracking'
+            description = 'Tracks concurrent executions'
+
+            async def execute(self, id: str) -> str:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+                await asyncio.sleep(0.01)
+                state['running'] -= 1
+                return id
+
+        executor = ToolExecutor([TrackingTool()], mock_logger)
+        tool_calls = [
+            {'name': 'tracking', 'arguments': {'id': str(i)}} for i in range(6)
+        ]
+
+        results = await executor.execute_multiple_tools(
+            tool_calls, parallel=True, max_concurrency=2
+        )
+
+        assert state['peak'] == 2
+        assert [r.result for r in results] == [str(i) for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_parallel_execution_preserves_call_order(self, mock_logger):
+        """Test that results follow call order, not completion order."""
+        import asyncio
+
+        class DelayTool(BaseTool):
+            name = 'delay'
+            description = 'Sleeps for the given time'
+
+            async def execute(self, seconds: float) -> float:
+                await asyncio.sleep(seconds)
+                return seconds
+
+        executor = ToolExecutor([DelayTool()], mock_logger)
+        tool_calls = [
+            {'name': 'delay', 'arguments': {'seconds': 0.03}},
+            {'name': 'delay', 'arguments': {'seconds': 0.0}},
+            {'name': 'delay', 'arguments': {'seconds': 0.01}},
+        ]
+
+        results = await executor.execute_multiple_tools(
+            tool_calls, parallel=True
+        )
+
+        assert [r.result for r in results] == [0.03, 0.0, 0.01]
+
+    @pytest.mark.asyncio
+    async def test_parallel_invalid_json_errors_keep_their_tool_names(
+        self, mock_logger
+    ):
+        """Test that each invalid call reports its own name and arguments."""
+        executor = ToolExecutor([MockGreeterTool()], mock_logger)
+        tool_calls = [
+            {'name': 'first', 'arguments': '{bad'},
+            {'name': 'second', 'arguments': '{worse'},
+        ]
+
+        results = await executor.execute_multiple_tools(
+            tool_calls, parallel=True
+        )
+
+        assert [r.tool_name for r in results] == ['first', 'second']
+        assert '{bad' in results[0].error
+        assert '{worse' in results[1].error
+
+
+@pytest.mark.unit
+class TestToolDeclarations:
+    """Tests for the per-tool timeout and idempotent deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_execute_tool_times_out(self, mock_logger):
+        """Test that a call exceeding timeout_s returns a failure."""
+        import asyncio
+
+        class SlowTool(BaseTool):
+            name = 'slow'
+            description = 'Never finishes in time'
+            timeout_s = 0.01
+
+            async def execute(self) -> str:
+                await asyncio.sleep(1)
+                return 'done'
+
+        executor = ToolExecutor([SlowTool()], mock_logger)
+
+        result = await executor.execute_tool('slow')
+
+        assert result.success is False
+        assert 'timed out' in result.error
+
+    @pytest.mark.asyncio
+    async def test_timed_out_sync_tool_keeps_its_slot_until_it_returns(
+        self, mock_logger
+    ):
+        """Test that a serialized sync tool never runs twice at once."""
+        import asyncio
+        import threading
+
+        release = threading.Event()
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        class BlockingTool(BaseTool):
+            name = 'blocking'
+            description = 'Blocks until released'
+            parallel_safe = False
+            timeout_s = 0.05
+
+            def execute(self) -> str:
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                release.wait(2)
+                with lock:
+                    running[0] -= 1
+                return 'done'
+
+        executor = ToolExecutor([BlockingTool()], mock_logger)
+
+        first = await executor.execute_tool('blocking')
+        second = asyncio.ensure_future(executor.execute_tool('blocking'))
+        await asyncio.sleep(0.1)
+        assert running[0] == 1
+
+        release.set()
+        await second
+
+        assert 'timed out after 0.05s' in first.error
+        assert peak[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_raising_timeout_error_is_not_reported_as_timeout(
+        self, mock_logger
+    ):
+        """Test that a tool's own TimeoutError is an ordinary failure."""
+
+        class FlakyTool(BaseTool):
+            name = 'flaky'
+            description = 'Its backend times out'
+
+            def execute(self) -> str:
+                raise TimeoutError('backend did not answer')
+
+        executor = ToolExecutor([FlakyTool()], mock_logger)
+
+        result = await executor.execute_tool('flaky')
+
+        assert result.success is False
+        assert 'timed out after' not in result.error
+        assert 'backend did not answer' in result.error
+
+    @pytest.mark.asyncio
+    async def test_identical_idempotent_calls_run_once(self, mock_logger):
+        """Test that identical idempotent calls in a batch share a run."""
+        calls = []
+
+        class LookupTool(BaseTool):
+            name = 'lookup'
+            description = 'Looks up a key'
+            idempotent = True
+
+            def execute(self, key: str) -> str:
+                calls.append(key)
+                return key.upper()
+
+        executor = ToolExecutor([LookupTool()], mock_logger)
+        tool_calls = [
+            {'name': 'lookup', 'arguments': {'key': 'a'}},
+            {'name': 'lookup', 'arguments': '{"key": "a"}'},
+            {'name': 'lookup', 'arguments': {'key': 'b'}},
+        ]
+
+        results = await executor.execute_multiple_tools(
+            tool_calls, parallel=True
+        )
+
+        assert calls.count('a') == 1
+        assert [r.result for r in results] == ['A', 'A', 'B']
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_calls_are_not_deduplicated(
+        self, mock_logger
+    ):
+        """Test that identical calls run every time by default."""
+        calls = []
+
+        class CounterTool(BaseTool):
+            name = 'counter'
+            description = 'Counts invocations'
+
+            def execute(self) -> int:
+                calls.append(1)
+                return len(calls)
+
+        executor = ToolExecutor([CounterTool()], mock_logger)
+
+        await executor.execute_multiple_tools(
+            [{'name': 'counter'}, {'name': 'counter'}], parallel=True
+        )
+
+        assert len(calls) == 2
+
+
+@pytest.mark.unit
+class TestToolResultCaching:
+    """Tests for result memoization of cacheable tools."""
+
+    @staticmethod
+    def _make_tool(calls, **attributes):
+        class LookupTool(BaseTool):
+            name = 'lookup'
+            description = 'Looks up a key'
+            cacheable = True
+
+            def execute(self, key: str) -> str:
+                calls.append(key)
+                return key.upper()
+
+        for name, value in attributes.items():
+            setattr(LookupTool, name, value)
+        return LookupTool()
+
+    @pytest.mark.asyncio
+    async def test_cacheable_tool_is_executed_once(self, mock_logger):
+        """Test that a repeated call is served from the cache."""
+        from createagents.domain import ToolResultCache
+
+        calls = []
+        executor = ToolExecutor(
+            [self._make_tool(calls)], mock_logger, ToolResultCache()
+        )
+
+        first = await executor.execute_tool('lookup', key='a')
+        second = await executor.execute_tool('lookup', key='a')
+
+        assert calls == ['a']
+        assert first.result == second.result == 'A'
+        assert executor.get_cache_stats() == {'hits': 1, 'misses': 1}
+
+    @pytest.mark.asyncio
+    async def test_cache_is_shared_across_executors(self, mock_logger):
+        """Test that results survive across executors (turns)."""
+        from createagents.domain import ToolResultCache
+
+        calls = []
+        cache = ToolResultCache()
+        tool = self._make_tool(calls)
+
+        await ToolExecutor([tool], mock_logger, cache).execute_tool(
+            'lookup', key='a'
+        )
+        await ToolExecutor([tool], mock_logger, cache).execute_tool(
+            'lookup', key='a'
+        )
+
+        assert calls == ['a']
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_thread_executor(
+        self, mock_logger, monkeypatch
+    ):
+        """Test that a hit does not hop to the executor thread."""
+        import asyncio
+
+        from createagents.domain import ToolResultCache
+
+        cache = ToolResultCache()
+        tool = self._make_tool([])
+        executor = ToolExecutor([tool], mock_logger, cache)
+        await executor.execute_tool('lookup', key='a')
+
+        loop = asyncio.get_running_loop()
+
+        def fail(*args, **kwargs):
+            raise AssertionError('run_in_executor should not be called')
+
+        monkeypatch.setattr(loop, 'run_in_executor', fail)
+
+        result = await executor.execute_tool('lookup', key='a')
+
+        assert result.success is True
+        assert result.result == 'A'
+
+    @pytest.mark.asyncio
+    async def test_non_cacheable_tool_is_always_executed(self, mock_logger):
+        """Test that tools must opt in to caching."""
+        from createagents.domain import ToolResultCache
+
+        calls = []
+        executor = ToolExecutor(
+            [self._make_tool(calls, cacheable=False)],
+            mock_logger,
+            ToolResultCache(),
+        )
+
+        await executor.execute_tool('lookup', key='a')
+        await executor.execute_tool('lookup', key='a')
+
+        assert calls == ['a', 'a']
+        assert executor.get_cache_stats() == {'hits': 0, 'misses': 0}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, mock_logger):
+        """Test that a failed execution is retried on the next call."""
+        from createagents.domain import ToolResultCache
+
+        attempts = []
+
+        class FlakyTool(BaseTool):
+            name = 'flaky'
+            description = 'Fails on the first call'
+            cacheable = True
+
+            def execute(self) -> str:
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise RuntimeError('boom')
+                return 'ok'
+
+        executor = ToolExecutor([FlakyTool()], mock_logger, ToolResultCache())
+
+        first = await executor.execute_tool('flaky')
+        second = await executor.execute_tool('flaky')
+
+        assert first.success is False
+        assert second.result == 'ok'
+
+
+@pytest.mark.unit
+class TestToolExecutorDeadline:
+    """Tests for the chat deadline shared by tool executions."""
+
+    @pytest.mark.asyncio
+    async def test_tool_finishing_in_time_succeeds(self, mock_logger):
+        from createagents.domain import Deadline
+
+        executor = ToolExecutor(
+            [MockCalculatorTool()], mock_logger, deadline=Deadline(5)
+        )
+
+        result = await executor.execute_tool('calculator', expression='2+2')
+
+        assert result.success is True
+        assert result.result == 'Result: 4'
+
+    @pytest.mark.asyncio
+    async def test_deadline_aborts_the_chat_instead_of_failing_the_tool(
+        self, mock_logger
+    ):
+        """A spent deadline is not reported back to the model as a tool
+        error: the whole chat call fails with ChatTimeoutException."""
+        import asyncio
+
+        from createagents.domain import ChatTimeoutException, Deadline
+
+        class SlowTool(BaseTool):
+            name = 'slow'
+            description = 'Takes longer than the chat budget'
+            timeout_s = 10
+
+            async def execute(self) -> str:
+                await asyncio.sleep(1)
+                return 'done'
+
+        executor = ToolExecutor(
+            [SlowTool()], mock_logger, deadline=Deadline(0.02)
+        )
+
+        with pytest.raises(ChatTimeoutException) as exc_info:
+            await executor.execute_tool('slow')
+
+        assert "running tool 'slow'" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_shorter_than_deadline_still_fails_tool(
+        self, mock_logger
+    ):
+        import asyncio
+
+        from createagents.domain import Deadline
+
+        class SlowTool(BaseTool):
+            name = 'slow'
+            description = 'Exceeds its own timeout'
+            timeout_s = 0.01
+
+            async def execute(self) -> str:
+                await asyncio.sleep(1)
+                return 'done'
+
+        executor = ToolExecutor(
+            [SlowTool()], mock_logger, deadline=Deadline(5)
+        )
+
+        result = await executor.execute_tool('slow')
+
+        assert result.success is False
+        assert 'timed out' in result.error
+
+
+@pytest.mark.unit
+class TestToolExecutorPools:
+    """Tests for running synchronous tools on named tool pools."""
+
+    @pytest.fixture(autouse=True)
+    def reset_pools(self):
+        from createagents.domain import ToolPools
+
+        yield
+        ToolPools.shutdown()
+
+    @staticmethod
+    def _thread_tool(pool=None):
+        import threading
+
+        class ThreadNameTool(BaseTool):
+            name = 'thread_name'
+            description = 'Returns the name of its thread'
+
+            def execute(self) -> str:
+                return threading.current_thread().name
+
+        ThreadNameTool.pool = pool
+        return ThreadNameTool()
+
+    @pytest.mark.asyncio
+    async def test_tool_runs_on_its_own_pool(self, mock_logger):
+        from createagents.domain import ToolPools
+
+        ToolPools.register('io', max_workers=1)
+        executor = ToolExecutor(
+            [self._thread_tool('io')], mock_logger, default_pool='other'
+        )
+
+        result = await executor.execute_tool('thread_name')
+
+        assert result.result.startswith('tool-pool-io')
+        assert ToolPools.get('io').get_stats()['completed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_default_pool_is_used(self, mock_logger):
+        from createagents.domain import ToolPools
+
+        ToolPools.register('agent', max_workers=1)
+        executor = ToolExecutor(
+            [self._thread_tool()], mock_logger, default_pool='agent'
+        )
+
+        result = await executor.execute_tool('thread_name')
+
+        assert result.result.startswith('tool-pool-agent')
+
+    @pytest.mark.asyncio
+    async def test_without_pool_uses_loop_default_executor(self, mock_logger):
+        executor = ToolExecutor([self._thread_tool()], mock_logger)
+
+        result = await executor.execute_tool('thread_name')
+
+        assert result.success is True
+        assert not result.result.startswith('tool-pool-')
+
+    @pytest.mark.asyncio
+    async def test_unknown_pool_fails_the_tool(self, mock_logger):
+        executor = ToolExecutor([self._thread_tool('missing')], mock_logger)
+
+        result = await executor.execute_tool('thread_name')
+
+        assert result.success is False
+        assert "'missing' is not registered" in result.error
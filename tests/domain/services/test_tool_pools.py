@@ -0,0 +1,243 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from createagents.domain import BaseTool, ToolPool, ToolPools
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def _fail() -> None:
+    raise ValueError('boom')
+
+
+_PARENT_STATE = {'changed': False}
+
+
+def _sees_parent_state() -> bool:
+    return _PARENT_STATE['changed']
+
+
+class PidTool(BaseTool):
+    name = 'pid'
+    description = 'Returns the id of the process it runs in'
+
+    def execute(self, offset: int = 0) -> int:
+        return os.getpid() + offset
+
+
+@pytest.fixture(autouse=True)
+def reset_pools():
+    yield
+    ToolPools.shutdown()
+
+
+@pytest.mark.unit
+class TestToolPool:
+    @pytest.mark.parametrize('kwargs', [{'kind': 'fiber'}, {'max_workers': 0}])
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            ToolPool('bad', **kwargs)
+
+    def test_max_workers_defaults_to_cpu_count(self):
+        pool = ToolPool('default')
+        try:
+            assert pool.max_workers == (os.cpu_count() or 1)
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_runs_off_the_loop(self):
+        pool = ToolPool('io', max_workers=2)
+        try:
+            name = await pool.run(lambda: threading.current_thread().name)
+        finally:
+            pool.shutdown()
+
+        assert name.startswith('tool-pool-io')
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_in_another_process(self):
+        pool = ToolPool('cpu', kind='process', max_workers=1, warm=True)
+        try:
+            worker_pid = await pool.run(_pid)
+            tool_result = await pool.run(PidTool().execute, offset=1)
+        finally:
+            pool.shutdown()
+
+        assert worker_pid != os.getpid()
+        assert tool_result == worker_pid + 1
+
+    @pytest.mark.asyncio
+    async def test_process_workers_are_not_forked(self, monkeypatch):
+        # A forked worker would inherit the parent's memory as it is now.
+        monkeypatch.setitem(_PARENT_STATE, 'changed', True)
+        pool = ToolPool('cpu', kind='process', max_workers=1)
+        try:
+            inherited = await pool.run(_sees_parent_state)
+        finally:
+            pool.shutdown()
+
+        assert inherited is False
+
+    @pytest.mark.asyncio
+    async def test_errors_are_raised_and_counted(self):
+        pool = ToolPool('io', max_workers=1)
+        try:
+            with pytest.raises(ValueError, match='boom'):
+                await pool.run(_fail)
+            stats = pool.get_stats()
+        finally:
+            pool.shutdown()
+
+        assert stats['completed'] == 1
+        assert stats['failed'] == 1
+        assert stats['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_track_queue_depth_and_wait_time(self):
+        pool = ToolPool('io', max_workers=1)
+        assert pool.get_stats()['avg_wait_ms'] is None
+
+        try:
+            calls = [
+                asyncio.ensure_future(pool.run(time.sleep, 0.05))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            busy = pool.get_stats()
+            await asyncio.gather(*calls)
+            done = pool.get_stats()
+        finally:
+            pool.shutdown()
+
+        assert busy['in_flight'] == 3
+        assert busy['queue_depth'] == 2
+        assert done['max_queue_depth'] == 2
+        assert done['submitted'] == done['completed'] == 3
+        assert done['queue_depth'] == 0
+        # The last call waited for the two before it.
+        assert done['max_wait_ms'] >= 80
+        assert 0 < done['avg_wait_ms'] < done['max_wait_ms']
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_is_counted(self):
+        pool = ToolPool('io', max_workers=1)
+        try:
+            running = asyncio.ensure_future(pool.run(time.sleep, 0.05))
+            queued = asyncio.ensure_future(pool.run(time.sleep, 0.05))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await running
+            stats = pool.get_stats()
+        finally:
+            pool.shutdown()
+
+        assert stats['cancelled'] == 1
+        assert stats['completed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_queued_calls(self):
+        pool = ToolPool('io', max_workers=1)
+        running = asyncio.ensure_future(pool.run(time.sleep, 0.05))
+        queued = asyncio.ensure_future(pool.run(time.sleep, 0.05))
+        await asyncio.sleep(0.01)
+
+        pool.shutdown(wait=False)
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(queued, timeout=1)
+        await running
+        assert pool.get_stats()['cancelled'] == 1
+
+    def test_shutdown_cancels_queued_submitted_futures(self):
+        pool = ToolPool('io', max_workers=1)
+        running = pool.submit(time.sleep, 0.05)
+        queued = pool.submit(time.sleep, 0.05)
+
+        pool.shutdown(wait=False)
+
+        running.result(timeout=1)
+        assert queued.cancelled()
+
+    def test_running_call_cannot_be_cancelled(self):
+        pool = ToolPool('io', max_workers=1)
+        try:
+            started = threading.Event()
+            running = pool.submit(lambda: started.set() or time.sleep(0.05))
+            queued = pool.submit(time.sleep, 0.05)
+            started.wait(1)
+
+            assert running.cancel() is False
+            assert queued.cancel() is True
+            assert running.result(timeout=1) is None
+            assert queued.cancelled()
+        finally:
+            pool.shutdown()
+
+    def test_submit_returns_future_for_sync_callers(self):
+        pool = ToolPool('io', max_workers=1)
+        try:
+            ok = pool.submit(pow, 2, 10)
+            failed = pool.submit(_fail)
+
+            assert ok.result(timeout=1) == 1024
+            with pytest.raises(ValueError, match='boom'):
+                failed.result(timeout=1)
+            stats = pool.get_stats()
+        finally:
+            pool.shutdown()
+
+        assert stats['submitted'] == stats['completed'] == 2
+        assert stats['failed'] == 1
+
+
+@pytest.mark.unit
+class TestToolPools:
+    def test_register_and_get(self):
+        pool = ToolPools.register('io', max_workers=2)
+
+        assert ToolPools.get('io') is pool
+        assert pool.kind == 'thread'
+        assert pool.max_workers == 2
+
+    def test_get_unknown_pool_raises(self):
+        with pytest.raises(ValueError, match="'missing' is not registered"):
+            ToolPools.get('missing')
+
+    def test_register_rejects_empty_name(self):
+        with pytest.raises(ValueError):
+            ToolPools.register('')
+
+    @pytest.mark.asyncio
+    async def test_register_replaces_pool_with_same_name(self):
+        first = ToolPools.register('io', max_workers=1)
+        second = ToolPools.register('io', max_workers=3)
+
+        assert ToolPools.get('io') is second
+        with pytest.raises(RuntimeError):
+            await first.run(_pid)
+
+    def test_get_stats_is_keyed_by_name(self):
+        ToolPools.register('io', max_workers=2)
+        ToolPools.register('cpu', kind='process', max_workers=1)
+
+        stats = ToolPools.get_stats()
+
+        assert set(stats) == {'io', 'cpu'}
+        assert stats['cpu']['kind'] == 'process'
+        assert stats['io']['max_workers'] == 2
+
+    def test_shutdown_unregisters_pools(self):
+        ToolPools.register('io', max_workers=1)
+
+        ToolPools.shutdown()
+
+        assert ToolPools.get_stats() == {}
@@ -0,0 +1,157 @@
+import time
+
+import pytest
+
+from createagents.domain import BaseTool, ToolResultCache
+
+
+class EchoTool(BaseTool):
+    name = 'echo'
+    description = 'Echoes its input'
+    cacheable = True
+
+    def execute(self, text: str) -> str:
+        return text
+
+
+class ShortLivedTool(EchoTool):
+    name = 'short_lived'
+    cache_ttl_s = 0.01
+
+
+@pytest.mark.unit
+class TestToolResultCache:
+    def test_get_returns_stored_result(self):
+        cache = ToolResultCache()
+        tool = EchoTool()
+        cache.set(tool, {'text': 'a'}, 'A')
+
+        assert cache.get(tool, {'text': 'a'}) == (True, 'A')
+
+    def test_instances_do_not_share_results_by_default(self):
+        cache = ToolResultCache()
+        cache.set(EchoTool(), {'text': 'a'}, 'A')
+
+        assert cache.get(EchoTool(), {'text': 'a'}) == (False, None)
+
+    def test_instances_with_equal_scope_share_results(self):
+        class ConfiguredTool(EchoTool):
+            def __init__(self, base_dir):
+                self.base_dir = base_dir
+
+            def cache_scope(self):
+                return self.base_dir
+
+        cache = ToolResultCache()
+        cache.set(ConfiguredTool('/a'), {'text': 'x'}, 'A')
+
+        assert cache.get(ConfiguredTool('/a'), {'text': 'x'}) == (True, 'A')
+        assert cache.get(ConfiguredTool('/b'), {'text': 'x'}) == (False, None)
+
+    def test_changed_version_misses(self):
+        class VersionedTool(EchoTool):
+            version = 1
+
+            def cache_scope(self):
+                return None
+
+            def cache_version(self, arguments):
+                return self.version
+
+        cache = ToolResultCache()
+        tool = VersionedTool()
+        cache.set(tool, {'text': 'a'}, 'A')
+        assert cache.get(tool, {'text': 'a'}) == (True, 'A')
+
+        tool.version = 2
+
+        assert cache.get(tool, {'text': 'a'}) == (False, None)
+
+    def test_results_rejected_by_tool_are_not_stored(self):
+        class FailingTool(EchoTool):
+            def is_cacheable_result(self, result):
+                return not result.startswith('[Error]')
+
+        cache = ToolResultCache()
+        tool = FailingTool()
+        cache.set(tool, {'text': 'a'}, '[Error] not found')
+
+        assert len(cache) == 0
+
+    def test_arguments_are_canonicalized(self):
+        cache = ToolResultCache()
+        tool = EchoTool()
+        cache.set(tool, {'a': 1, 'b': 2}, 'x')
+
+        hit, _ = cache.get(tool, {'b': 2, 'a': 1})
+
+        assert hit is True
+
+    def test_different_arguments_miss(self):
+        cache = ToolResultCache()
+        cache.set(EchoTool(), {'text': 'a'}, 'A')
+
+        assert cache.get(EchoTool(), {'text': 'b'}) == (False, None)
+
+    def test_entries_expire_after_ttl(self):
+        cache = ToolResultCache()
+        tool = ShortLivedTool()
+        cache.set(tool, {'text': 'a'}, 'A')
+
+        time.sleep(0.02)
+
+        assert cache.get(tool, {'text': 'a'}) == (False, None)
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ToolResultCache(max_bytes=500)
+        tool = EchoTool()
+        cache.set(tool, {'text': 'a'}, 'a' * 100)
+        cache.set(tool, {'text': 'b'}, 'b' * 100)
+        cache.get(tool, {'text': 'a'})
+
+        cache.set(tool, {'text': 'c'}, 'c' * 100)
+
+        assert cache.get(tool, {'text': 'a'})[0] is True
+        assert cache.get(tool, {'text': 'b'})[0] is False
+        assert cache.get_stats()['size_bytes'] <= 500
+
+    def test_result_larger_than_budget_is_not_stored(self):
+        cache = ToolResultCache(max_bytes=100)
+
+        cache.set(EchoTool(), {'text': 'a'}, 'a' * 1000)
+
+        assert len(cache) == 0
+
+    def test_unserializable_arguments_are_not_cached(self):
+        cache = ToolResultCache()
+
+        cache.set(EchoTool(), {'text': object()}, 'A')
+
+        assert len(cache) == 0
+
+    def test_stats_count_hits_and_misses(self):
+        cache = ToolResultCache()
+        tool = EchoTool()
+        cache.get(tool, {'text': 'a'})
+        cache.set(tool, {'text': 'a'}, 'A')
+        cache.get(tool, {'text': 'a'})
+
+        stats = cache.get_stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+
+    def test_configure_replaces_shared_cache(self):
+        shared = ToolResultCache.get_shared()
+
+        ToolResultCache.configure(1024)
+
+        assert ToolResultCache.get_shared() is not shared
+        assert ToolResultCache.get_shared() is ToolResultCache.get_shared()
+
+    @pytest.mark.parametrize('max_bytes', [0, -1])
+    def test_rejects_non_positive_budget(self, max_bytes):
+        with pytest.raises(ValueError):
+            ToolResultCache(max_bytes)
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from createagents.domain import BaseTool, ToolScheduler
+
+
+def _make_tracking_tool(state, **attributes):
+    class TrackingTool(BaseTool):
+        name = 'tracking'
+        description = 'Tracks concurrent executions'
+
+        async def execute(self) -> None:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+            await asyncio.sleep(0.01)
+            state['running'] -= 1
+
+    for key, value in attributes.items():
+        setattr(TrackingTool, key, value)
+    return TrackingTool()
+
+
+async def _run(tool, count):
+    async def call():
+        async with ToolScheduler.slot(tool):
+            await tool.execute()
+
+    await asyncio.gather(*(call() for _ in range(count)))
+
+
+@pytest.fixture(autouse=True)
+def reset_scheduler():
+    yield
+    ToolScheduler.configure(ToolScheduler.DEFAULT_GLOBAL_LIMIT)
+
+
+@pytest.mark.unit
+class TestToolScheduler:
+    def test_get_tool_limit(self):
+        state = {'running': 0, 'peak': 0}
+
+        assert ToolScheduler.get_tool_limit(_make_tracking_tool(state)) is None
+        assert (
+            ToolScheduler.get_tool_limit(
+                _make_tracking_tool(state, parallel_safe=False)
+            )
+            == 1
+        )
+        assert (
+            ToolScheduler.get_tool_limit(
+                _make_tracking_tool(state, max_concurrency=3)
+            )
+            == 3
+        )
+
+    @pytest.mark.asyncio
+    async def test_unsafe_tool_is_serialized(self):
+        state = {'running': 0, 'peak': 0}
+        tool = _make_tracking_tool(state, parallel_safe=False)
+
+        await _run(tool, 4)
+
+        assert state['peak'] == 1
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_is_respected(self):
+        state = {'running': 0, 'peak': 0}
+        tool = _make_tracking_tool(state, max_concurrency=2)
+
+        await _run(tool, 6)
+
+        assert state['peak'] == 2
+
+    @pytest.mark.asyncio
+    async def test_global_limit_caps_all_tools(self):
+        ToolScheduler.configure(3)
+        state = {'running': 0, 'peak': 0}
+        tool = _make_tracking_tool(state)
+
+        await _run(tool, 8)
+
+        assert state['peak'] == 3
+        assert ToolScheduler.get_global_limit() == 3
+
+    @pytest.mark.asyncio
+    async def test_in_flight_is_tracked(self):
+        tool = _make_tracking_tool({'running': 0, 'peak': 0})
+
+        async with ToolScheduler.slot(tool):
+            assert ToolScheduler.get_in_flight() == 1
+
+        assert ToolScheduler.get_in_flight() == 0
+
+    def test_slots_work_across_event_loops(self):
+        state = {'running': 0, 'peak': 0}
+        tool = _make_tracking_tool(state, parallel_safe=False)
+
+        asyncio.run(_run(tool, 2))
+        asyncio.run(_run(tool, 2))
+
+        assert state['peak'] == 1
+
+    @pytest.mark.parametrize('limit', [0, -1])
+    def test_configure_rejects_non_positive_limit(self, limit):
+        with pytest.raises(ValueError):
+            ToolScheduler.configure(limit)
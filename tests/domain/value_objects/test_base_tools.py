@@ -487,3 +487,14 @@ class TestToolEdgeCases:
         assert tool1 is not tool2
         assert tool1.name == tool2.name
         assert tool1.get_schema() == tool2.get_schema()
+
+
+@pytest.mark.unit
+class TestBaseToolConcurrencyDefaults:
+    def test_default_declarations(self):
+        tool = MinimalTestTool()
+
+        assert tool.parallel_safe is True
+        assert tool.idempotent is False
+        assert tool.max_concurrency is None
+        assert tool.timeout_s is None
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from createagents.domain import ChatTimeoutException, Deadline
+
+
+async def _numbers(count: int, delay: float):
+    for number in range(count):
+        await asyncio.sleep(delay)
+        yield number
+
+
+@pytest.mark.unit
+class TestDeadline:
+    @pytest.mark.parametrize('timeout', [0, -1, 'soon', None])
+    def test_rejects_invalid_timeout(self, timeout):
+        with pytest.raises(ValueError):
+            Deadline(timeout)
+
+    def test_after_returns_none_without_timeout(self):
+        assert Deadline.after(None) is None
+        assert isinstance(Deadline.after(5), Deadline)
+
+    def test_remaining_is_bounded_by_timeout(self):
+        deadline = Deadline(10)
+
+        assert 0 < deadline.remaining() <= 10
+        assert deadline.expired is False
+
+    def test_bound_caps_step_timeout(self):
+        deadline = Deadline(10)
+
+        assert deadline.bound(1) == 1
+        assert 9 < deadline.bound(60) <= 10
+        assert 9 < deadline.bound(None) <= 10
+
+    @pytest.mark.asyncio
+    async def test_check_raises_once_expired(self):
+        deadline = Deadline(0.01)
+        await asyncio.sleep(0.02)
+
+        assert deadline.expired is True
+        assert deadline.remaining() == 0.0
+        with pytest.raises(ChatTimeoutException) as exc_info:
+            deadline.check('calling the model')
+
+        assert exc_info.value.timeout_s == 0.01
+        assert exc_info.value.stage == 'calling the model'
+        assert 'while calling the model' in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_within_budget(self):
+        deadline = Deadline(1)
+
+        assert await deadline.run(asyncio.sleep(0, result=42), 'step') == 42
+
+    @pytest.mark.asyncio
+    async def test_run_cancels_step_when_budget_runs_out(self):
+        cancelled = asyncio.Event()
+
+        async def step():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(ChatTimeoutException):
+            await Deadline(0.02).run(step(), 'slow step')
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_run_keeps_step_own_timeout_error(self):
+        async def step():
+            raise asyncio.TimeoutError()
+
+        with pytest.raises(asyncio.TimeoutError) as exc_info:
+            await Deadline(1).run(step(), 'step')
+
+        assert not isinstance(exc_info.value, ChatTimeoutException)
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_start_step_after_expiry(self):
+        started = False
+
+        async def step():
+            nonlocal started
+            started = True
+
+        deadline = Deadline(0.01)
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(ChatTimeoutException):
+            await deadline.run(step(), 'step')
+
+        assert started is False
+
+    @pytest.mark.asyncio
+    async def test_iterate_yields_items_within_budget(self):
+        deadline = Deadline(1)
+
+        items = [n async for n in deadline.iterate(_numbers(3, 0), 'read')]
+
+        assert items == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_iterate_closes_stream_when_budget_runs_out(self):
+        stream = _numbers(100, 0.01)
+        items = []
+
+        with pytest.raises(ChatTimeoutException):
+            async for item in Deadline(0.05).iterate(stream, 'read'):
+                items.append(item)
+
+        assert 0 < len(items) < 100
+        assert stream.ag_running is False
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_iterate_closes_stream_when_closed_early(self):
+        stream = _numbers(10, 0)
+        iterator = Deadline(1).iterate(stream, 'read')
+
+        assert await iterator.__anext__() == 0
+        await iterator.aclose()
+
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
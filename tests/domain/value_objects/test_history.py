@@ -1,6 +1,15 @@
+from unittest.mock import Mock
+
 import pytest
 
-from createagents.domain import History, Message, MessageRole
+from createagents.domain import (
+    ApproximateTokenCounter,
+    History,
+    Message,
+    MessageRole,
+    TokenCounter,
+)
+from createagents.domain.value_objects.history import MESSAGE_OVERHEAD_TOKENS
 
 
 @pytest.mark.unit
@@ -631,3 +640,258 @@ class TestHistoryConcurrency:
             assert isinstance(msg, Message)
             assert msg.content is not None
             assert len(msg.content) > 0
+
+
+class WordCounter(TokenCounter):
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+@pytest.mark.unit
+class TestHistoryTokenBudget:
+    def test_default_counter_estimates_four_chars_per_token(self):
+        counter = ApproximateTokenCounter()
+
+        assert counter.count('') == 0
+        assert counter.count('abcd') == 1
+        assert counter.count('abcde') == 2
+
+    def test_messages_are_counted_once_when_added(self):
+        counter = WordCounter()
+        history = History(max_size=10, token_counter=counter)
+
+        history.add_user_message('one two three')
+        history.get_messages()
+        history.copy()
+
+        assert counter.calls == 1
+        assert history.get_messages()[0].token_count == 3
+        assert history.total_tokens == 3 + MESSAGE_OVERHEAD_TOKENS
+
+    def test_precounted_message_is_not_recounted(self):
+        counter = WordCounter()
+        history = History(token_counter=counter)
+
+        history.add(Message(MessageRole.USER, 'a b', token_count=50))
+
+        assert counter.calls == 0
+        assert history.total_tokens == 50 + MESSAGE_OVERHEAD_TOKENS
+
+    def test_total_follows_size_eviction_and_clear(self):
+        history = History(max_size=2, token_counter=WordCounter())
+
+        history.add_user_message('one')
+        history.add_assistant_message('one two')
+        history.add_user_message('one two three')
+
+        assert history.total_tokens == 5 + 2 * MESSAGE_OVERHEAD_TOKENS
+        history.clear()
+        assert history.total_tokens == 0
+
+    def test_oldest_whole_turns_are_evicted_over_budget(self):
+        # Each message costs its words plus the per-message overhead.
+        history = History(
+            max_size=None, max_tokens=29, token_counter=WordCounter()
+        )
+
+        history.add_user_message('q1 q1')
+        history.add_assistant_message('a1 a1')
+        history.add_tool_message('t1 t1')
+        history.add_user_message('q2 q2')
+        history.add_assistant_message('a2 a2')
+
+        contents = [message.content for message in history.get_messages()]
+        assert contents == ['q2 q2', 'a2 a2']
+        assert history.total_tokens == 12
+
+    def test_message_larger_than_budget_is_dropped(self):
+        history = History(max_tokens=5, token_counter=WordCounter())
+
+        history.add_user_message('far too many words here')
+
+        assert len(history) == 0
+        assert history.total_tokens == 0
+
+    def test_size_only_is_required_without_token_budget(self):
+        with pytest.raises(ValueError, match='max size'):
+            History(max_size=None)
+
+    @pytest.mark.parametrize('max_tokens', [0, -5, 'many'])
+    def test_invalid_max_tokens_raises(self, max_tokens):
+        with pytest.raises(ValueError, match='max tokens'):
+            History(max_tokens=max_tokens)
+
+    def test_copy_keeps_limits_and_is_independent(self):
+        history = History(max_size=4, max_tokens=100)
+        history.add_user_message('hello')
+
+        copy = history.copy()
+        copy.add_assistant_message('hi')
+
+        assert copy.max_size == 4
+        assert copy.max_tokens == 100
+        assert copy.token_counter is history.token_counter
+        assert len(history) == 1
+        assert len(copy) == 2
+
+    def test_from_dict_list_with_token_budget(self):
+        history = History.from_dict_list(
+            [
+                {'role': 'user', 'content': 'q1 q1'},
+                {'role': 'assistant', 'content': 'a1 a1'},
+                {'role': 'user', 'content': 'q2 q2'},
+            ],
+            max_size=None,
+            max_tokens=12,
+            token_counter=WordCounter(),
+        )
+
+        assert [m.content for m in history.get_messages()] == ['q2 q2']
+
+
+@pytest.mark.unit
+class TestHistorySnapshot:
+    def test_snapshot_is_cached_until_the_history_changes(self):
+        history = History()
+        history.add_user_message('Hello')
+
+        first = history.snapshot()
+
+        assert first == ({'role': 'user', 'content': 'Hello'},)
+        assert history.snapshot() is first
+
+        history.add_assistant_message('Hi')
+        second = history.snapshot()
+
+        assert second is not first
+        assert len(second) == 2
+        # Dicts of messages already present are reused, not rebuilt.
+        assert second[0] is first[0]
+
+    def test_version_changes_on_add_and_clear(self):
+        history = History()
+        start = history.version
+
+        history.add_user_message('Hello')
+        after_add = history.version
+        history.clear()
+
+        assert start < after_add < history.version
+        assert history.snapshot() == ()
+
+    def test_snapshot_follows_evictions(self):
+        history = History(max_size=2)
+        for content in ('one', 'two', 'three'):
+            history.add_user_message(content)
+
+        assert [item['content'] for item in history.snapshot()] == [
+            'two',
+            'three',
+        ]
+
+    def test_snapshot_follows_token_evictions(self):
+        history = History(max_size=None, max_tokens=12)
+        history.add_user_message('aaaa')
+        history.add_assistant_message('bbbb')
+        history.add_user_message('cccc')
+
+        assert history.snapshot() == ({'role': 'user', 'content': 'cccc'},)
+
+    def test_to_dict_list_returns_private_copies(self):
+        history = History()
+        history.add_user_message('Hello')
+
+        items = history.to_dict_list()
+        items[0]['content'] = 'changed'
+
+        assert history.snapshot()[0]['content'] == 'Hello'
+
+
+@pytest.mark.unit
+class TestHistoryReplacePrefix:
+    def test_prefix_is_replaced_and_totals_updated(self):
+        history = History(token_counter=WordCounter())
+        history.add_user_message('one two')
+        history.add_assistant_message('three four')
+        history.add_user_message('five')
+        version = history.version
+
+        replaced = history.replace_prefix(
+            history.get_messages()[:2],
+            Message(MessageRole.SYSTEM, 'summary'),
+        )
+
+        assert replaced is True
+        assert [m.content for m in history.get_messages()] == [
+            'summary',
+            'five',
+        ]
+        assert history.snapshot()[0] == {
+            'role': 'system',
+            'content': 'summary',
+        }
+        assert history.total_tokens == 2 + 2 * MESSAGE_OVERHEAD_TOKENS
+        assert history.version > version
+
+    def test_stale_prefix_is_ignored(self):
+        history = History(max_size=2)
+        history.add_user_message('one')
+        prefix = history.get_messages()
+        history.add_assistant_message('two')
+        history.add_user_message('three')
+
+        assert not history.replace_prefix(
+            prefix, Message(MessageRole.SYSTEM, 'summary')
+        )
+        assert [m.content for m in history.get_messages()] == [
+            'two',
+            'three',
+        ]
+        assert not history.replace_prefix(
+            [], Message(MessageRole.SYSTEM, 'summary')
+        )
+
+
+@pytest.mark.unit
+class TestHistoryFromMessages:
+    def test_add_returns_the_counted_message(self):
+        history = History(token_counter=WordCounter())
+
+        stored = history.add(Message(MessageRole.USER, 'one two three'))
+
+        assert stored.token_count == 3
+        assert history.get_messages() == [stored]
+
+    def test_from_messages_keeps_existing_counts(self):
+        counter = Mock(wraps=WordCounter())
+        messages = [
+            Message(MessageRole.USER, 'one two', token_count=7),
+            Message(MessageRole.ASSISTANT, 'three'),
+        ]
+
+        history = History.from_messages(
+            messages, max_size=10, token_counter=counter
+        )
+
+        counter.count.assert_called_once_with('three')
+        assert history.total_tokens == 7 + 1 + 2 * MESSAGE_OVERHEAD_TOKENS
+        assert history.snapshot() == (
+            {'role': 'user', 'content': 'one two'},
+            {'role': 'assistant', 'content': 'three'},
+        )
+
+    def test_from_messages_applies_the_limits(self):
+        messages = [Message(MessageRole.USER, str(i)) for i in range(5)]
+
+        history = History.from_messages(messages, max_size=2)
+
+        assert [m.content for m in history.get_messages()] == ['3', '4']
+
+    def test_message_tokens_includes_the_overhead(self):
+        message = Message(MessageRole.USER, 'hi', token_count=5)
+
+        assert History.message_tokens(message) == 5 + MESSAGE_OVERHEAD_TOKENS
@@ -77,6 +77,17 @@ class TestMessage:
         ):
             Message(role=MessageRole.USER, content='   ')
 
+    def test_token_count_is_not_part_of_equality(self):
+        counted = Message(MessageRole.USER, 'Test', token_count=1)
+
+        assert counted == Message(MessageRole.USER, 'Test')
+        assert counted.to_dict() == {'role': 'user', 'content': 'Test'}
+
+    @pytest.mark.parametrize('token_count', [-1, 1.5, '3'])
+    def test_message_validation_invalid_token_count(self, token_count):
+        with pytest.raises(ValueError, match="'token_count'"):
+            Message(MessageRole.USER, 'Test', token_count=token_count)
+
     def test_message_validation_invalid_role_type(self):
         with pytest.raises(
             ValueError, match="The 'role' must be an instance of MessageRole"
@@ -0,0 +1,200 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import asyncio
+
+from createagents.domain import (
+    ChatException,
+    ChatTimeoutException,
+    CircuitOpenException,
+)
+from createagents.infra.adapters.Common import CircuitBreakerChatAdapter
+from createagents.infra.config import CircuitBreaker, CircuitState
+
+
+def _chat_kwargs():
+    return {
+        'model': 'gpt-4',
+        'instructions': None,
+        'config': {},
+        'tools': None,
+        'history': [],
+        'user_ask': 'Hi',
+    }
+
+
+def _provider_error() -> ChatException:
+    """A chat error caused by the provider's transport failing."""
+    error = ChatException('down')
+    error.__cause__ = ConnectionError('connection reset')
+    return error
+
+
+def _adapter(**kwargs) -> Mock:
+    adapter = Mock()
+    adapter.chat = AsyncMock(**kwargs)
+    adapter.warmup = AsyncMock()
+    adapter.aclose = AsyncMock()
+    adapter.get_metrics.return_value = []
+    return adapter
+
+
+@pytest.mark.unit
+class TestCircuitBreakerChatAdapter:
+    @pytest.mark.asyncio
+    async def test_passes_response_through(self):
+        inner = _adapter(return_value='hello')
+        adapter = CircuitBreakerChatAdapter(inner, CircuitBreaker())
+
+        result = await adapter.chat(**_chat_kwargs())
+
+        assert result == 'hello'
+        assert adapter.breaker.get_stats()['window_requests'] == 1
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_once_open(self):
+        inner = _adapter(side_effect=_provider_error())
+        adapter = CircuitBreakerChatAdapter(
+            inner, CircuitBreaker(min_requests=2)
+        )
+        for _ in range(2):
+            with pytest.raises(ChatException):
+                await adapter.chat(**_chat_kwargs())
+
+        with pytest.raises(CircuitOpenException):
+            await adapter.chat(**_chat_kwargs())
+
+        assert inner.chat.await_count == 2
+        assert adapter.breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_stream_outcome_is_recorded_when_consumed(self):
+        async def stream():
+            yield 'a'
+            raise _provider_error()
+
+        inner = _adapter(return_value=stream())
+        adapter = CircuitBreakerChatAdapter(
+            inner, CircuitBreaker(min_requests=1)
+        )
+
+        result = await adapter.chat(**_chat_kwargs())
+        assert adapter.breaker.state == CircuitState.CLOSED
+        with pytest.raises(ChatException):
+            async for _ in result:
+                pass
+
+        assert adapter.breaker.state == CircuitState.OPEN
+
+    @pytest.mark.parametrize(
+        'error',
+        [
+            ChatTimeoutException(0.5, 'calling the model'),
+            ChatException('Maximum tool iterations reached'),
+            ValueError('bad request'),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_caller_errors_do_not_open_the_circuit(self, error):
+        inner = _adapter(side_effect=error)
+        adapter = CircuitBreakerChatAdapter(
+            inner, CircuitBreaker(min_requests=1)
+        )
+
+        for _ in range(3):
+            with pytest.raises(type(error)):
+                await adapter.chat(**_chat_kwargs())
+
+        assert inner.chat.await_count == 3
+        assert adapter.breaker.state == CircuitState.CLOSED
+        assert adapter.breaker.get_stats()['window_requests'] == 0
+
+    @pytest.mark.asyncio
+    async def test_bad_request_status_does_not_open_the_circuit(self):
+        status = Exception('400 Bad Request')
+        status.status_code = 400
+        error = ChatException('bad request')
+        error.__cause__ = status
+        inner = _adapter(side_effect=error)
+        adapter = CircuitBreakerChatAdapter(
+            inner, CircuitBreaker(min_requests=1)
+        )
+
+        with pytest.raises(ChatException):
+            await adapter.chat(**_chat_kwargs())
+
+        assert adapter.breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_stream_latency_stops_at_the_first_token(self):
+        async def stream():
+            yield 'a'
+            yield 'b'
+
+        breaker = Mock(wraps=CircuitBreaker())
+        breaker.acquire.return_value = False
+        adapter = CircuitBreakerChatAdapter(
+            _adapter(return_value=stream()), breaker
+        )
+
+        result = await adapter.chat(**_chat_kwargs())
+        async for _ in result:
+            # A slow consumer is not a slow provider.
+            await asyncio.sleep(0.05)
+
+        metrics = breaker.record.call_args.args[0]
+        assert metrics.success
+        assert metrics.latency_ms < 50
+
+    @pytest.mark.asyncio
+    async def test_abandoned_probe_stream_releases_the_probe(self):
+        async def stream():
+            yield 'a'
+            yield 'b'
+
+        inner = _adapter(return_value=stream())
+        breaker = Mock(wraps=CircuitBreaker())
+        breaker.acquire.return_value = True
+        adapter = CircuitBreakerChatAdapter(inner, breaker)
+
+        result = await adapter.chat(**_chat_kwargs())
+        await result.__anext__()
+        await result.aclose()
+
+        breaker.release.assert_called_once()
+        breaker.record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_closes_the_wrapped_stream(self):
+        closed = []
+
+        async def stream():
+            try:
+                yield 'a'
+                yield 'b'
+            finally:
+                closed.append(True)
+
+        adapter = CircuitBreakerChatAdapter(
+            _adapter(return_value=stream()), CircuitBreaker()
+        )
+
+        result = await adapter.chat(**_chat_kwargs())
+        await result.__anext__()
+        await result.aclose()
+
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_delegates_lifecycle_and_metrics(self):
+        inner = _adapter(return_value='x')
+        adapter = CircuitBreakerChatAdapter(inner, CircuitBreaker())
+
+        await adapter.warmup('gpt-4')
+        await adapter.aclose()
+
+        inner.warmup.assert_awaited_once_with('gpt-4')
+        inner.aclose.assert_awaited_once()
+        assert adapter.get_metrics() == []
+        assert adapter.wrapped is inner
@@ -109,6 +109,40 @@ class TestMetricsRecorder:
         assert metrics[0].error_message == 'Test error'
         assert metrics[0].latency_ms >= 0
 
+    def test_scenario_record_timeout_metrics_keeps_partial_usage(self):
+        recorder = MetricsRecorder()
+
+        recorder.record_timeout_metrics(
+            model='test-model',
+            start_time=time.time(),
+            error=TimeoutError('Chat did not complete within 1s.'),
+            tokens_used=30,
+            prompt_tokens=20,
+            completion_tokens=10,
+        )
+
+        metrics = recorder.get_metrics()
+        assert len(metrics) == 1
+        assert metrics[0].timed_out is True
+        assert metrics[0].success is False
+        assert metrics[0].tokens_used == 30
+        assert metrics[0].prompt_tokens == 20
+        assert metrics[0].completion_tokens == 10
+        assert 'within 1s' in metrics[0].error_message
+
+    def test_scenario_record_cancelled_metrics(self):
+        recorder = MetricsRecorder()
+
+        recorder.record_cancelled_metrics(
+            model='test-model', start_time=time.time(), tokens_used=0
+        )
+
+        metrics = recorder.get_metrics()
+        assert len(metrics) == 1
+        assert metrics[0].cancelled is True
+        assert metrics[0].success is False
+        assert metrics[0].tokens_used is None
+
     def test_scenario_get_metrics_returns_copy(self):
         recorder = MetricsRecorder()
         start_time = time.time()
@@ -0,0 +1,268 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from createagents.domain import BaseTool
+from createagents.infra import CurrentDateTool
+from createagents.infra.adapters.Common import ResponseCacheChatAdapter
+from createagents.infra.config import ResponseCache
+
+
+def _chat_kwargs(**overrides):
+    kwargs = {
+        'model': 'gpt-4',
+        'instructions': 'Be brief.',
+        'config': {'temperature': 0},
+        'tools': None,
+        'history': [],
+        'user_ask': 'What is 2 + 2?',
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _adapter(response='The answer is 4.') -> Mock:
+    adapter = Mock()
+    adapter.chat = AsyncMock(return_value=response)
+    adapter.warmup = AsyncMock()
+    adapter.aclose = AsyncMock()
+    adapter.get_metrics.return_value = []
+    return adapter
+
+
+async def _stream(*tokens):
+    for token in tokens:
+        yield token
+
+
+class _Tool(BaseTool):
+    name = 'side_effect'
+    description = 'A tool with side effects.'
+
+    def execute(self, **kwargs):
+        return 'done'
+
+
+@pytest.mark.unit
+class TestResponseCacheChatAdapter:
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_served_from_cache(self):
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        first = await adapter.chat(**_chat_kwargs())
+        second = await adapter.chat(**_chat_kwargs())
+
+        assert first == second == 'The answer is 4.'
+        assert inner.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_deterministic_mode_skips_sampled_requests(self):
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        for _ in range(2):
+            await adapter.chat(**_chat_kwargs(config={'temperature': 0.7}))
+            await adapter.chat(**_chat_kwargs(config=None))
+
+        assert inner.chat.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_always_mode_caches_sampled_requests(self):
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache(mode='always'))
+
+        for _ in range(2):
+            await adapter.chat(**_chat_kwargs(config={'temperature': 0.7}))
+
+        assert inner.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_key_depends_on_history_and_message(self):
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        await adapter.chat(**_chat_kwargs())
+        await adapter.chat(**_chat_kwargs(user_ask='What is 3 + 3?'))
+        await adapter.chat(
+            **_chat_kwargs(history=[{'role': 'user', 'content': 'Hi'}])
+        )
+
+        assert inner.chat.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_providers_do_not_share_entries(self):
+        cache = ResponseCache()
+        openai = _adapter('From OpenAI.')
+        ollama = _adapter('From Ollama.')
+
+        await ResponseCacheChatAdapter(openai, cache, provider='openai').chat(
+            **_chat_kwargs()
+        )
+        result = await ResponseCacheChatAdapter(
+            ollama, cache, provider='ollama'
+        ).chat(**_chat_kwargs())
+
+        assert result == 'From Ollama.'
+        ollama.chat.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_key_depends_on_tool_cache_scope(self):
+        class _Scoped(_Tool):
+            idempotent = True
+
+            def __init__(self, base_dir):
+                self.base_dir = base_dir
+
+            def cache_scope(self):
+                return self.base_dir
+
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        await adapter.chat(**_chat_kwargs(tools=[_Scoped('/a')]))
+        await adapter.chat(**_chat_kwargs(tools=[_Scoped('/a')]))
+        await adapter.chat(**_chat_kwargs(tools=[_Scoped('/b')]))
+
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_instances_do_not_share_entries_by_default(self):
+        class _LookupTool(_Tool):
+            idempotent = True
+
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        for _ in range(3):
+            await adapter.chat(**_chat_kwargs(tools=[_LookupTool()]))
+
+        assert inner.chat.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_side_effect_tools_disable_caching(self):
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        for _ in range(2):
+            await adapter.chat(**_chat_kwargs(tools=[_Tool()]))
+
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_answers_using_the_date_expire_with_the_tool_ttl(
+        self, monkeypatch
+    ):
+        now = [1000.0]
+        monkeypatch.setattr(
+            'createagents.infra.config.response_cache.time.time',
+            lambda: now[0],
+        )
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+        kwargs = _chat_kwargs(tools=[CurrentDateTool()])
+
+        await adapter.chat(**kwargs)
+        await adapter.chat(**kwargs)
+        assert inner.chat.await_count == 1
+
+        now[0] += CurrentDateTool.cache_ttl_s + 1
+        await adapter.chat(**kwargs)
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_idempotent_tools_do_not_limit_the_ttl(self, monkeypatch):
+        class _LookupTool(_Tool):
+            idempotent = True
+            cacheable = True
+            cache_ttl_s = 1.0
+
+        now = [1000.0]
+        monkeypatch.setattr(
+            'createagents.infra.config.response_cache.time.time',
+            lambda: now[0],
+        )
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+        tools = [_LookupTool()]
+
+        await adapter.chat(**_chat_kwargs(tools=tools))
+        now[0] += 60
+        await adapter.chat(**_chat_kwargs(tools=tools))
+
+        assert inner.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_is_recorded_and_replayed(self):
+        inner = _adapter()
+        inner.chat.return_value = _stream('The ', 'answer ', 'is 4.')
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+        kwargs = _chat_kwargs(config={'temperature': 0, 'stream': True})
+
+        first = [t async for t in await adapter.chat(**kwargs)]
+        replayed = [t async for t in await adapter.chat(**kwargs)]
+
+        assert ''.join(first) == ''.join(replayed) == 'The answer is 4.'
+        assert len(replayed) > 1
+        assert inner.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_complete_response_is_replayed_as_stream(self):
+        inner = _adapter('  Hello   there!\n')
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+        await adapter.chat(**_chat_kwargs())
+
+        stream = await adapter.chat(
+            **_chat_kwargs(config={'temperature': 0, 'stream': True})
+        )
+
+        assert ''.join([t async for t in stream]) == '  Hello   there!\n'
+        assert inner.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_interrupted_stream_is_not_cached(self):
+        inner = _adapter()
+        inner.chat.return_value = _stream('partial ', 'answer')
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+        kwargs = _chat_kwargs(config={'temperature': 0, 'stream': True})
+
+        stream = await adapter.chat(**kwargs)
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert adapter.cache.get_stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_closes_the_upstream_stream(self):
+        closed = []
+
+        async def upstream():
+            try:
+                yield 'partial '
+                yield 'answer'
+            finally:
+                closed.append(True)
+
+        inner = _adapter()
+        inner.chat.return_value = upstream()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+        kwargs = _chat_kwargs(config={'temperature': 0, 'stream': True})
+
+        stream = await adapter.chat(**kwargs)
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_delegates_lifecycle_and_metrics(self):
+        inner = _adapter()
+        adapter = ResponseCacheChatAdapter(inner, ResponseCache())
+
+        await adapter.warmup('gpt-4')
+        await adapter.aclose()
+
+        inner.warmup.assert_awaited_once_with('gpt-4')
+        inner.aclose.assert_awaited_once()
+        assert adapter.get_metrics() == []
+        assert adapter.wrapped is inner
@@ -0,0 +1,211 @@
+import hashlib
+import re
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from createagents.domain import BaseTool  # noqa: E402
+from createagents.infra import CurrentDateTool  # noqa: E402
+from createagents.infra.adapters.Common import (  # noqa: E402
+    SemanticCacheChatAdapter,
+)
+from createagents.infra.config import SemanticCache, TextEmbedder  # noqa: E402
+
+
+class BagOfWordsEmbedder(TextEmbedder):
+    """Deterministic stand-in for an embedding model."""
+
+    async def embed(self, texts):
+        vectors = []
+        for text in texts:
+            vector = [0.0] * 64
+            for word in re.findall(r'\w+', text.lower()):
+                vector[hashlib.md5(word.encode()).digest()[0] % 64] += 1.0
+            vectors.append(vector)
+        return vectors
+
+
+class FailingEmbedder(TextEmbedder):
+    async def embed(self, texts):
+        raise ConnectionError('embedding model is down')
+
+
+def _chat_kwargs(**overrides):
+    kwargs = {
+        'model': 'llama3',
+        'instructions': 'Be brief.',
+        'config': {'temperature': 0},
+        'tools': None,
+        'history': [],
+        'user_ask': 'What is the capital of France?',
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _adapter(response='Paris.') -> Mock:
+    adapter = Mock()
+    adapter.chat = AsyncMock(return_value=response)
+    adapter.warmup = AsyncMock()
+    adapter.aclose = AsyncMock()
+    adapter.get_metrics.return_value = []
+    return adapter
+
+
+async def _stream(*tokens):
+    for token in tokens:
+        yield token
+
+
+class _Tool(BaseTool):
+    name = 'side_effect'
+    description = 'A tool with side effects.'
+
+    def execute(self, **kwargs):
+        return 'done'
+
+
+def _cache(**kwargs):
+    return SemanticCache(BagOfWordsEmbedder(), threshold=0.9, **kwargs)
+
+
+@pytest.mark.unit
+class TestSemanticCacheChatAdapter:
+    @pytest.mark.asyncio
+    async def test_paraphrased_message_is_served_from_cache(self):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+
+        first = await adapter.chat(**_chat_kwargs())
+        second = await adapter.chat(
+            **_chat_kwargs(user_ask='what is the capital of France')
+        )
+
+        assert first == second == 'Paris.'
+        assert inner.chat.await_count == 1
+        assert adapter.cache.get_stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_unrelated_message_calls_provider(self):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+
+        await adapter.chat(**_chat_kwargs())
+        await adapter.chat(**_chat_kwargs(user_ask='How do I bake bread?'))
+
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_instructions_and_tools_must_match(self):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+        tool = _Tool()
+        tool.idempotent = True
+
+        await adapter.chat(**_chat_kwargs())
+        await adapter.chat(**_chat_kwargs(instructions='Be verbose.'))
+        await adapter.chat(**_chat_kwargs(tools=[tool]))
+        await adapter.chat(**_chat_kwargs(tools=[tool]))
+
+        assert inner.chat.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_tools_with_side_effects_are_never_cached(self):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+
+        for _ in range(2):
+            await adapter.chat(**_chat_kwargs(tools=[_Tool()]))
+
+        assert inner.chat.await_count == 2
+        assert len(adapter.cache) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('config', [{'temperature': 0.7}, {}, None])
+    async def test_sampled_requests_are_never_cached(self, config):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+
+        for _ in range(2):
+            await adapter.chat(**_chat_kwargs(config=config))
+
+        assert inner.chat.await_count == 2
+        assert len(adapter.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_answers_using_the_date_expire_with_the_tool_ttl(
+        self, monkeypatch
+    ):
+        now = [1000.0]
+        monkeypatch.setattr(
+            'createagents.infra.config.semantic_cache.time.time',
+            lambda: now[0],
+        )
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+        kwargs = _chat_kwargs(tools=[CurrentDateTool()])
+
+        await adapter.chat(**kwargs)
+        await adapter.chat(**kwargs)
+        assert inner.chat.await_count == 1
+
+        now[0] += CurrentDateTool.cache_ttl_s + 1
+        await adapter.chat(**kwargs)
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_is_recorded_and_replayed(self):
+        inner = _adapter()
+        inner.chat = AsyncMock(return_value=_stream('Paris', ' is', ' nice.'))
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+        config = {'temperature': 0, 'stream': True}
+
+        first = await adapter.chat(**_chat_kwargs(config=config))
+        assert ''.join([token async for token in first]) == 'Paris is nice.'
+
+        second = await adapter.chat(**_chat_kwargs(config=config))
+        tokens = [token async for token in second]
+
+        assert ''.join(tokens) == 'Paris is nice.'
+        assert len(tokens) == 3
+        assert inner.chat.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_interrupted_stream_is_not_cached(self):
+        inner = _adapter()
+        inner.chat = AsyncMock(return_value=_stream('Paris', ' is', ' nice.'))
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+
+        stream = await adapter.chat(
+            **_chat_kwargs(config={'temperature': 0, 'stream': True})
+        )
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert len(adapter.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_bypasses_cache(self):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(
+            inner, SemanticCache(FailingEmbedder())
+        )
+
+        assert await adapter.chat(**_chat_kwargs()) == 'Paris.'
+        assert await adapter.chat(**_chat_kwargs()) == 'Paris.'
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delegates_lifecycle_and_metrics(self):
+        inner = _adapter()
+        adapter = SemanticCacheChatAdapter(inner, _cache())
+
+        await adapter.warmup('llama3')
+        await adapter.aclose()
+
+        inner.warmup.assert_awaited_once_with('llama3')
+        inner.aclose.assert_awaited_once()
+        assert adapter.get_metrics() == []
+        assert adapter.wrapped is inner
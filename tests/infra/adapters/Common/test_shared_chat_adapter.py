@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from createagents.infra.adapters.Common import SharedChatAdapter
+
+
+def _chat_kwargs():
+    return {
+        'model': 'llama3',
+        'instructions': None,
+        'config': {},
+        'tools': None,
+        'history': [],
+        'user_ask': 'Hi',
+    }
+
+
+def _adapter() -> Mock:
+    adapter = Mock()
+    adapter.chat = AsyncMock(return_value='hello')
+    adapter.warmup = AsyncMock()
+    adapter.aclose = AsyncMock()
+    adapter.get_metrics.return_value = []
+    return adapter
+
+
+@pytest.mark.unit
+class TestSharedChatAdapter:
+    @pytest.mark.asyncio
+    async def test_adapter_is_closed_by_the_last_holder(self):
+        inner = _adapter()
+        first = SharedChatAdapter(inner)
+        second = SharedChatAdapter(inner)
+
+        await first.aclose()
+
+        inner.aclose.assert_not_awaited()
+        assert SharedChatAdapter.holders(inner) == 1
+        assert await second.chat(**_chat_kwargs()) == 'hello'
+
+        await second.aclose()
+
+        inner.aclose.assert_awaited_once()
+        assert SharedChatAdapter.holders(inner) == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_a_handle_twice_drops_one_hold(self):
+        inner = _adapter()
+        first = SharedChatAdapter(inner)
+        SharedChatAdapter(inner)
+
+        await first.aclose()
+        await first.aclose()
+
+        inner.aclose.assert_not_awaited()
+        assert SharedChatAdapter.holders(inner) == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_handle_holds_again_on_use(self):
+        inner = _adapter()
+        handle = SharedChatAdapter(inner)
+        await handle.aclose()
+
+        await handle.warmup('llama3')
+        other = SharedChatAdapter(inner)
+        await other.aclose()
+
+        assert SharedChatAdapter.holders(inner) == 1
+        inner.aclose.assert_awaited_once()
@@ -0,0 +1,335 @@
+import asyncio
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from createagents.domain import BaseTool, ChatException
+from createagents.infra.adapters.Common import (
+    SingleFlightChatAdapter,
+    StreamTee,
+)
+
+
+def _chat_kwargs(**overrides):
+    kwargs = {
+        'model': 'gpt-4',
+        'instructions': 'Be brief.',
+        'config': {},
+        'tools': None,
+        'history': [],
+        'user_ask': 'What are your opening hours?',
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+class _SlowAdapter:
+    """Counts upstream calls and answers after a short delay."""
+
+    def __init__(self, response='answer', stream_tokens=None, error=None):
+        self.calls = 0
+        self.response = response
+        self.stream_tokens = stream_tokens
+        self.error = error
+        self.stream_closed = False
+        self.warmup = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def chat(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.error is not None:
+            raise self.error
+        if self.stream_tokens is not None:
+            return self.__stream()
+        return f'{self.response}-{self.calls}'
+
+    async def __stream(self) -> AsyncGenerator[str, None]:
+        try:
+            for token in self.stream_tokens:
+                await asyncio.sleep(0.01)
+                yield token
+        finally:
+            self.stream_closed = True
+
+    def get_metrics(self):
+        return []
+
+
+class _Tool(BaseTool):
+    name = 'side_effect'
+    description = 'A tool with side effects.'
+
+    def execute(self, **kwargs):
+        return 'done'
+
+
+@pytest.mark.unit
+class TestSingleFlightChatAdapter:
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_call(self):
+        inner = _SlowAdapter()
+        adapter = SingleFlightChatAdapter(inner)
+
+        results = await asyncio.gather(
+            *(adapter.chat(**_chat_kwargs()) for _ in range(5))
+        )
+
+        assert results == ['answer-1'] * 5
+        assert inner.calls == 1
+        assert adapter.get_stats() == {
+            'requests': 5,
+            'shared': 4,
+            'in_flight': 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_shared(self):
+        inner = _SlowAdapter()
+        adapter = SingleFlightChatAdapter(inner)
+
+        await asyncio.gather(
+            adapter.chat(**_chat_kwargs()),
+            adapter.chat(**_chat_kwargs(user_ask='Where are you?')),
+            adapter.chat(
+                **_chat_kwargs(history=[{'role': 'user', 'content': 'hi'}])
+            ),
+        )
+
+        assert inner.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_are_not_shared(self):
+        inner = _SlowAdapter()
+        adapter = SingleFlightChatAdapter(inner)
+
+        first = await adapter.chat(**_chat_kwargs())
+        second = await adapter.chat(**_chat_kwargs())
+
+        assert (first, second) == ('answer-1', 'answer-2')
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_by_all_callers(self):
+        inner = _SlowAdapter(error=ChatException('upstream failed'))
+        adapter = SingleFlightChatAdapter(inner)
+
+        results = await asyncio.gather(
+            *(adapter.chat(**_chat_kwargs()) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert inner.calls == 1
+        assert all(isinstance(r, ChatException) for r in results)
+        assert adapter.get_stats()['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_with_side_effect_tools_are_not_shared(self):
+        inner = _SlowAdapter()
+        adapter = SingleFlightChatAdapter(inner)
+
+        await asyncio.gather(
+            *(adapter.chat(**_chat_kwargs(tools=[_Tool()])) for _ in range(2))
+        )
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_the_shared_call(self):
+        inner = _SlowAdapter()
+        adapter = SingleFlightChatAdapter(inner)
+
+        first = asyncio.ensure_future(adapter.chat(**_chat_kwargs()))
+        second = asyncio.ensure_future(adapter.chat(**_chat_kwargs()))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 'answer-1'
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_streaming_consumers_each_get_the_full_stream(self):
+        inner = _SlowAdapter(stream_tokens=['a', 'b', 'c'])
+        adapter = SingleFlightChatAdapter(inner)
+        kwargs = _chat_kwargs(config={'stream': True})
+
+        streams = await asyncio.gather(
+            *(adapter.chat(**kwargs) for _ in range(3))
+        )
+
+        async def collect(stream):
+            return [token async for token in stream]
+
+        results = await asyncio.gather(*(collect(s) for s in streams))
+
+        assert results == [['a', 'b', 'c']] * 3
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_late_stream_consumer_joins_in_flight_stream(self):
+        inner = _SlowAdapter(stream_tokens=['a', 'b', 'c'])
+        adapter = SingleFlightChatAdapter(inner)
+        kwargs = _chat_kwargs(config={'stream': True})
+
+        first = await adapter.chat(**kwargs)
+        assert await first.__anext__() == 'a'
+        second = await adapter.chat(**kwargs)
+
+        assert [token async for token in second] == ['a', 'b', 'c']
+        assert [token async for token in first] == ['b', 'c']
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_delegates_lifecycle_and_metrics(self):
+        inner = _SlowAdapter()
+        adapter = SingleFlightChatAdapter(inner)
+
+        await adapter.warmup('gpt-4')
+        await adapter.aclose()
+
+        inner.warmup.assert_awaited_once_with('gpt-4')
+        inner.aclose.assert_awaited_once()
+        assert adapter.get_metrics() == []
+        assert adapter.wrapped is inner
+
+    def test_key_ignores_dict_ordering(self):
+        first = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(config={'temperature': 0.1, 'top_p': 0.9})
+        )
+        second = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(config={'top_p': 0.9, 'temperature': 0.1})
+        )
+
+        assert first == second
+
+    def test_key_covers_tool_schema(self):
+        class _Narrow(_Tool):
+            parameters = {
+                'type': 'object',
+                'properties': {'path': {'type': 'string'}},
+            }
+
+        first = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(tools=[_Tool()])
+        )
+        second = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(tools=[_Narrow()])
+        )
+
+        assert first != second
+
+    def test_key_covers_tool_cache_scope(self):
+        class _Scoped(_Tool):
+            def __init__(self, base_dir):
+                self.base_dir = base_dir
+
+            def cache_scope(self):
+                return self.base_dir
+
+        same = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(tools=[_Scoped('/a')])
+        )
+        also_same = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(tools=[_Scoped('/a')])
+        )
+        other = SingleFlightChatAdapter.make_key(
+            **_chat_kwargs(tools=[_Scoped('/b')])
+        )
+
+        assert same == also_same
+        assert same != other
+
+
+@pytest.mark.unit
+class TestStreamTee:
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_consumer(self):
+        async def source():
+            yield 'a'
+            raise ChatException('broken')
+
+        tee = StreamTee(source())
+        consumers = [tee.subscribe(), tee.subscribe()]
+
+        for consumer in consumers:
+            assert await consumer.__anext__() == 'a'
+            with pytest.raises(ChatException):
+                await consumer.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_source_is_closed_when_every_consumer_stops(self):
+        closed = asyncio.Event()
+        on_done = Mock()
+
+        async def source():
+            try:
+                for token in ['a', 'b', 'c']:
+                    await asyncio.sleep(0.01)
+                    yield token
+            finally:
+                closed.set()
+
+        tee = StreamTee(source(), on_done=on_done)
+        consumer = tee.subscribe()
+        assert await consumer.__anext__() == 'a'
+        await consumer.aclose()
+
+        await asyncio.wait_for(closed.wait(), timeout=1.0)
+        await asyncio.sleep(0)
+        assert tee.abandoned
+        on_done.assert_called_once()
+
+
+class _DeadlineAdapter:
+    """Answers after `delay`, honouring the request's deadline."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.deadlines = []
+
+    async def chat(self, deadline=None, **kwargs):
+        self.deadlines.append(deadline)
+        work = asyncio.sleep(
+            self.delay, result=f'answer-{len(self.deadlines)}'
+        )
+        if deadline is None:
+            return await work
+        return await deadline.run(work, 'answering')
+
+
+@pytest.mark.unit
+class TestSingleFlightChatAdapterDeadline:
+    @pytest.mark.asyncio
+    async def test_waiter_gives_up_at_its_own_deadline(self):
+        from createagents.domain import ChatTimeoutException, Deadline
+
+        inner = _DeadlineAdapter(delay=0.1)
+        adapter = SingleFlightChatAdapter(inner)
+
+        leader = asyncio.ensure_future(adapter.chat(**_chat_kwargs()))
+        await asyncio.sleep(0)
+        with pytest.raises(ChatTimeoutException):
+            await adapter.chat(**_chat_kwargs(), deadline=Deadline(0.02))
+
+        assert await leader == 'answer-1'
+        assert len(inner.deadlines) == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_retries_when_the_leader_runs_out_of_time(self):
+        from createagents.domain import ChatTimeoutException, Deadline
+
+        inner = _DeadlineAdapter(delay=0.05)
+        adapter = SingleFlightChatAdapter(inner)
+        leader_deadline = Deadline(0.02)
+
+        leader = asyncio.ensure_future(
+            adapter.chat(**_chat_kwargs(), deadline=leader_deadline)
+        )
+        await asyncio.sleep(0)
+        waiter = await adapter.chat(**_chat_kwargs(), deadline=Deadline(1))
+
+        with pytest.raises(ChatTimeoutException):
+            await leader
+        assert waiter == 'answer-2'
+        assert inner.deadlines[0] is leader_deadline
+        assert adapter.get_stats()['in_flight'] == 0
@@ -1,9 +1,12 @@
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from createagents.domain import ChatException
 from createagents.infra import OllamaChatAdapter
+from createagents.infra.adapters.Ollama.ollama_residency_manager import (
+    OllamaResidencyManager,
+)
 
 IA_OLLAMA_TEST_1: str = 'phi4-mini:latest'
 IA_OLLAMA_TEST_2: str = 'gemma3:4b'
@@ -24,6 +27,13 @@ def _mock_response(content='Response', tool_calls=None, get_return=None):
     return m
 
 
+@pytest.fixture(autouse=True)
+async def close_residency_managers():
+    """Stops the sweepers started by adapters the tests do not close."""
+    yield
+    await OllamaResidencyManager.aclose_all()
+
+
 @pytest.mark.unit
 class TestOllamaChatAdapter:
     def test_initialization(self):
@@ -823,19 +833,18 @@ class TestOllamaChatAdapter:
         assert call_args.args[0] == IA_OLLAMA_TEST_2
         assert isinstance(call_args.args[1], list)
 
-    @patch('createagents.infra.adapters.Ollama.ollama_client.subprocess.run')
+    @patch(
+        'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.release_model'
+    )
     @patch(
         'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.call_api',
         new_callable=AsyncMock,
     )
     @pytest.mark.asyncio
-    async def test_stop_model_is_called_after_chat(
-        self, mock_chat, mock_subprocess
-    ):
+    async def test_model_is_released_after_chat(self, mock_chat, mock_release):
         mock_chat.return_value = _mock_response(
             content='Response', tool_calls=None, get_return=None
         )
-        mock_subprocess.return_value = Mock()
 
         adapter = OllamaChatAdapter()
 
@@ -848,21 +857,18 @@ class TestOllamaChatAdapter:
             user_ask='Test',
         )
 
-        mock_subprocess.assert_called_once()
-        call_args = mock_subprocess.call_args
-        assert call_args[0][0] == ['ollama', 'stop', IA_OLLAMA_TEST_1]
+        mock_release.assert_called_once_with(IA_OLLAMA_TEST_1)
 
-    @patch('createagents.infra.adapters.Ollama.ollama_client.subprocess.run')
+    @patch(
+        'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.release_model'
+    )
     @patch(
         'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.call_api',
         new_callable=AsyncMock,
     )
     @pytest.mark.asyncio
-    async def test_stop_model_called_even_on_error(
-        self, mock_chat, mock_subprocess
-    ):
+    async def test_model_released_even_on_error(self, mock_chat, mock_release):
         mock_chat.side_effect = Exception('Chat error')
-        mock_subprocess.return_value = Mock()
 
         adapter = OllamaChatAdapter()
 
@@ -878,90 +884,71 @@ class TestOllamaChatAdapter:
         except Exception:
             pass
 
-        mock_subprocess.assert_called_once()
+        mock_release.assert_called_once_with(IA_OLLAMA_TEST_2)
 
-    @patch('createagents.infra.adapters.Ollama.ollama_client.subprocess.run')
     @patch(
-        'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.call_api',
+        'createagents.infra.adapters.Ollama.ollama_residency_manager.OllamaResidencyManager.unload',
         new_callable=AsyncMock,
     )
-    @pytest.mark.asyncio
-    async def test_stop_model_handles_file_not_found(
-        self, mock_chat, mock_subprocess
-    ):
-        mock_chat.return_value = _mock_response(
-            content='Response', tool_calls=None, get_return=None
-        )
-        mock_subprocess.side_effect = FileNotFoundError('ollama not found')
-
-        adapter = OllamaChatAdapter()
-
-        response = await adapter.chat(
-            model=IA_OLLAMA_TEST_1,
-            instructions='Test',
-            config={},
-            tools=None,
-            history=[],
-            user_ask='Test',
-        )
-
-        assert response == 'Response'
-
-    @patch('createagents.infra.adapters.Ollama.ollama_client.subprocess.run')
     @patch(
         'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.call_api',
         new_callable=AsyncMock,
     )
     @pytest.mark.asyncio
-    async def test_stop_model_handles_timeout(
-        self, mock_chat, mock_subprocess
+    async def test_chat_does_not_unload_model_after_each_request(
+        self, mock_chat, mock_unload
     ):
-        import subprocess
-
         mock_chat.return_value = _mock_response(
             content='Response', tool_calls=None, get_return=None
         )
-        mock_subprocess.side_effect = subprocess.TimeoutExpired('ollama', 10)
 
         adapter = OllamaChatAdapter()
 
-        response = await adapter.chat(
-            model=IA_OLLAMA_TEST_2,
-            instructions='Test',
-            config={},
-            tools=None,
-            history=[],
-            user_ask='Test',
-        )
+        for _ in range(2):
+            response = await adapter.chat(
+                model=IA_OLLAMA_TEST_1,
+                instructions='Test',
+                config={},
+                tools=None,
+                history=[],
+                user_ask='Test',
+            )
+            assert response == 'Response'
 
-        assert response == 'Response'
+        mock_unload.assert_not_awaited()
 
-    @patch('createagents.infra.adapters.Ollama.ollama_client.subprocess.run')
     @patch(
         'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.call_api',
         new_callable=AsyncMock,
     )
     @pytest.mark.asyncio
-    async def test_stop_model_handles_generic_exception(
-        self, mock_chat, mock_subprocess
-    ):
+    async def test_chat_metrics_report_model_loads(self, mock_chat):
+        from createagents.infra.adapters.Ollama.ollama_residency_manager import (
+            OllamaResidencyManager,
+        )
+
+        OllamaResidencyManager.reset()
         mock_chat.return_value = _mock_response(
             content='Response', tool_calls=None, get_return=None
         )
-        mock_subprocess.side_effect = RuntimeError('Unknown error')
 
         adapter = OllamaChatAdapter()
 
-        response = await adapter.chat(
-            model=IA_OLLAMA_TEST_1,
-            instructions='Test',
-            config={},
-            tools=None,
-            history=[],
-            user_ask='Test',
-        )
+        for _ in range(2):
+            await adapter.chat(
+                model=IA_OLLAMA_TEST_1,
+                instructions='Test',
+                config={},
+                tools=None,
+                history=[],
+                user_ask='Test',
+            )
 
-        assert response == 'Response'
+        metrics = adapter.get_metrics()
+        assert [m.model_loads for m in metrics] == [1, 1]
+        assert [m.model_unloads for m in metrics] == [0, 0]
+        await adapter.aclose()
+        OllamaResidencyManager.reset()
 
     @patch(
         'createagents.infra.adapters.Ollama.ollama_client.OllamaClient.call_api',
@@ -1031,3 +1018,37 @@ class TestOllamaChatAdapter:
             OllamaChatAdapter()
 
             assert mock_get_env.call_count >= 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_pooled_client(self):
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_client.OllamaConnectionPool.release',
+            new_callable=AsyncMock,
+        ) as mock_pool_release:
+            adapter = OllamaChatAdapter()
+            await adapter.aclose()
+
+        mock_pool_release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_loads_model_through_client(self):
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_chat_adapter.OllamaClient.warmup',
+            new_callable=AsyncMock,
+            return_value=1200.0,
+        ) as mock_warmup:
+            adapter = OllamaChatAdapter()
+            await adapter.warmup(IA_OLLAMA_TEST_1)
+
+        mock_warmup.assert_awaited_once_with(IA_OLLAMA_TEST_1)
+
+    @pytest.mark.asyncio
+    async def test_warmup_wraps_errors_in_chat_exception(self):
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_chat_adapter.OllamaClient.warmup',
+            new_callable=AsyncMock,
+            side_effect=ConnectionError('Ollama is not running'),
+        ):
+            adapter = OllamaChatAdapter()
+            with pytest.raises(ChatException, match='not running'):
+                await adapter.warmup(IA_OLLAMA_TEST_1)
@@ -0,0 +1,306 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ollama import ResponseError
+
+from createagents.infra.adapters.Ollama.ollama_client import OllamaClient
+
+IA_OLLAMA_TEST_1: str = 'phi4-mini:latest'
+
+
+def _chat_payload(content: str = 'Hello from fake Ollama') -> dict:
+    return {
+        'model': IA_OLLAMA_TEST_1,
+        'created_at': '2025-01-01T00:00:00Z',
+        'message': {'role': 'assistant', 'content': content},
+        'done': True,
+    }
+
+
+def _make_client(server) -> OllamaClient:
+    def fake_get_env(key, default=None):
+        if key == 'OLLAMA_HOST':
+            return server.url
+        return default
+
+    with patch(
+        'createagents.infra.adapters.Ollama.ollama_client.EnvironmentConfig.get_env',
+        side_effect=fake_get_env,
+    ):
+        return OllamaClient()
+
+
+@pytest.mark.unit
+class TestOllamaClientRetryAgainstFakeServer:
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_until_success(self, fake_http_server):
+        fake_http_server.enqueue(503, {'error': 'model is loading'})
+        fake_http_server.enqueue(500, {'error': 'internal error'})
+        fake_http_server.enqueue(200, _chat_payload())
+        client = _make_client(fake_http_server)
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            response = await client.call_api(
+                IA_OLLAMA_TEST_1,
+                [{'role': 'user', 'content': 'Hi'}],
+                None,
+            )
+
+        assert response.message.content == 'Hello from fake Ollama'
+        assert len(fake_http_server.requests) == 3
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, fake_http_server):
+        fake_http_server.enqueue(404, {'error': 'model not found'})
+        client = _make_client(fake_http_server)
+
+        with pytest.raises(ResponseError) as exc_info:
+            await client.call_api(
+                IA_OLLAMA_TEST_1,
+                [{'role': 'user', 'content': 'Hi'}],
+                None,
+            )
+
+        assert exc_info.value.status_code == 404
+        assert len(fake_http_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_refused_is_retried(self):
+        def fake_get_env(key, default=None):
+            if key == 'OLLAMA_HOST':
+                return 'http://127.0.0.1:9'
+            return default
+
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_client.EnvironmentConfig.get_env',
+            side_effect=fake_get_env,
+        ):
+            client = OllamaClient()
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            with pytest.raises(ConnectionError):
+                await client.call_api(
+                    IA_OLLAMA_TEST_1,
+                    [{'role': 'user', 'content': 'Hi'}],
+                    None,
+                )
+
+        assert mock_sleep.await_count == 2
+
+
+@pytest.mark.unit
+class TestOllamaClientConnectionReuse:
+    @pytest.mark.asyncio
+    async def test_consecutive_calls_reuse_one_connection(
+        self, fake_http_server
+    ):
+        from createagents.infra.adapters.Ollama.ollama_connection_pool import (
+            OllamaConnectionPool,
+        )
+
+        fake_http_server.default_response = (200, {}, _chat_payload())
+        client = _make_client(fake_http_server)
+
+        for _ in range(3):
+            await client.call_api(
+                IA_OLLAMA_TEST_1,
+                [{'role': 'user', 'content': 'Hi'}],
+                None,
+            )
+
+        client_addresses = {
+            request['client_address'] for request in fake_http_server.requests
+        }
+        assert len(fake_http_server.requests) == 3
+        assert len(client_addresses) == 1
+
+        pooled = OllamaConnectionPool.get_client(fake_http_server.url)
+        await client.aclose()
+        assert pooled._client.is_closed
+        assert OllamaConnectionPool.get_client(fake_http_server.url) is not (
+            pooled
+        )
+
+    @pytest.mark.asyncio
+    async def test_aclose_keeps_connection_shared_with_another_client(
+        self, fake_http_server
+    ):
+        from createagents.infra.adapters.Ollama.ollama_connection_pool import (
+            OllamaConnectionPool,
+        )
+
+        fake_http_server.default_response = (200, {}, _chat_payload())
+        first = _make_client(fake_http_server)
+        second = _make_client(fake_http_server)
+        pooled = OllamaConnectionPool.get_client(fake_http_server.url)
+
+        await first.aclose()
+        await first.aclose()
+        response = await second.call_api(
+            IA_OLLAMA_TEST_1, [{'role': 'user', 'content': 'Hi'}], None
+        )
+
+        assert response['message']['content'] == 'Hello from fake Ollama'
+        assert not pooled._client.is_closed
+
+        await second.aclose()
+        assert pooled._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_reacquires_connection_after_aclose(
+        self, fake_http_server
+    ):
+        from createagents.infra.adapters.Ollama.ollama_connection_pool import (
+            OllamaConnectionPool,
+        )
+
+        fake_http_server.default_response = (200, {}, _chat_payload())
+        client = _make_client(fake_http_server)
+        await client.aclose()
+
+        await client.call_api(
+            IA_OLLAMA_TEST_1, [{'role': 'user', 'content': 'Hi'}], None
+        )
+        pooled = OllamaConnectionPool.get_client(fake_http_server.url)
+        await client.aclose()
+
+        assert pooled._client.is_closed
+
+
+@pytest.mark.unit
+class TestOllamaClientWarmup:
+    @pytest.mark.asyncio
+    async def test_warmup_loads_model_with_zero_token_request(
+        self, fake_http_server
+    ):
+        fake_http_server.enqueue(
+            200,
+            {
+                'model': IA_OLLAMA_TEST_1,
+                'created_at': '2025-01-01T00:00:00Z',
+                'response': '',
+                'done': True,
+                'load_duration': 1_500_000_000,
+            },
+        )
+        client = _make_client(fake_http_server)
+
+        load_duration_ms = await client.warmup(IA_OLLAMA_TEST_1)
+
+        request = fake_http_server.requests[0]
+        assert request['path'] == '/api/generate'
+        assert request['body']['model'] == IA_OLLAMA_TEST_1
+        assert not request['body'].get('prompt')
+        assert 'keep_alive' in request['body']
+        assert load_duration_ms == 1500.0
+        assert client.touch_model(IA_OLLAMA_TEST_1) is False
+
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warmup_reuses_connection_for_first_chat(
+        self, fake_http_server
+    ):
+        fake_http_server.enqueue(
+            200,
+            {
+                'model': IA_OLLAMA_TEST_1,
+                'created_at': '2025-01-01T00:00:00Z',
+                'response': '',
+                'done': True,
+            },
+        )
+        fake_http_server.enqueue(200, _chat_payload())
+        client = _make_client(fake_http_server)
+
+        assert await client.warmup(IA_OLLAMA_TEST_1) is None
+        await client.call_api(
+            IA_OLLAMA_TEST_1, [{'role': 'user', 'content': 'Hi'}], None
+        )
+
+        client_addresses = {
+            request['client_address'] for request in fake_http_server.requests
+        }
+        assert len(client_addresses) == 1
+
+        await client.aclose()
+
+
+@pytest.mark.unit
+class TestOllamaClientRateLimiting:
+    @pytest.mark.asyncio
+    async def test_stream_usage_is_reconciled_when_it_ends(
+        self, fake_http_server
+    ):
+        import json
+
+        from createagents.infra.config import RateLimiter
+
+        chunks = [
+            {**_chat_payload('Hel'), 'done': False},
+            {**_chat_payload('lo'), 'prompt_eval_count': 3, 'eval_count': 4},
+        ]
+        fake_http_server.default_response = (
+            200,
+            {'Content-Type': 'application/x-ndjson'},
+            ''.join(json.dumps(chunk) + '\n' for chunk in chunks),
+        )
+        client = _make_client(fake_http_server)
+        limiter = RateLimiter(tokens_per_minute=100_000)
+
+        with (
+            patch(
+                'createagents.infra.adapters.Ollama.ollama_client.RateLimiter.for_model',
+                return_value=limiter,
+            ),
+            patch.object(
+                limiter, 'reconcile', wraps=limiter.reconcile
+            ) as reconcile,
+        ):
+            stream = await client.call_api(
+                IA_OLLAMA_TEST_1,
+                [{'role': 'user', 'content': 'Hi'}],
+                {'stream': True},
+            )
+            contents = [chunk.message.content async for chunk in stream]
+
+        assert contents == ['Hel', 'lo']
+        reconcile.assert_called_once()
+        assert reconcile.call_args.args[1] == 7
+
+
+@pytest.mark.unit
+class TestOllamaClientHedging:
+    @pytest.mark.asyncio
+    async def test_hedged_stream_yields_the_response_chunks(
+        self, fake_http_server
+    ):
+        import json
+
+        from createagents.infra.config import RequestHedger
+
+        chunks = [
+            {**_chat_payload('Hel'), 'done': False},
+            _chat_payload('lo'),
+        ]
+        fake_http_server.default_response = (
+            200,
+            {'Content-Type': 'application/x-ndjson'},
+            ''.join(json.dumps(chunk) + '\n' for chunk in chunks),
+        )
+        client = _make_client(fake_http_server)
+
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_client.RequestHedger.for_model',
+            return_value=RequestHedger(),
+        ):
+            stream = await client.call_api(
+                IA_OLLAMA_TEST_1,
+                [{'role': 'user', 'content': 'Hi'}],
+                {'stream': True},
+            )
+            contents = [chunk.message.content async for chunk in stream]
+
+        assert contents == ['Hel', 'lo']
+        assert fake_http_server.requests[0]['body']['stream'] is True
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from createagents.infra.adapters.Ollama.ollama_connection_pool import (
+    OllamaConnectionPool,
+)
+
+HOST_A = 'http://127.0.0.1:11434'
+HOST_B = 'http://127.0.0.1:11435'
+
+
+@pytest.fixture(autouse=True)
+async def reset_pool():
+    await OllamaConnectionPool.aclose()
+    yield
+    await OllamaConnectionPool.aclose()
+
+
+@pytest.mark.unit
+class TestOllamaConnectionPool:
+    @pytest.mark.asyncio
+    async def test_same_host_returns_same_client(self):
+        client1 = OllamaConnectionPool.get_client(HOST_A)
+        client2 = OllamaConnectionPool.get_client(HOST_A)
+
+        assert client1 is client2
+        assert OllamaConnectionPool.size() == 1
+
+    @pytest.mark.asyncio
+    async def test_different_hosts_get_different_clients(self):
+        client1 = OllamaConnectionPool.get_client(HOST_A)
+        client2 = OllamaConnectionPool.get_client(HOST_B)
+
+        assert client1 is not client2
+        assert OllamaConnectionPool.size() == 2
+
+    def test_client_is_rebuilt_for_a_new_event_loop(self):
+        async def get():
+            return OllamaConnectionPool.get_client(HOST_A)
+
+        client1 = asyncio.run(get())
+        client2 = asyncio.run(get())
+
+        assert client1 is not client2
+        assert OllamaConnectionPool.size() == 1
+
+    def test_get_client_requires_running_loop(self):
+        with pytest.raises(RuntimeError):
+            OllamaConnectionPool.get_client(HOST_A)
+
+    @pytest.mark.asyncio
+    async def test_aclose_single_host(self):
+        client_a = OllamaConnectionPool.get_client(HOST_A)
+        OllamaConnectionPool.get_client(HOST_B)
+
+        await OllamaConnectionPool.aclose(HOST_A)
+
+        assert OllamaConnectionPool.size() == 1
+        assert client_a._client.is_closed
+        assert OllamaConnectionPool.get_client(HOST_A) is not client_a
+
+    @pytest.mark.asyncio
+    async def test_aclose_all_hosts(self):
+        client_a = OllamaConnectionPool.get_client(HOST_A)
+        client_b = OllamaConnectionPool.get_client(HOST_B)
+
+        await OllamaConnectionPool.aclose()
+
+        assert OllamaConnectionPool.size() == 0
+        assert client_a._client.is_closed
+        assert client_b._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_aclose_unknown_host_is_noop(self):
+        await OllamaConnectionPool.aclose('http://unknown:1')
+
+        assert OllamaConnectionPool.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_release_keeps_client_while_other_holders_remain(self):
+        OllamaConnectionPool.acquire(HOST_A)
+        OllamaConnectionPool.acquire(HOST_A)
+        client = OllamaConnectionPool.get_client(HOST_A)
+
+        await OllamaConnectionPool.release(HOST_A)
+
+        assert not client._client.is_closed
+        assert OllamaConnectionPool.get_client(HOST_A) is client
+
+        await OllamaConnectionPool.release(HOST_A)
+
+        assert client._client.is_closed
+        assert OllamaConnectionPool.size() == 0
+
+    def test_limits_default_values(self):
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_connection_pool.EnvironmentConfig.get_env',
+            side_effect=lambda key, default=None: default,
+        ):
+            limits = OllamaConnectionPool.get_limits()
+
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert limits.keepalive_expiry == 30.0
+
+    def test_limits_read_from_environment(self):
+        env = {
+            'OLLAMA_MAX_CONNECTIONS': '8',
+            'OLLAMA_MAX_KEEPALIVE_CONNECTIONS': '4',
+            'OLLAMA_KEEPALIVE_EXPIRY': '120',
+        }
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_connection_pool.EnvironmentConfig.get_env',
+            side_effect=lambda key, default=None: env.get(key, default),
+        ):
+            limits = OllamaConnectionPool.get_limits()
+
+        assert limits == httpx.Limits(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=120.0,
+        )
@@ -0,0 +1,42 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from createagents.infra.adapters.Ollama import OllamaEmbedder
+from createagents.infra.config import EnvironmentConfig
+
+
+@pytest.mark.unit
+class TestOllamaEmbedder:
+    @pytest.mark.asyncio
+    async def test_embeds_through_pooled_client(self):
+        client = Mock()
+        client.embed = AsyncMock(
+            return_value={'embeddings': [[0.1, 0.2], [0.3, 0.4]]}
+        )
+        with patch(
+            'createagents.infra.adapters.Ollama.ollama_embedder.'
+            'OllamaConnectionPool.get_client',
+            return_value=client,
+        ):
+            embedder = OllamaEmbedder(model='all-minilm')
+            vectors = await embedder.embed(['a', 'b'])
+
+        assert vectors == [[0.1, 0.2], [0.3, 0.4]]
+        client.embed.assert_awaited_once_with(
+            model='all-minilm', input=['a', 'b']
+        )
+
+    def test_model_defaults_to_environment(self, monkeypatch):
+        monkeypatch.setenv('OLLAMA_EMBED_MODEL', 'mxbai-embed-large')
+        EnvironmentConfig.clear_cache()
+        try:
+            assert OllamaEmbedder().model == 'mxbai-embed-large'
+        finally:
+            EnvironmentConfig.clear_cache()
+
+    def test_model_has_default(self, monkeypatch):
+        monkeypatch.delenv('OLLAMA_EMBED_MODEL', raising=False)
+        EnvironmentConfig.clear_cache()
+
+        assert OllamaEmbedder().model == OllamaEmbedder.DEFAULT_MODEL
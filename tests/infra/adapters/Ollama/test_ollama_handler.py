@@ -40,7 +40,8 @@ class TestOllamaHandler:
                 metrics={'prompt_eval_count': 2, 'eval_count': 3},
             )
         )
-        client.stop_model = MagicMock()
+        client.release_model = MagicMock()
+        client.get_residency_stats = MagicMock(return_value=(1, 0))
 
         handler = OllamaHandler(client, metrics_store)
 
@@ -55,7 +56,8 @@ class TestOllamaHandler:
         assert len(metrics_store) == 1
         assert metrics_store[0].success is True
         assert metrics_store[0].tokens_used == 5
-        client.stop_model.assert_called_once_with('test-model')
+        client.release_model.assert_called_once_with('test-model')
+        client.touch_model.assert_called_once_with('test-model')
 
     @pytest.mark.asyncio
     @patch('createagents.infra.adapters.Ollama.ollama_handler.ToolExecutor')
@@ -74,12 +76,14 @@ class TestOllamaHandler:
         client.call_api = AsyncMock(
             side_effect=[response_with_tool, final_response]
         )
-        client.stop_model = MagicMock()
+        client.release_model = MagicMock()
+        client.get_residency_stats = MagicMock(return_value=(1, 0))
 
         executor_instance = SimpleNamespace(
-            execute_tool=AsyncMock(
-                return_value=SimpleNamespace(success=True, result='ok')
-            )
+            execute_multiple_tools=AsyncMock(
+                return_value=[SimpleNamespace(success=True, result='ok')]
+            ),
+            get_cache_stats=lambda: {'hits': 0, 'misses': 1},
         )
         mock_tool_executor.return_value = executor_instance
 
@@ -93,9 +97,109 @@ class TestOllamaHandler:
         )
 
         assert result == 'done'
-        executor_instance.execute_tool.assert_awaited_once_with(
-            'dummy', value=1
+        executor_instance.execute_multiple_tools.assert_awaited_once_with(
+            [{'name': 'dummy', 'arguments': {'value': 1}}],
+            parallel=True,
+            max_concurrency=4,
         )
         assert len(metrics_store) == 1
         assert metrics_store[0].tokens_used == 2
-        client.stop_model.assert_called_once_with('test-model')
+        assert metrics_store[0].tool_cache_hits == 0
+        assert metrics_store[0].tool_cache_misses == 1
+        client.release_model.assert_called_once_with('test-model')
+        client.touch_model.assert_called_once_with('test-model')
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_in_one_turn_run_concurrently_in_order(self):
+        import asyncio
+        import time
+
+        class SlowTool(BaseTool):
+            name = 'slow'
+            description = 'slow tool'
+            parameters = {'type': 'object', 'properties': {}}
+
+            async def execute(self, label, seconds):
+                await asyncio.sleep(seconds)
+                return label
+
+        tool_calls = [
+            SimpleNamespace(
+                function=SimpleNamespace(
+                    name='slow', arguments={'label': label, 'seconds': delay}
+                )
+            )
+            for label, delay in [('a', 0.1), ('b', 0.05), ('c', 0.1)]
+        ]
+        client = MagicMock()
+        client.call_api = AsyncMock(
+            side_effect=[
+                FakeResponse(content='', tool_calls=tool_calls),
+                FakeResponse(content='done'),
+            ]
+        )
+        client.get_residency_stats = MagicMock(return_value=(1, 0))
+        messages = [{'role': 'user', 'content': 'Hi'}]
+
+        started = time.perf_counter()
+        result = await OllamaHandler(client).execute_tool_loop(
+            model='test-model',
+            messages=messages,
+            config=None,
+            tools=[SlowTool()],
+        )
+        elapsed = time.perf_counter() - started
+
+        assert result == 'done'
+        assert elapsed < 0.2
+        assert [m['content'] for m in messages if isinstance(m, dict)][1:] == [
+            'a',
+            'b',
+            'c',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_tools_of_one_runs_sequentially(self):
+        client = MagicMock()
+        tool_call = SimpleNamespace(
+            function=SimpleNamespace(name='dummy', arguments={'value': 1})
+        )
+        client.call_api = AsyncMock(
+            side_effect=[
+                FakeResponse(content='', tool_calls=[tool_call]),
+                FakeResponse(content='done'),
+            ]
+        )
+        client.get_residency_stats = MagicMock(return_value=(1, 0))
+
+        with (
+            patch(
+                'createagents.infra.adapters.Ollama.ollama_handler.EnvironmentConfig.get_env',
+                side_effect=lambda key, default=None: (
+                    '1' if key == 'OLLAMA_MAX_PARALLEL_TOOLS' else default
+                ),
+            ),
+            patch(
+                'createagents.infra.adapters.Ollama.ollama_handler.ToolExecutor'
+            ) as mock_tool_executor,
+        ):
+            executor_instance = SimpleNamespace(
+                execute_multiple_tools=AsyncMock(
+                    return_value=[SimpleNamespace(success=True, result='ok')]
+                ),
+                get_cache_stats=lambda: {'hits': 0, 'misses': 1},
+            )
+            mock_tool_executor.return_value = executor_instance
+            handler = OllamaHandler(client)
+            await handler.execute_tool_loop(
+                model='test-model',
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config=None,
+                tools=[DummyTool()],
+            )
+
+        executor_instance.execute_multiple_tools.assert_awaited_once_with(
+            [{'name': 'dummy', 'arguments': {'value': 1}}],
+            parallel=False,
+            max_concurrency=1,
+        )
@@ -0,0 +1,333 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from createagents.infra.adapters.Ollama.ollama_connection_pool import (
+    OllamaConnectionPool,
+)
+from createagents.infra.adapters.Ollama.ollama_residency_manager import (
+    OllamaResidencyManager,
+    ResidencyPolicy,
+)
+
+MODEL_A = 'phi4-mini:latest'
+MODEL_B = 'gemma3:4b'
+MODEL_C = 'llama3.2:1b'
+
+
+def _unload_payload(model: str) -> dict:
+    return {
+        'model': model,
+        'created_at': '2025-01-01T00:00:00Z',
+        'response': '',
+        'done': True,
+        'done_reason': 'unload',
+    }
+
+
+def _unloaded_models(server) -> list:
+    return [
+        request['body']['model']
+        for request in server.requests
+        if request['path'] == '/api/generate'
+        and request['body'].get('keep_alive') == 0
+    ]
+
+
+@pytest.fixture
+async def unload_server(fake_http_server):
+    fake_http_server.handler = lambda request: (
+        200,
+        {},
+        _unload_payload(request['body']['model']),
+    )
+    yield fake_http_server
+    await OllamaConnectionPool.aclose(fake_http_server.url)
+
+
+@pytest.mark.unit
+class TestOllamaResidencyManager:
+    def test_invalid_policy_raises(self):
+        with pytest.raises(ValueError, match='Invalid residency policy'):
+            OllamaResidencyManager('http://host', policy='forever')
+
+    def test_invalid_limits_raise(self):
+        with pytest.raises(ValueError):
+            OllamaResidencyManager('http://host', max_resident_models=0)
+        with pytest.raises(ValueError):
+            OllamaResidencyManager('http://host', idle_timeout=0)
+
+    def test_request_keep_alive_per_policy(self):
+        keep = OllamaResidencyManager(
+            'http://host', policy='keep_alive', keep_alive='30m'
+        )
+        lru = OllamaResidencyManager('http://host', policy='lru')
+        idle = OllamaResidencyManager(
+            'http://host', policy='idle', idle_timeout=120
+        )
+
+        assert keep.request_keep_alive() == '30m'
+        assert lru.request_keep_alive() == -1
+        assert idle.request_keep_alive() == '120s'
+
+    def test_touch_counts_loads_only_for_cold_models(self):
+        manager = OllamaResidencyManager('http://host', policy='keep_alive')
+
+        assert manager.touch(MODEL_A) is True
+        assert manager.touch(MODEL_A) is False
+        assert manager.is_resident(MODEL_A)
+        assert manager.get_stats(MODEL_A) == (1, 0)
+        assert manager.get_stats(MODEL_B) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_unload_uses_api_instead_of_subprocess(self, unload_server):
+        manager = OllamaResidencyManager(
+            unload_server.url, policy='keep_alive'
+        )
+        manager.touch(MODEL_A)
+
+        with patch('subprocess.run') as mock_run:
+            assert await manager.unload(MODEL_A) is True
+
+        mock_run.assert_not_called()
+        assert _unloaded_models(unload_server) == [MODEL_A]
+        assert not manager.is_resident(MODEL_A)
+        assert manager.get_stats(MODEL_A) == (1, 1)
+
+        manager.touch(MODEL_A)
+        assert manager.get_stats(MODEL_A) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_unload_failure_is_not_counted(self, fake_http_server):
+        fake_http_server.default_response = (500, {}, {'error': 'boom'})
+        manager = OllamaResidencyManager(
+            fake_http_server.url, policy='keep_alive'
+        )
+        manager.touch(MODEL_A)
+
+        assert await manager.unload(MODEL_A) is False
+        assert manager.get_stats(MODEL_A) == (1, 0)
+        await OllamaConnectionPool.aclose(fake_http_server.url)
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used_in_background(
+        self, unload_server
+    ):
+        manager = OllamaResidencyManager(
+            unload_server.url,
+            policy=ResidencyPolicy.LRU,
+            max_resident_models=2,
+        )
+
+        manager.touch(MODEL_A)
+        manager.touch(MODEL_B)
+        manager.touch(MODEL_A)
+        manager.touch(MODEL_C)
+
+        assert not manager.is_resident(MODEL_B)
+        assert manager.is_resident(MODEL_A)
+        assert manager.is_resident(MODEL_C)
+
+        await manager.aclose()
+
+        assert _unloaded_models(unload_server) == [MODEL_B]
+        assert manager.get_stats(MODEL_B) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_sweep_unloads_only_idle_models(self, unload_server):
+        manager = OllamaResidencyManager(
+            unload_server.url, policy='keep_alive', idle_timeout=0.05
+        )
+        manager.touch(MODEL_A)
+        await asyncio.sleep(0.06)
+        manager.touch(MODEL_B)
+
+        unloaded = await manager.sweep()
+
+        assert unloaded == 1
+        assert _unloaded_models(unload_server) == [MODEL_A]
+        assert manager.is_resident(MODEL_B)
+
+    @pytest.mark.asyncio
+    async def test_idle_policy_sweeps_in_background(self, unload_server):
+        manager = OllamaResidencyManager(
+            unload_server.url,
+            policy='idle',
+            idle_timeout=0.05,
+            sweep_interval=0.02,
+        )
+        manager.touch(MODEL_A)
+        manager.release(MODEL_A)
+
+        for _ in range(50):
+            if manager.get_stats(MODEL_A)[1]:
+                break
+            await asyncio.sleep(0.02)
+
+        assert _unloaded_models(unload_server) == [MODEL_A]
+        assert manager.get_stats(MODEL_A) == (1, 1)
+        await manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_release_restarts_idle_clock(self, unload_server):
+        manager = OllamaResidencyManager(
+            unload_server.url, policy='keep_alive', idle_timeout=0.05
+        )
+        manager.touch(MODEL_A)
+        await asyncio.sleep(0.06)
+        manager.release(MODEL_A)
+
+        assert await manager.sweep() == 0
+        assert manager.is_resident(MODEL_A)
+
+    @pytest.mark.asyncio
+    async def test_sweep_skips_models_with_requests_in_flight(
+        self, unload_server
+    ):
+        manager = OllamaResidencyManager(
+            unload_server.url, policy='keep_alive', idle_timeout=0.05
+        )
+        manager.acquire(MODEL_A)
+        manager.acquire(MODEL_A)
+        await asyncio.sleep(0.06)
+
+        assert await manager.sweep() == 0
+        assert manager.in_flight(MODEL_A) == 2
+
+        manager.release(MODEL_A)
+        manager.release(MODEL_A)
+        await asyncio.sleep(0.06)
+
+        assert manager.in_flight(MODEL_A) == 0
+        assert await manager.sweep() == 1
+        assert _unloaded_models(unload_server) == [MODEL_A]
+
+    @pytest.mark.asyncio
+    async def test_lru_does_not_evict_models_in_flight(self, unload_server):
+        manager = OllamaResidencyManager(
+            unload_server.url,
+            policy=ResidencyPolicy.LRU,
+            max_resident_models=1,
+        )
+
+        manager.acquire(MODEL_A)
+        manager.touch(MODEL_B)
+        await manager.aclose()
+
+        assert manager.is_resident(MODEL_A)
+        assert not manager.is_resident(MODEL_B)
+        assert _unloaded_models(unload_server) == [MODEL_B]
+
+    @pytest.mark.asyncio
+    async def test_detach_keeps_sweeper_while_other_clients_remain(
+        self, unload_server
+    ):
+        manager = OllamaResidencyManager(
+            unload_server.url,
+            policy='idle',
+            idle_timeout=0.05,
+            sweep_interval=0.02,
+        )
+        manager.attach()
+        manager.attach()
+        manager.touch(MODEL_A)
+
+        await manager.detach()
+
+        for _ in range(50):
+            if manager.get_stats(MODEL_A)[1]:
+                break
+            await asyncio.sleep(0.02)
+
+        assert _unloaded_models(unload_server) == [MODEL_A]
+        await manager.detach()
+
+    @pytest.mark.asyncio
+    async def test_last_detach_cancels_the_sweeper(self):
+        manager = OllamaResidencyManager(
+            'http://host-x', policy='idle', sweep_interval=60
+        )
+        manager.attach()
+        manager.touch(MODEL_A)
+        sweepers = [
+            task
+            for task in asyncio.all_tasks()
+            if 'sweep_forever' in repr(task.get_coro())
+        ]
+        assert len(sweepers) == 1
+
+        await manager.detach()
+
+        assert sweepers[0].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_a_sweeper_on_another_loop(self):
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        manager = OllamaResidencyManager(
+            'http://host-x', policy='idle', sweep_interval=60
+        )
+
+        async def touch():
+            manager.touch(MODEL_A)
+            return [
+                task
+                for task in asyncio.all_tasks()
+                if 'sweep_forever' in repr(task.get_coro())
+            ]
+
+        try:
+            sweepers = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(touch(), other)
+            )
+            await manager.aclose()
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other)
+            )
+
+            assert len(sweepers) == 1
+            assert sweepers[0].cancelled()
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
+
+    @pytest.mark.asyncio
+    async def test_aclose_all_stops_every_shared_manager(self):
+        OllamaResidencyManager.reset()
+        try:
+            manager = OllamaResidencyManager.for_host('http://host-x')
+            manager.touch(MODEL_A)
+
+            await OllamaResidencyManager.aclose_all()
+
+            assert not [
+                task
+                for task in asyncio.all_tasks()
+                if 'sweep_forever' in repr(task.get_coro()) and not task.done()
+            ]
+        finally:
+            OllamaResidencyManager.reset()
+
+    def test_for_host_shares_manager_and_reads_environment(self):
+        env = {
+            'OLLAMA_RESIDENCY_POLICY': 'lru',
+            'OLLAMA_MAX_RESIDENT_MODELS': '3',
+        }
+        OllamaResidencyManager.reset()
+        try:
+            with patch(
+                'createagents.infra.adapters.Ollama.ollama_residency_manager.EnvironmentConfig.get_env',
+                side_effect=lambda key, default=None: env.get(key, default),
+            ):
+                manager = OllamaResidencyManager.for_host('http://host-x')
+
+            assert OllamaResidencyManager.for_host('http://host-x') is manager
+            assert manager.policy == ResidencyPolicy.LRU
+            assert manager.max_resident_models == 3
+            assert manager.idle_timeout == 300.0
+        finally:
+            OllamaResidencyManager.reset()
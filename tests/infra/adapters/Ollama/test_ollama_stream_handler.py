@@ -65,7 +65,8 @@ class TestOllamaStreamHandler:
             ),
         ]
         client.call_api = AsyncMock(return_value=FakeStream(chunks))
-        client.stop_model = MagicMock()
+        client.release_model = MagicMock()
+        client.get_residency_stats = MagicMock(return_value=(1, 0))
 
         handler = OllamaStreamHandler(client, metrics_store)
 
@@ -84,7 +85,8 @@ class TestOllamaStreamHandler:
         assert metrics_store[0].load_duration_ms == 1.0
         assert metrics_store[0].prompt_eval_duration_ms == 2.0
         assert metrics_store[0].eval_duration_ms == 3.0
-        client.stop_model.assert_called_once_with('test-model')
+        client.release_model.assert_called_once_with('test-model')
+        client.touch_model.assert_called_once_with('test-model')
 
     @pytest.mark.asyncio
     @patch(
@@ -107,12 +109,14 @@ class TestOllamaStreamHandler:
         client.call_api = AsyncMock(
             side_effect=[stream_with_tool, stream_with_answer]
         )
-        client.stop_model = MagicMock()
+        client.release_model = MagicMock()
+        client.get_residency_stats = MagicMock(return_value=(1, 0))
 
         executor_instance = SimpleNamespace(
-            execute_tool=AsyncMock(
-                return_value=SimpleNamespace(success=True, result='ok')
-            )
+            execute_multiple_tools=AsyncMock(
+                return_value=[SimpleNamespace(success=True, result='ok')]
+            ),
+            get_cache_stats=lambda: {'hits': 0, 'misses': 1},
         )
         mock_tool_executor.return_value = executor_instance
 
@@ -128,9 +132,129 @@ class TestOllamaStreamHandler:
             tokens.append(piece)
 
         assert ''.join(tokens) == 'Answer'
-        executor_instance.execute_tool.assert_awaited_once_with(
-            'dummy', value=1
+        executor_instance.execute_multiple_tools.assert_awaited_once_with(
+            [{'name': 'dummy', 'arguments': {'value': 1}}],
+            parallel=True,
+            max_concurrency=4,
         )
         assert len(metrics_store) == 1
         assert metrics_store[0].completion_tokens == 2
-        client.stop_model.assert_called_once_with('test-model')
+        client.release_model.assert_called_once_with('test-model')
+        client.touch_model.assert_called_once_with('test-model')
+
+
+@pytest.mark.unit
+class TestOllamaStreamHandlerDeadline:
+    @pytest.mark.asyncio
+    async def test_stalled_stream_times_out_and_records_metrics(self):
+        import asyncio
+
+        from createagents.domain import ChatTimeoutException, Deadline
+
+        closed = []
+
+        async def stalled_stream():
+            try:
+                yield FakeChunk(content='Hel')
+                await asyncio.sleep(1)
+                yield FakeChunk(content='lo')
+            finally:
+                closed.append(True)
+
+        metrics_store = []
+        client = MagicMock()
+        client.call_api = AsyncMock(return_value=stalled_stream())
+        client.release_model = MagicMock()
+        client.get_residency_stats = MagicMock(return_value=(0, 0))
+        handler = OllamaStreamHandler(client, metrics_store)
+
+        tokens = []
+        with pytest.raises(ChatTimeoutException) as exc_info:
+            async for piece in handler.handle_stream(
+                model='test-model',
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={'stream': True},
+                tools=None,
+                deadline=Deadline(0.05),
+            ):
+                tokens.append(piece)
+
+        assert tokens == ['Hel']
+        assert closed == [True]
+        assert 'streaming from Ollama' in str(exc_info.value)
+        assert len(metrics_store) == 1
+        assert metrics_store[0].timed_out is True
+        assert metrics_store[0].success is False
+
+
+@pytest.mark.unit
+class TestOllamaStreamHandlerCancellation:
+    @staticmethod
+    def _client(stream):
+        client = MagicMock()
+        client.call_api = AsyncMock(return_value=stream)
+        client.release_model = MagicMock()
+        client.get_residency_stats = MagicMock(return_value=(0, 0))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_closes_upstream(self):
+        closed = []
+
+        async def upstream():
+            try:
+                yield FakeChunk(content='Hel')
+                yield FakeChunk(content='lo')
+            finally:
+                closed.append(True)
+
+        metrics_store = []
+        client = self._client(upstream())
+        handler = OllamaStreamHandler(client, metrics_store)
+
+        stream = handler.handle_stream(
+            model='test-model',
+            messages=[{'role': 'user', 'content': 'Hi'}],
+            config={'stream': True},
+            tools=None,
+        )
+        assert await stream.__anext__() == 'Hel'
+        await stream.aclose()
+
+        assert closed == [True]
+        assert len(metrics_store) == 1
+        assert metrics_store[0].cancelled is True
+        client.release_model.assert_called_once_with('test-model')
+
+    @pytest.mark.asyncio
+    async def test_rest_of_stream_is_closed_once_tools_are_detected(self):
+        closed = []
+        tool_call = SimpleNamespace(
+            function=SimpleNamespace(name='dummy', arguments={})
+        )
+
+        async def tool_stream():
+            try:
+                yield FakeChunk(tool_calls=[tool_call])
+                yield FakeChunk(content='never read')
+            finally:
+                closed.append('tools')
+
+        client = self._client(None)
+        client.call_api = AsyncMock(
+            side_effect=[tool_stream(), FakeStream([FakeChunk('Done')])]
+        )
+        handler = OllamaStreamHandler(client, [])
+
+        tokens = [
+            token
+            async for token in handler.handle_stream(
+                model='test-model',
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={'stream': True},
+                tools=[DummyTool()],
+            )
+        ]
+
+        assert tokens == ['Done']
+        assert closed == ['tools']
@@ -21,7 +21,9 @@ class TestClientOpenAI:
         client = ClientOpenAI.get_client('test-api-key')
 
         assert client is mock_client
-        mock_openai.assert_called_once_with(api_key='test-api-key')
+        mock_openai.assert_called_once_with(
+            api_key='test-api-key', max_retries=0
+        )
 
     @patch('createagents.infra.adapters.OpenAI.client_openai.AsyncOpenAI')
     def test_get_client_returns_openai_instance(self, mock_openai):
@@ -84,8 +86,8 @@ class TestClientOpenAI:
         ClientOpenAI.get_client('positional-key')
         ClientOpenAI.get_client(api_key='keyword-key')
 
-        mock_openai.assert_any_call(api_key='positional-key')
-        mock_openai.assert_any_call(api_key='keyword-key')
+        mock_openai.assert_any_call(api_key='positional-key', max_retries=0)
+        mock_openai.assert_any_call(api_key='keyword-key', max_retries=0)
 
     @patch('createagents.infra.adapters.OpenAI.client_openai.AsyncOpenAI')
     def test_get_client_accepts_non_string_keys(self, mock_openai):
@@ -99,7 +101,7 @@ class TestClientOpenAI:
         key_obj = object()
         ClientOpenAI.get_client(key_obj)
 
-        mock_openai.assert_called_with(api_key=key_obj)
+        mock_openai.assert_called_with(api_key=key_obj, max_retries=0)
 
     def test_api_openai_name_constant_type(self):
         from createagents.infra.adapters.OpenAI.client_openai import (
@@ -139,7 +141,7 @@ class TestClientOpenAI:
 
         client = ClientOpenAI.get_client('')
         assert client is mock_client
-        mock_openai.assert_called_with(api_key='')
+        mock_openai.assert_called_with(api_key='', max_retries=0)
 
     @patch('createagents.infra.adapters.OpenAI.client_openai.AsyncOpenAI')
     def test_get_client_returns_different_clients_for_different_keys(
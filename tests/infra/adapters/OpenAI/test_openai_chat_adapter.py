@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from createagents.domain import ChatException
 from createagents.infra.adapters.OpenAI.openai_chat_adapter import (
     OpenAIChatAdapter,
 )
@@ -114,3 +115,81 @@ class TestOpenAIChatAdapter:
 
         metrics = adapter.get_metrics()
         assert len(metrics) == 1
+
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_chat_adapter.OpenAIClient'
+    )
+    @pytest.mark.asyncio
+    async def test_warmup_delegates_to_client(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        mock_client.warmup = AsyncMock()
+        adapter = OpenAIChatAdapter()
+
+        await adapter.warmup('gpt-5-nano')
+
+        mock_client.warmup.assert_awaited_once_with('gpt-5-nano')
+
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_chat_adapter.OpenAIClient'
+    )
+    @pytest.mark.asyncio
+    async def test_warmup_wraps_errors_in_chat_exception(
+        self, mock_client_cls
+    ):
+        mock_client = mock_client_cls.return_value
+        mock_client.warmup = AsyncMock(side_effect=RuntimeError('refused'))
+        adapter = OpenAIChatAdapter()
+
+        with pytest.raises(ChatException, match='refused'):
+            await adapter.warmup('gpt-5-nano')
+
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_chat_adapter.OpenAIHandler'
+    )
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_chat_adapter.OpenAIClient'
+    )
+    @pytest.mark.asyncio
+    async def test_stateful_responses_env_enables_response_chain(
+        self, mock_client_cls, mock_handler_cls
+    ):
+        from createagents.infra.adapters.OpenAI.openai_response_chain import (
+            OpenAIResponseChain,
+        )
+
+        mock_handler_cls.return_value.execute_tool_loop = AsyncMock(
+            return_value='ok'
+        )
+        with patch(
+            'createagents.infra.adapters.OpenAI.openai_chat_adapter.EnvironmentConfig.get_env',
+            side_effect=lambda key, default=None: (
+                'true' if key == 'OPENAI_STATEFUL_RESPONSES' else default
+            ),
+        ):
+            adapter = OpenAIChatAdapter()
+
+        await adapter.chat('gpt-5-nano', None, None, None, [], 'Hi')
+        await adapter.chat('gpt-5-nano', None, None, None, [], 'Again')
+
+        chains = [call.args[2] for call in mock_handler_cls.call_args_list]
+        assert isinstance(chains[0], OpenAIResponseChain)
+        assert chains[0] is chains[1]
+
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_chat_adapter.OpenAIHandler'
+    )
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_chat_adapter.OpenAIClient'
+    )
+    @pytest.mark.asyncio
+    async def test_response_chain_disabled_by_default(
+        self, mock_client_cls, mock_handler_cls
+    ):
+        mock_handler_cls.return_value.execute_tool_loop = AsyncMock(
+            return_value='ok'
+        )
+        adapter = OpenAIChatAdapter()
+
+        await adapter.chat('gpt-5-nano', None, None, None, [], 'Hi')
+
+        assert mock_handler_cls.call_args.args[2] is None
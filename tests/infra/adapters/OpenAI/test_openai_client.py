@@ -135,3 +135,403 @@ class TestOpenAIClient:
 
         call_args = mock_client.responses.create.call_args
         assert call_args.kwargs['tools'] == tools
+
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_api_key'
+    )
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client'
+    )
+    @pytest.mark.asyncio
+    async def test_call_api_timeout_is_capped_by_deadline(
+        self, mock_get_client, mock_get_api_key
+    ):
+        from createagents.domain import Deadline
+
+        mock_get_api_key.return_value = 'test-api-key'
+        mock_client = Mock()
+        mock_client.responses = Mock()
+        mock_client.responses.create = AsyncMock()
+        mock_get_client.return_value = mock_client
+
+        client = OpenAIClient()
+
+        await client.call_api(
+            model=IA_OPENAI_TEST_1,
+            instructions='Instr',
+            messages=[],
+            config={},
+            deadline=Deadline(2),
+        )
+
+        timeout = mock_client.responses.create.call_args.kwargs['timeout']
+        assert 0 < timeout <= 2
+
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_api_key'
+    )
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client'
+    )
+    @pytest.mark.asyncio
+    async def test_call_api_with_expired_deadline_is_not_sent(
+        self, mock_get_client, mock_get_api_key
+    ):
+        import asyncio
+
+        from createagents.domain import ChatTimeoutException, Deadline
+
+        mock_get_api_key.return_value = 'test-api-key'
+        mock_client = Mock()
+        mock_client.responses = Mock()
+        mock_client.responses.create = AsyncMock()
+        mock_get_client.return_value = mock_client
+
+        client = OpenAIClient()
+        deadline = Deadline(0.01)
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(ChatTimeoutException):
+            await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions='Instr',
+                messages=[],
+                config={},
+                deadline=deadline,
+            )
+
+        mock_client.responses.create.assert_not_called()
+
+
+def _responses_payload(text: str = 'Hello from fake server') -> dict:
+    return {
+        'id': 'resp_fake',
+        'object': 'response',
+        'created_at': 0,
+        'model': IA_OPENAI_TEST_1,
+        'status': 'completed',
+        'parallel_tool_calls': True,
+        'tool_choice': 'auto',
+        'tools': [],
+        'output': [
+            {
+                'type': 'message',
+                'id': 'msg_fake',
+                'status': 'completed',
+                'role': 'assistant',
+                'content': [
+                    {'type': 'output_text', 'text': text, 'annotations': []}
+                ],
+            }
+        ],
+    }
+
+
+def _make_client(server) -> OpenAIClient:
+    from openai import AsyncOpenAI
+
+    real_client = AsyncOpenAI(
+        api_key='test-api-key',
+        base_url=f'{server.url}/v1',
+        max_retries=0,
+    )
+    with (
+        patch(
+            'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_api_key',
+            return_value='test-api-key',
+        ),
+        patch(
+            'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client',
+            return_value=real_client,
+        ),
+    ):
+        return OpenAIClient()
+
+
+@pytest.mark.unit
+class TestOpenAIClientRetryAgainstFakeServer:
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_until_success(self, fake_http_server):
+        fake_http_server.enqueue(503, {'error': {'message': 'overloaded'}})
+        fake_http_server.enqueue(
+            429,
+            {'error': {'message': 'rate limited'}},
+            headers={'Retry-After': '0'},
+        )
+        fake_http_server.enqueue(200, _responses_payload())
+        client = _make_client(fake_http_server)
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            response = await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={},
+            )
+
+        assert response.output_text == 'Hello from fake server'
+        assert len(fake_http_server.requests) == 3
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, fake_http_server):
+        from openai import BadRequestError
+
+        fake_http_server.enqueue(400, {'error': {'message': 'bad input'}})
+        client = _make_client(fake_http_server)
+
+        with pytest.raises(BadRequestError):
+            await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={},
+            )
+
+        assert len(fake_http_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_header_is_honoured(self, fake_http_server):
+        fake_http_server.enqueue(
+            429,
+            {'error': {'message': 'rate limited'}},
+            headers={'Retry-After': '7'},
+        )
+        fake_http_server.enqueue(200, _responses_payload())
+        client = _make_client(fake_http_server)
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={},
+            )
+
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, fake_http_server):
+        from openai import InternalServerError
+
+        fake_http_server.default_response = (
+            500,
+            {},
+            {'error': {'message': 'boom'}},
+        )
+        client = _make_client(fake_http_server)
+
+        with patch('asyncio.sleep', new=AsyncMock()):
+            with pytest.raises(InternalServerError):
+                await client.call_api(
+                    model=IA_OPENAI_TEST_1,
+                    instructions=None,
+                    messages=[{'role': 'user', 'content': 'Hi'}],
+                    config={},
+                )
+
+        assert len(fake_http_server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_max_retries_setting_bounds_attempts(self, fake_http_server):
+        from openai import InternalServerError
+
+        fake_http_server.default_response = (
+            500,
+            {},
+            {'error': {'message': 'boom'}},
+        )
+        with patch(
+            'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_env',
+            side_effect=lambda key, default=None: (
+                '0' if key == 'OPENAI_MAX_RETRIES' else default
+            ),
+        ):
+            client = _make_client(fake_http_server)
+
+        with patch('asyncio.sleep', new=AsyncMock()):
+            with pytest.raises(InternalServerError):
+                await client.call_api(
+                    model=IA_OPENAI_TEST_1,
+                    instructions=None,
+                    messages=[{'role': 'user', 'content': 'Hi'}],
+                    config={},
+                )
+
+        assert len(fake_http_server.requests) == 1
+
+
+@pytest.mark.unit
+class TestOpenAIClientWarmup:
+    @pytest.mark.asyncio
+    async def test_warmup_opens_connection_reused_by_first_call(
+        self, fake_http_server
+    ):
+        fake_http_server.enqueue(
+            200,
+            {
+                'id': IA_OPENAI_TEST_1,
+                'object': 'model',
+                'created': 1700000000,
+                'owned_by': 'openai',
+            },
+        )
+        fake_http_server.enqueue(200, _responses_payload())
+        client = _make_client(fake_http_server)
+
+        await client.warmup(IA_OPENAI_TEST_1)
+        await client.call_api(
+            model=IA_OPENAI_TEST_1,
+            instructions=None,
+            messages=[{'role': 'user', 'content': 'Hi'}],
+            config={},
+        )
+
+        warmup_request, chat_request = fake_http_server.requests
+        assert warmup_request['method'] == 'GET'
+        assert warmup_request['path'] == f'/v1/models/{IA_OPENAI_TEST_1}'
+        assert chat_request['path'] == '/v1/responses'
+        assert (
+            warmup_request['client_address'] == chat_request['client_address']
+        )
+
+
+@pytest.mark.unit
+class TestOpenAIClientRateLimiting:
+    @pytest.mark.asyncio
+    async def test_call_reconciles_with_reported_usage(self, fake_http_server):
+        from createagents.infra.config import RateLimiter
+
+        payload = _responses_payload()
+        payload['usage'] = {
+            'input_tokens': 30,
+            'input_tokens_details': {'cached_tokens': 0},
+            'output_tokens': 20,
+            'output_tokens_details': {'reasoning_tokens': 0},
+            'total_tokens': 50,
+        }
+        fake_http_server.enqueue(200, payload)
+        client = _make_client(fake_http_server)
+        limiter = RateLimiter(tokens_per_minute=100000)
+
+        with (
+            patch.object(RateLimiter, 'for_model', return_value=limiter),
+            patch.object(
+                limiter, 'reconcile', wraps=limiter.reconcile
+            ) as mock_reconcile,
+        ):
+            await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi' * 500}],
+                config={},
+            )
+
+        estimated, actual = mock_reconcile.call_args.args
+        assert estimated > 250
+        assert actual == 50
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_pauses_the_limiter(self, fake_http_server):
+        from createagents.infra.config import RateLimiter
+
+        fake_http_server.enqueue(
+            429,
+            {'error': {'message': 'rate limited'}},
+            headers={'Retry-After': '3'},
+        )
+        fake_http_server.enqueue(200, _responses_payload())
+        client = _make_client(fake_http_server)
+        limiter = RateLimiter(requests_per_minute=1000)
+
+        with (
+            patch.object(RateLimiter, 'for_model', return_value=limiter),
+            patch.object(limiter, 'pause') as mock_pause,
+            patch('asyncio.sleep', new=AsyncMock()),
+        ):
+            await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={},
+            )
+
+        mock_pause.assert_called_once_with(3.0)
+
+
+@pytest.mark.unit
+class TestOpenAIClientHedging:
+    @pytest.mark.asyncio
+    async def test_slow_call_is_answered_by_the_hedged_request(
+        self, fake_http_server
+    ):
+        import time
+
+        from createagents.infra.config import RequestHedger
+
+        def handler(request):
+            if len(fake_http_server.requests) == 1:
+                time.sleep(0.5)
+                return 200, {}, _responses_payload('slow')
+            return 200, {}, _responses_payload('fast')
+
+        fake_http_server.handler = handler
+        client = _make_client(fake_http_server)
+        hedger = RequestHedger(min_samples=1, budget=1.0)
+        hedger.record_latency(0.05)
+
+        with patch.object(RequestHedger, 'for_model', return_value=hedger):
+            response = await client.call_api(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={},
+            )
+
+        assert response.output_text == 'fast'
+        assert len(fake_http_server.requests) == 2
+        assert hedger.get_stats()['hedges_won'] == 1
+
+
+@pytest.mark.unit
+class TestOpenAIClientClose:
+    @pytest.mark.asyncio
+    async def test_aclose_closes_connections_and_stays_usable(
+        self, fake_http_server
+    ):
+        from openai import AsyncOpenAI
+
+        clients = []
+
+        def make_client(api_key):
+            client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=f'{fake_http_server.url}/v1',
+                max_retries=0,
+            )
+            clients.append(client)
+            return client
+
+        fake_http_server.default_response = (200, {}, _responses_payload())
+        with (
+            patch(
+                'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_api_key',
+                return_value='test-api-key',
+            ),
+            patch(
+                'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client',
+                side_effect=make_client,
+            ),
+        ):
+            client = OpenAIClient()
+            await client.aclose()
+
+        assert clients[0].is_closed()
+        response = await client.call_api(
+            model=IA_OPENAI_TEST_1,
+            instructions=None,
+            messages=[{'role': 'user', 'content': 'Hi'}],
+            config={},
+        )
+        assert response.output_text == 'Hello from fake server'
+        assert not clients[1].is_closed()
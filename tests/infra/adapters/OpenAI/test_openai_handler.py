@@ -130,12 +130,15 @@ class TestOpenAIHandler:
 
         # Mock tool execution
         mock_executor = Mock()
-        mock_executor.execute_tool = AsyncMock()
+        mock_executor.execute_multiple_tools = AsyncMock()
+        mock_executor.get_cache_stats.return_value = {'hits': 0, 'misses': 1}
         mock_executor_cls.return_value = mock_executor
         mock_execution_result = Mock()
         mock_execution_result.success = True
         mock_execution_result.result = 'Tool Result'
-        mock_executor.execute_tool.return_value = mock_execution_result
+        mock_executor.execute_multiple_tools.return_value = [
+            mock_execution_result
+        ]
 
         # Mock responses
         response1 = self._make_response(
@@ -159,8 +162,145 @@ class TestOpenAIHandler:
         # Verify
         assert response == 'Final Answer'
         assert self.mock_client.call_api.call_count == 2
-        mock_executor.execute_tool.assert_called_with('test_tool', arg='val')
+        mock_executor.execute_multiple_tools.assert_awaited_once_with(
+            [
+                {
+                    'id': 'call_1',
+                    'name': 'test_tool',
+                    'arguments': {'arg': 'val'},
+                }
+            ],
+            parallel=True,
+            max_concurrency=4,
+        )
 
         metrics = self.handler.get_metrics()
         assert len(metrics) == 1
         assert metrics[0].success is True
+
+    @patch('createagents.infra.adapters.OpenAI.openai_handler.ToolExecutor')
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_handler.ToolSchemaFormatter'
+    )
+    @pytest.mark.asyncio
+    async def test_tool_pool_is_passed_to_tool_executor(
+        self, mock_formatter, mock_executor_cls
+    ):
+        mock_executor_cls.return_value.get_cache_stats.return_value = {
+            'hits': 0,
+            'misses': 0,
+        }
+        self.mock_client.call_api.return_value = self._make_response(
+            output_text='Answer'
+        )
+
+        await self.handler.execute_tool_loop(
+            model=IA_OPENAI_TEST_1,
+            instructions=None,
+            messages=[],
+            config={},
+            tools=[Mock(name='test_tool')],
+            tool_pool='io',
+        )
+
+        assert mock_executor_cls.call_args.kwargs['default_pool'] == 'io'
+
+
+@pytest.mark.unit
+class TestOpenAIHandlerDeadline:
+    def setup_method(self):
+        self.mock_client = Mock()
+        self.mock_client.call_api = AsyncMock()
+        self.handler = OpenAIHandler(self.mock_client)
+
+    @patch('createagents.infra.adapters.OpenAI.openai_handler.ToolCallParser')
+    @patch('createagents.infra.adapters.OpenAI.openai_handler.ToolExecutor')
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_handler.ToolSchemaFormatter'
+    )
+    @pytest.mark.asyncio
+    async def test_deadline_stops_the_loop_and_records_partial_metrics(
+        self, mock_formatter, mock_executor_cls, mock_parser
+    ):
+        import asyncio
+
+        from createagents.domain import ChatTimeoutException, Deadline
+
+        mock_parser.has_tool_calls.return_value = True
+        mock_parser.get_assistant_message_with_tool_calls.return_value = []
+        mock_parser.extract_tool_calls.return_value = [
+            {'id': 'call_1', 'name': 'test_tool', 'arguments': {}}
+        ]
+        mock_executor = Mock()
+        mock_executor.get_cache_stats.return_value = {'hits': 0, 'misses': 0}
+        mock_executor.execute_multiple_tools = AsyncMock(
+            return_value=[Mock(success=True, result='Tool Result')]
+        )
+        mock_executor_cls.return_value = mock_executor
+
+        first = MagicMock()
+        first.usage = MagicMock(total_tokens=50)
+
+        async def call_api(*args, **kwargs):
+            if self.mock_client.call_api.await_count > 1:
+                await asyncio.sleep(1)
+            return first
+
+        self.mock_client.call_api.side_effect = call_api
+        deadline = Deadline(0.05)
+
+        with pytest.raises(ChatTimeoutException):
+            await self.handler.execute_tool_loop(
+                model=IA_OPENAI_TEST_1,
+                instructions='Instr',
+                messages=[],
+                config={},
+                tools=[Mock(name='test_tool')],
+                deadline=deadline,
+            )
+
+        assert mock_executor_cls.call_args.kwargs['deadline'] is deadline
+        for call in self.mock_client.call_api.call_args_list:
+            assert call.kwargs['deadline'] is deadline
+
+        metrics = self.handler.get_metrics()
+        assert len(metrics) == 1
+        assert metrics[0].timed_out is True
+        assert metrics[0].success is False
+        assert metrics[0].tokens_used == 50
+
+
+@pytest.mark.unit
+class TestOpenAIHandlerCancellation:
+    @pytest.mark.asyncio
+    async def test_cancelled_call_records_cancelled_metric(self):
+        import asyncio
+
+        started = asyncio.Event()
+
+        async def call_api(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(10)
+
+        client = Mock()
+        client.call_api = AsyncMock(side_effect=call_api)
+        handler = OpenAIHandler(client)
+
+        task = asyncio.ensure_future(
+            handler.execute_tool_loop(
+                model=IA_OPENAI_TEST_1,
+                instructions='Instr',
+                messages=[],
+                config={},
+                tools=None,
+            )
+        )
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        metrics = handler.get_metrics()
+        assert len(metrics) == 1
+        assert metrics[0].cancelled is True
+        assert metrics[0].timed_out is False
@@ -0,0 +1,547 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from createagents.domain import BaseTool
+from createagents.infra.adapters.OpenAI.openai_client import OpenAIClient
+from createagents.infra.adapters.OpenAI.openai_handler import OpenAIHandler
+from createagents.infra.adapters.OpenAI.openai_response_chain import (
+    OpenAIResponseChain,
+)
+from createagents.infra.adapters.OpenAI.openai_stream_handler import (
+    OpenAIStreamHandler,
+)
+
+IA_OPENAI_TEST_1: str = 'gpt-5-nano'
+
+
+class _EchoTool(BaseTool):
+    name = 'echo'
+    description = 'Echoes the given text'
+    parameters = {
+        'type': 'object',
+        'properties': {'text': {'type': 'string'}},
+        'required': ['text'],
+    }
+
+    def execute(self, text: str) -> str:
+        return f'echo: {text}'
+
+
+class StatefulResponsesAPI:
+    """A stand-in Responses API that stores every response server-side.
+
+    The reply summarises the whole context the server reconstructed, so
+    tests can check that incremental requests lose nothing.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.bodies = []
+        self.__counter = 0
+
+    def __call__(self, request):
+        body = request['body']
+        self.bodies.append(body)
+
+        previous_id = body.get('previous_response_id')
+        if previous_id is not None and previous_id not in self.store:
+            return (
+                400,
+                {},
+                {
+                    'error': {
+                        'message': (
+                            f"Previous response with id '{previous_id}' "
+                            'not found.'
+                        ),
+                        'type': 'invalid_request_error',
+                        'param': 'previous_response_id',
+                        'code': 'previous_response_not_found',
+                    }
+                },
+            )
+
+        context = list(self.store.get(previous_id, [])) + list(body['input'])
+        self.__counter += 1
+        response_id = f'resp_{self.__counter}'
+
+        last_user = max(
+            i for i, item in enumerate(context) if item.get('role') == 'user'
+        )
+        answered = any(
+            item.get('type') == 'function_call_output'
+            for item in context[last_user:]
+        )
+        if body.get('tools') and not answered:
+            output = [
+                {
+                    'type': 'function_call',
+                    'id': f'fc_{self.__counter}',
+                    'call_id': f'call_{self.__counter}',
+                    'name': 'echo',
+                    'arguments': json.dumps(
+                        {'text': context[last_user]['content']}
+                    ),
+                    'status': 'completed',
+                }
+            ]
+        else:
+            users = sum(1 for item in context if item.get('role') == 'user')
+            outputs = sum(
+                1
+                for item in context
+                if item.get('type') == 'function_call_output'
+            )
+            output = [
+                {
+                    'type': 'message',
+                    'id': f'msg_{self.__counter}',
+                    'status': 'completed',
+                    'role': 'assistant',
+                    'content': [
+                        {
+                            'type': 'output_text',
+                            'text': f'users={users} tool_outputs={outputs}',
+                            'annotations': [],
+                        }
+                    ],
+                }
+            ]
+
+        assistant_items = [
+            {'role': 'assistant', 'content': part['text']}
+            for item in output
+            if item['type'] == 'message'
+            for part in item['content']
+        ]
+        self.store[response_id] = context + (
+            assistant_items or [dict(item) for item in output]
+        )
+
+        response = {
+            'id': response_id,
+            'object': 'response',
+            'created_at': 0,
+            'model': body['model'],
+            'status': 'completed',
+            'parallel_tool_calls': True,
+            'tool_choice': 'auto',
+            'tools': [],
+            'output': output,
+        }
+        if body.get('stream'):
+            return 200, {'Content-Type': 'text/event-stream'}, _sse(response)
+        return 200, {}, response
+
+
+def _sse(response) -> str:
+    events = []
+    for item in response['output']:
+        if item['type'] == 'message':
+            events.append(
+                {
+                    'type': 'response.output_text.delta',
+                    'item_id': item['id'],
+                    'output_index': 0,
+                    'content_index': 0,
+                    'delta': item['content'][0]['text'],
+                    'logprobs': [],
+                    'sequence_number': len(events),
+                }
+            )
+    events.append(
+        {
+            'type': 'response.completed',
+            'response': response,
+            'sequence_number': len(events),
+        }
+    )
+    return ''.join(
+        f'event: {event["type"]}\ndata: {json.dumps(event)}\n\n'
+        for event in events
+    )
+
+
+def _make_client(server) -> OpenAIClient:
+    from openai import AsyncOpenAI
+
+    real_client = AsyncOpenAI(
+        api_key='test-api-key',
+        base_url=f'{server.url}/v1',
+        max_retries=0,
+    )
+    with (
+        patch(
+            'createagents.infra.adapters.OpenAI.openai_client.EnvironmentConfig.get_api_key',
+            return_value='test-api-key',
+        ),
+        patch(
+            'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client',
+            return_value=real_client,
+        ),
+    ):
+        return OpenAIClient()
+
+
+@pytest.fixture
+def responses_api(fake_http_server):
+    api = StatefulResponsesAPI()
+    fake_http_server.handler = api
+    return api
+
+
+@pytest.mark.unit
+class TestOpenAIResponseChain:
+    def test_lookup_returns_remembered_response(self):
+        chain = OpenAIResponseChain()
+        conversation = [
+            {'role': 'user', 'content': 'Hi'},
+            {'role': 'assistant', 'content': 'Hello'},
+        ]
+
+        chain.remember(conversation, 'resp_1')
+
+        assert chain.lookup(list(conversation)) == 'resp_1'
+        assert chain.lookup(conversation[:1]) is None
+        assert chain.lookup([]) is None
+
+    def test_least_recently_used_entries_are_evicted(self):
+        chain = OpenAIResponseChain(max_entries=2)
+        first = [{'role': 'user', 'content': '1'}]
+        second = [{'role': 'user', 'content': '2'}]
+        third = [{'role': 'user', 'content': '3'}]
+
+        chain.remember(first, 'resp_1')
+        chain.remember(second, 'resp_2')
+        chain.lookup(first)
+        chain.remember(third, 'resp_3')
+
+        assert len(chain) == 2
+        assert chain.lookup(first) == 'resp_1'
+        assert chain.lookup(second) is None
+
+    def test_context_is_part_of_the_key(self):
+        chain = OpenAIResponseChain()
+        conversation = [{'role': 'user', 'content': 'Hi'}]
+        context = OpenAIResponseChain.context('gpt-5-nano', 'Be brief.', None)
+        chain.remember(conversation, 'resp_1', context)
+
+        assert chain.lookup(conversation, context) == 'resp_1'
+        assert chain.lookup(conversation) is None
+        assert (
+            chain.lookup(
+                conversation,
+                OpenAIResponseChain.context('gpt-5-nano', 'Be kind.', None),
+            )
+            is None
+        )
+        assert (
+            chain.lookup(
+                conversation,
+                OpenAIResponseChain.context(
+                    'gpt-5-nano', 'Be brief.', [{'name': 'echo'}]
+                ),
+            )
+            is None
+        )
+
+    def test_sessions_keep_one_entry_each(self):
+        chain = OpenAIResponseChain()
+        first = [{'role': 'user', 'content': 'Hi'}]
+        second = first + [
+            {'role': 'assistant', 'content': 'Hello'},
+            {'role': 'user', 'content': 'Bye'},
+        ]
+
+        chain.remember(first, 'resp_1', session='s1')
+        chain.remember(second, 'resp_2', session='s1')
+
+        assert len(chain) == 1
+        assert chain.lookup(second, session='s1') == 'resp_2'
+        assert chain.lookup(first, session='s1') is None
+        assert chain.lookup(second, session='s2') is None
+        assert chain.lookup(second) is None
+
+    def test_forget_drops_entries_for_response(self):
+        chain = OpenAIResponseChain()
+        conversation = [{'role': 'user', 'content': 'Hi'}]
+        chain.remember(conversation, 'resp_1')
+
+        chain.forget('resp_1')
+
+        assert chain.lookup(conversation) is None
+
+    def test_remember_ignores_missing_response_id(self):
+        chain = OpenAIResponseChain()
+
+        chain.remember([{'role': 'user', 'content': 'Hi'}], None)
+
+        assert len(chain) == 0
+
+    def test_invalid_max_entries_raises(self):
+        with pytest.raises(ValueError):
+            OpenAIResponseChain(max_entries=0)
+
+    def test_missing_state_error_detection(self):
+        missing = Mock(status_code=400, code='previous_response_not_found')
+        not_found = Mock(status_code=404, code=None)
+        not_found.__str__ = lambda self: 'Previous response not found'
+        bad_request = Mock(status_code=400, code='invalid_value')
+        bad_request.__str__ = lambda self: 'Invalid temperature'
+        server_error = Mock(status_code=500, code=None)
+
+        assert OpenAIResponseChain.is_missing_state_error(missing)
+        assert OpenAIResponseChain.is_missing_state_error(not_found)
+        assert not OpenAIResponseChain.is_missing_state_error(bad_request)
+        assert not OpenAIResponseChain.is_missing_state_error(server_error)
+        assert not OpenAIResponseChain.is_missing_state_error(
+            ValueError('previous response')
+        )
+
+
+@pytest.mark.unit
+class TestIncrementalStateAgainstStatefulServer:
+    @pytest.mark.asyncio
+    async def test_tool_loop_sends_only_tool_outputs(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIHandler(
+            _make_client(fake_http_server),
+            response_chain=OpenAIResponseChain(),
+        )
+        history = [
+            {'role': 'user', 'content': 'Earlier'},
+            {'role': 'assistant', 'content': 'Reply'},
+        ]
+
+        result = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            history + [{'role': 'user', 'content': 'Now'}],
+            None,
+            [_EchoTool()],
+        )
+
+        assert result == 'users=2 tool_outputs=1'
+        first, second = responses_api.bodies
+        assert 'previous_response_id' not in first
+        assert len(first['input']) == 3
+        assert second['previous_response_id'] == 'resp_1'
+        assert [item['type'] for item in second['input']] == [
+            'function_call_output'
+        ]
+        assert second['input'][0]['output'] == 'echo: Now'
+
+    @pytest.mark.asyncio
+    async def test_next_turn_sends_only_new_user_message(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIHandler(
+            _make_client(fake_http_server),
+            response_chain=OpenAIResponseChain(),
+        )
+        first_turn = [{'role': 'user', 'content': 'One'}]
+        answer = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1, None, list(first_turn), None, None
+        )
+
+        history = first_turn + [{'role': 'assistant', 'content': answer}]
+        result = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            history + [{'role': 'user', 'content': 'Two'}],
+            None,
+            None,
+        )
+
+        assert result == 'users=2 tool_outputs=0'
+        second = responses_api.bodies[1]
+        assert second['previous_response_id'] == 'resp_1'
+        assert second['input'] == [{'role': 'user', 'content': 'Two'}]
+
+    @pytest.mark.asyncio
+    async def test_other_session_with_same_history_replays_in_full(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIHandler(
+            _make_client(fake_http_server),
+            response_chain=OpenAIResponseChain(),
+        )
+        first_turn = [{'role': 'user', 'content': 'One'}]
+        answer = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1, None, list(first_turn), None, None, session='a'
+        )
+        history = first_turn + [{'role': 'assistant', 'content': answer}]
+
+        await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            history + [{'role': 'user', 'content': 'Two'}],
+            None,
+            None,
+            session='b',
+        )
+        await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            history + [{'role': 'user', 'content': 'Two'}],
+            None,
+            None,
+            session='a',
+        )
+
+        other, same = responses_api.bodies[1:]
+        assert 'previous_response_id' not in other
+        assert same['previous_response_id'] == 'resp_1'
+
+    @pytest.mark.asyncio
+    async def test_changed_instructions_fall_back_to_full_replay(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIHandler(
+            _make_client(fake_http_server),
+            response_chain=OpenAIResponseChain(),
+        )
+        first_turn = [{'role': 'user', 'content': 'One'}]
+        answer = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1, 'Be brief.', list(first_turn), None, None
+        )
+
+        await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            'Be verbose.',
+            first_turn
+            + [
+                {'role': 'assistant', 'content': answer},
+                {'role': 'user', 'content': 'Two'},
+            ],
+            None,
+            None,
+        )
+
+        assert 'previous_response_id' not in responses_api.bodies[1]
+
+    @pytest.mark.asyncio
+    async def test_changed_history_falls_back_to_full_replay(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIHandler(
+            _make_client(fake_http_server),
+            response_chain=OpenAIResponseChain(),
+        )
+        await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            [{'role': 'user', 'content': 'One'}],
+            None,
+            None,
+        )
+
+        await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            [{'role': 'user', 'content': 'Fresh start'}],
+            None,
+            None,
+        )
+
+        assert 'previous_response_id' not in responses_api.bodies[1]
+
+    @pytest.mark.asyncio
+    async def test_missing_server_state_replays_full_conversation(
+        self, fake_http_server, responses_api
+    ):
+        chain = OpenAIResponseChain()
+        handler = OpenAIHandler(
+            _make_client(fake_http_server), response_chain=chain
+        )
+        first_turn = [{'role': 'user', 'content': 'One'}]
+        answer = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1, None, list(first_turn), None, None
+        )
+        responses_api.store.clear()
+
+        result = await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            first_turn
+            + [
+                {'role': 'assistant', 'content': answer},
+                {'role': 'user', 'content': 'Two'},
+            ],
+            None,
+            None,
+        )
+
+        assert result == 'users=2 tool_outputs=0'
+        rejected, replayed = responses_api.bodies[1:]
+        assert rejected['previous_response_id'] == 'resp_1'
+        assert 'previous_response_id' not in replayed
+        assert len(replayed['input']) == 3
+
+    @pytest.mark.asyncio
+    async def test_without_chain_every_request_is_a_full_replay(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIHandler(_make_client(fake_http_server))
+
+        await handler.execute_tool_loop(
+            IA_OPENAI_TEST_1,
+            None,
+            [{'role': 'user', 'content': 'Now'}],
+            None,
+            [_EchoTool()],
+        )
+
+        first, second = responses_api.bodies
+        assert 'previous_response_id' not in second
+        assert len(second['input']) == len(first['input']) + 2
+
+    @pytest.mark.asyncio
+    async def test_stream_handler_chains_turns_and_tool_outputs(
+        self, fake_http_server, responses_api
+    ):
+        handler = OpenAIStreamHandler(
+            _make_client(fake_http_server),
+            response_chain=OpenAIResponseChain(),
+        )
+        first_turn = [{'role': 'user', 'content': 'One'}]
+
+        tokens = [
+            token
+            async for token in handler.handle_stream(
+                IA_OPENAI_TEST_1,
+                None,
+                list(first_turn),
+                {'stream': True},
+                [_EchoTool()],
+            )
+        ]
+        answer = ''.join(tokens)
+
+        tokens = [
+            token
+            async for token in handler.handle_stream(
+                IA_OPENAI_TEST_1,
+                None,
+                first_turn
+                + [
+                    {'role': 'assistant', 'content': answer},
+                    {'role': 'user', 'content': 'Two'},
+                ],
+                {'stream': True},
+                [_EchoTool()],
+            )
+        ]
+
+        assert answer == 'users=1 tool_outputs=1'
+        assert ''.join(tokens) == 'users=2 tool_outputs=2'
+        third, fourth = responses_api.bodies[2:]
+        assert third['previous_response_id'] == 'resp_2'
+        assert third['input'] == [{'role': 'user', 'content': 'Two'}]
+        assert fourth['previous_response_id'] == 'resp_3'
+        assert [item['type'] for item in fourth['input']] == [
+            'function_call_output'
+        ]
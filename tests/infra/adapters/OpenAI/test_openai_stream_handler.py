@@ -107,9 +107,13 @@ class TestOpenAIStreamHandler:
         }
 
         executor_instance = Mock()
-        executor_instance.execute_tool = AsyncMock(
-            return_value=SimpleNamespace(success=True, result='done')
+        executor_instance.execute_multiple_tools = AsyncMock(
+            return_value=[SimpleNamespace(success=True, result='done')]
         )
+        executor_instance.get_cache_stats.return_value = {
+            'hits': 0,
+            'misses': 1,
+        }
         mock_executor_cls.return_value = executor_instance
 
         response_with_tool = SimpleNamespace(usage=None)
@@ -144,8 +148,8 @@ class TestOpenAIStreamHandler:
             collected.append(token)
 
         assert ''.join(collected) == 'Answer'
-        executor_instance.execute_tool.assert_awaited_once_with(
-            'dummy', value=1
+        executor_instance.execute_multiple_tools.assert_awaited_once_with(
+            [{'name': 'dummy', 'arguments': {'value': 1}, 'id': 'call_1'}]
         )
         metrics = self.handler.get_metrics()
         assert len(metrics) == 1
@@ -173,3 +177,81 @@ class TestOpenAIStreamHandler:
         assert len(metrics) == 1
         assert metrics[0].success is False
         assert 'Stream Error' in metrics[0].error_message
+
+
+class ClosableStream(FakeStream):
+    """A stream that records whether the SDK `close` was awaited."""
+
+    def __init__(self, events):
+        super().__init__(events)
+        self.close = AsyncMock()
+
+
+@pytest.mark.unit
+class TestOpenAIStreamHandlerCancellation:
+    def setup_method(self):
+        self.mock_client = Mock()
+        self.mock_client.call_api = AsyncMock()
+        self.handler = OpenAIStreamHandler(self.mock_client)
+
+    def _delta(self, text):
+        event = MagicMock()
+        event.type = 'response.output_text.delta'
+        event.delta = text
+        return event
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_closes_upstream_and_records_metric(
+        self,
+    ):
+        upstream = ClosableStream([self._delta('Hello'), self._delta('!')])
+        self.mock_client.call_api.return_value = upstream
+
+        stream = self.handler.handle_stream(
+            model=IA_OPENAI_TEST_1,
+            instructions=None,
+            messages=[{'role': 'user', 'content': 'Hi'}],
+            config={'stream': True},
+            tools=None,
+        )
+        assert await stream.__anext__() == 'Hello'
+        await stream.aclose()
+
+        upstream.close.assert_awaited_once()
+        metrics = self.handler.get_metrics()
+        assert len(metrics) == 1
+        assert metrics[0].cancelled is True
+        assert metrics[0].success is False
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_reader_closes_upstream(self):
+        import asyncio
+
+        waiting = asyncio.Event()
+
+        class StalledStream(ClosableStream):
+            async def __anext__(self):
+                waiting.set()
+                await asyncio.sleep(10)
+
+        upstream = StalledStream([])
+        self.mock_client.call_api.return_value = upstream
+
+        async def read():
+            async for _ in self.handler.handle_stream(
+                model=IA_OPENAI_TEST_1,
+                instructions=None,
+                messages=[{'role': 'user', 'content': 'Hi'}],
+                config={'stream': True},
+                tools=None,
+            ):
+                pass
+
+        task = asyncio.ensure_future(read())
+        await waiting.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        upstream.close.assert_awaited_once()
+        assert self.handler.get_metrics()[0].cancelled is True
@@ -0,0 +1,252 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from createagents.domain import BaseTool, ToolExecutor
+from createagents.infra.adapters.OpenAI.openai_stream_handler import (
+    OpenAIStreamHandler,
+)
+from createagents.infra.adapters.OpenAI.stream_tool_dispatcher import (
+    StreamToolDispatcher,
+)
+
+
+class _SlowTool(BaseTool):
+    name = 'slow'
+    description = 'Sleeps, then echoes its input'
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.started = []
+
+    async def execute(self, value: str) -> str:
+        self.started.append(value)
+        await asyncio.sleep(self.delay)
+        return value.upper()
+
+
+def _function_call(call_id, value, item_id=None):
+    return SimpleNamespace(
+        type='function_call',
+        id=item_id or f'fc_{call_id}',
+        call_id=call_id,
+        name='slow',
+        arguments=f'{{"value": "{value}"}}',
+    )
+
+
+def _item_done(item):
+    return SimpleNamespace(type='response.output_item.done', item=item)
+
+
+def _make_dispatcher(tool, max_concurrency=4):
+    return StreamToolDispatcher(ToolExecutor([tool], Mock()), max_concurrency)
+
+
+@pytest.mark.unit
+class TestStreamToolDispatcher:
+    @pytest.mark.asyncio
+    async def test_output_item_done_starts_the_call(self):
+        tool = _SlowTool()
+        dispatcher = _make_dispatcher(tool)
+
+        dispatcher.on_event(_item_done(_function_call('call_1', 'a')))
+        await asyncio.sleep(0)
+
+        assert tool.started == ['a']
+
+    @pytest.mark.asyncio
+    async def test_arguments_done_starts_an_added_call(self):
+        tool = _SlowTool()
+        dispatcher = _make_dispatcher(tool)
+        item = _function_call('call_1', 'ignored', item_id='fc_1')
+
+        dispatcher.on_event(
+            SimpleNamespace(type='response.output_item.added', item=item)
+        )
+        dispatcher.on_event(
+            SimpleNamespace(
+                type='response.function_call_arguments.done',
+                item_id='fc_1',
+                arguments='{"value": "b"}',
+            )
+        )
+        dispatcher.on_event(_item_done(item))
+        await asyncio.sleep(0)
+
+        assert tool.started == ['b']
+
+    @pytest.mark.asyncio
+    async def test_join_returns_results_in_call_order(self):
+        tool = _SlowTool()
+        dispatcher = _make_dispatcher(tool)
+        dispatcher.on_event(_item_done(_function_call('call_2', 'b')))
+
+        results = await dispatcher.join(
+            [
+                {'id': 'call_1', 'name': 'slow', 'arguments': {'value': 'a'}},
+                {'id': 'call_2', 'name': 'slow', 'arguments': {'value': 'b'}},
+            ]
+        )
+
+        assert [r.result for r in results] == ['A', 'B']
+        assert sorted(tool.started) == ['a', 'b']
+
+    @pytest.mark.asyncio
+    async def test_join_cancels_calls_missing_from_the_response(self):
+        tool = _SlowTool(delay=1)
+        dispatcher = _make_dispatcher(tool)
+        dispatcher.on_event(_item_done(_function_call('call_1', 'a')))
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        results = await dispatcher.join([])
+
+        assert results == []
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_early_and_late_calls_share_the_concurrency_limit(self):
+        class _CountingTool(_SlowTool):
+            running = 0
+            peak = 0
+
+            async def execute(self, value: str) -> str:
+                type(self).running += 1
+                type(self).peak = max(type(self).peak, type(self).running)
+                try:
+                    return await super().execute(value)
+                finally:
+                    type(self).running -= 1
+
+        tool = _CountingTool(delay=0.05)
+        dispatcher = _make_dispatcher(tool, max_concurrency=2)
+        dispatcher.on_event(_item_done(_function_call('call_1', 'a')))
+        dispatcher.on_event(_item_done(_function_call('call_2', 'b')))
+
+        results = await dispatcher.join(
+            [
+                {'id': f'call_{i}', 'name': 'slow', 'arguments': {'value': v}}
+                for i, v in enumerate('abcd', 1)
+            ]
+        )
+
+        assert [r.result for r in results] == ['A', 'B', 'C', 'D']
+        assert _CountingTool.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_idempotent_calls_run_once_across_phases(self):
+        class _IdempotentTool(_SlowTool):
+            idempotent = True
+
+        tool = _IdempotentTool(delay=0.05)
+        dispatcher = _make_dispatcher(tool)
+        dispatcher.on_event(_item_done(_function_call('call_1', 'a')))
+
+        results = await dispatcher.join(
+            [
+                {'id': 'call_1', 'name': 'slow', 'arguments': {'value': 'a'}},
+                {'id': 'call_2', 'name': 'slow', 'arguments': {'value': 'a'}},
+            ]
+        )
+
+        assert [r.result for r in results] == ['A', 'A']
+        assert tool.started == ['a']
+
+    @pytest.mark.asyncio
+    async def test_non_function_items_are_ignored(self):
+        tool = _SlowTool()
+        dispatcher = _make_dispatcher(tool)
+
+        dispatcher.on_event(
+            _item_done(SimpleNamespace(type='message', id='msg_1'))
+        )
+        await asyncio.sleep(0)
+
+        assert tool.started == []
+
+
+class _TimedStream:
+    """Yields events, sleeping where a float is found."""
+
+    def __init__(self, events):
+        self._events = list(events)
+
+    async def __aiter__(self):
+        for event in self._events:
+            if isinstance(event, float):
+                await asyncio.sleep(event)
+            else:
+                yield event
+
+
+@pytest.mark.unit
+class TestOpenAIStreamHandlerEarlyDispatch:
+    @pytest.mark.asyncio
+    async def test_tool_runs_while_the_stream_continues(self):
+        tool = _SlowTool(delay=0.1)
+        call = _function_call('call_1', 'a')
+        tool_response = SimpleNamespace(id='resp_1', output=[call], usage=None)
+        final_response = SimpleNamespace(
+            id='resp_2',
+            output=[SimpleNamespace(type='message')],
+            usage=None,
+        )
+        client = Mock()
+        client.call_api = Mock(
+            side_effect=[
+                _stream_coroutine(
+                    _TimedStream(
+                        [
+                            _item_done(call),
+                            0.1,
+                            SimpleNamespace(
+                                type='response.completed',
+                                response=tool_response,
+                            ),
+                        ]
+                    )
+                ),
+                _stream_coroutine(
+                    _TimedStream(
+                        [
+                            SimpleNamespace(
+                                type='response.output_text.delta',
+                                delta='done',
+                            ),
+                            SimpleNamespace(
+                                type='response.completed',
+                                response=final_response,
+                            ),
+                        ]
+                    )
+                ),
+            ]
+        )
+        handler = OpenAIStreamHandler(client)
+        messages = [{'role': 'user', 'content': 'Hi'}]
+
+        start = time.perf_counter()
+        tokens = [
+            token
+            async for token in handler.handle_stream(
+                'gpt-4', None, messages, None, [tool]
+            )
+        ]
+        elapsed = time.perf_counter() - start
+
+        assert tokens == ['done']
+        assert tool.started == ['a']
+        assert elapsed < 0.18
+        assert messages[-1] == {
+            'type': 'function_call_output',
+            'call_id': 'call_1',
+            'output': 'A',
+        }
+
+
+async def _stream_coroutine(stream):
+    return stream
@@ -20,6 +20,23 @@ class TestCurrentDateTool:
         tool = CurrentDateTool()
         assert tool.name == 'currentdate'
 
+    def test_error_results_are_not_cached_and_instances_share(self):
+        from createagents.domain import ToolResultCache
+
+        cache = ToolResultCache()
+        error = CurrentDateTool().execute('date', 'Invalid/Zone')
+        cache.set(CurrentDateTool(), {'action': 'date', 'tz': 'x'}, error)
+        cache.set(CurrentDateTool(), {'action': 'date', 'tz': 'UTC'}, 'ok')
+
+        assert error.startswith('[CurrentDateTool Error]')
+        assert cache.get(CurrentDateTool(), {'action': 'date', 'tz': 'x'}) == (
+            False,
+            None,
+        )
+        assert cache.get(
+            CurrentDateTool(), {'action': 'date', 'tz': 'UTC'}
+        ) == (True, 'ok')
+
     def test_tool_has_description(self):
         tool = CurrentDateTool()
         assert tool.description
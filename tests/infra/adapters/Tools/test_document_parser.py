@@ -0,0 +1,187 @@
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from createagents.domain import FileReadException, ToolPools
+from createagents.infra.adapters.Tools.Read_Local_File_Tool import (
+    DocumentParser,
+)
+from createagents.infra.adapters.Tools.Read_Local_File_Tool.file_utils import (
+    format_pdf_pages,
+    read_pdf_file,
+)
+
+MODULE = (
+    'createagents.infra.adapters.Tools.Read_Local_File_Tool.document_parser'
+)
+
+
+def _fake_partition(path, first_page=1, last_page=None):
+    last_page = last_page or 3
+    # Later ranges finish first, so ordering is up to the parser.
+    time.sleep(0.01 * (10 - first_page // 10))
+    return [
+        (page, f'text of page {page}')
+        for page in range(first_page, last_page + 1)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def thread_pool():
+    # A thread pool lets the patched partition functions reach the workers.
+    ToolPools.register(DocumentParser.POOL_NAME, max_workers=4)
+    yield
+    ToolPools.shutdown()
+    DocumentParser.reset_shared()
+
+
+@pytest.mark.unit
+class TestDocumentParser:
+    @pytest.mark.parametrize(
+        'kwargs',
+        [{'workers': -1}, {'pages_per_chunk': 0}, {'timeout_s': 0}],
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            DocumentParser(**kwargs)
+
+    def test_from_env(self):
+        env = {
+            'DOCUMENT_PARSER_WORKERS': '3',
+            'DOCUMENT_PARSER_PAGES_PER_CHUNK': '5',
+            'DOCUMENT_PARSER_TIMEOUT': '12.5',
+        }
+        with patch(
+            f'{MODULE}.EnvironmentConfig.get_env',
+            side_effect=lambda key, default=None: env.get(key, default),
+        ):
+            parser = DocumentParser.from_env()
+
+        assert parser.workers == 3
+        assert parser.pages_per_chunk == 5
+        assert parser.timeout_s == 12.5
+
+    def test_long_pdf_is_split_and_merged_in_page_order(self):
+        parser = DocumentParser(pages_per_chunk=20)
+
+        with (
+            patch(f'{MODULE}._count_pages', return_value=45),
+            patch(
+                f'{MODULE}.partition_pdf_pages', side_effect=_fake_partition
+            ) as partition,
+        ):
+            page_texts = parser.parse_pdf(Path('big.pdf'))
+
+        assert sorted(call.args for call in partition.call_args_list) == [
+            ('big.pdf', 1, 20),
+            ('big.pdf', 21, 40),
+            ('big.pdf', 41, 45),
+        ]
+        assert [page for page, _ in page_texts] == list(range(1, 46))
+        stats = ToolPools.get_stats()[DocumentParser.POOL_NAME]
+        assert stats['completed'] == 3
+
+    def test_short_pdf_is_parsed_whole(self):
+        parser = DocumentParser(pages_per_chunk=20)
+
+        with (
+            patch(f'{MODULE}._count_pages', return_value=3),
+            patch(
+                f'{MODULE}.partition_pdf_pages', side_effect=_fake_partition
+            ) as partition,
+        ):
+            page_texts = parser.parse_pdf(Path('small.pdf'))
+
+        partition.assert_called_once_with('small.pdf', 1, None)
+        assert len(page_texts) == 3
+
+    def test_inline_parsing_without_workers(self):
+        ToolPools.shutdown()
+        parser = DocumentParser(workers=0)
+
+        with (
+            patch(f'{MODULE}._count_pages') as count_pages,
+            patch(
+                f'{MODULE}.partition_document',
+                return_value=[(None, 'hello')],
+            ),
+        ):
+            assert parser.parse_document(Path('a.docx')) == [(None, 'hello')]
+
+        count_pages.assert_not_called()
+        assert ToolPools.get_stats() == {}
+
+    def test_timeout_fails_the_document(self):
+        parser = DocumentParser(timeout_s=0.05)
+
+        def slow(path):
+            time.sleep(0.5)
+            return []
+
+        with patch(f'{MODULE}.partition_document', side_effect=slow):
+            with pytest.raises(FileReadException, match='timed out'):
+                parser.parse_document(Path('slow.docx'))
+
+    def test_failed_range_fails_the_document(self):
+        parser = DocumentParser(pages_per_chunk=10)
+
+        def partition(path, first_page=1, last_page=None):
+            if first_page == 11:
+                raise ValueError('broken page')
+            time.sleep(0.2)
+            return [(first_page, 'text')]
+
+        with (
+            patch(f'{MODULE}._count_pages', return_value=30),
+            patch(f'{MODULE}.partition_pdf_pages', side_effect=partition),
+        ):
+            with pytest.raises(ValueError, match='broken page'):
+                parser.parse_pdf(Path('broken.pdf'))
+
+    def test_creates_warm_process_pool_on_first_use(self):
+        ToolPools.shutdown()
+
+        DocumentParser(workers=1).warmup()
+
+        stats = ToolPools.get_stats()[DocumentParser.POOL_NAME]
+        assert stats['kind'] == 'process'
+        assert stats['max_workers'] == 1
+
+
+@pytest.mark.unit
+class TestReadPdfWithParser:
+    def test_format_pdf_pages_groups_by_page(self):
+        text = format_pdf_pages([(1, 'a'), (1, 'b'), (2, 'c')])
+
+        assert text == '--- Page 1 ---\na\nb\n\n--- Page 2 ---\nc'
+
+    def test_format_pdf_pages_without_page_numbers(self):
+        assert format_pdf_pages([(None, 'a'), (None, 'b')]) == 'a\n\nb'
+
+    def test_read_pdf_file_uses_shared_parser(self):
+        with (
+            patch(
+                'createagents.infra.adapters.Tools.Read_Local_File_Tool.'
+                'file_utils.importlib.util.find_spec',
+                return_value=object(),
+            ),
+            patch.object(
+                DocumentParser,
+                'parse_pdf',
+                return_value=[(1, 'first'), (2, 'second')],
+            ),
+        ):
+            text = read_pdf_file(Path('doc.pdf'))
+
+        assert text == '--- Page 1 ---\nfirst\n\n--- Page 2 ---\nsecond'
+
+    def test_read_pdf_file_requires_unstructured(self):
+        with patch(
+            'createagents.infra.adapters.Tools.Read_Local_File_Tool.'
+            'file_utils.importlib.util.find_spec',
+            return_value=None,
+        ):
+            with pytest.raises(RuntimeError, match='unstructured'):
+                read_pdf_file(Path('doc.pdf'))
@@ -451,3 +451,27 @@ class TestReadLocalFileToolMissingDependencies:
         else:
             tool = ReadLocalFileTool()
             assert tool is not None
+
+
+@pytest.mark.unit
+class TestReadLocalFileToolCacheVersion:
+    MODULE = (
+        'createagents.infra.adapters.Tools.Read_Local_File_Tool.'
+        'read_local_file_tool'
+    )
+
+    def test_edited_file_changes_the_cache_version(self, tmp_path):
+        module = pytest.importorskip(self.MODULE)
+        if not module.DEPENDENCIES_AVAILABLE:
+            pytest.skip('Optional dependencies not available')
+        with patch(f'{self.MODULE}.initialize_tiktoken'):
+            tool = module.ReadLocalFileTool()
+        path = tmp_path / 'notes.txt'
+        path.write_text('first')
+
+        before = tool.cache_version({'path': str(path)})
+        path.write_text('second version')
+
+        assert before is not None
+        assert tool.cache_version({'path': str(path)}) != before
+        assert tool.cache_version({'path': str(tmp_path / 'missing')}) is None
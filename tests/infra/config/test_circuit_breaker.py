@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+import pytest
+
+from createagents.domain import ChatException, CircuitOpenException
+from createagents.infra.config import (
+    ChatMetrics,
+    CircuitBreaker,
+    CircuitState,
+    EnvironmentConfig,
+)
+
+
+def _ok(latency_ms: float = 10.0) -> ChatMetrics:
+    return ChatMetrics(model='m', latency_ms=latency_ms)
+
+
+def _failed() -> ChatMetrics:
+    return ChatMetrics(
+        model='m', latency_ms=10.0, success=False, error_message='boom'
+    )
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch(
+        'createagents.infra.config.circuit_breaker.time.monotonic',
+        side_effect=lambda: now[0],
+    ):
+        yield now
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    def test_starts_closed(self):
+        breaker = CircuitBreaker()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.acquire() is False
+
+    def test_does_not_trip_below_min_requests(self):
+        breaker = CircuitBreaker(min_requests=5)
+        for _ in range(4):
+            breaker.record(_failed())
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_opens_when_failure_rate_is_reached(self):
+        breaker = CircuitBreaker(min_requests=4, failure_rate=0.5)
+        breaker.record(_ok())
+        breaker.record(_ok())
+        breaker.record(_failed())
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record(_failed())
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker(
+            min_requests=2, failure_rate=1.0, slow_call_ms=100
+        )
+
+        breaker.record(_ok(latency_ms=150))
+        breaker.record(_ok(latency_ms=500))
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_old_outcomes_leave_the_window(self, clock):
+        breaker = CircuitBreaker(window_s=10, min_requests=2)
+        breaker.record(_failed())
+        clock[0] += 11
+
+        breaker.record(_failed())
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_open_circuit_fails_fast(self, clock):
+        breaker = CircuitBreaker(min_requests=1, open_s=30)
+        breaker.record(_failed())
+        clock[0] += 10
+
+        with pytest.raises(CircuitOpenException) as exc_info:
+            breaker.acquire()
+
+        assert isinstance(exc_info.value, ChatException)
+        assert exc_info.value.retry_after == pytest.approx(20.0)
+        assert breaker.get_stats()['rejected'] == 1
+
+    def test_half_open_lets_a_single_probe_through(self, clock):
+        breaker = CircuitBreaker(min_requests=1, open_s=30)
+        breaker.record(_failed())
+        clock[0] += 31
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.acquire() is True
+        with pytest.raises(CircuitOpenException):
+            breaker.acquire()
+
+    def test_successful_probe_closes_the_circuit(self, clock):
+        breaker = CircuitBreaker(min_requests=1, open_s=30)
+        breaker.record(_failed())
+        clock[0] += 31
+        probe = breaker.acquire()
+
+        breaker.record(_ok(), probe=probe)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.acquire() is False
+
+    def test_failed_probe_opens_the_circuit_again(self, clock):
+        breaker = CircuitBreaker(min_requests=1, open_s=30)
+        breaker.record(_failed())
+        clock[0] += 31
+        probe = breaker.acquire()
+
+        breaker.record(_failed(), probe=probe)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.get_stats()['times_opened'] == 2
+
+    def test_non_probe_outcomes_do_not_decide_recovery(self, clock):
+        breaker = CircuitBreaker(min_requests=1, open_s=30)
+        breaker.record(_failed())
+        clock[0] += 31
+        breaker.acquire()
+
+        breaker.record(_ok())
+
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    def test_release_frees_the_probe_slot(self, clock):
+        breaker = CircuitBreaker(min_requests=1, open_s=30)
+        breaker.record(_failed())
+        clock[0] += 31
+        breaker.acquire()
+
+        breaker.release()
+
+        assert breaker.acquire() is True
+
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {'window_s': 0},
+            {'open_s': -1},
+            {'min_requests': 0},
+            {'failure_rate': 0},
+            {'failure_rate': 1.5},
+            {'slow_call_ms': 0},
+        ],
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            CircuitBreaker(**kwargs)
+
+
+@pytest.mark.unit
+class TestCircuitBreakerFromEnv:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv('CIRCUIT_BREAKER_ENABLED', raising=False)
+        EnvironmentConfig.clear_cache()
+
+        assert CircuitBreaker.from_env('openai:gpt-4') is None
+
+    def test_reads_settings(self, monkeypatch):
+        monkeypatch.setenv('CIRCUIT_BREAKER_ENABLED', 'true')
+        monkeypatch.setenv('CIRCUIT_BREAKER_MIN_REQUESTS', '3')
+        monkeypatch.setenv('CIRCUIT_BREAKER_FAILURE_RATE', '0.25')
+        monkeypatch.setenv('CIRCUIT_BREAKER_SLOW_CALL_MS', '2000')
+        EnvironmentConfig.clear_cache()
+        try:
+            breaker = CircuitBreaker.from_env('openai:gpt-4')
+        finally:
+            monkeypatch.delenv('CIRCUIT_BREAKER_ENABLED')
+            EnvironmentConfig.clear_cache()
+
+        assert breaker is not None
+        assert breaker.name == 'openai:gpt-4'
+        assert breaker.min_requests == 3
+        assert breaker.failure_rate == 0.25
+        assert breaker.slow_call_ms == 2000.0
+        assert breaker.window_s == CircuitBreaker.DEFAULT_WINDOW_S
@@ -0,0 +1,224 @@
+import asyncio
+
+import pytest
+
+from createagents.infra.config import EnvironmentConfig, RequestHedger
+
+
+@pytest.fixture(autouse=True)
+def reset_hedgers():
+    RequestHedger.reset_registry()
+    yield
+    RequestHedger.reset_registry()
+    EnvironmentConfig.clear_cache()
+
+
+def _warm_hedger(latency: float = 0.01, **kwargs) -> RequestHedger:
+    hedger = RequestHedger(min_samples=5, budget=1.0, **kwargs)
+    for _ in range(5):
+        hedger.record_latency(latency)
+    return hedger
+
+
+def _attempts(*delays, results=None):
+    """Returns an attempt factory whose n-th attempt sleeps delays[n]."""
+    calls = []
+
+    async def attempt():
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(delays[index])
+        return results[index] if results else f'attempt-{index}'
+
+    return attempt, calls
+
+
+@pytest.mark.unit
+class TestRequestHedger:
+    def test_threshold_needs_min_samples(self):
+        hedger = RequestHedger(min_samples=3)
+        hedger.record_latency(0.1)
+        hedger.record_latency(0.2)
+
+        assert hedger.get_threshold() is None
+
+        hedger.record_latency(0.3)
+        assert hedger.get_threshold() == pytest.approx(0.3)
+
+    def test_threshold_is_the_configured_percentile(self):
+        hedger = RequestHedger(percentile=50, min_samples=1)
+        for latency in (0.4, 0.1, 0.3, 0.2):
+            hedger.record_latency(latency)
+
+        assert hedger.get_threshold() == pytest.approx(0.3)
+
+    @pytest.mark.asyncio
+    async def test_fast_attempt_is_not_hedged(self):
+        hedger = _warm_hedger(latency=0.5)
+        attempt, calls = _attempts(0.0)
+
+        result = await hedger.run(attempt)
+
+        assert result == 'attempt-0'
+        assert len(calls) == 1
+        assert hedger.get_stats()['hedges_fired'] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_attempt_is_hedged_and_hedge_wins(self):
+        hedger = _warm_hedger()
+        attempt, calls = _attempts(5.0, 0.0)
+
+        result = await asyncio.wait_for(hedger.run(attempt), timeout=1.0)
+
+        assert result == 'attempt-1'
+        assert len(calls) == 2
+        stats = hedger.get_stats()
+        assert stats['hedges_fired'] == 1
+        assert stats['hedges_won'] == 1
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win_after_hedging(self):
+        hedger = _warm_hedger()
+        attempt, _ = _attempts(0.05, 5.0)
+
+        result = await asyncio.wait_for(hedger.run(attempt), timeout=1.0)
+
+        assert result == 'attempt-0'
+        stats = hedger.get_stats()
+        assert stats['hedges_fired'] == 1
+        assert stats['hedges_won'] == 0
+
+    @pytest.mark.asyncio
+    async def test_loser_is_cancelled(self):
+        hedger = _warm_hedger()
+        cancelled = []
+
+        async def attempt():
+            if not cancelled:
+                cancelled.append(False)
+                try:
+                    await asyncio.sleep(5.0)
+                except asyncio.CancelledError:
+                    cancelled[0] = True
+                    raise
+            return 'hedge'
+
+        assert await hedger.run(attempt) == 'hedge'
+        await asyncio.sleep(0)
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_primary(self):
+        hedger = _warm_hedger()
+        calls = []
+
+        async def attempt():
+            calls.append(None)
+            if len(calls) == 2:
+                raise RuntimeError('hedge failed')
+            await asyncio.sleep(0.05)
+            return 'primary'
+
+        assert await hedger.run(attempt) == 'primary'
+
+    @pytest.mark.asyncio
+    async def test_error_of_primary_is_raised_when_all_fail(self):
+        hedger = _warm_hedger()
+
+        async def attempt():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError, match='boom'):
+            await hedger.run(attempt)
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_hedges(self):
+        hedger = RequestHedger(percentile=50, min_samples=1, budget=0.5)
+        for _ in range(50):
+            hedger.record_latency(0.001)
+
+        for _ in range(4):
+            attempt, _ = _attempts(0.02, 0.02)
+            await hedger.run(attempt)
+
+        assert hedger.get_stats()['requests'] == 4
+        assert hedger.get_stats()['hedges_fired'] == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_is_hedged_on_first_item(self):
+        hedger = _warm_hedger()
+        closed = []
+
+        def make_stream(name, first_delay):
+            async def stream():
+                try:
+                    await asyncio.sleep(first_delay)
+                    yield f'{name}-1'
+                    yield f'{name}-2'
+                finally:
+                    closed.append(name)
+
+            return stream()
+
+        streams = iter([make_stream('slow', 5.0), make_stream('fast', 0.0)])
+
+        async def attempt():
+            return next(streams)
+
+        result = await asyncio.wait_for(hedger.run_stream(attempt), 1.0)
+        items = [item async for item in result]
+        await asyncio.sleep(0)
+
+        assert items == ['fast-1', 'fast-2']
+        assert sorted(closed) == ['fast', 'slow']
+        assert hedger.get_stats()['hedges_won'] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_is_passed_through(self):
+        hedger = RequestHedger()
+
+        async def empty():
+            return
+            yield
+
+        async def attempt():
+            return empty()
+
+        result = await hedger.run_stream(attempt)
+
+        assert [item async for item in result] == []
+
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {'percentile': 0},
+            {'percentile': 100},
+            {'budget': 0},
+            {'min_samples': 0},
+            {'min_samples': 10, 'max_samples': 5},
+        ],
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            RequestHedger(**kwargs)
+
+
+@pytest.mark.unit
+class TestRequestHedgerRegistry:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv('OPENAI_HEDGING', raising=False)
+        EnvironmentConfig.clear_cache()
+
+        assert RequestHedger.for_model('openai', 'gpt-4') is None
+
+    def test_shared_per_model_with_env_settings(self, monkeypatch):
+        monkeypatch.setenv('OLLAMA_HEDGING', 'true')
+        monkeypatch.setenv('OLLAMA_HEDGE_BUDGET', '0.1')
+        EnvironmentConfig.clear_cache()
+
+        hedger = RequestHedger.for_model('ollama', 'llama3')
+
+        assert hedger is not None
+        assert hedger.budget == 0.1
+        assert hedger.percentile == RequestHedger.DEFAULT_PERCENTILE
+        assert RequestHedger.for_model('ollama', 'llama3') is hedger
@@ -1,10 +1,11 @@
+import asyncio
 import concurrent.futures
 import threading
 from datetime import datetime
 
 import pytest
 
-from createagents.infra import ChatMetrics, MetricsCollector
+from createagents.infra import ChatMetrics, MetricsCollector, MetricsScope
 
 
 @pytest.mark.unit
@@ -670,3 +671,186 @@ class TestMetricsCollector:
         assert isinstance(timestamp_str, str)
         parsed = datetime.fromisoformat(timestamp_str)
         assert isinstance(parsed, datetime)
+
+
+@pytest.mark.unit
+class TestChatMetricsResidency:
+    def test_residency_counts_default_to_none(self):
+        metrics = ChatMetrics(model='llama3', latency_ms=10.0)
+
+        assert metrics.model_loads is None
+        assert metrics.model_unloads is None
+        assert 'loads=' not in str(metrics)
+
+    def test_residency_counts_in_dict_and_str(self):
+        metrics = ChatMetrics(
+            model='llama3', latency_ms=10.0, model_loads=2, model_unloads=1
+        )
+
+        result = metrics.to_dict()
+
+        assert result['model_loads'] == 2
+        assert result['model_unloads'] == 1
+        assert 'loads=2, unloads=1' in str(metrics)
+
+
+@pytest.mark.unit
+class TestChatMetricsToolCache:
+    def test_tool_cache_counts_in_dict_and_str(self):
+        metrics = ChatMetrics(
+            model='gpt-4',
+            latency_ms=10.0,
+            tool_cache_hits=2,
+            tool_cache_misses=1,
+        )
+
+        result = metrics.to_dict()
+
+        assert result['tool_cache_hits'] == 2
+        assert result['tool_cache_misses'] == 1
+        assert 'tool_cache=2/3' in str(metrics)
+
+    def test_tool_cache_counts_are_aggregated(self):
+        collector = MetricsCollector()
+        collector.add(
+            ChatMetrics(
+                model='gpt-4',
+                latency_ms=10.0,
+                tool_cache_hits=2,
+                tool_cache_misses=1,
+            )
+        )
+        collector.add(ChatMetrics(model='gpt-4', latency_ms=10.0))
+
+        summary = collector.get_summary()
+        prometheus = collector.export_prometheus()
+
+        assert summary['tool_cache_hits'] == 2
+        assert summary['tool_cache_misses'] == 1
+        assert 'chat_tool_cache_hits_total 2' in prometheus
+        assert 'chat_tool_cache_misses_total 1' in prometheus
+
+
+@pytest.mark.unit
+class TestChatMetricsTimeout:
+    def test_timed_out_defaults_to_false(self):
+        metrics = ChatMetrics(model='gpt-4', latency_ms=10.0)
+
+        assert metrics.timed_out is False
+        assert metrics.to_dict()['timed_out'] is False
+        assert 'timed out' not in str(metrics)
+
+    def test_timed_out_requests_are_counted(self):
+        collector = MetricsCollector()
+        collector.add(
+            ChatMetrics(
+                model='gpt-4',
+                latency_ms=10.0,
+                success=False,
+                tokens_used=12,
+                timed_out=True,
+            )
+        )
+        collector.add(ChatMetrics(model='gpt-4', latency_ms=10.0))
+
+        summary = collector.get_summary()
+
+        assert summary['timed_out'] == 1
+        assert summary['failed'] == 1
+        assert 'chat_requests_timed_out_total 1' in (
+            collector.export_prometheus()
+        )
+        assert 'timed out' in str(collector.get_all()[0])
+
+
+@pytest.mark.unit
+class TestChatMetricsCancellation:
+    def test_cancelled_defaults_to_false(self):
+        metrics = ChatMetrics(model='gpt-4', latency_ms=10.0)
+
+        assert metrics.cancelled is False
+        assert metrics.to_dict()['cancelled'] is False
+        assert 'cancelled' not in str(metrics)
+
+    def test_cancelled_requests_are_counted(self):
+        collector = MetricsCollector()
+        collector.add(
+            ChatMetrics(
+                model='gpt-4',
+                latency_ms=10.0,
+                success=False,
+                cancelled=True,
+            )
+        )
+        collector.add(ChatMetrics(model='gpt-4', latency_ms=10.0))
+
+        summary = collector.get_summary()
+
+        assert summary['cancelled'] == 1
+        assert summary['timed_out'] == 0
+        assert 'chat_requests_cancelled_total 1' in (
+            collector.export_prometheus()
+        )
+        assert 'cancelled' in str(collector.get_all()[0])
+
+
+@pytest.mark.unit
+class TestMetricsScope:
+    def test_collects_metrics_reported_inside(self):
+        MetricsScope.report(
+            ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=7)
+        )
+        with MetricsScope() as scope:
+            MetricsScope.report(
+                ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=3)
+            )
+            MetricsScope.report(
+                ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=4)
+            )
+        MetricsScope.report(
+            ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=9)
+        )
+
+        assert len(scope.metrics) == 2
+        assert scope.tokens_used == 7
+
+    def test_creating_metrics_does_not_report_them(self):
+        with MetricsScope() as scope:
+            # e.g. the summary a circuit breaker builds for its own use
+            ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=3)
+
+        assert scope.metrics == []
+
+    def test_tokens_are_none_without_usage(self):
+        with MetricsScope() as scope:
+            MetricsScope.report(ChatMetrics(model='gpt-4', latency_ms=1.0))
+
+        assert scope.tokens_used is None
+
+    def test_nested_scopes_report_outwards(self):
+        with MetricsScope() as outer:
+            MetricsScope.report(
+                ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=1)
+            )
+            with MetricsScope() as inner:
+                MetricsScope.report(
+                    ChatMetrics(model='gpt-4', latency_ms=1.0, tokens_used=2)
+                )
+
+        assert inner.tokens_used == 2
+        assert outer.tokens_used == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_their_own_metrics(self):
+        async def record(tokens):
+            with MetricsScope() as scope:
+                for _ in range(3):
+                    await asyncio.sleep(0)
+                    MetricsScope.report(
+                        ChatMetrics(
+                            model='gpt-4', latency_ms=1.0, tokens_used=tokens
+                        )
+                    )
+            return scope.tokens_used
+
+        assert await asyncio.gather(record(1), record(10)) == [3, 30]
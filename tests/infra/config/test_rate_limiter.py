@@ -0,0 +1,193 @@
+import asyncio
+import time
+
+import pytest
+
+from createagents.infra.config import EnvironmentConfig, RateLimiter
+from createagents.infra.config.rate_limiter import TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def reset_limiters():
+    RateLimiter.reset_registry()
+    yield
+    RateLimiter.reset_registry()
+    EnvironmentConfig.clear_cache()
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    def test_starts_full(self):
+        bucket = TokenBucket(60)
+
+        assert bucket.wait_time(60) == 0
+
+    def test_wait_time_reflects_refill_rate(self):
+        bucket = TokenBucket(60)
+        bucket.take(60)
+
+        assert bucket.wait_time(2) == pytest.approx(2.0, abs=0.05)
+
+    def test_amount_above_capacity_is_clamped(self):
+        bucket = TokenBucket(10)
+
+        assert bucket.wait_time(1000) == 0
+
+    def test_give_back_never_exceeds_capacity(self):
+        bucket = TokenBucket(10)
+
+        bucket.give_back(5)
+
+        assert bucket.level == pytest.approx(10)
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_requests_are_exhausted(self):
+        limiter = RateLimiter(requests_per_minute=600)
+        for _ in range(600):
+            await limiter.acquire(1)
+
+        start = time.perf_counter()
+        await limiter.acquire(1)
+
+        assert time.perf_counter() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_acquire_takes_estimated_tokens(self):
+        limiter = RateLimiter(tokens_per_minute=1000)
+
+        await limiter.acquire(300)
+
+        assert limiter.get_available()['tokens'] == pytest.approx(700, abs=1)
+        assert limiter.get_available()['requests'] is None
+
+    @pytest.mark.asyncio
+    async def test_reconcile_refunds_overestimate(self):
+        limiter = RateLimiter(tokens_per_minute=1000)
+        await limiter.acquire(300)
+
+        limiter.reconcile(300, 100)
+
+        assert limiter.get_available()['tokens'] == pytest.approx(900, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_reconcile_charges_underestimate(self):
+        limiter = RateLimiter(tokens_per_minute=1000)
+        await limiter.acquire(100)
+
+        limiter.reconcile(100, 400)
+
+        assert limiter.get_available()['tokens'] == pytest.approx(600, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_unknown_usage_keeps_estimate(self):
+        limiter = RateLimiter(tokens_per_minute=1000)
+        await limiter.acquire(100)
+
+        limiter.reconcile(100, None)
+
+        assert limiter.get_available()['tokens'] == pytest.approx(900, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_callers_back(self):
+        limiter = RateLimiter(requests_per_minute=1000)
+        limiter.pause(0.1)
+
+        start = time.perf_counter()
+        await limiter.acquire(1)
+
+        assert time.perf_counter() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_track_stream_reconciles_with_reported_usage(self):
+        limiter = RateLimiter(tokens_per_minute=1000)
+        await limiter.acquire(500)
+
+        async def stream():
+            yield {'done': False}
+            yield {'done': True, 'total': 50}
+
+        items = [
+            item
+            async for item in limiter.track_stream(
+                stream(), 500, lambda item: item.get('total')
+            )
+        ]
+
+        assert len(items) == 2
+        assert limiter.get_available()['tokens'] == pytest.approx(950, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_track_stream_closes_and_reconciles_when_stopped_early(
+        self,
+    ):
+        limiter = RateLimiter(tokens_per_minute=1000)
+        await limiter.acquire(500)
+        closed = []
+
+        async def stream():
+            try:
+                yield {'done': False}
+                yield {'done': True, 'total': 50}
+            finally:
+                closed.append(True)
+
+        tracked = limiter.track_stream(
+            stream(), 500, lambda item: item.get('total')
+        )
+        assert await tracked.__anext__() == {'done': False}
+        await tracked.aclose()
+
+        assert closed == [True]
+        # Nothing was reported, so the estimate stays charged.
+        assert limiter.get_available()['tokens'] == pytest.approx(500, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_shared_by_concurrent_callers(self):
+        limiter = RateLimiter(requests_per_minute=1200)
+        for _ in range(1200):
+            await limiter.acquire(1)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire(1) for _ in range(3)))
+
+        assert time.perf_counter() - start >= 0.14
+
+    def test_estimate_tokens_counts_prompt_tools_and_output(self):
+        messages = [{'role': 'user', 'content': 'x' * 400}]
+
+        without_output = RateLimiter.estimate_tokens('abcd', messages)
+        with_output = RateLimiter.estimate_tokens(
+            'abcd', messages, [{'name': 'tool'}], max_output_tokens=100
+        )
+
+        assert without_output > 100
+        assert with_output > without_output + 100
+
+    @pytest.mark.parametrize('limit', [0, -5])
+    def test_rejects_non_positive_limits(self, limit):
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=limit)
+
+
+@pytest.mark.unit
+class TestRateLimiterRegistry:
+    def test_no_limiter_without_configuration(self, monkeypatch):
+        monkeypatch.delenv('OPENAI_RPM_LIMIT', raising=False)
+        monkeypatch.delenv('OPENAI_TPM_LIMIT', raising=False)
+        EnvironmentConfig.clear_cache()
+
+        assert RateLimiter.for_model('openai', 'gpt-4') is None
+
+    def test_limiter_is_shared_per_provider_and_model(self, monkeypatch):
+        monkeypatch.setenv('OPENAI_TPM_LIMIT', '10000')
+        EnvironmentConfig.clear_cache()
+
+        limiter = RateLimiter.for_model('openai', 'gpt-4')
+
+        assert limiter is not None
+        assert RateLimiter.for_model('openai', 'gpt-4') is limiter
+        assert RateLimiter.for_model('openai', 'gpt-5') is not limiter
+        assert limiter.get_available()['tokens'] == pytest.approx(10000)
@@ -0,0 +1,214 @@
+import pytest
+
+from createagents.infra.config import (
+    EnvironmentConfig,
+    MemoryResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_cache():
+    ResponseCache.reset_shared()
+    yield
+    ResponseCache.reset_shared()
+    EnvironmentConfig.clear_cache()
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / 'cache' / 'responses.db'))
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+class TestMemoryResponseCache:
+    def test_set_and_get(self):
+        cache = MemoryResponseCache()
+
+        cache.set('k', 'hello', ttl_s=None)
+
+        assert cache.get('k') == 'hello'
+        assert cache.get('missing') is None
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        cache = MemoryResponseCache()
+        cache.set('k', 'hello', ttl_s=10)
+
+        monkeypatch.setattr(
+            'createagents.infra.config.response_cache.time.time',
+            lambda: 10**12,
+        )
+
+        assert cache.get('k') is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryResponseCache(max_entries=2)
+        cache.set('a', '1', None)
+        cache.set('b', '2', None)
+        cache.get('a')
+
+        cache.set('c', '3', None)
+
+        assert cache.get('a') == '1'
+        assert cache.get('b') is None
+        assert cache.get('c') == '3'
+
+
+@pytest.mark.unit
+class TestSQLiteResponseCache:
+    def test_entries_survive_reopening(self, tmp_path):
+        path = str(tmp_path / 'responses.db')
+        first = SQLiteResponseCache(path)
+        first.set('k', 'persisted', ttl_s=60)
+        first.close()
+
+        second = SQLiteResponseCache(path)
+        try:
+            assert second.get('k') == 'persisted'
+        finally:
+            second.close()
+
+    def test_expired_entries_are_ignored(self, sqlite_cache, monkeypatch):
+        sqlite_cache.set('k', 'hello', ttl_s=10)
+
+        monkeypatch.setattr(
+            'createagents.infra.config.response_cache.time.time',
+            lambda: 10**12,
+        )
+
+        assert sqlite_cache.get('k') is None
+        assert len(sqlite_cache) == 0
+
+    def test_size_bound_evicts_least_recently_read(self, tmp_path):
+        cache = SQLiteResponseCache(
+            str(tmp_path / 'responses.db'), max_bytes=25
+        )
+        try:
+            cache.set('a', 'x' * 10, None)
+            cache.set('b', 'y' * 10, None)
+            cache.get('a')
+
+            cache.set('c', 'z' * 10, None)
+
+            assert cache.get('a') == 'x' * 10
+            assert cache.get('b') is None
+            assert cache.get('c') == 'z' * 10
+        finally:
+            cache.close()
+
+    def test_clear(self, sqlite_cache):
+        sqlite_cache.set('k', 'hello', None)
+
+        sqlite_cache.clear()
+
+        assert len(sqlite_cache) == 0
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_disk_hits_are_promoted_to_memory(self, sqlite_cache):
+        sqlite_cache.set('k', 'from disk', None)
+        cache = ResponseCache(disk=sqlite_cache)
+
+        assert await cache.get('k') == 'from disk'
+        assert await cache.get('k') == 'from disk'
+
+        stats = cache.get_stats()
+        assert stats['disk_hits'] == 1
+        assert stats['memory_hits'] == 1
+        assert stats['entries'] == 1
+
+    @pytest.mark.asyncio
+    async def test_promoted_disk_hits_keep_their_remaining_ttl(
+        self, sqlite_cache, monkeypatch
+    ):
+        now = [1000.0]
+        monkeypatch.setattr(
+            'createagents.infra.config.response_cache.time.time',
+            lambda: now[0],
+        )
+        sqlite_cache.set('k', 'from disk', ttl_s=10)
+        cache = ResponseCache(disk=sqlite_cache, ttl_s=3600)
+
+        now[0] += 8
+        assert await cache.get('k') == 'from disk'
+
+        now[0] += 5
+        assert cache.memory.get('k') is None
+
+    @pytest.mark.asyncio
+    async def test_disk_read_errors_are_misses(self, sqlite_cache):
+        import sqlite3
+
+        sqlite_cache.set('k', 'from disk', None)
+        sqlite_cache.close()
+        cache = ResponseCache(disk=sqlite_cache)
+
+        with pytest.raises(sqlite3.Error):
+            sqlite_cache.get('k')
+        assert await cache.get('k') is None
+        assert cache.get_stats()['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_caps_the_ttl(self, sqlite_cache, monkeypatch):
+        monkeypatch.setattr(
+            'createagents.infra.config.response_cache.time.time',
+            lambda: 1000.0,
+        )
+        cache = ResponseCache(disk=sqlite_cache, ttl_s=3600)
+
+        await cache.set('k', 'hello', max_ttl_s=5)
+
+        assert cache.memory.get_entry('k') == ('hello', 1005.0)
+        assert sqlite_cache.get_entry('k') == ('hello', 1005.0)
+
+    @pytest.mark.asyncio
+    async def test_set_writes_every_tier(self, sqlite_cache):
+        cache = ResponseCache(disk=sqlite_cache)
+
+        await cache.set('k', 'hello')
+
+        assert cache.memory.get('k') == 'hello'
+        assert sqlite_cache.get('k') == 'hello'
+
+    @pytest.mark.asyncio
+    async def test_miss_is_counted(self):
+        cache = ResponseCache()
+
+        assert await cache.get('k') is None
+        assert cache.get_stats()['misses'] == 1
+
+    @pytest.mark.parametrize(
+        'kwargs', [{'mode': 'off'}, {'mode': 'sometimes'}, {'ttl_s': 0}]
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            ResponseCache(**kwargs)
+
+    def test_shared_cache_is_off_by_default(self, monkeypatch):
+        monkeypatch.delenv('RESPONSE_CACHE_MODE', raising=False)
+        EnvironmentConfig.clear_cache()
+
+        assert ResponseCache.get_shared() is None
+
+    def test_shared_cache_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('RESPONSE_CACHE_MODE', 'always')
+        monkeypatch.setenv('RESPONSE_CACHE_TTL_S', '120')
+        monkeypatch.setenv(
+            'RESPONSE_CACHE_PATH', str(tmp_path / 'responses.db')
+        )
+        EnvironmentConfig.clear_cache()
+
+        cache = ResponseCache.get_shared()
+
+        assert cache is not None
+        assert cache.mode == 'always'
+        assert cache.ttl_s == 120.0
+        assert isinstance(cache.disk, SQLiteResponseCache)
+        assert ResponseCache.get_shared() is cache
+        cache.disk.close()
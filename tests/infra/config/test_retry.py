@@ -1,9 +1,12 @@
+import asyncio
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from createagents.infra import retry_with_backoff
+from createagents.infra.config.retry import get_retry_after, is_retryable_error
 
 
 @pytest.mark.unit
@@ -699,3 +702,213 @@ class TestRetryWithBackoff:
         test_func()
 
         assert mock_func.call_count == 0
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+        self.response = Mock(headers=headers or {})
+
+
+@pytest.mark.unit
+class TestAsyncRetryWithBackoff:
+    @pytest.mark.asyncio
+    async def test_retries_errors_raised_while_awaiting(self):
+        attempts = [0]
+
+        @retry_with_backoff(max_attempts=3, initial_delay=0.01)
+        async def test_func():
+            attempts[0] += 1
+            if attempts[0] < 3:
+                raise ConnectionError('reset')
+            return 'success'
+
+        result = await test_func()
+
+        assert result == 'success'
+        assert attempts[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_uses_asyncio_sleep_not_time_sleep(self):
+        mock_func = AsyncMock(side_effect=[ConnectionError('reset'), 'ok'])
+
+        @retry_with_backoff(max_attempts=2, initial_delay=0.5, jitter=False)
+        async def test_func():
+            return await mock_func()
+
+        with (
+            patch('time.sleep') as mock_time_sleep,
+            patch('asyncio.sleep', new=AsyncMock()) as mock_async_sleep,
+        ):
+            result = await test_func()
+
+        assert result == 'ok'
+        mock_time_sleep.assert_not_called()
+        mock_async_sleep.assert_awaited_once_with(0.5)
+
+    @pytest.mark.asyncio
+    async def test_wrapper_is_coroutine_function(self):
+        @retry_with_backoff()
+        async def test_func():
+            return 'ok'
+
+        assert asyncio.iscoroutinefunction(test_func)
+        assert test_func.__name__ == 'test_func'
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raises_immediately(self):
+        mock_func = AsyncMock(side_effect=_StatusError(400))
+
+        @retry_with_backoff(
+            max_attempts=3, initial_delay=0.01, retry_if=is_retryable_error
+        )
+        async def test_func():
+            return await mock_func()
+
+        with pytest.raises(_StatusError):
+            await test_func()
+
+        assert mock_func.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retryable_status_is_retried(self):
+        mock_func = AsyncMock(side_effect=[_StatusError(503), 'ok'])
+
+        @retry_with_backoff(
+            max_attempts=3, initial_delay=0.01, retry_if=is_retryable_error
+        )
+        async def test_func():
+            return await mock_func()
+
+        assert await test_func() == 'ok'
+        assert mock_func.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after_header(self):
+        error = _StatusError(429, headers={'retry-after': '3'})
+        mock_func = AsyncMock(side_effect=[error, 'ok'])
+
+        @retry_with_backoff(max_attempts=2, initial_delay=0.01, jitter=False)
+        async def test_func():
+            return await mock_func()
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_async_sleep:
+            await test_func()
+
+        mock_async_sleep.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_ignored_when_disabled(self):
+        error = _StatusError(429, headers={'retry-after': '3'})
+        mock_func = AsyncMock(side_effect=[error, 'ok'])
+
+        @retry_with_backoff(
+            max_attempts=2,
+            initial_delay=0.01,
+            jitter=False,
+            respect_retry_after=False,
+        )
+        async def test_func():
+            return await mock_func()
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_async_sleep:
+            await test_func()
+
+        mock_async_sleep.assert_awaited_once_with(0.01)
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_stops_retrying(self):
+        error = _StatusError(503, headers={'retry-after': '10'})
+        mock_func = AsyncMock(side_effect=error)
+
+        @retry_with_backoff(
+            max_attempts=5, initial_delay=0.01, max_retry_time=1.0
+        )
+        async def test_func():
+            return await mock_func()
+
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_async_sleep:
+            with pytest.raises(_StatusError):
+                await test_func()
+
+        assert mock_func.await_count == 1
+        mock_async_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_retries_do_not_block_event_loop(self):
+        attempts = [0]
+
+        @retry_with_backoff(max_attempts=2, initial_delay=0.2, jitter=False)
+        async def flaky():
+            attempts[0] += 1
+            if attempts[0] == 1:
+                raise ConnectionError('reset')
+            return 'flaky'
+
+        async def healthy():
+            await asyncio.sleep(0.01)
+            return time.monotonic()
+
+        start = time.monotonic()
+        _, healthy_done = await asyncio.gather(flaky(), healthy())
+
+        assert healthy_done - start < 0.15
+
+
+@pytest.mark.unit
+class TestRetryErrorClassification:
+    @pytest.mark.parametrize('status', [408, 429, 500, 502, 503, 504])
+    def test_transient_statuses_are_retryable(self, status):
+        assert is_retryable_error(_StatusError(status)) is True
+
+    @pytest.mark.parametrize('status', [400, 401, 403, 404, 422])
+    def test_client_errors_are_not_retryable(self, status):
+        assert is_retryable_error(_StatusError(status)) is False
+
+    def test_connection_errors_are_retryable(self):
+        assert is_retryable_error(ConnectionError('reset')) is True
+        assert is_retryable_error(TimeoutError()) is True
+        assert is_retryable_error(httpx.ConnectError('refused')) is True
+
+    def test_chained_transport_error_is_retryable(self):
+        try:
+            try:
+                raise httpx.ReadError('reset')
+            except httpx.ReadError as e:
+                raise RuntimeError('wrapped') from e
+        except RuntimeError as wrapped:
+            assert is_retryable_error(wrapped) is True
+
+    def test_chat_timeout_is_not_retryable(self):
+        from createagents.domain import ChatTimeoutException
+
+        try:
+            try:
+                raise asyncio.TimeoutError()
+            except asyncio.TimeoutError as e:
+                raise ChatTimeoutException(1.0) from e
+        except ChatTimeoutException as timeout:
+            assert is_retryable_error(timeout) is False
+
+    def test_generic_errors_are_not_retryable(self):
+        assert is_retryable_error(ValueError('bad')) is False
+        assert is_retryable_error(Exception('API Error')) is False
+
+    def test_get_retry_after_seconds(self):
+        error = _StatusError(429, headers={'retry-after': '2.5'})
+        assert get_retry_after(error) == 2.5
+
+    def test_get_retry_after_milliseconds(self):
+        error = _StatusError(429, headers={'retry-after-ms': '1500'})
+        assert get_retry_after(error) == 1.5
+
+    def test_get_retry_after_http_date(self):
+        error = _StatusError(
+            429, headers={'retry-after': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        )
+        assert get_retry_after(error) == 0.0
+
+    def test_get_retry_after_missing(self):
+        assert get_retry_after(_StatusError(503)) is None
+        assert get_retry_after(ValueError('no response')) is None
@@ -0,0 +1,210 @@
+import hashlib
+import re
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from createagents.infra.config import (  # noqa: E402
+    EnvironmentConfig,
+    SemanticCache,
+    TextEmbedder,
+)
+
+
+class BagOfWordsEmbedder(TextEmbedder):
+    """Deterministic stand-in for an embedding model."""
+
+    def __init__(self, dimensions=64):
+        self.dimensions = dimensions
+        self.calls = 0
+
+    async def embed(self, texts):
+        self.calls += 1
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimensions
+            for word in re.findall(r'\w+', text.lower()):
+                digest = hashlib.md5(word.encode()).digest()
+                vector[digest[0] % self.dimensions] += 1.0
+            vectors.append(vector)
+        return vectors
+
+
+@pytest.mark.unit
+class TestSemanticCache:
+    @pytest.mark.asyncio
+    async def test_similar_text_hits(self):
+        cache = SemanticCache(BagOfWordsEmbedder(), threshold=0.9)
+        context = SemanticCache.make_context('model', 'Be brief.')
+
+        cache.add(
+            context,
+            await cache.embed('What is the capital of France?'),
+            'Paris',
+        )
+
+        vector = await cache.embed('what is the capital of france')
+        assert cache.search(context, vector) == 'Paris'
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_text_misses(self):
+        cache = SemanticCache(BagOfWordsEmbedder(), threshold=0.9)
+        context = SemanticCache.make_context('model')
+
+        cache.add(context, await cache.embed('Capital of France?'), 'Paris')
+
+        vector = await cache.embed('How do I bake bread?')
+        assert cache.search(context, vector) is None
+
+    @pytest.mark.asyncio
+    async def test_other_context_misses(self):
+        cache = SemanticCache(BagOfWordsEmbedder())
+        vector = await cache.embed('Capital of France?')
+
+        cache.add(SemanticCache.make_context('a'), vector, 'Paris')
+
+        assert cache.search(SemanticCache.make_context('b'), vector) is None
+        assert cache.search(SemanticCache.make_context('a'), vector) == 'Paris'
+
+    @pytest.mark.asyncio
+    async def test_vectors_are_normalized_float32(self):
+        cache = SemanticCache(BagOfWordsEmbedder())
+
+        vector = await cache.embed('one two three')
+
+        assert str(vector.dtype) == 'float32'
+        assert float((vector**2).sum()) == pytest.approx(1.0, rel=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_zero_vector_is_rejected(self):
+        cache = SemanticCache(BagOfWordsEmbedder())
+
+        with pytest.raises(ValueError):
+            await cache.embed('')
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_entry(self):
+        cache = SemanticCache(BagOfWordsEmbedder(), max_entries=2)
+        context = SemanticCache.make_context('model')
+        alpha = await cache.embed('alpha')
+        beta = await cache.embed('beta')
+        gamma = await cache.embed('gamma')
+
+        cache.add(context, alpha, 'A')
+        cache.add(context, beta, 'B')
+        assert cache.search(context, alpha) == 'A'
+        cache.add(context, gamma, 'C')
+
+        assert len(cache) == 2
+        assert cache.search(context, beta) is None
+        assert cache.search(context, alpha) == 'A'
+        assert cache.search(context, gamma) == 'C'
+        assert cache.get_stats()['evictions'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_report_hit_rate(self):
+        cache = SemanticCache(BagOfWordsEmbedder())
+        context = SemanticCache.make_context('model')
+        vector = await cache.embed('hello there')
+
+        assert cache.get_stats()['hit_rate'] is None
+        cache.search(context, vector)
+        cache.add(context, vector, 'Hi!')
+        cache.search(context, vector)
+        cache.search(context, vector)
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+        assert stats['entries'] == 1
+
+    @pytest.mark.asyncio
+    async def test_dimension_change_resets_index(self):
+        cache = SemanticCache(BagOfWordsEmbedder(dimensions=16))
+        context = SemanticCache.make_context('model')
+        cache.add(context, await cache.embed('hello'), 'Hi!')
+
+        cache.embedder = BagOfWordsEmbedder(dimensions=32)
+        vector = await cache.embed('hello')
+
+        assert cache.search(context, vector) is None
+        cache.add(context, vector, 'Hello!')
+        assert len(cache) == 1
+        assert cache.search(context, vector) == 'Hello!'
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_entries(self):
+        cache = SemanticCache(BagOfWordsEmbedder())
+        context = SemanticCache.make_context('model')
+        vector = await cache.embed('hello')
+        cache.add(context, vector, 'Hi!')
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.search(context, vector) is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            'createagents.infra.config.semantic_cache.time.time',
+            lambda: now[0],
+        )
+        cache = SemanticCache(BagOfWordsEmbedder(), ttl_s=60)
+        context = SemanticCache.make_context('model')
+        vector = await cache.embed('hello')
+        cache.add(context, vector, 'Hi!')
+        cache.add(context, await cache.embed('bye'), 'Bye!', max_ttl_s=5)
+
+        now[0] += 10
+        assert cache.search(context, vector) == 'Hi!'
+        assert cache.search(context, await cache.embed('bye')) is None
+
+        now[0] += 60
+        assert cache.search(context, vector) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_replaced_first(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            'createagents.infra.config.semantic_cache.time.time',
+            lambda: now[0],
+        )
+        cache = SemanticCache(BagOfWordsEmbedder(), max_entries=2)
+        context = SemanticCache.make_context('model')
+        cache.add(context, await cache.embed('alpha'), 'A', max_ttl_s=5)
+        cache.add(context, await cache.embed('beta'), 'B')
+
+        now[0] += 10
+        cache.add(context, await cache.embed('gamma'), 'C')
+
+        assert cache.search(context, await cache.embed('beta')) == 'B'
+        assert cache.search(context, await cache.embed('gamma')) == 'C'
+        assert cache.get_stats()['evictions'] == 0
+
+    def test_invalid_settings_raise(self):
+        with pytest.raises(ValueError):
+            SemanticCache(BagOfWordsEmbedder(), threshold=0)
+        with pytest.raises(ValueError):
+            SemanticCache(BagOfWordsEmbedder(), threshold=1.5)
+        with pytest.raises(ValueError):
+            SemanticCache(BagOfWordsEmbedder(), max_entries=0)
+        with pytest.raises(ValueError):
+            SemanticCache(BagOfWordsEmbedder(), ttl_s=0)
+
+    def test_from_env_reads_settings(self, monkeypatch):
+        monkeypatch.setenv('SEMANTIC_CACHE_THRESHOLD', '0.8')
+        monkeypatch.setenv('SEMANTIC_CACHE_MAX_ENTRIES', '10')
+        monkeypatch.setenv('SEMANTIC_CACHE_TTL_S', '60')
+        EnvironmentConfig.clear_cache()
+        try:
+            cache = SemanticCache.from_env(BagOfWordsEmbedder())
+        finally:
+            EnvironmentConfig.clear_cache()
+
+        assert cache.threshold == 0.8
+        assert cache.max_entries == 10
+        assert cache.ttl_s == 60
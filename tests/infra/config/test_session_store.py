@@ -0,0 +1,203 @@
+import sqlite3
+
+import pytest
+
+from createagents.domain import Message, MessageRole
+from createagents.domain.value_objects.history import MESSAGE_OVERHEAD_TOKENS
+from createagents.infra import JSONLSessionStore, SQLiteSessionStore
+
+
+def _turn(index: int, tokens: int = 10):
+    return [
+        Message(MessageRole.USER, f'question {index}', token_count=tokens),
+        Message(MessageRole.ASSISTANT, f'answer {index}', token_count=tokens),
+    ]
+
+
+@pytest.fixture(params=['jsonl', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'jsonl':
+        store = JSONLSessionStore(str(tmp_path / 'sessions'))
+    else:
+        store = SQLiteSessionStore(str(tmp_path / 'sessions.db'))
+    yield store
+    store.close()
+
+
+@pytest.mark.unit
+class TestSessionStores:
+    def test_unknown_session_is_empty(self, store):
+        assert store.load('missing') == []
+
+    def test_turns_are_appended_in_order(self, store):
+        for index in range(3):
+            store.append('s1', _turn(index))
+
+        messages = store.load('s1')
+
+        assert [m.content for m in messages] == [
+            'question 0',
+            'answer 0',
+            'question 1',
+            'answer 1',
+            'question 2',
+            'answer 2',
+        ]
+        assert messages[0].role == MessageRole.USER
+        assert messages[0].token_count == 10
+
+    def test_sessions_are_kept_apart(self, store):
+        store.append('s1', _turn(1))
+        store.append('s2', _turn(2))
+
+        assert store.load('s1') == _turn(1)
+        assert store.session_ids() == ['s1', 's2']
+
+    def test_load_takes_the_latest_messages(self, store):
+        for index in range(5):
+            store.append('s1', _turn(index))
+
+        messages = store.load('s1', max_messages=4)
+
+        assert [m.content for m in messages] == [
+            'question 3',
+            'answer 3',
+            'question 4',
+            'answer 4',
+        ]
+
+    def test_load_starts_at_a_user_turn(self, store):
+        for index in range(5):
+            store.append('s1', _turn(index))
+
+        messages = store.load('s1', max_messages=3)
+
+        assert [m.content for m in messages] == ['question 4', 'answer 4']
+
+    def test_load_respects_the_token_budget(self, store):
+        for index in range(5):
+            store.append('s1', _turn(index, tokens=6))
+
+        # Two turns of two messages, each 6 tokens plus the overhead.
+        budget = 4 * (6 + MESSAGE_OVERHEAD_TOKENS)
+        messages = store.load('s1', max_tokens=budget)
+
+        assert [m.content for m in messages] == [
+            'question 3',
+            'answer 3',
+            'question 4',
+            'answer 4',
+        ]
+
+    def test_delete_removes_the_session(self, store):
+        store.append('s1', _turn(1))
+        store.append('s2', _turn(2))
+
+        store.delete('s1')
+        store.delete('missing')
+
+        assert store.load('s1') == []
+        assert store.session_ids() == ['s2']
+
+    def test_load_stops_at_the_summary(self, store):
+        for index in range(3):
+            store.append('s1', _turn(index))
+        summary = Message(MessageRole.SYSTEM, 'summary', token_count=5)
+        store.append_summary('s1', summary, kept=2)
+        store.append('s1', _turn(3))
+
+        messages = store.load('s1')
+
+        assert messages == [summary] + _turn(2) + _turn(3)
+
+    def test_latest_summary_wins_over_earlier_ones(self, store):
+        store.append('s1', _turn(0))
+        store.append('s1', _turn(1))
+        store.append_summary(
+            's1', Message(MessageRole.SYSTEM, 'first', token_count=5), kept=2
+        )
+        store.append('s1', _turn(2))
+        latest = Message(MessageRole.SYSTEM, 'second', token_count=5)
+        store.append_summary('s1', latest, kept=4)
+
+        messages = store.load('s1')
+
+        # The earlier summary sits among the kept turns and is skipped.
+        assert messages == [latest] + _turn(1) + _turn(2)
+
+    def test_summary_counts_against_the_limits(self, store):
+        store.append('s1', _turn(0))
+        store.append_summary(
+            's1', Message(MessageRole.SYSTEM, 'summary', token_count=5), 0
+        )
+        store.append('s1', _turn(1))
+
+        assert store.load('s1', max_messages=2) == _turn(1)
+
+    def test_empty_session_id_is_rejected(self, store):
+        with pytest.raises(ValueError):
+            store.append('', _turn(1))
+
+
+@pytest.mark.unit
+class TestJSONLSessionStore:
+    def test_session_id_is_quoted_into_one_file(self, tmp_path):
+        store = JSONLSessionStore(str(tmp_path))
+        store.append('../user/42', _turn(1))
+
+        assert [p.name for p in tmp_path.iterdir()] == ['..%2Fuser%2F42.jsonl']
+        assert store.session_ids() == ['../user/42']
+        assert store.load('../user/42') == _turn(1)
+
+    def test_load_reads_across_blocks(self, tmp_path):
+        store = JSONLSessionStore(str(tmp_path))
+        store.BLOCK_SIZE = 64
+        for index in range(20):
+            store.append('s1', _turn(index))
+
+        messages = store.load('s1')
+
+        assert len(messages) == 40
+        assert messages[0].content == 'question 0'
+        assert messages[-1].content == 'answer 19'
+
+    def test_damaged_lines_are_skipped(self, tmp_path):
+        store = JSONLSessionStore(str(tmp_path))
+        store.append('s1', _turn(1))
+        with open(tmp_path / 's1.jsonl', 'ab') as f:
+            # A write cut short by a crash.
+            f.write(b'{"role": "user", "cont')
+        store.append('s1', _turn(2))
+
+        assert store.load('s1') == _turn(1) + _turn(2)
+
+
+@pytest.mark.unit
+class TestSQLiteSessionStore:
+    def test_database_without_summaries_is_upgraded(self, tmp_path):
+        path = str(tmp_path / 'sessions.db')
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute(
+                'CREATE TABLE session_messages ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'session_id TEXT NOT NULL, '
+                'role TEXT NOT NULL, '
+                'content TEXT NOT NULL, '
+                'tokens INTEGER, '
+                'created_at REAL NOT NULL)'
+            )
+            connection.execute(
+                'INSERT INTO session_messages '
+                '(session_id, role, content, tokens, created_at) '
+                "VALUES ('s1', 'user', 'question 0', 10, 0)"
+            )
+        connection.close()
+
+        store = SQLiteSessionStore(path)
+        summary = Message(MessageRole.SYSTEM, 'summary', token_count=5)
+        store.append_summary('s1', summary, kept=0)
+        store.append('s1', _turn(1))
+
+        assert store.load('s1') == [summary] + _turn(1)
+        store.close()
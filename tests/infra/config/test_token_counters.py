@@ -0,0 +1,23 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from createagents.infra import TiktokenCounter
+
+
+@pytest.mark.unit
+class TestTiktokenCounter:
+    def test_missing_tiktoken_raises_with_install_hint(self):
+        with patch.dict(sys.modules, {'tiktoken': None}):
+            with pytest.raises(RuntimeError, match='file-tools'):
+                TiktokenCounter()
+
+    def test_counts_tokens_exactly(self):
+        pytest.importorskip('tiktoken')
+        counter = TiktokenCounter()
+
+        assert counter.count('') == 0
+        assert counter.count('hello world') == 2
+        # Special-token text is counted as plain text, not rejected.
+        assert counter.count('<|endoftext|>') > 1
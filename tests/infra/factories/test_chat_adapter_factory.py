@@ -2,6 +2,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from createagents.infra.adapters.Common import SharedChatAdapter
 from createagents.infra.adapters.Ollama.ollama_chat_adapter import (
     OllamaChatAdapter,
 )
@@ -349,3 +350,111 @@ class TestChatAdapterFactory:
                     )
 
                     assert isinstance(adapter, OpenAIChatAdapter)
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_every_cached_adapter(self):
+        from unittest.mock import AsyncMock
+
+        ChatAdapterFactory.clear_cache()
+        with patch(
+            'createagents.infra.factories.chat_adapter_factory.OllamaChatAdapter.aclose',
+            new_callable=AsyncMock,
+        ) as mock_aclose:
+            ChatAdapterFactory.create(provider='ollama', model='gemma3:4b')
+            ChatAdapterFactory.create(provider='ollama', model='phi4-mini')
+
+            await ChatAdapterFactory.aclose()
+
+        assert mock_aclose.await_count == 2
+        ChatAdapterFactory.clear_cache()
+
+    def test_wraps_adapter_with_circuit_breaker_when_enabled(
+        self, monkeypatch
+    ):
+        from createagents.infra.adapters.Common import (
+            CircuitBreakerChatAdapter,
+        )
+        from createagents.infra.config import EnvironmentConfig
+
+        monkeypatch.setenv('CIRCUIT_BREAKER_ENABLED', 'true')
+        monkeypatch.setenv('CIRCUIT_BREAKER_OPEN_S', '5')
+        EnvironmentConfig.clear_cache()
+        ChatAdapterFactory.clear_cache()
+        try:
+            adapter = ChatAdapterFactory.create(
+                provider='ollama', model='gemma3:4b'
+            )
+        finally:
+            monkeypatch.delenv('CIRCUIT_BREAKER_ENABLED')
+            EnvironmentConfig.clear_cache()
+            ChatAdapterFactory.clear_cache()
+
+        assert isinstance(adapter, CircuitBreakerChatAdapter)
+        assert isinstance(adapter.wrapped, OllamaChatAdapter)
+        assert adapter.breaker.name == 'ollama:gemma3:4b'
+        assert adapter.breaker.open_s == 5.0
+
+    def test_wraps_adapter_with_single_flight_when_enabled(self, monkeypatch):
+        from createagents.infra.adapters.Common import (
+            SingleFlightChatAdapter,
+        )
+        from createagents.infra.config import EnvironmentConfig
+
+        monkeypatch.setenv('SINGLE_FLIGHT_ENABLED', 'true')
+        EnvironmentConfig.clear_cache()
+        ChatAdapterFactory.clear_cache()
+        try:
+            adapter = ChatAdapterFactory.create(
+                provider='ollama', model='gemma3:4b'
+            )
+        finally:
+            monkeypatch.delenv('SINGLE_FLIGHT_ENABLED')
+            EnvironmentConfig.clear_cache()
+            ChatAdapterFactory.clear_cache()
+
+        assert isinstance(adapter, SingleFlightChatAdapter)
+        assert isinstance(adapter.wrapped, OllamaChatAdapter)
+
+    def test_wraps_adapter_with_response_cache_when_enabled(self, monkeypatch):
+        from createagents.infra.adapters.Common import (
+            ResponseCacheChatAdapter,
+        )
+        from createagents.infra.config import EnvironmentConfig, ResponseCache
+
+        monkeypatch.setenv('RESPONSE_CACHE_MODE', 'deterministic')
+        EnvironmentConfig.clear_cache()
+        ResponseCache.reset_shared()
+        ChatAdapterFactory.clear_cache()
+        try:
+            adapter = ChatAdapterFactory.create(
+                provider='ollama', model='gemma3:4b'
+            )
+        finally:
+            monkeypatch.delenv('RESPONSE_CACHE_MODE')
+            EnvironmentConfig.clear_cache()
+            ResponseCache.reset_shared()
+            ChatAdapterFactory.clear_cache()
+
+        assert isinstance(adapter, ResponseCacheChatAdapter)
+        assert isinstance(adapter.wrapped, OllamaChatAdapter)
+        assert adapter.cache.mode == 'deterministic'
+
+    @patch('createagents.infra.config.EnvironmentConfig.get_api_key')
+    @patch(
+        'createagents.infra.adapters.OpenAI.openai_client.ClientOpenAI.get_client'
+    )
+    def test_acquire_returns_a_handle_on_the_cached_adapter(
+        self, mock_get_client, mock_get_api_key
+    ):
+        mock_get_api_key.return_value = 'test-api-key'
+        mock_get_client.return_value = Mock()
+        ChatAdapterFactory.clear_cache()
+
+        handle = ChatAdapterFactory.acquire(provider='openai', model='gpt-5')
+
+        assert isinstance(handle, SharedChatAdapter)
+        assert handle.wrapped is ChatAdapterFactory.create(
+            provider='openai', model='gpt-5'
+        )
+        assert SharedChatAdapter.holders(handle.wrapped) == 1
+        ChatAdapterFactory.clear_cache()
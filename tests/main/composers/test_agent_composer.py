@@ -150,6 +150,32 @@ class TestAgentComposer:
 
             assert hasattr(use_case, '_ChatWithAgentUseCase__chat_repository')
 
+    def test_create_chat_use_case_wraps_semantic_cache(self):
+        pytest.importorskip('numpy')
+        from createagents.infra import (
+            OllamaEmbedder,
+            SemanticCache,
+            SemanticCacheChatAdapter,
+        )
+
+        cache = SemanticCache(OllamaEmbedder())
+        use_case = AgentComposer.create_chat_use_case(
+            provider='ollama', model='phi4-mini:latest', semantic_cache=cache
+        )
+
+        repository = use_case._ChatWithAgentUseCase__chat_repository
+        assert isinstance(repository, SemanticCacheChatAdapter)
+        assert repository.cache is cache
+
+    def test_create_semantic_cache_uses_ollama_embedder(self):
+        pytest.importorskip('numpy')
+        from createagents.infra import OllamaEmbedder
+
+        cache = AgentComposer.create_semantic_cache()
+
+        assert isinstance(cache.embedder, OllamaEmbedder)
+        assert len(cache) == 0
+
     def test_create_get_config_use_case_returns_use_case(self):
         use_case = AgentComposer.create_get_config_use_case()
 